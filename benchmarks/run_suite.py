@@ -0,0 +1,222 @@
+"""
+Run the benchmark suite and keep a history of the results.
+
+Run this as::
+
+    $ python run_suite.py [pattern ...]
+
+This runs every benchmark in the ``suite`` package whose name contains
+one of the given patterns (all of them by default) headlessly with an
+offscreen engine.  The ``time_*`` benchmarks are timed and the values
+returned by the ``track_*`` benchmarks are recorded.  The results are
+appended, along with the current git commit, to a JSON history file and
+compared with the last run on the same machine; benchmarks that got
+slower, or whose tracked value grew, by more than the allowed threshold
+are reported and make the script exit with a non-zero status.
+
+The benchmarks follow the airspeed velocity (asv) conventions and can
+also be run with asv to track them across the whole commit history.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import traceback
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def get_commit():
+    """Return the current git commit or None."""
+    try:
+        out = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=HERE)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.decode('ascii').strip()
+
+
+def get_params(klass):
+    """Return the list of parameter tuples of a benchmark class."""
+    params = getattr(klass, 'params', None)
+    if params is None:
+        return [()]
+    if len(getattr(klass, 'param_names', ())) > 1:
+        return list(itertools.product(*params))
+    return [(p,) for p in params]
+
+
+def discover(patterns):
+    """Return a list of (name, class, method name, params) for the
+    benchmarks whose name matches one of the patterns."""
+    sys.path.insert(0, HERE)
+    import suite
+    benchmarks = []
+    for _, mod_name, _ in pkgutil.iter_modules(suite.__path__):
+        if not mod_name.startswith('bench_'):
+            continue
+        mod = importlib.import_module('suite.%s'%mod_name)
+        for cls_name in sorted(dir(mod)):
+            klass = getattr(mod, cls_name)
+            if not isinstance(klass, type) or \
+               klass.__module__ != mod.__name__:
+                continue
+            methods = [x for x in sorted(dir(klass))
+                       if x.startswith(('time_', 'track_'))]
+            for meth, params in itertools.product(methods,
+                                                  get_params(klass)):
+                name = '%s.%s.%s'%(mod_name, cls_name, meth)
+                if len(params) > 0:
+                    name += '(%s)'%', '.join(repr(p) for p in params)
+                if patterns and not any(p in name for p in patterns):
+                    continue
+                benchmarks.append((name, klass, meth, params))
+    return benchmarks
+
+
+def run_benchmark(klass, meth, params, repeat, min_time):
+    """Return the best time per call in seconds."""
+    obj = klass()
+    func = getattr(obj, meth)
+    number = getattr(klass, 'number', None)
+    best = None
+    for i in range(repeat):
+        if hasattr(obj, 'setup'):
+            obj.setup(*params)
+        try:
+            timer = timeit.Timer(lambda: func(*params))
+            if number is None:
+                # Calibrate the number of calls on the first repeat.
+                number = 1
+                while True:
+                    t = timer.timeit(number)
+                    if t >= min_time or number >= 1000000:
+                        break
+                    number *= 10
+            else:
+                t = timer.timeit(number)
+        finally:
+            if hasattr(obj, 'teardown'):
+                obj.teardown(*params)
+        t /= number
+        if best is None or t < best:
+            best = t
+    return best
+
+
+def run_track(klass, meth, params):
+    """Return the value of a track benchmark."""
+    obj = klass()
+    if hasattr(obj, 'setup'):
+        obj.setup(*params)
+    try:
+        return getattr(obj, meth)(*params)
+    finally:
+        if hasattr(obj, 'teardown'):
+            obj.teardown(*params)
+
+
+def is_regression(value, last, threshold):
+    if last:
+        return value/last > 1.0 + threshold
+    return value > 0
+
+
+def load_history(fname):
+    if not os.path.exists(fname):
+        return []
+    with open(fname) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('patterns', nargs='*',
+                        help='only run benchmarks whose name contains one '
+                        'of these')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='the number of repeats, the best is kept')
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help='the minimum time of a repeat in seconds')
+    parser.add_argument('--history',
+                        default=os.path.join(HERE, 'results',
+                                             'history.json'),
+                        help='the JSON file holding the history')
+    parser.add_argument('--no-save', action='store_true',
+                        help='do not add this run to the history')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='the allowed relative slow down')
+    args = parser.parse_args()
+
+    history = load_history(args.history)
+    machine = platform.node()
+    previous = {}
+    for run in history:
+        if run['machine'] == machine:
+            previous = run['results']
+
+    results = {}
+    regressions = []
+    # Times are shown in ms, tracked values as they are.
+    print('%-70s %12s %12s %8s'%('benchmark', 'result', 'last', 'ratio'))
+    for name, klass, meth, params in discover(args.patterns):
+        track = meth.startswith('track_')
+        try:
+            if track:
+                value = run_track(klass, meth, params)
+            else:
+                value = run_benchmark(klass, meth, params, args.repeat,
+                                      args.min_time)
+        except NotImplementedError:
+            # Benchmarks that cannot run here skip themselves this way.
+            print('%-70s skipped'%name)
+            continue
+        except Exception:
+            print('%-70s failed'%name)
+            traceback.print_exc()
+            continue
+        results[name] = value
+        last = previous.get(name)
+        scale = 1.0 if track else 1e3
+        flag = ''
+        if last is not None and is_regression(value, last, args.threshold):
+            flag = ' larger' if track else ' slower'
+            regressions.append(name)
+        if last:
+            print('%-70s %12.4g %12.4g %8.2f%s'%(name, value*scale,
+                                                 last*scale, value/last,
+                                                 flag))
+        elif last is not None:
+            print('%-70s %12.4g %12.4g %8s%s'%(name, value*scale, last,
+                                               '-', flag))
+        else:
+            print('%-70s %12.4g'%(name, value*scale))
+
+    if not args.no_save:
+        history.append({'commit': get_commit(), 'date': time.time(),
+                        'machine': machine,
+                        'python': platform.python_version(),
+                        'results': results})
+        dirname = os.path.dirname(args.history)
+        if dirname and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        with open(args.history, 'w') as f:
+            json.dump(history, f, indent=1, sort_keys=True)
+
+    if len(regressions) > 0:
+        print('%d benchmarks are more than %d%% slower or larger than the '
+              'last run.'%(len(regressions), args.threshold*100))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,10 @@
+"""
+The mayavi benchmark suite.
+
+The benchmarks follow the conventions of airspeed velocity (asv): each
+module holds classes whose ``time_*`` methods are timed and whose
+``track_*`` methods return a value to record, with optional
+``params``, ``param_names``, ``setup`` and ``teardown``.  A benchmark
+that cannot run raises ``NotImplementedError`` to be skipped.  They can
+be run with ``benchmarks/run_suite.py`` or with asv.
+"""
@@ -0,0 +1,35 @@
+"""
+Benchmarks for the numpy/VTK array conversions of tvtk.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import numpy as np
+
+from tvtk import array_handler
+
+
+class ArrayConversion(object):
+    params = [1000, 100000, 1000000]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.points = np.random.random((size, 3))
+        self.scalars = np.random.random(size)
+        self.vtk_points = array_handler.array2vtk(self.points.copy())
+        self.cells = np.random.randint(0, size, (size, 3))
+
+    def time_array2vtk_scalars(self, size):
+        array_handler.array2vtk(self.scalars)
+
+    def time_array2vtk_points(self, size):
+        array_handler.array2vtk(self.points)
+
+    def time_array2vtk_non_contiguous(self, size):
+        array_handler.array2vtk(self.points[:, 1])
+
+    def time_vtk2array(self, size):
+        array_handler.vtk2array(self.vtk_points)
+
+    def time_array2vtkCellArray(self, size):
+        array_handler.array2vtkCellArray(self.cells)
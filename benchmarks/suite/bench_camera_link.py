@@ -0,0 +1,82 @@
+"""
+Benchmarks for interacting with a grid of figures with linked cameras.
+
+The camera of the first figure is rotated as an interaction would, a
+few camera changes and a render per step.  The cameras are linked in
+two ways: as `mlab.sync_camera` does, by sharing the camera and
+rendering the figure on each camera trait change, and with a
+`CameraLink` updated once per step as the GUI event loop would.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+from mayavi import mlab
+from tvtk.pyface.camera_link import CameraLink
+
+from .common import get_engine, close_all
+
+
+class RenderCounter(object):
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, obj, event):
+        self.count += 1
+
+
+def sync_camera(reference, target):
+    """Link the cameras as `mlab.sync_camera` does but render right away
+    instead of on the event loop."""
+    reference.scene._renderer.sync_trait('active_camera',
+                                         target.scene._renderer)
+    target.scene._renderer.active_camera.on_trait_change(
+        lambda: target.scene.render())
+
+
+class LinkedCameras(object):
+    params = [['sync_camera', 'CameraLink'], [4, 16]]
+    param_names = ['link', 'figures']
+
+    def setup(self, link, n):
+        get_engine()
+        close_all()
+        figures = []
+        for i in range(n):
+            figures.append(mlab.figure(size=(200, 200)))
+            mlab.test_plot3d()
+        self.counter = RenderCounter()
+        for fig in figures:
+            fig.scene.render_window.add_observer('EndEvent', self.counter)
+        self.link = None
+        if link == 'sync_camera':
+            for fig in figures[1:]:
+                sync_camera(figures[0], fig)
+        else:
+            self.link = CameraLink(figures)
+            # The updates are made by `step` instead of the event loop.
+            self.link._schedule = lambda: None
+        self.scene = figures[0].scene
+
+    def teardown(self, link, n):
+        close_all()
+
+    def step(self):
+        scene = self.scene
+        camera = scene.camera
+        camera.azimuth(2.0)
+        camera.elevation(0.5)
+        camera.orthogonalize_view_up()
+        scene.renderer.reset_camera_clipping_range()
+        scene.render()
+        if self.link is not None:
+            # What the event loop does after the interaction event.
+            self.link.update()
+
+    def time_interaction_step(self, link, n):
+        self.step()
+
+    def track_renders_per_step(self, link, n):
+        self.counter.count = 0
+        for i in range(10):
+            self.step()
+        return self.counter.count/10.0
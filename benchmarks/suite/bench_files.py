@@ -0,0 +1,101 @@
+"""
+Benchmarks for the file readers, saving and loading visualizations and
+saving offscreen images.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from mayavi import mlab
+
+from .common import get_engine, get_example_data, new_figure, close_all
+
+
+class Readers(object):
+    params = ['cube.vti', 'pyramid_ug.vtu', 'uGridEx.vtk',
+              'SampleStructGrid.vtk', 'foot.mha', 'tiny.xyz', 'prism.neu',
+              'humanoid_tri.stla', 'caffeine.pdb']
+    param_names = ['file']
+    # Each call opens a new reader.
+    number = 1
+
+    def setup(self, fname):
+        self.fname = get_example_data(fname)
+        self.engine = get_engine()
+        new_figure()
+
+    def teardown(self, fname):
+        close_all()
+
+    def time_open(self, fname):
+        src = self.engine.open(self.fname)
+        src.update()
+
+
+def make_visualization():
+    new_figure()
+    x, y, z = np.mgrid[-5:5:32j, -5:5:32j, -5:5:32j]
+    s = np.sin(x*y*z)/(x*y*z)
+    src = mlab.pipeline.scalar_field(s)
+    mlab.pipeline.iso_surface(src, contours=4)
+    mlab.pipeline.image_plane_widget(src)
+    mlab.pipeline.outline(src)
+
+
+class SaveVisualization(object):
+    def setup(self):
+        self.engine = get_engine()
+        self.root = tempfile.mkdtemp()
+        self.fname = os.path.join(self.root, 'vis.mv2')
+        make_visualization()
+
+    def teardown(self):
+        close_all()
+        shutil.rmtree(self.root)
+
+    def time_save_visualization(self):
+        self.engine.save_visualization(self.fname)
+
+
+class LoadVisualization(object):
+    # Each call loads another copy of the visualization.
+    number = 1
+
+    def setup(self):
+        self.engine = get_engine()
+        self.root = tempfile.mkdtemp()
+        self.fname = os.path.join(self.root, 'vis.mv2')
+        make_visualization()
+        self.engine.save_visualization(self.fname)
+        close_all()
+
+    def teardown(self):
+        close_all()
+        shutil.rmtree(self.root)
+
+    def time_load_visualization(self):
+        self.engine.load_visualization(self.fname)
+
+
+class Savefig(object):
+    params = [[(400, 400), (1000, 1000)], ['png', 'jpg']]
+    param_names = ['size', 'format']
+
+    def setup(self, size, fmt):
+        self.root = tempfile.mkdtemp()
+        self.fname = os.path.join(self.root, 'image.%s'%fmt)
+        new_figure(size=size)
+        x, y = np.mgrid[-5:5:200j, -5:5:200j]
+        mlab.surf(np.sin(x*y)/(x*y))
+
+    def teardown(self, size, fmt):
+        close_all()
+        shutil.rmtree(self.root)
+
+    def time_savefig(self, size, fmt):
+        mlab.savefig(self.fname, size=size)
@@ -0,0 +1,60 @@
+"""
+Benchmarks for the latency and bandwidth of the frame server with a
+local client.
+
+A client connected over the loopback interface rotates the camera of an
+offscreen scene and waits for the frame showing each event.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import time
+
+from mayavi import mlab
+from mayavi.tools.frame_server import FrameServer, FrameClient
+
+from .common import new_figure, close_all
+
+
+class FrameServerEvents(object):
+    params = [(400, 300), (800, 600)]
+    param_names = ['size']
+
+    def setup(self, size):
+        new_figure(size=size)
+        mlab.test_contour3d()
+        self.server = server = FrameServer(port=0)
+        server.start()
+        self.client = FrameClient('127.0.0.1', server.port, server.token)
+        self.client.connect()
+        self.client.send_event(type='start')
+        self.event_to_frame()
+
+    def teardown(self, size):
+        self.client.close()
+        self.server.stop()
+        close_all()
+
+    def event_to_frame(self):
+        """Send a camera event and process it until the frame showing
+        it is received."""
+        client, server = self.client, self.server
+        event_id = client.send_event(type='rotate', dx=2.0)
+        t_end = time.time() + 10.0
+        while time.time() < t_end:
+            server.process(0.01)
+            while not client.frames.empty():
+                header, data = client.get_frame()
+                if header.get('event') == event_id:
+                    return
+        raise RuntimeError('No frame was received for event %d.'%event_id)
+
+    def time_event_to_frame(self, size):
+        self.event_to_frame()
+
+    def track_kb_per_frame(self, size):
+        client = self.client
+        received = client.bytes_received
+        for i in range(10):
+            self.event_to_frame()
+        return (client.bytes_received - received)/10.0/1024.0
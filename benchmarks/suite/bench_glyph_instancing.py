@@ -0,0 +1,60 @@
+"""
+Benchmarks comparing glyphs built by the `Glyph3D` filter with glyphs
+instanced at render time by the glyph mapper (`instanced=True`).
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import numpy as np
+
+from mayavi import mlab
+
+from .common import new_figure, close_all
+
+
+def make_glyphs(xyzs, mode):
+    x, y, z, s = xyzs
+    return mlab.points3d(x, y, z, s, scale_factor=0.01, mode='sphere',
+                         resolution=8, instanced=(mode == 'instanced'))
+
+
+class GlyphInstancing(object):
+    params = [['filter', 'instanced'], [10000, 100000]]
+    param_names = ['mode', 'points']
+    # Every call adds the glyphs to the figure.
+    number = 1
+
+    def setup(self, mode, n):
+        np.random.seed(0)
+        self.xyzs = np.random.random((4, n))
+        self.fig = new_figure(size=(400, 400))
+
+    def teardown(self, mode, n):
+        close_all()
+
+    def time_first_render(self, mode, n):
+        make_glyphs(self.xyzs, mode)
+        self.fig.scene.render()
+
+    def track_data_kb(self, mode, n):
+        """The memory of the poly data rendered by the mapper."""
+        g = make_glyphs(self.xyzs, mode)
+        return g.actor.mapper.input.actual_memory_size
+
+
+class GlyphRender(object):
+    params = [['filter', 'instanced'], [10000, 100000]]
+    param_names = ['mode', 'points']
+
+    def setup(self, mode, n):
+        np.random.seed(0)
+        self.fig = new_figure(size=(400, 400))
+        make_glyphs(np.random.random((4, n)), mode)
+        self.fig.scene.render()
+
+    def teardown(self, mode, n):
+        close_all()
+
+    def time_render(self, mode, n):
+        self.fig.scene.camera.azimuth(1)
+        self.fig.scene.render()
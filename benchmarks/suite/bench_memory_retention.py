@@ -0,0 +1,88 @@
+"""
+Benchmarks that repeatedly create and destroy visualizations and track
+the memory they retain.
+
+Every source, filter and module in the registry is run through
+create/update/destroy cycles with `mayavi.tests.retention`, 'figures'
+creates plots with mlab and destroys them with `mlab.close`.  The
+objects retained and the growth of the Python objects per cycle are
+tracked so that a leak shows up as a step in the history.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import numpy as np
+
+from mayavi import mlab
+from mayavi.tests.retention import RetentionHarness, get_registry_cases
+
+from .common import get_engine, close_all
+
+# The results of the sweep of each kind, the sweep is slow and is shared
+# by the track methods.
+_results = {}
+
+
+def figure_cases():
+    x, y, z = np.mgrid[-1:1:20j, -1:1:20j, -1:1:20j]
+    s = np.sin(x*y*z)
+
+    def points(engine):
+        mlab.points3d(x.ravel(), y.ravel(), z.ravel(), s.ravel(),
+                      scale_factor=0.05)
+
+    def surf(engine):
+        mlab.surf(x[:, :, 0], y[:, :, 0], s[:, :, 10])
+
+    def contour(engine):
+        mlab.contour3d(x, y, z, s, contours=4)
+
+    def flow(engine):
+        mlab.flow(x, y, z, -y, x, z)
+
+    return [('mlab.points3d', points), ('mlab.surf', surf),
+            ('mlab.contour3d', contour), ('mlab.flow', flow)]
+
+
+def close_figure(engine, scene):
+    mlab.close(scene)
+
+
+def get_results(engine, kind):
+    """Run the cases of the given kind once with the given engine and
+    return their results."""
+    if kind not in _results:
+        harness = RetentionHarness(engine=engine, cycles=5, warmup=2)
+        if kind == 'figures':
+            results = harness.run(figure_cases(), destroy=close_figure)
+        else:
+            results = harness.run(get_registry_cases(kinds=(kind,)))
+        _results[kind] = results
+    return _results[kind]
+
+
+class Retention(object):
+    params = ['sources', 'filters', 'modules', 'figures']
+    param_names = ['kind']
+    timeout = 600
+
+    def setup(self, kind):
+        self.engine = get_engine()
+        close_all()
+
+    def teardown(self, kind):
+        close_all()
+
+    def track_retained(self, kind):
+        """The pipeline and VTK objects retained per cycle by all cases."""
+        return sum(r.growth['retained'] + r.growth['vtk_retained']
+                   for r in get_results(self.engine, kind) if r.growth)
+
+    def track_python_objects(self, kind):
+        """The growth of the Python objects per cycle of all cases."""
+        return sum(r.growth['objects'] for r in get_results(self.engine, kind)
+                   if r.growth)
+
+    def track_failures(self, kind):
+        """The number of cases that retain objects or raise errors."""
+        return len([r for r in get_results(self.engine, kind) if r.failed])
@@ -0,0 +1,46 @@
+"""
+Benchmarks for creating visualizations with mlab.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import numpy as np
+
+from mayavi import mlab
+
+from .common import new_figure, close_all
+
+
+class MlabCreation(object):
+    params = [32, 64]
+    param_names = ['size']
+    # Every call adds to the figure so each repeat times a single call
+    # in a new figure.
+    number = 1
+
+    def setup(self, size):
+        n = size*1j
+        x, y, z = np.mgrid[-5:5:n, -5:5:n, -5:5:n]
+        self.s = np.sin(x*y*z)/(x*y*z)
+        self.xyz = np.random.random((4, size**2))
+        self.fig = new_figure()
+
+    def teardown(self, size):
+        close_all()
+
+    def time_surf(self, size):
+        mlab.surf(self.s[:, :, 0])
+        self.fig.scene.render()
+
+    def time_points3d(self, size):
+        x, y, z, s = self.xyz
+        mlab.points3d(x, y, z, s, scale_factor=0.05)
+        self.fig.scene.render()
+
+    def time_contour3d(self, size):
+        mlab.contour3d(self.s, contours=4)
+        self.fig.scene.render()
+
+    def time_volume(self, size):
+        mlab.pipeline.volume(mlab.pipeline.scalar_field(self.s))
+        self.fig.scene.render()
@@ -0,0 +1,66 @@
+"""
+Benchmarks for the per call overhead of the mlab helper functions.
+
+This times the factory bookkeeping (`Pipeline.store_kwargs` and
+`Pipeline.build_pipeline` metadata) with and without the per class
+metadata caches, and the creation of many small objects with one call
+per object and with a single `batch` call.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import numpy as np
+
+from mayavi import mlab
+from mayavi.tools import helper_functions, pipe_base
+
+from .common import new_figure, close_all
+
+
+def clear_caches():
+    """Clear the factory metadata caches, this is what every call did
+    before they were cached."""
+    helper_functions._all_traits.clear()
+    helper_functions._pipe_keywords.clear()
+    pipe_base._public_trait_names.clear()
+    pipe_base._adapts_components.clear()
+
+
+class FactoryMetadata(object):
+    params = ['uncached', 'cached']
+    param_names = ['caches']
+
+    def setup(self, caches):
+        self.pipeline = helper_functions.Points3d()
+        self.kwargs = dict(scale_factor=0.1, color=(1, 0, 0),
+                           mode='sphere')
+
+    def time_bookkeeping(self, caches):
+        if caches == 'uncached':
+            clear_caches()
+        pipeline = self.pipeline
+        pipeline.store_kwargs(self.kwargs)
+        for pipe in pipeline._pipeline:
+            helper_functions._get_pipe_keywords(pipe)
+
+
+class Points3dCreation(object):
+    params = ['calls', 'batch']
+    param_names = ['mode']
+    # Every call adds the objects to the figure.
+    number = 1
+
+    def setup(self, mode):
+        self.pts = [np.random.random((3, 10)) for i in range(100)]
+        self.kwargs = dict(scale_factor=0.1, color=(1, 0, 0))
+        new_figure()
+
+    def teardown(self, mode):
+        close_all()
+
+    def time_100_objects(self, mode):
+        if mode == 'batch':
+            mlab.points3d.batch(self.pts, **self.kwargs)
+        else:
+            for x, y, z in self.pts:
+                mlab.points3d(x, y, z, **self.kwargs)
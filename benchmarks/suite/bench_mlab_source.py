@@ -0,0 +1,75 @@
+"""
+Benchmarks for changing the data of the mlab sources with `set` and
+`reset`.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import numpy as np
+
+from mayavi import mlab
+
+from .common import new_figure, close_all
+
+
+class MlabSourceSet(object):
+    params = [['glyph', 'vertical_glyph', 'array', 'line', 'array2d',
+               'grid', 'triangular_mesh'], [50, 200]]
+    param_names = ['source', 'size']
+
+    def setup(self, source, size):
+        new_figure()
+        n = size
+        r = np.random.random
+        if source == 'glyph':
+            x, y, z, s = r((4, n*n))
+            self.src = mlab.points3d(x, y, z, s).mlab_source
+            self.data = dict(x=x[::-1], y=y, z=z, scalars=s[::-1])
+            x, y, z, s = r((4, 2*n*n))
+            self.new = dict(x=x, y=y, z=z, scalars=s)
+        elif source == 'vertical_glyph':
+            x, y, z, s = r((4, n*n))
+            self.src = mlab.barchart(x, y, z, s).mlab_source
+            self.data = dict(x=x[::-1], y=y, z=z, scalars=s[::-1])
+            x, y, z, s = r((4, 2*n*n))
+            self.new = dict(x=x, y=y, z=z, scalars=s)
+        elif source == 'array':
+            s = r((n, n, n//4 + 1))
+            self.src = mlab.pipeline.scalar_field(s).mlab_source
+            self.data = dict(scalars=s[::-1])
+            self.new = dict(scalars=r((n, n, n//2 + 1)))
+        elif source == 'line':
+            x, y, z, s = r((4, n*n))
+            self.src = mlab.plot3d(x, y, z, s).mlab_source
+            self.data = dict(x=x[::-1], y=y, z=z, scalars=s[::-1])
+            x, y, z, s = r((4, 2*n*n))
+            self.new = dict(x=x, y=y, z=z, scalars=s)
+        elif source == 'array2d':
+            s = r((n, n))
+            self.src = mlab.surf(s).mlab_source
+            self.data = dict(scalars=s[::-1])
+            self.new = dict(scalars=r((2*n, n)))
+        elif source == 'grid':
+            x, y = np.mgrid[0:1:n*1j, 0:1:n*1j]
+            z = r((n, n))
+            self.src = mlab.mesh(x, y, z).mlab_source
+            self.data = dict(x=x, y=y, z=z[::-1])
+            x, y = np.mgrid[0:1:2*n*1j, 0:1:n*1j]
+            self.new = dict(x=x, y=y, z=r((2*n, n)))
+        elif source == 'triangular_mesh':
+            x, y, z = r((3, n*n))
+            t = np.random.randint(0, n*n, (2*n*n, 3))
+            self.src = mlab.triangular_mesh(x, y, z, t).mlab_source
+            self.data = dict(x=x[::-1], y=y, z=z)
+            x, y, z = r((3, 2*n*n))
+            t = np.random.randint(0, 2*n*n, (4*n*n, 3))
+            self.new = dict(x=x, y=y, z=z, triangles=t)
+
+    def teardown(self, source, size):
+        close_all()
+
+    def time_set(self, source, size):
+        self.src.set(**self.data)
+
+    def time_reset(self, source, size):
+        self.src.reset(**self.new)
@@ -0,0 +1,106 @@
+"""
+Benchmarks for the overhead of script recording on trait changes.
+
+This uses the objects of the recorder tests, a parent holding children
+with a toy and a TVTK property, and changes their traits as an
+interactive session would.  It is timed without a recorder, with a
+registered recorder that is not recording, with the `Recorder` from
+`apptools.scripting` and with the `BufferedRecorder`.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+from traits.api import HasTraits, Float, Instance, Str, List
+from tvtk.api import tvtk
+from apptools.scripting.api import Recorder, set_recorder
+
+from mayavi.core.buffered_recorder import BufferedRecorder
+
+
+class Toy(HasTraits):
+    color = Str
+    type = Str
+
+
+class Child(HasTraits):
+    name = Str('child')
+    age = Float(10.0)
+    property = Instance(tvtk.Property, (), record=True)
+    toy = Instance(Toy, (), record=True)
+
+
+class Parent(HasTraits):
+    children = List(Child, record=True)
+    recorder = Instance(Recorder, record=False)
+
+
+def make_parent(n_children):
+    p = Parent()
+    p.children.extend([Child(name='child%d' % i) for i in range(n_children)])
+    return p
+
+
+def workload(p, n):
+    children = p.children
+    nc = len(children)
+    for i in range(n):
+        c = children[i % nc]
+        # Dragging a slider gives many changes of the same trait.
+        c.property.opacity = (i % 100)/100.0
+        c.property.opacity = (i % 100 + 0.5)/100.0
+        c.age = float(i)
+        if i % 10 == 0:
+            c.property.color = (i % 3/2.0, 0.5, 1.0)
+            c.toy.color = 'red' if i % 20 else 'blue'
+
+
+def make_recorder(kind):
+    if kind == 'BufferedRecorder':
+        return BufferedRecorder()
+    elif kind == 'none':
+        return None
+    return Recorder()
+
+
+class RecordChanges(object):
+    params = ['none', 'not_recording', 'Recorder', 'BufferedRecorder']
+    param_names = ['recorder']
+
+    def setup(self, kind):
+        self.parent = make_parent(10)
+        self.recorder = recorder = make_recorder(kind)
+        if recorder is not None:
+            set_recorder(recorder)
+            recorder.recording = kind != 'not_recording'
+            recorder.register(self.parent)
+
+    def teardown(self, kind):
+        if self.recorder is not None:
+            self.recorder.clear()
+            set_recorder(None)
+
+    def time_1000_changes(self, kind):
+        workload(self.parent, 1000)
+
+
+class RecordedCode(object):
+    params = ['Recorder', 'BufferedRecorder']
+    param_names = ['recorder']
+
+    def setup(self, kind):
+        parent = make_parent(10)
+        self.recorder = recorder = make_recorder(kind)
+        set_recorder(recorder)
+        recorder.recording = True
+        recorder.register(parent)
+        workload(parent, 1000)
+
+    def teardown(self, kind):
+        self.recorder.clear()
+        set_recorder(None)
+
+    def time_get_code(self, kind):
+        self.recorder.get_code()
+
+    def track_lines(self, kind):
+        return self.recorder.get_code().count('\n')
@@ -0,0 +1,83 @@
+"""
+Benchmarks for saving an offscreen scene to image files.
+
+The camera of an offscreen scene is rotated and a PNG file is saved
+per frame in three ways: the way scenes were saved before the capture
+pipeline was reused (a new `WindowToImageFilter` and writer and two
+renders per image), one `scene.save_png` call per frame and a single
+`scene.save_frames` call.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import os
+import shutil
+import tempfile
+
+from mayavi import mlab
+from tvtk.api import tvtk
+from tvtk.common import configure_input
+
+from .common import new_figure, close_all
+
+
+def old_save_png(scene, file_name):
+    """Save the scene as `TVTKScene.save_png` used to."""
+    w2if = tvtk.WindowToImageFilter(read_front_buffer=
+                                    not scene.off_screen_rendering)
+    if hasattr(w2if, 'magnification'):
+        w2if.magnification = scene.magnification
+    else:
+        w2if.scale = (scene.magnification,)*2
+    w2if.input = scene.render_window
+    ex = tvtk.PNGWriter()
+    ex.file_name = file_name
+    configure_input(ex, w2if)
+    rw = scene.render_window
+    # VTK 9 has no anti-aliasing frames.
+    has_aa = hasattr(rw, 'aa_frames')
+    if has_aa:
+        aa_frames = rw.aa_frames
+        rw.aa_frames = scene.anti_aliasing_frames
+    rw.render()
+    ex.update()
+    ex.write()
+    if has_aa:
+        rw.aa_frames = aa_frames
+    rw.render()
+
+
+def frames(scene, n):
+    camera = scene.camera
+    for i in range(n):
+        camera.azimuth(360.0/n)
+        yield i
+
+
+class SaveFrames(object):
+    params = ['old', 'save_png', 'save_frames']
+    param_names = ['mode']
+    number = 1
+
+    def setup(self, mode):
+        self.root = tempfile.mkdtemp()
+        self.pattern = os.path.join(self.root, 'frame%05d.png')
+        new_figure(size=(400, 400))
+        mlab.test_plot3d()
+        self.scene = mlab.gcf().scene
+        self.scene.render()
+
+    def teardown(self, mode):
+        close_all()
+        shutil.rmtree(self.root)
+
+    def time_20_frames(self, mode):
+        scene, pattern = self.scene, self.pattern
+        if mode == 'old':
+            for i in frames(scene, 20):
+                old_save_png(scene, pattern%i)
+        elif mode == 'save_png':
+            for i in frames(scene, 20):
+                scene.save_png(pattern%i)
+        else:
+            scene.save_frames(pattern, frames(scene, 20))
@@ -0,0 +1,82 @@
+"""
+Benchmarks for the memory and build time of many simple primitives.
+
+A scene of spheres, cones and cylinders is built once with a source and
+mapper per object as `tvtk.pyface.actors` used to, and once with the
+geometry shared through `tvtk.pyface.geometry_cache`.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import random
+
+from tvtk.api import tvtk
+from tvtk.common import configure_input_data
+from tvtk.pyface import actors, geometry_cache
+from tvtk.pyface.tvtk_scene import TVTKScene
+
+
+def unshared_actors(center, resolution):
+    """Create the actors with their own source as before."""
+    result = []
+    for cls, kw in ((tvtk.SphereSource, dict(theta_resolution=resolution,
+                                             phi_resolution=resolution)),
+                    (tvtk.ConeSource, dict(resolution=resolution)),
+                    (tvtk.CylinderSource, dict(resolution=resolution))):
+        source = cls(center=center, **kw)
+        source.update()
+        mapper = tvtk.PolyDataMapper()
+        configure_input_data(mapper, source.output)
+        result.append(tvtk.Actor(mapper=mapper))
+    return result
+
+
+def shared_actors(center, resolution):
+    return [actors.sphere_actor(center=center, resolution=resolution),
+            actors.cone_actor(center=center, resolution=resolution),
+            actors.cylinder_actor(center=center, resolution=resolution)]
+
+
+class SharedGeometry(object):
+    params = ['unshared', 'shared']
+    param_names = ['mode']
+    # Every call builds a new scene.
+    number = 1
+
+    def setup(self, mode):
+        geometry_cache.clear()
+        random.seed(0)
+        self.centers = [(random.random()*10, random.random()*10,
+                         random.random()*10) for i in range(200)]
+        self.factory = shared_actors if mode == 'shared' else \
+            unshared_actors
+        self.scene = TVTKScene(off_screen_rendering=True)
+
+    def teardown(self, mode):
+        self.scene.close()
+        geometry_cache.clear()
+
+    def build(self):
+        actor_list = []
+        for c in self.centers:
+            actor_list.extend(self.factory(c, 24))
+        self.scene.add_actors(actor_list)
+        return actor_list
+
+    def time_build(self, mode):
+        self.build()
+
+    def time_build_and_render(self, mode):
+        self.build()
+        self.scene.render()
+
+    def track_kb_per_object(self, mode):
+        """The memory of the distinct polydata used per object."""
+        actor_list = self.build()
+        seen = {}
+        for a in actor_list:
+            pd = a.mapper.input
+            # Keep the wrapper alive so its id is not reused.
+            seen[id(pd)] = pd
+        total = sum(pd.actual_memory_size for pd in seen.values())
+        return float(total)/len(actor_list)
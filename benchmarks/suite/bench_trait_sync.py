@@ -0,0 +1,143 @@
+"""
+Benchmarks for the Python callbacks made to keep TVTK traits in sync
+while rendering.
+
+Every TVTK object observes the `ModifiedEvent` of its VTK object through
+`tvtk.messenger`, so `Messenger.send` is called for each modification
+made while the pipeline executes or renders.  An offscreen scene is
+rendered and these calls are counted, and sending an event is timed the
+way `Messenger.send` used to do it and the way it does now.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import numpy as np
+
+from mayavi import mlab
+from tvtk import messenger, tvtk_base
+
+from .common import new_figure, close_all
+
+
+def old_send(self, source, event, *args, **kw_args):
+    """Send an event as `Messenger.send` used to."""
+    try:
+        sigs = self._get_signals(source)
+    except (messenger.MessengerError, KeyError):
+        return
+    events = self._catch_all[:]
+    if event not in events:
+        events.append(event)
+    for evt in events:
+        if evt in sigs:
+            slots = sigs[evt]
+            for key in list(slots.keys()):
+                obj, meth = slots[key]
+                if obj: # instance method
+                    inst = obj()
+                    if inst:
+                        getattr(inst, meth)(source, event, *args, **kw_args)
+                    else:
+                        # Oops, dead reference.
+                        del slots[key]
+                else: # normal function
+                    meth(source, event, *args, **kw_args)
+
+
+class Observer(object):
+    """Stands for a TVTK object observing its VTK object."""
+    def update(self, obj, event, *args, **kw):
+        pass
+
+
+class CallCounter(object):
+    """Count the calls to `Messenger.send` and
+    `TVTKBase.update_traits`."""
+
+    def __init__(self):
+        self.sends = 0
+        self.updates = 0
+        self._saved = []
+
+    def start(self):
+        counter = self
+        send = messenger.Messenger.send
+        update_traits = tvtk_base.TVTKBase.update_traits
+
+        def counted_send(self, *args, **kw):
+            counter.sends += 1
+            return send(self, *args, **kw)
+
+        def counted_update_traits(self, *args, **kw):
+            counter.updates += 1
+            return update_traits(self, *args, **kw)
+
+        self._saved = [(messenger.Messenger, 'send', send),
+                       (tvtk_base.TVTKBase, 'update_traits', update_traits)]
+        messenger.Messenger.send = counted_send
+        tvtk_base.TVTKBase.update_traits = counted_update_traits
+
+    def stop(self):
+        for klass, name, func in self._saved:
+            setattr(klass, name, func)
+        self._saved = []
+
+
+class TraitSyncRender(object):
+    def setup(self):
+        fig = new_figure(size=(400, 400))
+        np.random.seed(0)
+        for i in range(50):
+            x, y, z = np.random.random((3, 20))
+            mlab.plot3d(x + i, y, z, tube_radius=0.02)
+        self.scene = scene = fig.scene
+        scene.reset_zoom()
+        scene.render()
+
+    def teardown(self):
+        close_all()
+
+    def render(self):
+        # Move the camera so the renderer has something to do.
+        self.scene.camera.azimuth(1)
+        self.scene.render()
+
+    def time_render(self):
+        self.render()
+
+    def track_sends_per_render(self):
+        return self.count()[0]
+
+    def track_updates_per_render(self):
+        return self.count()[1]
+
+    def count(self):
+        counter = CallCounter()
+        counter.start()
+        try:
+            for i in range(10):
+                self.render()
+        finally:
+            counter.stop()
+        return counter.sends/10.0, counter.updates/10.0
+
+
+class MessengerSend(object):
+    params = ['old', 'new']
+    param_names = ['send']
+
+    def setup(self, send):
+        self.messenger = messenger.Messenger()
+        self.send = old_send if send == 'old' else messenger.Messenger.send
+        self.source = Observer()
+        self.observer = Observer()
+        self.messenger.connect(self.source, 'ModifiedEvent',
+                               self.observer.update)
+
+    def teardown(self, send):
+        self.messenger.disconnect(self.source)
+
+    def time_1000_sends(self, send):
+        m, source, send = self.messenger, self.source, self.send
+        for i in range(1000):
+            send(m, source, 'ModifiedEvent')
@@ -0,0 +1,43 @@
+"""
+Helpers shared by the benchmarks.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import os
+
+from mayavi import mlab
+from mayavi.core.off_screen_engine import OffScreenEngine
+
+_engine = []
+
+
+def get_engine():
+    """Return a started offscreen engine shared by all the benchmarks and
+    used by mlab.
+    """
+    if len(_engine) == 0:
+        mlab.options.offscreen = True
+        engine = OffScreenEngine()
+        engine.start()
+        mlab.set_engine(engine)
+        _engine.append(engine)
+    return _engine[0]
+
+
+def new_figure(size=(400, 350)):
+    """Close all the figures and return a new one."""
+    get_engine()
+    mlab.close(all=True)
+    return mlab.figure(size=size)
+
+
+def close_all():
+    mlab.close(all=True)
+
+
+def get_example_data(fname):
+    """Return the path to a file in the mayavi test data."""
+    import mayavi.tests
+    return os.path.join(os.path.dirname(mayavi.tests.__file__), 'data',
+                        fname)
@@ -11,11 +11,12 @@ a convenient option to create "filled contours".
 # License: BSD Style.
 
 # Standard library imports.
+from collections import OrderedDict
 import numpy
 
 # Enthought library imports.
 from traits.api import Instance, List, Tuple, Bool, Range, \
-                                 Float, Property
+                                 Float, Property, Any, Int
 from tvtk.api import tvtk
 
 # Local imports.
@@ -24,6 +25,64 @@ from mayavi.core.common import error
 from mayavi.components.common \
      import get_module_source, convert_to_poly_data
 
+# The number of cells along each side of the bricks used by the cell
+# range index.
+BRICK_SIZE = 16
+
+
+######################################################################
+# Utility functions.
+######################################################################
+def _brick_reduce(arr, axis, brick, ufunc):
+    """Reduce `arr` along `axis` over bricks of `brick` cells, i.e.
+    `brick` + 1 points, since adjacent bricks share a layer of points.
+    """
+    n = arr.shape[axis]
+    starts = numpy.arange(0, max(n - 1, 1), brick)
+    result = ufunc.reduceat(arr, starts, axis=axis)
+    if len(starts) > 1:
+        # Include the first layer of points of the next brick.
+        shared = numpy.take(arr, starts[1:], axis=axis)
+        head = [slice(None)]*arr.ndim
+        head[axis] = slice(0, len(starts) - 1)
+        head = tuple(head)
+        result[head] = ufunc(result[head], shared)
+    return result
+
+
+def compute_brick_ranges(scalars, dims, brick=BRICK_SIZE):
+    """Given the point `scalars` of an image of dimensions `dims`,
+    return the minimum and maximum of the scalars over each brick of
+    `brick` cells as two arrays indexed as [z, y, x].
+    """
+    arr = numpy.reshape(scalars, dims[::-1])
+    lo, hi = arr, arr
+    for axis in range(3):
+        lo = _brick_reduce(lo, axis, brick, numpy.minimum)
+        hi = _brick_reduce(hi, axis, brick, numpy.maximum)
+    return lo, hi
+
+
+def get_active_extent(ranges, values, dims, brick=BRICK_SIZE):
+    """Return the point extent of the image covering all the bricks
+    that contain any of the given contour `values`, or None if there
+    are none.  `ranges` is the result of `compute_brick_ranges`.
+    """
+    lo, hi = ranges
+    active = numpy.zeros(lo.shape, dtype=bool)
+    for value in values:
+        active |= (lo <= value) & (value <= hi)
+    idx = numpy.nonzero(active)
+    if len(idx[0]) == 0:
+        return None
+    extent = []
+    # The indices are in [z, y, x] order.
+    for axis in (2, 1, 0):
+        n = dims[2 - axis]
+        extent.append(int(idx[axis].min())*brick)
+        extent.append(min((int(idx[axis].max()) + 1)*brick, n - 1))
+    return tuple(extent)
+
 
 ######################################################################
 # `Contour` class.
@@ -89,6 +148,19 @@ class Contour(Component):
     auto_update_range = Bool(True,
                              desc='if the contour range is updated automatically')
 
+    # Use an index of the scalar range of the cells to speed up
+    # repeated contouring of the same data.  For ImageData inputs a
+    # min/max index of bricks of cells restricts the contouring to the
+    # bricks containing the contour values.  For other inputs a VTK
+    # scalar tree (span space if available) is used.  The index is
+    # built once for each modification of the input.
+    use_index = Bool(False, desc='if a cell range index is used to '\
+                     'speed up repeated contouring')
+
+    # The number of recently generated surfaces to cache.  Changing the
+    # contours back to a cached set of values reuses the surface.
+    cache_size = Range(0, 1000, 0, desc='the number of surfaces cached')
+
     ########################################
     # The component's view
 
@@ -142,13 +214,29 @@ class Contour(Component):
     _fill_cont_filt = Instance(tvtk.BandedPolyDataContourFilter, args=(),
                                kw={'clipping': 1, 'scalar_mode':'value'})
 
+    # Extracts the bricks containing the contours for ImageData inputs.
+    _voi = Instance(tvtk.ExtractVOI, args=())
+
+    # The brick ranges of the input and the input modification time
+    # they were computed for.
+    _brick_ranges = Any
+    _index_mtime = Int(-1)
+
+    # The cached surfaces keyed on the input modification time, filled
+    # contour flag and contour values.
+    _cache = Instance(OrderedDict, args=())
+
+    # The output when caching surfaces.
+    _cached_output = Instance(tvtk.PolyData, args=())
+
     ######################################################################
     # `object` interface
     ######################################################################
     def __get_pure_state__(self):
         d = super(Contour, self).__get_pure_state__()
         # These traits are dynamically created.
-        for name in ('_data_min', '_data_max', '_default_contour'):
+        for name in ('_data_min', '_data_max', '_default_contour',
+                     '_brick_ranges', '_cache', '_cached_output'):
             d.pop(name, None)
 
         return d
@@ -176,7 +264,7 @@ class Contour(Component):
             self.contours = [(cr[0] + cr[1])/2]
             self.minimum_contour = cr[0]
             self.maximum_contour = cr[1]
-        self.outputs = [cf]
+        self._set_outputs()
 
     def update_data(self):
         """Override this method to do what is necessary when upstream
@@ -186,15 +274,21 @@ class Contour(Component):
         sends a `data_changed` event.
         """
         self._update_ranges()
-        # Propagage the data changed event.
-        self.data_changed = True
+        if self.use_index or self.cache_size > 0:
+            self._execute()
+        else:
+            # Propagage the data changed event.
+            self.data_changed = True
 
     def has_output_port(self):
-        """ The contour filter has an output port."""
-        return True
+        """ The contour filter has an output port unless surfaces are
+        cached."""
+        return self.cache_size == 0
 
     def get_output_object(self):
         """ Returns the output port."""
+        if self.cache_size > 0:
+            return self._cached_output
         return self.contour_filter.output_port
 
     ######################################################################
@@ -208,8 +302,7 @@ class Contour(Component):
                                  list_event.index)
         if len(added) == len(removed):
             cf.set_value(index, added[0])
-            cf.update()
-            self.data_changed = True
+            self._execute()
         else:
             self._contours_changed(self.contours)
 
@@ -220,8 +313,7 @@ class Contour(Component):
         cf.number_of_contours = len(values)
         for i, x in enumerate(values):
             cf.set_value(i, x)
-        cf.update()
-        self.data_changed = True
+        self._execute()
 
     def _update_ranges(self):
         # Here we get the module's source since the input of this
@@ -282,15 +374,18 @@ class Contour(Component):
             self.contour_filter.generate_values(self.number_of_contours,
                                                 min(minc, maxc),
                                                 max(minc, maxc))
-            self.data_changed = True
+            if self.use_index or self.cache_size > 0:
+                self._execute()
+            else:
+                self.data_changed = True
 
     def _filled_contours_changed(self, val):
         if not self._has_input():
             return
-        cf = self._set_contour_input()
+        self._set_contour_input()
         # This will trigger a change.
         self._auto_contours_changed(self.auto_contours)
-        self.outputs = [cf]
+        self._set_outputs()
 
     def _get_contour_filter(self):
         if self.filled_contours:
@@ -307,11 +402,118 @@ class Contour(Component):
         if self.filled_contours:
             inp = convert_to_poly_data(inp)
             self.configure_input(cf, inp)
+        elif self._use_brick_index():
+            self.configure_input(self._voi, inp)
+            cf.input_connection = self._voi.output_port
+            self._update_voi()
         else:
             self.configure_input(cf, inp)
+        self._setup_scalar_tree()
         cf.update()
         return cf
 
+    def _set_outputs(self):
+        if self.cache_size > 0:
+            self._execute()
+            self.outputs = [self._cached_output]
+        else:
+            self.outputs = [self.contour_filter]
+
+    def _get_input_dataset(self):
+        return self.inputs[0].get_output_dataset()
+
+    def _use_brick_index(self):
+        """Returns if the brick index is used for the current input."""
+        if not self.use_index or self.filled_contours:
+            return False
+        dataset = self._get_input_dataset()
+        return dataset is not None and dataset.is_a('vtkImageData') and \
+            dataset.point_data.scalars is not None
+
+    def _setup_scalar_tree(self):
+        cf = self._cont_filt
+        use_tree = self.use_index and not self._use_brick_index()
+        cf.use_scalar_tree = use_tree
+        if use_tree and cf.scalar_tree is None:
+            if hasattr(tvtk, 'SpanSpace'):
+                cf.scalar_tree = tvtk.SpanSpace()
+            else:
+                cf.scalar_tree = tvtk.SimpleScalarTree()
+
+    def _get_contour_values(self):
+        cf = self.contour_filter
+        return tuple([cf.get_value(i)
+                      for i in range(cf.number_of_contours)])
+
+    def _update_voi(self):
+        """Restrict the extracted region of the input to the bricks
+        containing the current contour values.
+        """
+        dataset = self._get_input_dataset()
+        if dataset.m_time != self._index_mtime:
+            sc = dataset.point_data.scalars.to_array()
+            if sc.ndim > 1:
+                sc = sc[:, 0]
+            self._brick_ranges = compute_brick_ranges(sc,
+                                                      dataset.dimensions)
+            self._index_mtime = dataset.m_time
+        dims = dataset.dimensions
+        e0 = dataset.extent
+        extent = get_active_extent(self._brick_ranges,
+                                   self._get_contour_values(), dims)
+        if extent is None:
+            # A single point, which has no contours.
+            extent = (0, 0, 0, 0, 0, 0)
+        # Offset by the start of the input extent.
+        extent = [x + e0[2*(i//2)] for i, x in enumerate(extent)]
+        self._voi.voi = extent
+
+    def _execute(self):
+        """Update the contours, using the index and the cache of
+        surfaces if they are enabled.
+        """
+        if not self._has_input():
+            return
+        cf = self.contour_filter
+        dataset = self._get_input_dataset()
+        mtime = dataset.m_time if dataset is not None else -1
+        cache = self._cache
+        if self.cache_size > 0:
+            key = (mtime, self.filled_contours, self._get_contour_values())
+            # Drop the surfaces of older data.
+            for k in list(cache.keys()):
+                if k[0] != mtime:
+                    del cache[k]
+            if key in cache:
+                surface = cache.pop(key)
+                cache[key] = surface
+                self._cached_output.shallow_copy(surface)
+                self.data_changed = True
+                return
+        if self._use_brick_index():
+            self._update_voi()
+        cf.update()
+        if self.cache_size > 0:
+            surface = tvtk.PolyData()
+            surface.deep_copy(cf.output)
+            cache[key] = surface
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+            self._cached_output.shallow_copy(surface)
+        self.data_changed = True
+
+    def _use_index_changed(self):
+        if self._has_input():
+            self._set_contour_input()
+            self._execute()
+
+    def _cache_size_changed(self, old, new):
+        cache = self._cache
+        while len(cache) > new:
+            cache.popitem(last=False)
+        if self._has_input() and (old == 0 or new == 0):
+            self._set_outputs()
+
     def _has_input(self):
         """Returns if this component has a valid input."""
         if (len(self.inputs) > 0)  and \
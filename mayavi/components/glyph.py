@@ -8,6 +8,7 @@ input point data.
 # License: BSD Style.
 
 # Enthought library imports.
+from vtk.util import vtkConstants
 from traits.api import Instance, Trait, Bool
 from traits.api import Enum
 from traitsui.api import View, Group, Item
@@ -73,6 +74,18 @@ class Glyph(Component):
     # The Glyph3D instance.
     glyph = Instance(tvtk.Object, allow_none=False, record=True)
 
+    # Instance the glyph source at each point at render time using a
+    # glyph mapper instead of building the combined glyph geometry with
+    # the `glyph` filter.  This uses far less memory for large numbers
+    # of points.  Only supported for vector glyphs, the settings of
+    # `glyph` are mirrored on the mapper.
+    instanced = Bool(False, desc='if the glyphs are instanced '\
+                     'by the mapper at render time')
+
+    # The glyph mapper used when `instanced` is True.
+    glyph_mapper = Instance(tvtk.Glyph3DMapper, args=(),
+                            kw={'use_lookup_table_scalar_range': True})
+
     # The Source to use for the glyph.  This is chosen from
     # `self._glyph_list` or `self.glyph_dict`.
     glyph_source = Instance(glyph_source.GlyphSource,
@@ -94,6 +107,17 @@ class Glyph(Component):
     # Used for optimization.
     _updating = Bool(False)
 
+    # Makes the (s, s, s) array of the scalars the glyph mapper scales
+    # the instanced glyphs by when scaling by scalar.  The mapper would
+    # use the absolute value of the scalars otherwise.  The result is
+    # also set as the active vectors of its output, the mapper is given
+    # the names of the arrays it uses.
+    _scale_array = Instance(tvtk.ArrayCalculator, args=(),
+                            kw={'attribute_type': 'point_data',
+                                'function': 's*iHat + s*jHat + s*kHat',
+                                'result_array_name': 'GlyphScale',
+                                'result_array_type': vtkConstants.VTK_FLOAT})
+
     ########################################
     # View related traits.
 
@@ -105,7 +129,9 @@ class Glyph(Component):
                             ),
                       label='Masking',
                       ),
-                Group(Group(Item(name='scale_mode',
+                Group(Group(Item(name='instanced',
+                                 enabled_when='glyph_type == "vector"'),
+                            Item(name='scale_mode',
                                  enabled_when='show_scale_mode',
                                  visible_when='show_scale_mode'),
                             Item(name='color_mode',
@@ -134,7 +160,8 @@ class Glyph(Component):
     ######################################################################
     def __get_pure_state__(self):
         d = super(Glyph, self).__get_pure_state__()
-        for attr in ('module', '_updating'):
+        for attr in ('module', '_updating', 'glyph_mapper',
+                     '_scale_array'):
             d.pop(attr, None)
         return d
 
@@ -179,7 +206,7 @@ class Glyph(Component):
         self._scale_mode_changed(self.scale_mode)
 
         # Set our output.
-        tvtk_common.configure_outputs(self, self.glyph)
+        self._set_outputs()
         self.pipeline_changed = True
 
     def update_data(self):
@@ -190,6 +217,7 @@ class Glyph(Component):
         sends a `data_changed` event.
         """
         self._scale_mode_changed(self.scale_mode)
+        self._update_glyph_mapper()
         self.data_changed = True
 
     def render(self):
@@ -212,26 +240,171 @@ class Glyph(Component):
 
     def has_output_port(self):
         """ The filter has an output port."""
+        if self._use_glyph_mapper() and not self.mask_input_points and \
+                not self._use_scale_array():
+            return self.inputs[0].has_output_port()
         return True
 
     def get_output_object(self):
         """ Returns the output port."""
+        if self._use_glyph_mapper():
+            if self._use_scale_array():
+                return self._scale_array.output_port
+            if self.mask_input_points:
+                return self.mask_points.output_port
+            return self.inputs[0].get_output_object()
         return self.glyph.output_port
 
+    ######################################################################
+    # `Glyph` interface
+    ######################################################################
+    def configure_actor(self, actor):
+        """Set the mapper of the given `Actor` component to the glyph
+        mapper when the glyphs are instanced and to a plain poly data
+        mapper otherwise.
+        """
+        if actor is None:
+            return
+        old = actor.mapper
+        if self.instanced:
+            if old is self.glyph_mapper:
+                return
+            new = self.glyph_mapper
+        else:
+            if not isinstance(old, tvtk.Glyph3DMapper):
+                return
+            new = tvtk.PolyDataMapper(use_lookup_table_scalar_range=1)
+        new.scalar_visibility = old.scalar_visibility
+        actor.mapper = new
+
     ######################################################################
     # Non-public methods.
     ######################################################################
+    def _use_glyph_mapper(self):
+        return self.instanced and (self.glyph_type == 'vector') and \
+               (len(self.inputs) > 0) and (len(self.inputs[0].outputs) > 0)
+
+    def _use_scale_array(self):
+        """Return True if the glyph mapper scales by the `_scale_array`
+        of the scalars."""
+        if not self._use_glyph_mapper() or \
+           self.scale_mode != 'scale_by_scalar':
+            return False
+        scalars = self.inputs[0].get_output_dataset().point_data.scalars
+        # Unnamed scalars cannot be used by the mapper.
+        return scalars is not None and scalars.name is not None
+
+    def _set_scale_array_input(self, name):
+        """Make the `_scale_array` from the named scalars."""
+        calc = self._scale_array
+        if calc.number_of_scalar_arrays != 1 or \
+           calc.get_scalar_array_name(0) != name:
+            calc.remove_all_variables()
+            calc.add_scalar_variable('s', name, 0)
+
+    def _update_glyph_mapper(self):
+        """Mirror the settings of the `glyph` filter and the scale and
+        color modes on the glyph mapper.
+        """
+        if not self._use_glyph_mapper():
+            return
+        calc = self._scale_array
+        uses_calc = len(self.outputs) > 0 and \
+                    self.outputs[0] is calc.output_port
+        if uses_calc != self._use_scale_array():
+            # The scale mode or the scalars changed, this updates the
+            # glyph mapper once its input is set.
+            self._set_outputs()
+            return
+        glyph = self.glyph
+        gm = self.glyph_mapper
+        pd = self.inputs[0].get_output_dataset().point_data
+        scalars = pd.scalars
+        vectors = pd.vectors
+        if glyph.vector_mode == 'use_normal':
+            vectors = pd.normals
+        s_name = None if scalars is None else scalars.name
+        v_name = None if vectors is None else vectors.name
+
+        self._updating = True
+        try:
+            gm.set(scaling=glyph.scaling, scale_factor=glyph.scale_factor,
+                   range=glyph.range, clamping=glyph.clamping)
+            mode = self.scale_mode
+            if mode == 'scale_by_scalar' and s_name is not None:
+                # Scaling by the components of (s, s, s) scales, clamps
+                # and flips the glyphs of negative scalars like the
+                # `glyph` filter.
+                self._set_scale_array_input(s_name)
+                gm.scale_mode = 'scale_by_vector_components'
+                gm.set_scale_array(calc.result_array_name)
+            elif mode == 'scale_by_vector' and v_name is not None:
+                gm.scale_mode = 'scale_by_magnitude'
+                gm.set_scale_array(v_name)
+            elif mode == 'scale_by_vector_components' and \
+                     v_name is not None:
+                gm.scale_mode = 'scale_by_vector_components'
+                gm.set_scale_array(v_name)
+            else:
+                gm.scale_mode = 'no_data_scaling'
+
+            orient = (glyph.vector_mode != 'vector_rotation_off') and \
+                     (v_name is not None)
+            gm.orient = orient
+            if orient:
+                gm.set_orientation_array(v_name)
+
+            # The vectors are colored by magnitude through the lookup
+            # table, the scalars are used as is.
+            if self.color_mode == 'color_by_vector' and v_name is not None:
+                gm.scalar_mode = 'use_point_field_data'
+                gm.select_color_array(v_name)
+            else:
+                gm.scalar_mode = 'default'
+        finally:
+            self._updating = False
+        self.render()
+
+    def _set_outputs(self):
+        if self._use_glyph_mapper():
+            # The glyph mapper is fed the (masked) points directly.
+            if self.mask_input_points:
+                points = self.mask_points
+            else:
+                points = self.inputs[0].outputs[0]
+            if self._use_scale_array():
+                calc = self._scale_array
+                tvtk_common.configure_input(calc, points)
+                pd = self.inputs[0].get_output_dataset().point_data
+                self._set_scale_array_input(pd.scalars.name)
+                calc.update()
+                tvtk_common.configure_outputs(self, calc)
+            elif self.mask_input_points:
+                tvtk_common.configure_outputs(self, points)
+            else:
+                self.outputs = [points]
+            self._update_glyph_mapper()
+        else:
+            tvtk_common.configure_outputs(self, self.glyph)
+
+    def _instanced_changed(self):
+        self.update_pipeline()
+
     def _update_source(self):
         self.configure_source_data(self.glyph, self.glyph_source.outputs[0])
+        self.configure_source_data(self.glyph_mapper,
+                                   self.glyph_source.outputs[0])
 
     def _glyph_source_changed(self, value):
         self.configure_source_data(self.glyph, value.outputs[0])
+        self.configure_source_data(self.glyph_mapper, value.outputs[0])
 
     def _color_mode_changed(self, value):
         if len(self.inputs) == 0:
             return
         if value != 'no_coloring':
             self.glyph.color_mode = value
+        self._update_glyph_mapper()
 
     def _color_mode_tensor_changed(self, value):
         if len(self.inputs) == 0:
@@ -260,6 +433,7 @@ class Glyph(Component):
                 glyph.range = tuple(mm.scalar_lut_manager.data_range)
             else:
                 glyph.range = tuple(mm.vector_lut_manager.data_range)
+            self._update_glyph_mapper()
         finally:
             self._updating = False
             self.render()
@@ -274,7 +448,11 @@ class Glyph(Component):
             self.configure_connection(self.glyph, mask)
         else:
             self.configure_connection(self.glyph, inputs[0])
-        self.glyph.update()
+        if self._use_glyph_mapper():
+            # Do not build the glyph geometry that is not rendered.
+            self._set_outputs()
+        else:
+            self.glyph.update()
 
     def _glyph_type_changed(self, value):
         if self.glyph_type == 'vector':
@@ -283,6 +461,11 @@ class Glyph(Component):
             self.glyph = tvtk.TensorGlyph(scale_factor=0.1)
             self.show_scale_mode = False
         self.glyph.on_trait_change(self.render)
+        self.glyph.on_trait_change(self._on_glyph_trait_changed)
+
+    def _on_glyph_trait_changed(self):
+        if not self._updating:
+            self._update_glyph_mapper()
 
     def _scene_changed(self, old, new):
         super(Glyph, self)._scene_changed(old, new)
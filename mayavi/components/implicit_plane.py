@@ -5,12 +5,13 @@
 # License: BSD Style.
 
 # Enthought library imports.
-from traits.api import Instance, Bool, Property
+from traits.api import Instance, Bool, Property, Range, Any
 from traitsui.api import View, Group, Item, InstanceEditor
 from tvtk.api import tvtk
 
 # Local imports.
 from mayavi.core.component import Component
+from mayavi.components.update_throttle import UpdateThrottle
 
 VTK_VER = tvtk.Version().vtk_version
 
@@ -18,7 +19,7 @@ VTK_VER = tvtk.Version().vtk_version
 ######################################################################
 # `ImplicitPlane` class.
 ######################################################################
-class ImplicitPlane(Component):
+class ImplicitPlane(Component, UpdateThrottle):
     # The version of this class.  Used for persistence.
     __version__ = 0
 
@@ -37,6 +38,21 @@ class ImplicitPlane(Component):
                          'normal':(0,0,1)},
                      record=True)
 
+    # The maximum number of times per second the plane is updated while
+    # the widget is dragged, zero for no limit.  The last skipped update
+    # is done once the wait is over and the plane is always updated when
+    # the interaction ends.
+    max_update_rate = Range(0.0, 100.0, 0.0,
+                            desc='the maximum number of updates per '
+                            'second while interacting (0 for no limit)')
+
+    # If larger than one, structured inputs are subsampled with this
+    # stride while the widget is dragged, giving a coarse preview.  The
+    # full resolution input is restored when the interaction ends.
+    preview_stride = Range(1, 16, 1,
+                           desc='the stride of the input used while '
+                           'interacting')
+
     # Convenience property for the normal delegated to the widget.
     normal = Property
 
@@ -49,6 +65,9 @@ class ImplicitPlane(Component):
     _first = Bool(True)
     _busy = Bool(False)
 
+    # The filter subsampling the input during the interaction.
+    _preview = Any
+
     ########################################
     # View related traits.
 
@@ -78,9 +97,21 @@ class ImplicitPlane(Component):
 
     view = View(Group(Item(name='widget', style='custom',
                            editor=InstanceEditor(view=View(_widget_group))),
-                      show_labels=False)
+                      show_labels=False),
+                Group(Item(name='max_update_rate'),
+                      Item(name='preview_stride'))
                 )
 
+    ######################################################################
+    # `Base` interface
+    ######################################################################
+    def __get_pure_state__(self):
+        d = super(ImplicitPlane, self).__get_pure_state__()
+        for attr in ('_interacting', '_last_update', '_pending',
+                     '_preview', '_timer'):
+            d.pop(attr, None)
+        return d
+
     ######################################################################
     # `Component` interface
     ######################################################################
@@ -109,6 +140,7 @@ class ImplicitPlane(Component):
         if len(self.inputs) == 0 or len(self.inputs[0].outputs) == 0:
             return
         inp = self.inputs[0].outputs[0]
+        self._preview = None
         w = self.widget
         self.configure_input(w, inp)
         if self._first:
@@ -169,10 +201,58 @@ class ImplicitPlane(Component):
 
     def _on_interaction_event(self, obj, event):
         if not self._busy:
+            if self._interacting and self._throttle():
+                return
+            self._pending = False
             self._busy = True
             self.update_plane()
             self._busy = False
 
+    def _throttled_update(self):
+        self._pending = False
+        self._busy = True
+        self.update_plane()
+        self._busy = False
+
+    def _on_start_interaction(self, obj, event):
+        self._start_throttle()
+        if self.preview_stride > 1:
+            self._start_preview()
+
+    def _on_end_interaction(self, obj, event):
+        self._interacting = False
+        self._stop_timer()
+        if self._preview is not None:
+            self._preview = None
+            if len(self.inputs) > 0 and len(self.inputs[0].outputs) > 0:
+                # Setting the outputs updates everything downstream.
+                self.widget.get_plane(self.plane)
+                self.outputs = [self.inputs[0].outputs[0]]
+        elif self._pending:
+            self.update_plane()
+        self._pending = False
+        self.render()
+
+    def _start_preview(self):
+        """Switch the output to a subsampled copy of a structured
+        input.  Other inputs are not changed.
+        """
+        if len(self.inputs) == 0 or len(self.inputs[0].outputs) == 0:
+            return
+        dataset = self.inputs[0].get_output_dataset()
+        if dataset.is_a('vtkImageData'):
+            f = tvtk.ExtractVOI()
+        elif dataset.is_a('vtkStructuredGrid'):
+            f = tvtk.ExtractGrid()
+        elif dataset.is_a('vtkRectilinearGrid'):
+            f = tvtk.ExtractRectilinearGrid()
+        else:
+            return
+        f.sample_rate = (self.preview_stride,)*3
+        self.configure_connection(f, self.inputs[0])
+        self._preview = f
+        self.outputs = [f]
+
     def _on_normal_set(self):
         w = self.widget
         w.place_widget()
@@ -183,6 +263,10 @@ class ImplicitPlane(Component):
         w = self.widget
         w.add_observer('InteractionEvent',
                        self._on_interaction_event)
+        w.add_observer('StartInteractionEvent',
+                       self._on_start_interaction)
+        w.add_observer('EndInteractionEvent',
+                       self._on_end_interaction)
         w.on_trait_change(self._on_normal_set, 'normal_to_x_axis')
         w.on_trait_change(self._on_normal_set, 'normal_to_y_axis')
         w.on_trait_change(self._on_normal_set, 'normal_to_z_axis')
@@ -7,7 +7,8 @@ to be used by various modules.
 # License: BSD Style.
 
 # Enthought library imports.
-from traits.api import Event, Instance, List, Trait, Bool, TraitPrefixList
+from traits.api import (Event, Instance, List, Trait, Bool, TraitPrefixList,
+                        Range)
 from traitsui.api import View, Group, Item, InstanceEditor
 from tvtk.api import tvtk
 from apptools.persistence.state_pickler import set_state
@@ -15,11 +16,12 @@ from apptools.persistence.state_pickler import set_state
 # Local imports.
 from mayavi.core.common import handle_children_state
 from mayavi.core.component import Component
+from mayavi.components.update_throttle import UpdateThrottle
 
 ######################################################################
 # `SourceWidget` class.
 ######################################################################
-class SourceWidget(Component):
+class SourceWidget(Component, UpdateThrottle):
 
     # The version of this class.  Used for persistence.
     __version__ = 0
@@ -39,12 +41,30 @@ class SourceWidget(Component):
                                                         'non-interactive']),
                         desc='the speed at which the poly data is updated')
 
+    # The maximum number of times per second the poly data is updated
+    # while the widget is dragged in the 'interactive' mode, zero for no
+    # limit.  The last skipped update is done once the wait is over and
+    # the poly data is always updated when the interaction ends.
+    max_update_rate = Range(0.0, 100.0, 0.0,
+                            desc='the maximum number of updates per '
+                            'second while interacting (0 for no limit)')
+
+    # Only every `preview_stride` point of the widget is used for the
+    # poly data while the widget is dragged, giving a coarse preview.
+    # The full poly data is set when the interaction ends.
+    preview_stride = Range(1, 32, 1,
+                           desc='the stride of the points used while '
+                           'interacting')
+
     # A list of predefined glyph sources that can be used.
     widget_list = List(tvtk.Object, record=False)
 
     # The poly data that the widget manages.
     poly_data = Instance(tvtk.PolyData, args=())
 
+    # Fired when `poly_data` has been updated from the widget.
+    poly_data_updated = Event(record=False)
+
     ########################################
     # Private traits.
 
@@ -52,13 +72,24 @@ class SourceWidget(Component):
     _busy = Bool(False)
     _unpickling = Bool(False)
 
+    # The filter that picks the points of the preview.
+    _preview_filter = Instance(tvtk.MaskPoints, args=(),
+                               kw={'generate_vertices': True,
+                                   'single_vertex_per_cell': True,
+                                   'random_mode': False})
+
     ########################################
     # View related traits.
 
-    view = View(Group(Item(name='widget', style='custom', resizable=True,
-                           editor=InstanceEditor(name='widget_list')),
+    view = View(Group(Group(Item(name='max_update_rate'),
+                            Item(name='preview_stride'),
+                            ),
+                      Group(Item(name='widget', style='custom',
+                                 resizable=True,
+                                 editor=InstanceEditor(name='widget_list')),
+                            show_labels=False,
+                            ),
                       label='Source Widget',
-                      show_labels=False,
                       ),
                 resizable=True,
                 )
@@ -68,7 +99,9 @@ class SourceWidget(Component):
     ######################################################################
     def __get_pure_state__(self):
         d = super(SourceWidget, self).__get_pure_state__()
-        for attr in ('poly_data', '_unpickling', '_first', '_busy'):
+        for attr in ('poly_data', '_unpickling', '_first', '_busy',
+                     '_interacting', '_last_update', '_pending',
+                     '_preview_filter', '_timer'):
             d.pop(attr, None)
         return d
 
@@ -193,6 +226,21 @@ class SourceWidget(Component):
     ######################################################################
     def update_poly_data(self):
         self.widget.get_poly_data(self.poly_data)
+        self.poly_data_updated = True
+
+    def update_preview(self):
+        """Set the poly data to every `preview_stride` point of the
+        widget.  This is done while the widget is dragged.
+        """
+        full = tvtk.PolyData()
+        self.widget.get_poly_data(full)
+        f = self._preview_filter
+        f.on_ratio = self.preview_stride
+        f.maximum_number_of_points = max(full.number_of_points, 1)
+        self.configure_input_data(f, full)
+        f.update()
+        self.poly_data.shallow_copy(f.output)
+        self.poly_data_updated = True
 
     ######################################################################
     # Non-public traits.
@@ -232,11 +280,45 @@ class SourceWidget(Component):
 
     def _on_interaction_event(self, obj, event):
         if (not self._busy) and (self.update_mode == 'interactive'):
+            if self._interacting and self._throttle():
+                return
+            self._update_interactive()
+
+    def _update_interactive(self):
+        self._busy = True
+        preview = self._interacting and self.preview_stride > 1
+        if preview:
+            self.update_preview()
+        else:
+            self.update_poly_data()
+        # A preview is replaced by the full poly data at the end, like
+        # a skipped update.
+        self._pending = preview
+        self._busy = False
+
+    def _throttled_update(self):
+        self._update_interactive()
+
+    def _on_start_interaction(self, obj, event):
+        self._start_throttle()
+
+    def _on_end_interaction(self, obj, event):
+        self._interacting = False
+        self._stop_timer()
+        mode = self.update_mode
+        if (mode == 'interactive' and self._pending) or \
+           mode == 'semi-interactive':
             self._busy = True
             self.update_poly_data()
             self._busy = False
+            self.render()
+        self._pending = False
 
     def _on_widget_trait_changed(self):
+        # While the widget is dragged the updates are done by the
+        # interaction handlers.
+        if self._interacting:
+            return
         if (not self._busy) and (self.update_mode != 'non-interactive'):
             self._busy = True
             # This render call forces any changes to the trait to be
@@ -255,6 +337,10 @@ class SourceWidget(Component):
         """Wires up all the event handlers."""
         obj.add_observer('InteractionEvent',
                          self._on_interaction_event)
+        obj.add_observer('StartInteractionEvent',
+                         self._on_start_interaction)
+        obj.add_observer('EndInteractionEvent',
+                         self._on_end_interaction)
         if isinstance(obj, tvtk.PlaneWidget):
             obj.on_trait_change(self._on_alignment_set, 'normal_to_x_axis')
             obj.on_trait_change(self._on_alignment_set, 'normal_to_y_axis')
@@ -0,0 +1,85 @@
+"""A mixin limiting the rate of the updates made by a component while
+its widget is dragged.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+# Standard library imports.
+import time
+
+# Enthought library imports.
+from traits.api import HasTraits, Bool, Float, Any
+
+
+######################################################################
+# `UpdateThrottle` class.
+######################################################################
+class UpdateThrottle(HasTraits):
+    """Mixin for the components whose widget updates must respect a
+    `max_update_rate` trait while it is dragged.
+
+    The interaction event handler calls `_throttle` and skips its update
+    if it returns True.  A timer then calls `_throttled_update` when the
+    wait is over, which the component must implement.  The component
+    also sets `_interacting` and calls `_start_throttle` and
+    `_stop_timer` when the interaction starts and ends.
+    """
+
+    # Is the widget being interacted with?
+    _interacting = Bool(False)
+
+    # The time of the last update during the interaction.
+    _last_update = Float(0.0)
+
+    # Was an update skipped during the interaction?
+    _pending = Bool(False)
+
+    # The timer doing the last skipped update.
+    _timer = Any
+
+    def _throttled_update(self):
+        """Do the update skipped during the interaction."""
+        raise NotImplementedError
+
+    def _start_throttle(self):
+        self._interacting = True
+        self._last_update = 0.0
+        self._pending = False
+
+    def _throttle(self):
+        """Return True if an update during the interaction must wait to
+        respect `max_update_rate`.  A timer then does the update when
+        the wait is over.
+        """
+        rate = self.max_update_rate
+        now = time.time()
+        wait = self._last_update + 1.0/rate - now if rate > 0 else 0.0
+        if wait <= 0.0:
+            self._last_update = now
+            return False
+        self._pending = True
+        if self._timer is None:
+            self._timer = self._make_timer(wait)
+        return True
+
+    def _make_timer(self, wait):
+        """Return a timer calling `_on_timer` in `wait` seconds, None
+        if there is no UI.
+        """
+        scene = self.scene
+        if scene is None or scene.off_screen_rendering:
+            return None
+        from pyface.timer.api import Timer
+        return Timer(int(wait*1000) + 1, self._on_timer)
+
+    def _stop_timer(self):
+        if self._timer is not None:
+            self._timer.Stop()
+            self._timer = None
+
+    def _on_timer(self):
+        self._stop_timer()
+        if self._interacting and self._pending and not self._busy:
+            self._last_update = time.time()
+            self._throttled_update()
+            self.render()
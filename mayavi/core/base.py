@@ -90,7 +90,8 @@ class Base(TreeNodeObject):
     visible = Bool(True, desc='if the object is visible')
 
     # Extend the children list with an AdderNode when a TreeEditor needs it.
-    children_ui_list = Property(depends_on=['children'], record=False)
+    # Changes are notified by `_trigger_children_ui_list`.
+    children_ui_list = Property(record=False)
 
     # The parent of this object, i.e. self is an element of the parents
     # children.  If there is no notion of a parent/child relationship
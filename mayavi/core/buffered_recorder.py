@@ -0,0 +1,186 @@
+"""A script recorder that buffers the recorded events.
+
+The `Recorder` from `apptools.scripting` formats the Python code for
+every recorded trait change and method call as it happens.  During
+interaction this can happen many times a second and most of the
+changes are repeated assignments to the same trait.  The
+`BufferedRecorder` instead stores compact events, the changed object,
+the trait name and the new value, and only renders them to code when
+the script is asked for or the buffer fills up.  Consecutive
+assignments to the same trait of an object are coalesced into one::
+
+    from mayavi.core.buffered_recorder import BufferedRecorder
+    r = BufferedRecorder()
+    r.recording = True
+    r.register(engine)
+    ...
+    print(r.get_code())
+
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+# Standard library imports.
+from collections import deque
+
+# Enthought library imports.
+from traits.api import Any, Bool, Int
+from apptools.scripting.api import Recorder
+
+# The kinds of events recorded.
+_LINE, _FORMAT, _TRAIT = range(3)
+
+# The types of trait values that are stored as such, other values are
+# stored as their repr when recorded since they may change later.
+_IMMUTABLE = (bool, int, float, complex, str, type(None))
+try:
+    _IMMUTABLE += (long, unicode)
+except NameError:
+    pass
+
+
+######################################################################
+# `BufferedRecorder` class.
+######################################################################
+class BufferedRecorder(Recorder):
+    """A `Recorder` that buffers the recorded events and renders them
+    as code only when needed.  Note that the `lines` are only up to date
+    after `flush` or `get_code` is called.
+    """
+
+    # The number of events buffered before they are rendered.
+    buffer_size = Int(4096)
+
+    # Coalesce consecutive assignments to the same trait of an object.
+    coalesce = Bool(True)
+
+    # The number of events that were coalesced.
+    n_coalesced = Int(0)
+
+    ########################################
+    # Private traits.
+
+    # The buffered events.
+    _events = Any
+
+    # The (registry data, trait name) of the last event if it was a
+    # trait assignment.
+    _last_key = Any
+
+    def __init__(self, **traits):
+        super(BufferedRecorder, self).__init__(**traits)
+        self._events = deque()
+
+    ######################################################################
+    # `BufferedRecorder` interface.
+    ######################################################################
+    def record_format(self, fmt, args):
+        """Record the code `fmt % args`.  The code is only formatted
+        when it is rendered.
+        """
+        if self.recording and not self._in_function:
+            self._add_event((_FORMAT, fmt, args))
+
+    def flush(self):
+        """Render the buffered events to the `lines`."""
+        events = self._events
+        self._last_key = None
+        if len(events) == 0:
+            return
+        lines = self.lines
+        render = self._render_event
+        while events:
+            code = render(events.popleft())
+            self._analyze_code(code)
+            lines.append(code)
+
+    ######################################################################
+    # `Recorder` interface.
+    ######################################################################
+    def record(self, code):
+        """Record a string to be stored to the output file.
+        """
+        if self.recording and not self._in_function:
+            self._add_event((_LINE, code))
+
+    def unregister(self, object):
+        # The events must be rendered while the object is registered.
+        self.flush()
+        super(BufferedRecorder, self).unregister(object)
+
+    def record_function(self, func, args, kw):
+        # Function calls are added to the lines directly.
+        if self.recording and not self._in_function:
+            self.flush()
+        return super(BufferedRecorder, self).record_function(func, args, kw)
+
+    def clear(self):
+        self._events.clear()
+        self._last_key = None
+        self.n_coalesced = 0
+        super(BufferedRecorder, self).clear()
+
+    def get_code(self):
+        self.flush()
+        return super(BufferedRecorder, self).get_code()
+
+    ######################################################################
+    # Non-public interface.
+    ######################################################################
+    def _add_event(self, event, key=None):
+        events = self._events
+        events.append(event)
+        self._last_key = key
+        if len(events) >= self.buffer_size:
+            self.flush()
+
+    def _render_event(self, event):
+        """Return the code for the given event."""
+        kind = event[0]
+        if kind == _LINE:
+            return event[1]
+        elif kind == _FORMAT:
+            return event[1] % event[2]
+
+        data, name, value, is_repr = event[1:]
+        if not is_repr:
+            value = repr(value)
+        sid = data.script_id
+        if len(sid) == 0:
+            msg = '%s = %s' % (name, value)
+        else:
+            msg = '%s.%s = %s' % (sid, name, value)
+        if value.startswith('<') and value.endswith('>'):
+            msg = '# ' + msg
+        return msg
+
+    def _listner(self, object, name, old, new):
+        """The listner for trait changes on an object."""
+        if self.recording and not self._in_function:
+            data = self._get_registry_data(object)
+            is_repr = type(new) not in _IMMUTABLE
+            if is_repr:
+                new = repr(new)
+            event = (_TRAIT, data, name, new, is_repr)
+            key = (data, name)
+            if self.coalesce and self._last_key == key:
+                self._events[-1] = event
+                self.n_coalesced += 1
+            else:
+                self._add_event(event, key)
+
+    def _list_items_listner(self, object, name, old, event):
+        # This changes the paths of the objects in the list.
+        self.flush()
+        super(BufferedRecorder, self)._list_items_listner(object, name,
+                                                          old, event)
+
+    def _recording_changed(self, value):
+        # Render the pending events with recording on since the names
+        # used are only written to the namespace when recording.
+        if not value and len(self._events) > 0:
+            self.trait_setq(recording=True)
+            try:
+                self.flush()
+            finally:
+                self.trait_setq(recording=False)
@@ -336,6 +336,17 @@ class Engine(HasStrictTraits):
             if src is not None:
                 return src
 
+    def profile(self):
+        """Return a `PipelineProfiler` for the scenes of this engine.
+        This is typically used as a context manager::
+
+            with engine.profile() as profiler:
+                engine.add_module(IsoSurface())
+            print(profiler.report())
+        """
+        from mayavi.core.profiler import PipelineProfiler
+        return PipelineProfiler(engine=self)
+
     def record(self, msg):
         """This is merely a convenience method to record messages to the
         script recorder.
@@ -6,8 +6,12 @@ basically abstracts out the common parts of the pipeline interface.
 # Copyright (c) 2005-2008, Enthought, Inc.
 # License: BSD Style.
 
+# Standard library imports.
+import vtk
+
 # Enthought library imports.
 from traits.api import List, Event, Bool, Instance
+from tvtk.api import tvtk
 
 # Local imports.
 from mayavi.core.base import Base
@@ -189,6 +193,47 @@ class PipelineBase(Base):
         else:
             return None
 
+    def get_output_size(self):
+        """ Return the number of points and cells of the output
+        dataset.
+
+        Unlike `get_output_dataset` this avoids executing the upstream
+        pipeline where it can: the size of structured outputs is found
+        from their whole extent, which only needs the pipeline
+        information, and other outputs are only updated if they are out
+        of date.
+        """
+        if not self.outputs:
+            return 0, 0
+        o = self.outputs[0]
+        if o.is_a('vtkDataSet'):
+            return o.number_of_points, o.number_of_cells
+        vtk_obj = tvtk.to_vtk(o)
+        vtk_obj.UpdateInformation()
+        data = vtk_obj.GetOutputDataObject(0)
+        info = vtk_obj.GetOutputInformation(0)
+        key = vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT()
+        structured = data is not None and \
+            (data.IsA('vtkImageData') or data.IsA('vtkRectilinearGrid') or
+             data.IsA('vtkStructuredGrid'))
+        if structured and info.Has(key):
+            ext = info.Get(key)
+            dims = [ext[2*i + 1] - ext[2*i] + 1 for i in range(3)]
+            if min(dims) < 1:
+                return 0, 0
+            n_points = dims[0]*dims[1]*dims[2]
+            n_cells = 1
+            for d in dims:
+                if d > 1:
+                    n_cells *= d - 1
+            return n_points, n_cells
+        executive = vtk_obj.GetExecutive()
+        if data is None or not hasattr(executive, 'GetPipelineMTime') or \
+           data.GetUpdateTime() < executive.GetPipelineMTime():
+            o.update()
+        dataset = o.output
+        return dataset.number_of_points, dataset.number_of_cells
+
     def configure_connection(self, obj, inp):
         """ Configure topology for vtk pipeline obj."""
         tvtk_common.configure_connection(obj, inp)
@@ -0,0 +1,391 @@
+"""A profiler for the Mayavi pipeline.
+
+The profiler times the `update_pipeline`, `update_data` and `update`
+methods of the sources, filters, modules, module managers and
+components, the execution of the VTK algorithms they own and the
+rendering of each scene.  It is normally obtained from an engine::
+
+    with engine.profile() as profiler:
+        ... create and change the visualization ...
+    print(profiler.report())
+    profiler.save('profile.json')
+
+The methods are instrumented on the classes, so while a profiler runs
+the calls of every engine go through it.  Only the calls on objects of
+the profiled engine are recorded.  Objects that are not in a scene yet,
+and components, are recorded when they are called from an object of
+the engine or when they belong to a scene of the engine.
+
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+# Standard library imports.
+import json
+import threading
+import time
+from os.path import splitext
+
+# Enthought library imports.
+from traits.api import HasTraits, Instance, Bool, Dict, List, Float
+from tvtk.api import tvtk
+
+# Local imports.
+from mayavi.core.common import get_engine
+from mayavi.core.component import Component
+from mayavi.core.filter import Filter
+from mayavi.core.module import Module
+from mayavi.core.module_manager import ModuleManager
+from mayavi.core.source import Source
+
+# The methods that are timed for each base class and its subclasses,
+# filters are sources.
+PROFILED_METHODS = ((Source, ('update', 'update_pipeline',
+                              'update_data')),
+                    (Module, ('update_pipeline', 'update_data')),
+                    (ModuleManager, ('update',)),
+                    (Component, ('update_pipeline', 'update_data')))
+
+# Traits that refer to other pipeline objects and are not searched for
+# VTK algorithms.
+_SKIP_TRAITS = ('scene', 'parent', 'inputs', 'outputs', 'children',
+                'module_manager', 'source', 'module')
+
+clock = getattr(time, 'perf_counter', time.time)
+
+
+def _get_subclasses(klass):
+    """Return the given class and all its subclasses."""
+    result = [klass]
+    for sub in klass.__subclasses__():
+        for k in _get_subclasses(sub):
+            if k not in result:
+                result.append(k)
+    return result
+
+
+def _get_type(obj):
+    for klass in (Filter, Source, ModuleManager, Module, Component):
+        if isinstance(obj, klass):
+            return klass.__name__
+    return obj.__class__.__name__
+
+
+def _output_size(obj):
+    """The memory size in kB of the first output dataset of the given
+    object or None.  This does not update the VTK pipeline.
+    """
+    try:
+        o = obj.outputs[0]
+        if not o.is_a('vtkDataSet'):
+            o = o.output
+        return o.actual_memory_size
+    except (AttributeError, IndexError, TypeError):
+        return None
+
+
+######################################################################
+# `PipelineProfiler` class.
+######################################################################
+class PipelineProfiler(HasTraits):
+
+    # The engine whose scenes are profiled.
+    engine = Instance('mayavi.core.engine.Engine')
+
+    # Is the profiler running?
+    running = Bool(False)
+
+    # Statistics per pipeline object keyed on the object id: the
+    # label, class and type of the object, the number of calls and
+    # wall time of each method, the total and self wall time, the VTK
+    # execution time and the last output size.
+    objects = Dict
+
+    # Render count and time per scene name.
+    renders = Dict
+
+    # The self time of each call path, used for flame graphs.
+    stacks = Dict
+
+    # The total time spent profiling.
+    total_time = Float
+
+    ########################################
+    # Private traits.
+
+    _patched = List
+    _observers = List
+    _watched = Dict
+    _stack = List
+    _vtk_start = Dict
+    _start_time = Float
+    _thread = Instance(threading.Thread)
+
+    ######################################################################
+    # `object` interface
+    ######################################################################
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    ######################################################################
+    # `PipelineProfiler` interface
+    ######################################################################
+    def start(self):
+        """Start profiling.  Any results of a previous run are kept."""
+        if self.running:
+            return
+        for base, names in PROFILED_METHODS:
+            for klass in _get_subclasses(base):
+                for name in names:
+                    func = klass.__dict__.get(name)
+                    if func is None or hasattr(func, '_profiled'):
+                        continue
+                    setattr(klass, name, self._wrap(func, name))
+                    self._patched.append((klass, name, func))
+        engine = self.engine
+        if engine is not None:
+            for scene in engine.scenes:
+                self._watch_scene(scene)
+                self._watch_tree(scene)
+            engine.on_trait_change(self._scenes_changed, 'scenes_items')
+        self._thread = threading.current_thread()
+        self._start_time = clock()
+        self.running = True
+
+    def stop(self):
+        """Stop profiling and remove all the instrumentation."""
+        if not self.running:
+            return
+        for klass, name, func in self._patched:
+            setattr(klass, name, func)
+        self._patched = []
+        if self.engine is not None:
+            self.engine.on_trait_change(self._scenes_changed, 'scenes_items',
+                                        remove=True)
+        for vtk_obj, tag in self._observers:
+            vtk_obj.RemoveObserver(tag)
+        self._observers = []
+        self._watched = {}
+        self._stack = []
+        self.total_time += clock() - self._start_time
+        self.running = False
+
+    def clear(self):
+        """Clear the results."""
+        self.objects = {}
+        self.renders = {}
+        self.stacks = {}
+        self.total_time = 0.0
+
+    def summary(self):
+        """Return the statistics of the pipeline objects sorted on the
+        total wall time.
+        """
+        return sorted(self.objects.values(), key=lambda x: -x['wall_time'])
+
+    def report(self):
+        """Return the results as a text table."""
+        lines = ['%-40s %6s %10s %10s %10s %10s'%('object', 'calls',
+                                                 'wall (s)', 'self (s)',
+                                                 'vtk (s)', 'size (kB)')]
+        for stat in self.summary():
+            size = stat['output_size']
+            lines.append('%-40s %6d %10.4f %10.4f %10.4f %10s'%(
+                stat['label'][:40], sum(stat['calls'].values()),
+                stat['wall_time'], stat['self_time'], stat['vtk_time'],
+                '' if size is None else size))
+        for name, r in sorted(self.renders.items()):
+            lines.append('%-40s %6d %10.4f'%(('render: %s'%name)[:40],
+                                             r['count'], r['time']))
+        lines.append('Total profiled time: %.4f s'%self.total_time)
+        return '\n'.join(lines)
+
+    def to_dict(self):
+        """Return the results as a dictionary that can be saved as
+        JSON."""
+        stacks = [{'stack': list(k), 'self_time': v}
+                  for k, v in self.stacks.items()]
+        return {'total_time': self.total_time,
+                'objects': self.summary(),
+                'renders': self.renders,
+                'stacks': stacks}
+
+    def to_folded(self):
+        """Return the results in the folded stack format used by flame
+        graph tools, one line per call path with the self time in
+        microseconds.
+        """
+        lines = []
+        for path, t in sorted(self.stacks.items()):
+            frames = [x.replace(';', ',') for x in path]
+            lines.append('%s %d'%(';'.join(frames), int(t*1e6)))
+        for name, r in sorted(self.renders.items()):
+            lines.append('render %s %d'%(name.replace(';', ','),
+                                         int(r['time']*1e6)))
+        return '\n'.join(lines)
+
+    def save(self, fname):
+        """Save the results to the given file.  A '.json' file gets the
+        JSON report, any other file the folded stacks for flame graphs.
+        """
+        if splitext(fname)[1].lower() == '.json':
+            data = json.dumps(self.to_dict(), indent=2)
+        else:
+            data = self.to_folded()
+        with open(fname, 'w') as f:
+            f.write(data)
+
+    ######################################################################
+    # Non-public interface.
+    ######################################################################
+    def _wrap(self, func, name):
+        profiler = self
+
+        def wrapper(obj, *args, **kw):
+            return profiler._call(obj, name, func, args, kw)
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        wrapper._profiled = func
+        return wrapper
+
+    def _call(self, obj, name, func, args, kw):
+        stack = self._stack
+        if (threading.current_thread() is not self._thread) or \
+           (len(stack) > 0 and stack[-1][0] is obj and stack[-1][1] == name) \
+           or not self._is_profiled(obj):
+            # Another thread, a call to the super class method or an
+            # object of another engine.
+            return func(obj, *args, **kw)
+        self._watch(obj)
+        if isinstance(obj, ModuleManager) and obj.source is not None:
+            self._watch(obj.source)
+        frame = [obj, name, 0.0]
+        stack.append(frame)
+        path = tuple('%s.%s'%(self._label(x[0]), x[1]) for x in stack)
+        t0 = clock()
+        try:
+            return func(obj, *args, **kw)
+        finally:
+            wall = clock() - t0
+            stack.pop()
+            if len(stack) > 0:
+                stack[-1][2] += wall
+            self._record(obj, name, wall, wall - frame[2], path)
+
+    def _is_profiled(self, obj):
+        """Return True if the calls of the given object are recorded."""
+        engine = self.engine
+        if engine is None:
+            return True
+        obj_engine = get_engine(obj)
+        if obj_engine is not None:
+            return obj_engine is engine
+        if len(self._stack) > 0:
+            # Called by an object of the engine.
+            return True
+        scene = getattr(obj, 'scene', None)
+        return scene is not None and \
+            any(s.scene is scene for s in engine.scenes)
+
+    def _record(self, obj, name, wall, self_time, path):
+        stat = self._get_stat(obj)
+        stat['calls'][name] = stat['calls'].get(name, 0) + 1
+        stat['wall_time'] += wall
+        stat['self_time'] += self_time
+        size = _output_size(obj)
+        if size is not None:
+            stat['output_size'] = size
+        self.stacks[path] = self.stacks.get(path, 0.0) + self_time
+
+    def _get_stat(self, obj):
+        key = id(obj)
+        stat = self.objects.get(key)
+        if stat is None:
+            stat = {'label': self._label(obj),
+                    'class': obj.__class__.__name__,
+                    'type': _get_type(obj), 'id': key,
+                    'calls': {}, 'wall_time': 0.0, 'self_time': 0.0,
+                    'vtk_time': 0.0, 'output_size': None}
+            self.objects[key] = stat
+        return stat
+
+    def _label(self, obj):
+        name = getattr(obj, 'name', '')
+        if not name:
+            return obj.__class__.__name__
+        return name
+
+    def _watch_tree(self, obj):
+        """Watch the given object and all the objects below it."""
+        self._watch(obj)
+        for child in getattr(obj, 'children', []):
+            self._watch_tree(child)
+
+    def _watch(self, obj, owner=None):
+        """Observe the execution of the VTK algorithms held by the
+        given pipeline object, and its components, attributing the
+        time to `owner` (the object itself by default).
+        """
+        key = id(obj)
+        if key in self._watched:
+            return
+        self._watched[key] = True
+        if owner is None:
+            owner = obj
+        for name, value in list(obj.__dict__.items()):
+            if name in _SKIP_TRAITS or name.startswith('__'):
+                continue
+            values = value if isinstance(value, list) else [value]
+            for v in values:
+                if isinstance(v, tvtk.Algorithm):
+                    self._observe_algorithm(v, owner)
+                elif isinstance(v, Component):
+                    self._watch(v, owner)
+
+    def _observe_algorithm(self, algorithm, owner):
+        vtk_obj = tvtk.to_vtk(algorithm)
+        key = id(vtk_obj)
+        stat = self._get_stat(owner)
+
+        def start(vtk_obj, event):
+            self._vtk_start[key] = clock()
+
+        def end(vtk_obj, event):
+            t0 = self._vtk_start.pop(key, None)
+            if t0 is not None:
+                stat['vtk_time'] += clock() - t0
+
+        self._observers.append((vtk_obj, vtk_obj.AddObserver('StartEvent',
+                                                             start)))
+        self._observers.append((vtk_obj, vtk_obj.AddObserver('EndEvent',
+                                                             end)))
+
+    def _scenes_changed(self, list_event):
+        for scene in list_event.added:
+            self._watch_scene(scene)
+
+    def _watch_scene(self, scene):
+        if scene.scene is None:
+            return
+        vtk_obj = tvtk.to_vtk(scene.scene.render_window)
+        name = scene.name
+        renders = self.renders
+        t_start = []
+
+        def start(vtk_obj, event):
+            t_start.append(clock())
+
+        def end(vtk_obj, event):
+            if len(t_start) > 0:
+                r = renders.setdefault(name, {'count': 0, 'time': 0.0})
+                r['count'] += 1
+                r['time'] += clock() - t_start.pop()
+
+        self._observers.append((vtk_obj, vtk_obj.AddObserver('StartEvent',
+                                                             start)))
+        self._observers.append((vtk_obj, vtk_obj.AddObserver('EndEvent',
+                                                             end)))
@@ -2,15 +2,99 @@
 # Copyright (c) 2006, Enthought, Inc.
 # License: BSD Style.
 
+import numpy
+
 # Enthought library imports.
-from traits.api import Instance
+from traits.api import Instance, Enum, Int, Range, Any
+from traitsui.api import View, Group, Item
 from tvtk.api import tvtk
+from tvtk.array_handler import array2vtk
 
 # Local imports
 from mayavi.filters.filter_base import FilterBase
 from mayavi.core.pipeline_info import PipelineInfo
 
 
+######################################################################
+# Utility functions.
+######################################################################
+def random_subsample(n, count, seed=0):
+    """Return the sorted indices of `count` of `n` points chosen at
+    random.  The same `seed` gives the same indices.
+    """
+    if count >= n:
+        return numpy.arange(n)
+    rng = numpy.random.RandomState(seed)
+    return numpy.sort(rng.permutation(n)[:count])
+
+
+def voxel_subsample(points, count, seed=0, blue_noise=False):
+    """Return the sorted indices of at most `count` of the given (n, 3)
+    `points`, picking at most one point per cell of a uniform grid of
+    at most `count` cells over the bounding box of the points.
+
+    The point picked in each cell is random, or with `blue_noise` the
+    one closest to a randomly jittered cell center which spreads the
+    chosen points more evenly.  The same `seed` gives the same indices.
+    """
+    n = len(points)
+    if n == 0 or count <= 0:
+        return numpy.arange(0)
+    lo = points.min(axis=0)
+    size = points.max(axis=0) - lo
+    active = size > 0
+    if not active.any():
+        return numpy.arange(1)
+    d = active.sum()
+    cell = (numpy.prod(size[active])/float(count))**(1.0/d)
+    dims = numpy.where(active, numpy.round(size/cell), 1).astype(int)
+    dims = numpy.maximum(dims, 1)
+    # Never use more cells than the points asked for.
+    while numpy.prod(dims) > count:
+        dims[numpy.argmax(dims)] -= 1
+    scale = numpy.where(active, size/dims, 1.0)
+    ijk = numpy.floor((points - lo)/scale).astype(int)
+    ijk[:, ~active] = 0
+    ijk = numpy.minimum(ijk, dims - 1)
+    vid = numpy.ravel_multi_index(ijk.T, dims)
+
+    rng = numpy.random.RandomState(seed)
+    if blue_noise:
+        uniq, inv = numpy.unique(vid, return_inverse=True)
+        jitter = rng.uniform(-0.25, 0.25, (len(uniq), 3))
+        center = lo + (ijk + 0.5 + jitter[inv])*scale
+        delta = points - center
+        delta[:, ~active] = 0.0
+        order = numpy.lexsort(((delta**2).sum(axis=1), inv))
+    else:
+        order = rng.permutation(n)
+    # The first point of each cell in the given order.
+    first = numpy.unique(vid[order], return_index=True)[1]
+    return numpy.sort(order[first])
+
+
+def get_point_coordinates(dataset, idx):
+    """Return the coordinates of the points of `dataset` with the given
+    indices as an (n, 3) array."""
+    if dataset.is_a('vtkImageData') or dataset.is_a('vtkRectilinearGrid'):
+        nx, ny, nz = dataset.dimensions
+        ext = dataset.extent
+        i = idx % nx
+        j = (idx//nx) % ny
+        k = idx//(nx*ny)
+        if dataset.is_a('vtkImageData'):
+            ijk = numpy.c_[i + ext[0], j + ext[2], k + ext[4]]
+            return numpy.asarray(dataset.origin) + \
+                ijk*numpy.asarray(dataset.spacing)
+        return numpy.c_[dataset.x_coordinates.to_array()[i],
+                        dataset.y_coordinates.to_array()[j],
+                        dataset.z_coordinates.to_array()[k]]
+    points = getattr(dataset, 'points', None)
+    if points is not None:
+        return points.to_array()[idx]
+    return numpy.array([dataset.get_point(x) for x in idx])
+
+
 ######################################################################
 # `MaskPoints` class.
 ######################################################################
@@ -27,6 +111,26 @@ class MaskPoints(FilterBase):
     # The actual TVTK filter that this class manages.
     filter = Instance(tvtk.MaskPoints, args=(), allow_none=False, record=True)
 
+    # How the points are chosen.  'vtk' uses the VTK filter, 'random'
+    # picks `number_of_points` points at random, 'voxel' picks one
+    # random point in each cell of a grid of about `number_of_points`
+    # cells and 'blue_noise' picks the point nearest a jittered center
+    # in each cell, spreading the points evenly.  The other strategies
+    # only compute the chosen points again when the points of the input
+    # change, so updating the attributes of the input is cheap.
+    strategy = Enum('vtk', 'random', 'voxel', 'blue_noise',
+                    desc='how the points are chosen')
+
+    # The number of points kept by the 'random' strategy and the
+    # approximate number kept by the grid based strategies.
+    number_of_points = Range(1, 100000000, 5000, enter_set=True,
+                             auto_set=False,
+                             desc='the number of points to keep')
+
+    # The seed of the random numbers, the same seed picks the same
+    # points.
+    seed = Int(0, desc='the seed of the random numbers')
+
     input_info = PipelineInfo(datasets=['any'],
                               attribute_types=['any'],
                               attributes=['any'])
@@ -35,10 +139,51 @@ class MaskPoints(FilterBase):
                                attribute_types=['any'],
                                attributes=['any'])
 
+    view = View(Group(Item(name='strategy'),
+                      Item(name='number_of_points',
+                           enabled_when='strategy != "vtk"'),
+                      Item(name='seed', enabled_when='strategy != "vtk"')),
+                Group(Item(name='filter', style='custom', resizable=True,
+                           show_label=False,
+                           visible_when='strategy == "vtk"'),
+                      springy=True),
+                scrollable=True,
+                resizable=True
+                )
+
+    ########################################
+    # Private traits.
+
+    # The output of the numpy based strategies.
+    _output = Instance(tvtk.PolyData, args=())
+
+    # The indices of the chosen points.
+    _indices = Any
+
+    # The input geometry and the parameters the indices were computed
+    # for.
+    _cache_key = Any
+
+    ######################################################################
+    # `Base` interface
+    ######################################################################
+    def __get_pure_state__(self):
+        d = super(MaskPoints, self).__get_pure_state__()
+        for attr in ('_output', '_indices', '_cache_key'):
+            d.pop(attr, None)
+        return d
+
     ######################################################################
     # `Filter` interface.
     ######################################################################
     def update_pipeline(self):
+        if len(self.inputs) == 0:
+            return
+        if self.strategy != 'vtk':
+            self._cache_key = None
+            self._subsample()
+            self._set_outputs([self._output])
+            return
         # FIXME: This is needed, for with VTK-5.10 (for sure), the filter
         # allocates memory for maximum_number_of_points which is impossibly
         # large,  so we set it to the number of points in the input
@@ -47,12 +192,84 @@ class MaskPoints(FilterBase):
             self._find_number_of_points_in_input()
         super(MaskPoints, self).update_pipeline()
 
+    def update_data(self):
+        if self.strategy == 'vtk':
+            super(MaskPoints, self).update_data()
+            return
+        if len(self.inputs) == 0 or not self.running:
+            return
+        self._subsample()
+        self.data_changed = True
+
     ######################################################################
     # Non-public interface.
     ######################################################################
     def _find_number_of_points_in_input(self):
+        return self.inputs[0].get_output_size()[0]
+
+    def _get_input_dataset(self):
         inp = self.inputs[0].outputs[0]
         if hasattr(inp, 'update'):
             inp.update()
-        inp = self.inputs[0].get_output_dataset()
-        return inp.number_of_points
+        return self.inputs[0].get_output_dataset()
+
+    def _subsample(self):
+        """Compute the output of the numpy based strategies, reusing the
+        chosen points if the input points did not change."""
+        inp = self._get_input_dataset()
+        n = inp.number_of_points
+        points = getattr(inp, 'points', None)
+        if points is not None:
+            geometry = points.m_time
+        else:
+            geometry = tuple(inp.bounds)
+        key = (self.strategy, self.number_of_points, self.seed, n,
+               geometry)
+        out = self._output
+        if key != self._cache_key:
+            count = self.number_of_points
+            if self.strategy == 'random':
+                idx = random_subsample(n, count, self.seed)
+                coords = get_point_coordinates(inp, idx)
+            else:
+                all_coords = get_point_coordinates(inp, numpy.arange(n))
+                idx = voxel_subsample(all_coords, count, self.seed,
+                                      self.strategy == 'blue_noise')
+                coords = all_coords[idx]
+            out.initialize()
+            out.points = coords
+            out.verts = numpy.arange(len(idx)).reshape(-1, 1)
+            self._indices = idx
+            self._cache_key = key
+        self._update_attributes(inp, self._indices)
+
+    def _update_attributes(self, inp, idx):
+        """Copy the point data of the chosen points to the output."""
+        out = self._output
+        ipd = inp.point_data
+        pd = out.point_data
+        pd.initialize()
+        for i in range(ipd.number_of_arrays):
+            arr = ipd.get_array(i)
+            if arr is None:
+                continue
+            a = tvtk.to_tvtk(array2vtk(arr.to_array()[idx]))
+            a.name = arr.name
+            pd.add_array(a)
+        for attr in ('scalars', 'vectors', 'tensors', 'normals'):
+            arr = getattr(ipd, attr)
+            if arr is not None and arr.name:
+                getattr(pd, 'set_active_%s'%attr)(arr.name)
+        out.modified()
+
+    def _strategy_changed(self):
+        if self.running:
+            self.update_pipeline()
+
+    def _number_of_points_changed(self):
+        if self.strategy != 'vtk':
+            self.update_data()
+
+    def _seed_changed(self):
+        if self.strategy != 'vtk':
+            self.update_data()
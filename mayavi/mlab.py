@@ -26,7 +26,7 @@ if not 'wx' in sys.modules:
 # Mayavi imports
 from mayavi.tools.camera import view, roll, yaw, pitch, move
 from mayavi.tools.figure import figure, clf, gcf, savefig, \
-    draw, sync_camera, close, screenshot
+    draw, sync_camera, link_cameras, close, screenshot, batch
 from mayavi.tools.engine_manager import get_engine, show_pipeline, \
         options, set_engine
 from mayavi.tools.show import show
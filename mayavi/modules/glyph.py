@@ -7,7 +7,7 @@
 
 
 # Enthought library imports.
-from traits.api import Instance
+from traits.api import Instance, Any
 from traitsui.api import View, Group, Item
 
 # Local imports
@@ -31,6 +31,10 @@ class Glyph(Module):
     # The Glyph component.
     actor = Instance(Actor, allow_none=False, record=True)
 
+    # The vector LUT and its vector mode before it was changed for the
+    # instanced glyphs, None if it was not changed.
+    _saved_vector_mode = Any
+
     input_info = PipelineInfo(datasets=['any'],
                               attribute_types=['any'],
                               attributes=['any'])
@@ -47,6 +51,14 @@ class Glyph(Module):
                       show_labels=False),
                 )
 
+    ######################################################################
+    # `object` interface
+    ######################################################################
+    def __get_pure_state__(self):
+        d = super(Glyph, self).__get_pure_state__()
+        d.pop('_saved_vector_mode', None)
+        return d
+
     ######################################################################
     # `Module` interface
     ######################################################################
@@ -92,6 +104,10 @@ class Glyph(Module):
 
         self.pipeline_changed = True
 
+    def stop(self):
+        self._restore_vector_mode()
+        super(Glyph, self).stop()
+
     def update_data(self):
         """Override this method so that it flushes the vtk pipeline if
         that is necessary.
@@ -109,6 +125,7 @@ class Glyph(Module):
         # This is a listner for the glyph component's color_mode trait
         # so that the the lut can be changed when the a different
         # color mode is requested.
+        self._restore_vector_mode()
         if self.module_manager is None:
             return
         actor = self.actor
@@ -119,18 +136,38 @@ class Glyph(Module):
         elif value == 'color_by_vector':
             lut_mgr = self.module_manager.vector_lut_manager
             actor.set_lut(lut_mgr.lut)
+            if self.glyph.instanced:
+                # The glyph mapper maps the vectors themselves.  The
+                # LUT is shared so its mode is restored later.
+                lut = lut_mgr.lut
+                self._saved_vector_mode = (lut, lut.vector_mode)
+                lut.vector_mode = 'magnitude'
         else:
             actor.mapper.scalar_visibility = 0
 
         self.render()
 
+    def _restore_vector_mode(self):
+        saved = self._saved_vector_mode
+        if saved is not None:
+            lut, mode = saved
+            lut.vector_mode = mode
+            self._saved_vector_mode = None
+
+    def _instanced_changed(self):
+        self.glyph.configure_actor(self.actor)
+        self._color_mode_changed(self.glyph.color_mode)
+
     def _glyph_changed(self, old, new):
         # Hookup a callback to set the lut appropriately.
         if old is not None:
             old.on_trait_change(self._color_mode_changed,
                                 'color_mode',
                                 remove=True)
+            old.on_trait_change(self._instanced_changed, 'instanced',
+                                remove=True)
         new.on_trait_change(self._color_mode_changed, 'color_mode')
+        new.on_trait_change(self._instanced_changed, 'instanced')
 
         # Set the glyph's module attribute -- this is important!
         new.module = self
@@ -139,6 +176,7 @@ class Glyph(Module):
         actor = self.actor
         if actor is not None:
             actor.inputs = [new]
+            new.configure_actor(actor)
         self._change_components(old, new)
 
     def _actor_changed(self, old, new):
@@ -147,6 +185,7 @@ class Glyph(Module):
         g = self.glyph
         if g is not None:
             new.inputs = [g]
+            g.configure_actor(new)
         self._change_components(old, new)
 
 
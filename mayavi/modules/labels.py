@@ -3,11 +3,14 @@
 # License: BSD Style.
 
 # Standard library imports.
+import numpy
 
 # Enthought library imports.
-from traits.api import Int, Instance, Str, TraitError
+from traits.api import Int, Instance, Str, TraitError, Bool, Range, Dict, \
+    Any
 from traitsui.api import View, Group, Item
 from tvtk.api import tvtk
+from tvtk import messenger
 from apptools.persistence import state_pickler
 
 # Local imports.
@@ -22,6 +25,37 @@ from mayavi.components.actor2d import Actor2D
 from mayavi.core.common import handle_children_state
 
 
+# The maximum number of formatted labels that are cached.
+MAX_CACHED_LABELS = 100000
+
+
+################################################################################
+# Utility functions.
+################################################################################
+def cull_labels(xy, depth, cell_size, budget):
+    """Given the display coordinates, `xy` (an (N, 2) array), and
+    depths of N points, return the indices of at most `budget` points
+    that may be labeled without their labels overlapping.
+
+    The display is divided into square cells of side `cell_size`.  Only
+    the point nearest to the viewer in each cell is kept and the
+    nearest of these are returned first.
+    """
+    xy = numpy.asarray(xy, dtype=float)
+    depth = numpy.asarray(depth, dtype=float)
+    if len(xy) == 0 or budget < 1:
+        return numpy.zeros(0, dtype=int)
+    order = numpy.argsort(depth, kind='mergesort')
+    cells = numpy.floor(xy[order]/float(cell_size)).astype(numpy.int64)
+    cells -= cells.min(axis=0)
+    key = cells[:, 0]*(cells[:, 1].max() + 1) + cells[:, 1]
+    # numpy.unique returns the first, hence nearest, point in each cell.
+    first = numpy.unique(key, return_index=True)[1]
+    keep = order[first]
+    keep = keep[numpy.argsort(depth[keep], kind='mergesort')]
+    return keep[:budget]
+
+
 ################################################################################
 # `Labels` class.
 ################################################################################
@@ -61,6 +95,23 @@ class Labels(Module):
     # The mapper for the labels.
     mapper = Instance(tvtk.LabeledDataMapper, args=(), record=True)
 
+    # If on, the labels are culled before every render so that they do
+    # not overlap or lie outside the view.  If the visible points filter
+    # is enabled, occluded labels are culled using the z-buffer of the
+    # previous frame.  The `number_of_labels` is then ignored and
+    # `label_budget` is used.
+    label_culling = Bool(False, desc='if overlapping and occluded '
+                                     'labels are culled on every render')
+
+    # The maximum number of labels displayed when culling labels.
+    label_budget = Range(1, None, 100,
+                         desc='the maximum number of visible labels')
+
+    # The size in pixels of the screen cells used to cull labels, at
+    # most one label is shown per cell.
+    cell_size = Range(1, None, 40,
+                      desc='the size of a label cell in pixels')
+
     input_info = PipelineInfo(datasets=['any'],
                               attribute_types=['any'],
                               attributes=['any'])
@@ -75,13 +126,33 @@ class Labels(Module):
     # persistence.
     object_id = Int(-2)
 
+    # The points labeled when culling labels.
+    _culled = Instance(tvtk.PolyData, args=())
+
+    # The modification time of the labeled data and the indices of the
+    # labeled points, used to update the labels only when these change.
+    _culled_key = Any
+
+    # Cache of the formatted label text, keyed by value.
+    _label_cache = Dict
+
+    # The renderer we observe when culling labels.
+    _renderer = Any
+    _observer_id = Int(-1)
+
 
     ########################################
     # View related traits.
 
 
-    view = View(Group(Item(name='number_of_labels'),
+    view = View(Group(Item(name='number_of_labels',
+                           enabled_when='not label_culling'),
                       Item(name='label_format'),
+                      Item(name='label_culling'),
+                      Item(name='label_budget',
+                           enabled_when='label_culling'),
+                      Item(name='cell_size',
+                           enabled_when='label_culling'),
                       Item(name='mapper',
                            style='custom',
                            show_label=False,
@@ -114,7 +185,8 @@ class Labels(Module):
     def __get_pure_state__(self):
         self._compute_object_id()
         d = super(Labels, self).__get_pure_state__()
-        for name in ('object', 'mapper', 'input'):
+        for name in ('object', 'mapper', 'input', '_renderer',
+                     '_culled_key'):
             d.pop(name, None)
         # Must pickle the components.
         d['components'] = self.components
@@ -142,6 +214,14 @@ class Labels(Module):
         self.property.on_trait_change(self.render)
         self.components = [self.mask, self.visible_points, self.actor]
 
+    def start(self):
+        super(Labels, self).start()
+        self._label_culling_changed(self.label_culling)
+
+    def stop(self):
+        self._remove_culling_observer()
+        super(Labels, self).stop()
+
     def update_pipeline(self):
         mm = self.module_manager
         if mm is None:
@@ -150,7 +230,7 @@ class Labels(Module):
         self._find_input() # Calculates self.input
         self.mask.inputs = [self.input]
         self.visible_points.inputs = [self.mask]
-        self.actor.inputs = [self.visible_points]
+        self._connect_actor()
         self._number_of_labels_changed(self.number_of_labels)
         self._label_format_changed(self.label_format)
 
@@ -194,22 +274,37 @@ class Labels(Module):
             inp.update()
         npts = inp.number_of_points
         typ = type(f.on_ratio)
-        f.on_ratio = typ(max(npts/value, 1))
+        if self.label_culling:
+            # All the points are culled on every render instead.
+            f.on_ratio = typ(1)
+        else:
+            f.on_ratio = typ(max(npts/value, 1))
         if self.mask.running:
             f.update()
             self.mask.data_changed = True
 
     def _label_format_changed(self, value):
-        if len(value) > 0:
+        self._label_cache = {}
+        self._culled_key = None
+        if self.label_culling:
+            # The labels are formatted by `_format_label`.
+            self._reset_mapper_format('%s')
+            self.render()
+        elif len(value) > 0:
             self.mapper.label_format = value
             self.render()
         else:
-            try:
-                self.mapper.label_format = None
-            except TraitError:
-                self.mapper.label_format = '%g'
+            self._reset_mapper_format('%g')
             self.render()
 
+    def _reset_mapper_format(self, default):
+        """Let the mapper pick the format suited to the labeled array,
+        or use `default` if this is not possible."""
+        try:
+            self.mapper.label_format = None
+        except TraitError:
+            self.mapper.label_format = default
+
     def _object_changed(self, value):
         self.update_pipeline()
 
@@ -228,3 +323,149 @@ class Labels(Module):
     def _scene_changed(self, old, new):
         self.visible_points.filter.filter.renderer = new.renderer
         super(Labels, self)._scene_changed(old, new)
+        if self.running:
+            self._label_culling_changed(self.label_culling)
+
+    def _connect_actor(self):
+        if self.label_culling:
+            # The mapper is fed the culled points directly.
+            self.actor.inputs = []
+            self.configure_input_data(self.mapper, self._culled)
+        else:
+            self.actor.inputs = [self.visible_points]
+
+    def _label_culling_changed(self, value):
+        self._remove_culling_observer()
+        if self.actor is None:
+            return
+        # The labels of the new input may not match the current format.
+        self._reset_mapper_format('%s')
+        self._connect_actor()
+        if value:
+            self.mapper.set(label_mode='label_field_data',
+                            field_data_name='labels')
+            scene = self.scene
+            if scene is not None and self.running:
+                # The labels are culled when the renderer starts, so
+                # they are drawn in the same frame.
+                ren = scene.renderer
+                self._observer_id = ren.add_observer('StartEvent',
+                                                     messenger.send)
+                messenger.connect(tvtk.to_vtk(ren), 'StartEvent',
+                                  self._on_render_start)
+                self._renderer = ren
+        else:
+            self.mapper.label_mode = 'label_scalars'
+        self._culled_key = None
+        self._label_format_changed(self.label_format)
+        self._number_of_labels_changed(self.number_of_labels)
+        self.render()
+
+    def _label_budget_changed(self):
+        self.render()
+
+    def _cell_size_changed(self):
+        self.render()
+
+    def _remove_culling_observer(self):
+        ren = self._renderer
+        if ren is not None:
+            ren.remove_observer(self._observer_id)
+            messenger.disconnect(tvtk.to_vtk(ren), 'StartEvent',
+                                 self._on_render_start)
+        self._renderer = None
+        self._observer_id = -1
+
+    def _format_label(self, value):
+        """Return the label text for the given value, using a cache
+        so that each value is only formatted once."""
+        cache = self._label_cache
+        try:
+            return cache[value]
+        except KeyError:
+            fmt = self.label_format or '%g'
+            if isinstance(value, tuple):
+                text = '(%s)' % ', '.join([fmt % x for x in value])
+            else:
+                text = fmt % value
+            if len(cache) < MAX_CACHED_LABELS:
+                cache[value] = text
+            return text
+
+    def _on_render_start(self, *args):
+        """Called when the renderer starts a frame when culling labels.
+        """
+        self._update_culled_labels()
+
+    def _update_culled_labels(self):
+        """Select the points to label for the current view using the
+        z-buffer of the previous frame.  Returns True if the labeled
+        points have changed.
+        """
+        culled = self._culled
+        scene = self.scene
+        data = self.mask.get_output_dataset()
+        if scene is None or data is None or data.points is None or \
+                data.number_of_points == 0:
+            changed = self._culled_key != ()
+            self._culled_key = ()
+            culled.points = numpy.zeros((0, 3))
+            return changed
+        ren = scene.renderer
+        w, h = ren.size
+        if w < 1 or h < 1:
+            return False
+        pts = data.points.to_array()
+
+        # Project the points to normalized device coordinates.
+        cam = ren.active_camera
+        m = cam.get_composite_projection_transform_matrix(float(w)/h,
+                                                          -1, 1).to_array()
+        hom = numpy.dot(pts, m[:, :3].T) + m[:, 3]
+        front = hom[:, 3] > 0
+        ndc = hom[:, :3]/numpy.where(front, hom[:, 3], 1.0)[:, None]
+        inside = front & numpy.all(numpy.abs(ndc) <= 1.0, axis=1)
+        idx = numpy.nonzero(inside)[0]
+        xy = (ndc[idx, :2] + 1.0)*0.5*numpy.array([w, h])
+        depth = (ndc[idx, 2] + 1.0)*0.5
+
+        if self.visible_points.enabled and len(idx) > 0:
+            # Cull points hidden behind the surfaces of the previous
+            # frame, the z-buffer is that of the whole window.
+            x0, y0 = ren.origin
+            zbuf = tvtk.FloatArray()
+            scene.render_window.get_zbuffer_data(x0, y0, x0 + w - 1,
+                                                 y0 + h - 1, zbuf)
+            zbuf = numpy.reshape(zbuf.to_array(), (h, w))
+            ix = numpy.clip(xy[:, 0].astype(int), 0, w - 1)
+            iy = numpy.clip(xy[:, 1].astype(int), 0, h - 1)
+            tol = self.visible_points.filter.filter.tolerance
+            visible = depth <= zbuf[iy, ix] + tol
+            idx, xy, depth = idx[visible], xy[visible], depth[visible]
+
+        keep = idx[cull_labels(xy, depth, self.cell_size,
+                               self.label_budget)]
+        key = (tvtk.to_vtk(data).GetMTime(), tuple(keep.tolist()))
+        if key == self._culled_key:
+            return False
+        self._culled_key = key
+
+        sc = data.point_data.scalars
+        labels = tvtk.StringArray(name='labels')
+        if sc is None:
+            values = keep
+        else:
+            values = sc.to_array()[keep]
+        fmt = self._format_label
+        for value in values:
+            if numpy.ndim(value) > 0:
+                value = tuple(value.tolist())
+            else:
+                value = value.item()
+            labels.insert_next_value(fmt(value))
+        culled.points = pts[keep]
+        pd = culled.point_data
+        pd.remove_array('labels')
+        pd.add_array(labels)
+        culled.modified()
+        return True
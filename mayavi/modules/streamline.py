@@ -10,13 +10,16 @@ streamlines.
 
 # Standard library imports.
 from math import sqrt
+import threading
+
+import numpy
 
 # Enthought library imports.
 from traits.api import Instance, Bool, TraitPrefixList, Trait, \
-                             Delegate, Button
+                             Delegate, Button, Range, Int, Dict, List
 from traitsui.api import View, Group, Item, InstanceEditor
 from tvtk.api import tvtk
-from tvtk.common import configure_outputs
+from tvtk.common import configure_outputs, is_old_pipeline
 
 # Local imports
 from mayavi.core.module import Module
@@ -65,6 +68,22 @@ class Streamline(Module):
     # The actor component that represents the visualization.
     actor = Instance(Actor, allow_none=False, record=True)
 
+    # Trace the streamlines in a background thread so the UI is not
+    # blocked.  The seeds are traced in `number_of_subsets` subsets and
+    # the streamlines of each subset are shown as soon as it is done.
+    # Moving the seeds, changing the tracer or the upstream data aborts
+    # a trace that is running and traces again once it has stopped.
+    background_tracing = Bool(False, desc='if the streamlines are '
+                                          'traced in the background')
+
+    # The number of seed subsets traced in turn in the background.
+    number_of_subsets = Range(1, 64, 4, desc='the number of seed subsets '
+                                             'shown as they are traced')
+
+    # The fraction of the seed subsets traced so far.
+    trace_progress = Range(0.0, 1.0, 1.0,
+                           desc='the fraction of the seeds traced')
+
     input_info = PipelineInfo(datasets=['any'],
                               attribute_types=['any'],
                               attributes=['vectors'])
@@ -74,6 +93,28 @@ class Streamline(Module):
 
     _first = Bool(True)
 
+    # Merges the streamlines of the seed subsets traced in the
+    # background.
+    _merge = Instance(tvtk.AppendPolyData, args=())
+
+    # The traced streamlines of each seed subset keyed on subset index.
+    _parts = Dict
+
+    # The VTK stream tracers of the running trace, used to abort it.
+    _tracers = List
+
+    # Incremented for each new trace, results of older traces are
+    # discarded.
+    _generation = Int(0)
+
+    # The modification time of `stream_tracer` when last traced.
+    _tracer_mtime = Int(-1)
+
+    # True while a trace is running and when another trace is needed
+    # once it is done.
+    _tracing = Bool(False)
+    _trace_again = Bool(False)
+
     ########################################
     # View related code.
 
@@ -101,6 +142,12 @@ class Streamline(Module):
                       Group(Item(name='update_streamlines'),
                             show_labels=False,
                             ),
+                      Group(Item(name='background_tracing'),
+                            Item(name='number_of_subsets',
+                                 enabled_when='background_tracing'),
+                            Item(name='trace_progress', style='readonly',
+                                 enabled_when='background_tracing'),
+                            ),
                       Group(Item(name='streamline_type'),
                             Item(name='ribbon_filter', style='custom',
                                  visible_when='object.streamline_type == "ribbon"',
@@ -125,6 +172,16 @@ class Streamline(Module):
                 resizable=True
                 )
 
+    ######################################################################
+    # `object` interface
+    ######################################################################
+    def __get_pure_state__(self):
+        d = super(Streamline, self).__get_pure_state__()
+        for attr in ('_merge', '_parts', '_tracers', '_generation',
+                     '_tracer_mtime', '_tracing', '_trace_again', 'trace_progress'):
+            d.pop(attr, None)
+        return d
+
     ######################################################################
     # `Module` interface
     ######################################################################
@@ -180,6 +237,8 @@ class Streamline(Module):
             self.tube_filter.radius = length*0.0075
             self._first = False
 
+        if self.background_tracing:
+            self._trace()
         self._streamline_type_changed(self.streamline_type)
         # Set the LUT for the mapper.
         self.actor.set_lut(mm.scalar_lut_manager.lut)
@@ -193,6 +252,8 @@ class Streamline(Module):
         This method is invoked (automatically) when any of the inputs
         sends a `data_changed` event.
         """
+        if self.background_tracing:
+            self._trace()
         # Just set data_changed, the components should do the rest if
         # they are connected.
         self.data_changed = True
@@ -204,6 +265,8 @@ class Streamline(Module):
         if self.module_manager is None:
             return
         st = self.stream_tracer
+        if self.background_tracing:
+            st = self._merge
         rf = self.ribbon_filter
         tf = self.tube_filter
         if value == 'line':
@@ -221,17 +284,154 @@ class Streamline(Module):
         self.render()
 
     def _update_streamlines_fired(self):
+        # With background tracing this starts a trace.
         self.seed.update_poly_data()
-        self.stream_tracer.update()
+        if not self.background_tracing:
+            self.stream_tracer.update()
+            self.render()
+
+    def _background_tracing_changed(self, value):
+        if value:
+            self._trace()
+        else:
+            self._generation += 1
+            self._abort_traces()
+            self._parts = {}
+            self.trace_progress = 1.0
+        self._streamline_type_changed(self.streamline_type)
+
+    def _number_of_subsets_changed(self):
+        if self.background_tracing:
+            self._trace()
+
+    def _on_tracer_changed(self):
+        if self.background_tracing:
+            # Traits like the start position are also updated when the
+            # tracer executes, only trace again if it was modified.
+            mtime = tvtk.to_vtk(self.stream_tracer).GetMTime()
+            if mtime != self._tracer_mtime:
+                self._trace()
+        else:
+            self.render()
+
+    def _on_seed_updated(self):
+        if self.background_tracing:
+            self._trace()
+
+    def _trace(self):
+        """Trace the streamlines of the seeds in subsets in a background
+        thread.  A trace that is running is aborted and the latest state
+        is traced once it has stopped.
+        """
+        mm = self.module_manager
+        if mm is None or self.seed is None:
+            return
+        self._generation += 1
+        generation = self._generation
+        self._tracer_mtime = tvtk.to_vtk(self.stream_tracer).GetMTime()
+        if self._tracing:
+            self._abort_traces()
+            self._trace_again = True
+            return
+
+        points = self.seed.poly_data.points
+        if points is None or len(points) == 0:
+            self._parts = {}
+            self.trace_progress = 1.0
+            self._update_merge()
+            return
+        points = points.to_array()
+        dataset = mm.source.get_output_dataset()
+        state = self.stream_tracer.__getstate__()
+        tracers = []
+        for subset in numpy.array_split(points,
+                                        min(self.number_of_subsets,
+                                            len(points))):
+            # Each subset gets its own tracer, a shallow copy of the input
+            # and no trait observers, so the background thread uses no
+            # object of the rendered pipeline and runs no Python handler.
+            data = dataset.new_instance()
+            data.shallow_copy(dataset)
+            seeds = tvtk.PolyData(points=subset)
+            tracer = tvtk.StreamTracer()
+            tracer.__setstate__(state)
+            self.configure_input_data(tracer, data)
+            self.configure_source_data(tracer, seeds)
+            for obj in (data, seeds, tracer):
+                obj.teardown_observers()
+            tracers.append(tvtk.to_vtk(tracer))
+
+        self._tracers = tracers
+        self._parts = {}
+        self._tracing = True
+        self.trace_progress = 0.0
+        from pyface.api import GUI
+        t = threading.Thread(target=self._run_traces,
+                             args=(generation, tracers, GUI.invoke_later))
+        t.daemon = True
+        t.start()
+
+    def _run_traces(self, generation, tracers, invoke):
+        """Trace the seed subsets in turn, this is run in the background
+        thread.  `invoke` is used to call back into the UI thread.
+        """
+        try:
+            for index, tracer in enumerate(tracers):
+                if generation != self._generation:
+                    break
+                tracer.Update()
+                output = tracer.GetOutput().NewInstance()
+                output.ShallowCopy(tracer.GetOutput())
+                invoke(self._trace_done, generation, index, output)
+        finally:
+            invoke(self._traces_finished)
+
+    def _trace_done(self, generation, index, output):
+        """Called in the UI thread when a seed subset is traced."""
+        if generation != self._generation:
+            return
+        self._parts[index] = tvtk.to_tvtk(output)
+        self.trace_progress = float(len(self._parts))/len(self._tracers)
+        self._update_merge()
+
+    def _traces_finished(self):
+        """Called in the UI thread when the background thread is done.
+        """
+        self._tracing = False
+        self._tracers = []
+        if self._trace_again:
+            self._trace_again = False
+            self._trace()
+
+    def _abort_traces(self):
+        # VTK 9.3 and later stop tracing when asked to, older versions
+        # finish and their results are discarded.
+        for tracer in self._tracers:
+            tracer.SetAbortExecute(1)
+
+    def _update_merge(self):
+        """Merge the streamlines traced so far and render them."""
+        merge = self._merge
+        merge.remove_all_inputs()
+        parts = [self._parts[i] for i in sorted(self._parts.keys())]
+        if len(parts) == 0:
+            parts = [tvtk.PolyData()]
+        for part in parts:
+            if is_old_pipeline():
+                merge.add_input(part)
+            else:
+                merge.add_input_data(part)
+        merge.update()
+        self.data_changed = True
         self.render()
 
     def _stream_tracer_changed(self, old, new):
         if old is not None:
-            old.on_trait_change(self.render, remove=True)
+            old.on_trait_change(self._on_tracer_changed, remove=True)
         seed = self.seed
         if seed is not None:
             self.configure_source_data(new, seed.poly_data)
-        new.on_trait_change(self.render)
+        new.on_trait_change(self._on_tracer_changed)
         mm = self.module_manager
         if mm is not None:
             src = mm.source
@@ -244,9 +444,13 @@ class Streamline(Module):
         self.update_pipeline()
 
     def _seed_changed(self, old, new):
+        if old is not None:
+            old.on_trait_change(self._on_seed_updated, 'poly_data_updated',
+                                remove=True)
         st = self.stream_tracer
         if st is not None:
             self.configure_source_data(st, new.poly_data)
+        new.on_trait_change(self._on_seed_updated, 'poly_data_updated')
         self._change_components(old, new)
 
     def _ribbon_filter_changed(self, old, new):
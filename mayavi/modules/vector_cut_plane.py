@@ -10,7 +10,7 @@ attributes.
 
 
 # Enthought library imports.
-from traits.api import Instance
+from traits.api import Instance, Any
 from traitsui.api import View, Group, Item
 
 # Local imports
@@ -43,6 +43,10 @@ class VectorCutPlane(Module):
     # The Glyph component.
     actor = Instance(Actor, allow_none=False, record=True)
 
+    # The vector LUT and its vector mode before it was changed for the
+    # instanced glyphs, None if it was not changed.
+    _saved_vector_mode = Any
+
     input_info = PipelineInfo(datasets=['any'],
                               attribute_types=['any'],
                               attributes=['vectors'])
@@ -61,6 +65,14 @@ class VectorCutPlane(Module):
                       show_labels=False),
                 )
 
+    ######################################################################
+    # `object` interface
+    ######################################################################
+    def __get_pure_state__(self):
+        d = super(VectorCutPlane, self).__get_pure_state__()
+        d.pop('_saved_vector_mode', None)
+        return d
+
     ######################################################################
     # `Module` interface
     ######################################################################
@@ -107,6 +119,10 @@ class VectorCutPlane(Module):
 
         self.pipeline_changed = True
 
+    def stop(self):
+        self._restore_vector_mode()
+        super(VectorCutPlane, self).stop()
+
     def update_data(self):
         """Override this method so that it flushes the vtk pipeline if
         that is necessary.
@@ -124,6 +140,7 @@ class VectorCutPlane(Module):
         # This is a listner for the glyph component's color_mode trait
         # so that the the lut can be changed when the a different
         # color mode is requested.
+        self._restore_vector_mode()
         actor = self.actor
         if value == 'color_by_scalar':
             actor.mapper.scalar_visibility = 1
@@ -132,6 +149,12 @@ class VectorCutPlane(Module):
         elif value == 'color_by_vector':
             lut_mgr = self.module_manager.vector_lut_manager
             actor.set_lut(lut_mgr.lut)
+            if self.glyph.instanced:
+                # The glyph mapper maps the vectors themselves.  The
+                # LUT is shared so its mode is restored later.
+                lut = lut_mgr.lut
+                self._saved_vector_mode = (lut, lut.vector_mode)
+                lut.vector_mode = 'magnitude'
         else:
             actor.mapper.scalar_visibility = 0
 
@@ -154,17 +177,32 @@ class VectorCutPlane(Module):
             g.inputs = [new]
         self._change_components(old, new)
 
+    def _restore_vector_mode(self):
+        saved = self._saved_vector_mode
+        if saved is not None:
+            lut, mode = saved
+            lut.vector_mode = mode
+            self._saved_vector_mode = None
+
+    def _instanced_changed(self):
+        self.glyph.configure_actor(self.actor)
+        if self.module_manager is not None:
+            self._color_mode_changed(self.glyph.color_mode)
+
     def _glyph_changed(self, old, new):
         if old is not None:
             old.on_trait_change(self._color_mode_changed,
                                 'color_mode',
                                 remove=True)
+            old.on_trait_change(self._instanced_changed, 'instanced',
+                                remove=True)
         new.module = self
         cutter = self.cutter
         if cutter:
             new.inputs = [cutter]
         new.on_trait_change(self._color_mode_changed,
                             'color_mode')
+        new.on_trait_change(self._instanced_changed, 'instanced')
         self._change_components(old, new)
 
     def _actor_changed(self, old, new):
@@ -172,5 +210,6 @@ class VectorCutPlane(Module):
         glyph = self.glyph
         if glyph is not None:
             new.inputs = [glyph]
+            glyph.configure_actor(new)
         self._change_components(old, new)
 
@@ -11,11 +11,13 @@ probably with the ImageData based renderers.
 
 # Standard imports
 from math import cos, sqrt, pi
+import time
+import numpy
 from vtk.util import vtkConstants
 
 # Enthought library imports.
 from traits.api import Instance, Property, List, ReadOnly, \
-     Str, Button, Tuple
+     Str, Button, Tuple, Bool, Int, Float, Enum, Dict, Any
 from traitsui.api import View, Group, Item, InstanceEditor
 from tvtk.api import tvtk
 from tvtk.util.gradient_editor import hsva_to_rgba, GradientTable
@@ -125,6 +127,51 @@ def default_CTF(x1, x2):
                     mode='sqrt')
 
 
+def downsample_image_data(data, factor):
+    """Return a new `tvtk.ImageData` obtained by averaging blocks of
+    `factor` points along each axis of the point scalars of the given
+    image `data`.  Axes with fewer than `factor` points are left alone.
+    Each component of multi-component (e.g. RGB or RGBA) scalars is
+    averaged separately.  The type of the scalars is preserved, integer
+    averages are rounded half up to the nearest value.
+    """
+    dims = tuple(data.dimensions)
+    sc = data.point_data.scalars
+    ncomp = sc.number_of_components
+    # The array is indexed as [z, y, x, component].
+    arr = numpy.reshape(sc.to_array(), dims[::-1] + (ncomp,))
+    f = [min(factor, n) for n in dims[::-1]]
+    n = [(dims[::-1][i]//f[i])*f[i] for i in range(3)]
+    arr = arr[:n[0], :n[1], :n[2]]
+    # Sum the points of each block in a float accumulator of the size of
+    # the result, float32 for small types, instead of a float64 copy of
+    # the whole array.
+    acc = numpy.zeros((n[0]//f[0], n[1]//f[1], n[2]//f[2], ncomp),
+                      dtype=numpy.result_type(arr.dtype, numpy.float32))
+    for i in range(f[0]):
+        for j in range(f[1]):
+            for k in range(f[2]):
+                numpy.add(acc, arr[i::f[0], j::f[1], k::f[2]], out=acc)
+    acc /= f[0]*f[1]*f[2]
+    if numpy.issubdtype(arr.dtype, numpy.integer):
+        acc += 0.5
+        numpy.floor(acc, out=acc)
+    avg = acc.astype(arr.dtype)
+
+    fx = numpy.array(f[::-1])
+    spacing = numpy.array(data.spacing)
+    result = tvtk.ImageData(dimensions=avg.shape[2::-1],
+                            spacing=tuple(spacing*fx),
+                            origin=tuple(numpy.array(data.origin) +
+                                         0.5*(fx - 1)*spacing))
+    if ncomp == 1:
+        result.point_data.scalars = numpy.ravel(avg)
+    else:
+        result.point_data.scalars = numpy.reshape(avg, (-1, ncomp))
+    result.point_data.scalars.name = sc.name
+    return result
+
+
 def load_volume_prop_from_grad(grad_file_name, volume_prop,
                                scalar_range=(0, 255)):
     """Load a ``*.grad`` file (*grad_file_name*) and set the given volume
@@ -202,6 +249,22 @@ class Volume(Module):
     lut_manager = Instance(VolumeLUTManager, args=(), allow_none=False,
                            record=True)
 
+    # Render a coarse, block averaged level of detail of ImageData
+    # inputs while the camera is being interacted with.
+    use_lod = Bool(False, desc='if a coarse volume is used during '
+                               'interaction')
+
+    # The downsampling factor of the level of detail rendered during
+    # interaction.
+    interactive_lod = Enum(4, 2, 8, desc='the level of detail rendered '
+                                         'during interaction')
+
+    # The time in seconds taken to build the level of detail pyramid.
+    lod_build_time = Float(0.0, desc='the time taken to build the pyramid')
+
+    # The memory in bytes used by the level of detail pyramid.
+    lod_memory = Int(0, desc='the memory used by the pyramid')
+
     input_info = PipelineInfo(datasets=['image_data',
                                         'unstructured_grid'],
                               attribute_types=['any'],
@@ -236,6 +299,12 @@ class Volume(Module):
                            resizable=True),
                       label='Property',
                       show_labels=False),
+                Group(Item(name='use_lod'),
+                      Item(name='interactive_lod', enabled_when='use_lod'),
+                      Item(name='lod_build_time', style='readonly'),
+                      Item(name='lod_memory', style='readonly'),
+                      label='LOD',
+                      ),
                 Group(Item(name='volume', style='custom',
                            editor=InstanceEditor(),
                            resizable=True),
@@ -267,13 +336,28 @@ class Volume(Module):
     # The opacity values.
     _otf = Instance(PiecewiseFunction)
 
+    # The level of detail pyramid, mapping the downsampling factor to
+    # the image data.
+    _lod_pyramid = Dict(Int, Instance(tvtk.ImageData))
+
+    # The modification time of the input the pyramid was built from.
+    _lod_mtime = Int(-1)
+
+    # The interactor and observer ids used to switch the level of detail.
+    _lod_interactor = Any
+    _lod_observers = List(Int)
+
+    # True while the coarse level of detail is being rendered.
+    _lod_active = Bool(False)
+
     ######################################################################
     # `object` interface
     ######################################################################
     def __get_pure_state__(self):
         d = super(Volume, self).__get_pure_state__()
         d['ctf_state'] = save_ctfs(self._volume_property)
-        for name in ('current_range', '_ctf', '_otf'):
+        for name in ('current_range', '_ctf', '_otf', '_lod_pyramid',
+                     '_lod_interactor', '_lod_observers'):
             d.pop(name, None)
         return d
 
@@ -292,8 +376,10 @@ class Volume(Module):
     def start(self):
         super(Volume, self).start()
         self.lut_manager.start()
+        self._setup_lod_observers()
 
     def stop(self):
+        self._remove_lod_observers()
         super(Volume, self).stop()
         self.lut_manager.stop()
 
@@ -356,6 +442,7 @@ class Volume(Module):
         self._setup_current_range()
         self._volume_mapper_type_changed(self.volume_mapper_type)
         self._update_ctf_fired()
+        self._update_lod_pyramid()
         self.pipeline_changed = True
 
     def update_data(self):
@@ -368,8 +455,41 @@ class Volume(Module):
         self._setup_mapper_types()
         self._setup_current_range()
         self._update_ctf_fired()
+        self._update_lod_pyramid()
         self.data_changed = True
 
+    ######################################################################
+    # `Volume` interface
+    ######################################################################
+    def build_lod_pyramid(self):
+        """Build the 2x, 4x and 8x block averaged levels of detail of
+        the input.  This is done automatically when `use_lod` is on and
+        the input changes.  The time taken and the memory used are
+        stored in `lod_build_time` and `lod_memory`.
+        """
+        self._lod_pyramid = {}
+        self.lod_build_time = 0.0
+        self.lod_memory = 0
+        mm = self.module_manager
+        if mm is None:
+            return
+        dataset = mm.source.get_output_dataset()
+        if not dataset.is_a('vtkImageData') or \
+                dataset.point_data.scalars is None:
+            return
+        t1 = time.time()
+        pyramid = {}
+        data = dataset
+        for factor in (2, 4, 8):
+            # Each level is averaged from the previous one.
+            data = downsample_image_data(data, 2)
+            pyramid[factor] = data
+        self.lod_build_time = time.time() - t1
+        self.lod_memory = sum(d.point_data.scalars.to_array().nbytes
+                              for d in pyramid.values())
+        self._lod_pyramid = pyramid
+        self._lod_mtime = dataset.m_time
+
     ######################################################################
     # Non-public methods.
     ######################################################################
@@ -507,3 +627,65 @@ class Volume(Module):
     def _scene_changed(self, old, new):
         super(Volume, self)._scene_changed(old, new)
         self.lut_manager.scene = new
+        if self.running:
+            self._remove_lod_observers()
+            self._setup_lod_observers()
+
+    def _use_lod_changed(self, value):
+        if value:
+            self._update_lod_pyramid()
+        else:
+            self._end_lod()
+            self._lod_pyramid = {}
+            self._lod_mtime = -1
+
+    def _update_lod_pyramid(self):
+        """Rebuild the pyramid if it is enabled and out of date."""
+        mm = self.module_manager
+        if not self.use_lod or mm is None:
+            return
+        dataset = mm.source.get_output_dataset()
+        if dataset is not None and dataset.m_time != self._lod_mtime:
+            self._end_lod()
+            self.build_lod_pyramid()
+
+    def _setup_lod_observers(self):
+        scene = self.scene
+        if scene is None or scene.interactor is None:
+            return
+        interactor = scene.interactor
+        self._lod_interactor = interactor
+        self._lod_observers = [
+            interactor.add_observer('StartInteractionEvent',
+                                    self._start_lod),
+            interactor.add_observer('EndInteractionEvent',
+                                    self._end_lod)
+        ]
+
+    def _remove_lod_observers(self):
+        interactor = self._lod_interactor
+        if interactor is not None:
+            for oid in self._lod_observers:
+                interactor.remove_observer(oid)
+        self._lod_interactor = None
+        self._lod_observers = []
+
+    def _start_lod(self, *args):
+        """Switch the mapper to the coarse level of detail."""
+        data = self._lod_pyramid.get(self.interactive_lod)
+        vm = self._volume_mapper
+        if not self.use_lod or data is None or vm is None:
+            return
+        self.configure_input_data(vm, data)
+        self._lod_active = True
+
+    def _end_lod(self, *args):
+        """Switch the mapper back to the full resolution input."""
+        if not self._lod_active:
+            return
+        self._lod_active = False
+        mm = self.module_manager
+        vm = self._volume_mapper
+        if mm is not None and vm is not None:
+            self.configure_connection(vm, mm.source)
+            self.render()
@@ -110,6 +110,16 @@ following:
      This is most useful for scripts that need to render images
      offscreen.
 
+--profile report-file
+
+     Profile the Mayavi pipeline while the application runs and save
+     the report to the given file when it exits.  The report records
+     the time spent updating each filter, module and module manager,
+     the VTK execution time and output size of each object, and the
+     time spent rendering each scene.  A file ending with '.json' gets
+     a JSON report, any other file the folded stacks used by flame
+     graph tools.
+
 -x script-file
 --exec script-file
 
@@ -215,7 +225,7 @@ def parse_cmd_line(arguments):
                  'exec=',
                  'set=',
                  'verbose',
-                 'module-mgr', 'new-scene', 'offscreen']
+                 'module-mgr', 'new-scene', 'offscreen', 'profile=']
 
     try:
         opts, args = getopt.getopt (arguments, options, long_opts)
@@ -260,6 +270,11 @@ def process_cmd_line(app, opts, args):
     script = app.script
     last_obj = None
 
+    for o, a in opts:
+        if o == '--profile':
+            _start_profiler(script.engine, a)
+    opts = [x for x in opts if x[0] != '--profile']
+
     # Start a new scene by default if there is none currently and none
     # was specified at the start of the command line arguments.
     if script.engine.current_scene is None:
@@ -389,6 +404,22 @@ def process_cmd_line(app, opts, args):
             script.open(arg)
 
 
+def _start_profiler(engine, fname):
+    """Start profiling the given engine, the report is saved to
+    `fname` when the application exits.
+    """
+    import atexit
+    profiler = engine.profile()
+    profiler.start()
+
+    def save_report():
+        profiler.stop()
+        profiler.save(fname)
+        print('Saved profile to %s'%fname)
+
+    atexit.register(save_report)
+
+
 def run_script(mayavi, script_name):
     """Execfiles a given script.  The name `mayavi` is bound to the
     mayavi script instance just like in the embedded interpreter.
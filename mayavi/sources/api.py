@@ -11,6 +11,7 @@ from .builtin_image import BuiltinImage
 from .builtin_surface import BuiltinSurface
 from .chaco_reader import ChacoReader
 from .image_reader import ImageReader
+from .memmap_volume_reader import MemmapVolumeReader
 from .parametric_surface import ParametricSurface
 from .plot3d_reader import PLOT3DReader
 from .point_load import PointLoad
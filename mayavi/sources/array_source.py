@@ -11,7 +11,7 @@ from vtk.util import vtkConstants
 
 # Enthought library imports
 from traits.api import (Instance, Trait, Str, Bool, Button, DelegatesTo, List,
-                        Int)
+                        Int, Enum)
 from traitsui.api import View, Group, Item
 from tvtk.api import tvtk
 from tvtk import array_handler
@@ -106,7 +106,15 @@ class ArraySource(Source):
     # user explicitly requests that transpose_input_array is false
     # then we assume that the array has already been suitably
     # formatted by the user.
-    transpose_input_array = Bool(True, desc='if input array should be transposed (if on VTK will copy the input data)')
+    transpose_input_array = Bool(True, desc='if input array should be transposed (if on VTK will copy C ordered input data)')
+
+    # The order of the axes of the input arrays when
+    # `transpose_input_array` is on.  With 'xyz' the arrays are indexed
+    # as [x, y, z] and are not copied if they are Fortran ordered.  With
+    # 'zyx' they are indexed as [z, y, x], which is the natural layout
+    # of C ordered arrays, and C ordered arrays are not copied.
+    input_axis_order = Enum('xyz', 'zyx',
+                            desc='the order of the axes of the input arrays')
 
     # Information about what this object can produce.
     output_info = PipelineInfo(datasets=['image_data'])
@@ -116,6 +124,8 @@ class ArraySource(Source):
 
     # Our view.
     view = View(Group(Item(name='transpose_input_array'),
+                      Item(name='input_axis_order',
+                           enabled_when='transpose_input_array'),
                       Item(name='scalar_name'),
                       Item(name='vector_name'),
                       Item(name='spacing'),
@@ -178,9 +188,7 @@ class ArraySource(Source):
             img_data.point_data.scalars = None
             self.data_changed = True
             return
-        dims = list(data.shape)
-        if len(dims) == 2:
-            dims.append(1)
+        dims = self._get_dimensions(data.shape)
 
         # set the dimension indices
         dim0, dim1, dim2 = self.dimensions_order
@@ -193,10 +201,15 @@ class ArraySource(Source):
         else:
             update_extent = [0, dims[dim0]-1, 0, dims[dim1]-1, 0, dims[dim2]-1]
             self.change_information_filter.set_update_extent(update_extent)
-        if self.transpose_input_array:
-            img_data.point_data.scalars = numpy.ravel(numpy.transpose(data))
-        else:
+        if not self.transpose_input_array:
             img_data.point_data.scalars = numpy.ravel(data)
+        elif self.input_axis_order == 'zyx':
+            # No copy is made for C ordered arrays.
+            img_data.point_data.scalars = numpy.ravel(data, order='C')
+        else:
+            # This is the same as ravelling the transpose of the data
+            # but no copy is made for Fortran ordered arrays.
+            img_data.point_data.scalars = numpy.ravel(data, order='F')
         img_data.point_data.scalars.name = self.scalar_name
         # This is very important and if not done can lead to a segfault!
         typecode = data.dtype
@@ -220,10 +233,7 @@ class ArraySource(Source):
             img_data.point_data.vectors = None
             self.data_changed = True
             return
-        dims = list(data.shape)
-        if len(dims) == 3:
-            dims.insert(2, 1)
-            data = numpy.reshape(data, dims)
+        dims = self._get_dimensions(data.shape[:-1]) + [3]
 
         img_data.origin = tuple(self.origin)
         img_data.dimensions = tuple(dims[:-1])
@@ -235,11 +245,14 @@ class ArraySource(Source):
             update_extent = [0, dims[0]-1, 0, dims[1]-1, 0, dims[2]-1]
             self.change_information_filter.set_update_extent(update_extent)
         sz = numpy.size(data)
-        if self.transpose_input_array:
+        if self.transpose_input_array and self.input_axis_order == 'xyz':
+            if len(data.shape) == 3:
+                data = numpy.reshape(data, dims)
             data_t = numpy.transpose(data, (2, 1, 0, 3))
         else:
             data_t = data
-        img_data.point_data.vectors = numpy.reshape(data_t, (sz/3, 3))
+        # This does not copy the data if it is suitably ordered.
+        img_data.point_data.vectors = numpy.reshape(data_t, (sz//3, 3))
         img_data.point_data.vectors.name = self.vector_name
         if is_old_pipeline():
             img_data.update() # This sets up the extents correctly.
@@ -267,6 +280,21 @@ class ArraySource(Source):
         if self.vector_data is not None:
             self._vector_data_changed(self.vector_data)
 
+    def _input_axis_order_changed(self, value):
+        self._transpose_input_array_changed(self.transpose_input_array)
+
+    def _get_dimensions(self, shape):
+        """Return the VTK dimensions of the image, as a list of three
+        ints, given the shape of the input array without any vector
+        component axis.
+        """
+        dims = list(shape)
+        if self.transpose_input_array and self.input_axis_order == 'zyx':
+            dims = dims[::-1]
+        if len(dims) == 2:
+            dims.append(1)
+        return dims
+
     def _information_changed(self):
         self.change_information_filter.update()
         self.data_changed = True
@@ -0,0 +1,429 @@
+"""An out-of-core volume reader for raw binary and ``.npy`` files.
+
+The file is memory-mapped and never read in full.  The reader produces
+two image data outputs: a strided, level of detail overview of the whole
+volume and a full resolution "detail" region.  Both are limited to
+``max_points`` points so that the memory used stays bounded whatever
+the size of the file.  The detail region can be set explicitly via the
+``voi`` trait or made to follow a ``ScalarCutPlane``,
+``ImagePlaneWidget`` or ``ExtractGrid`` with the ``track`` method.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+# Standard library imports.
+from os.path import basename, splitext
+
+import numpy
+
+# Enthought library imports.
+from traits.api import (Str, Enum, Int, Range, Array, Any, List,
+                        Property, Button, Instance, on_trait_change)
+from traitsui.api import View, Group, Item
+from tvtk.api import tvtk
+
+# Local imports.
+from mayavi.core.source import Source
+from mayavi.core.pipeline_info import PipelineInfo
+
+
+######################################################################
+# Utility functions.
+######################################################################
+def get_stride(shape, max_points):
+    """Return the smallest integer stride which, when used to subsample
+    an array of the given `shape`, results in at most `max_points`
+    points.
+    """
+    stride = 1
+    while True:
+        n = 1
+        for d in shape:
+            n *= (d - 1)//stride + 1
+        if n <= max_points or stride >= max(shape):
+            return stride
+        stride += 1
+
+
+def _snap_extent(extent, brick_size, shape):
+    """Grow the given inclusive `extent` outward to the nearest brick
+    boundaries, clipped to the array `shape`.
+    """
+    result = []
+    for i in range(3):
+        lo, hi = extent[2*i], extent[2*i+1]
+        lo = max((lo//brick_size)*brick_size, 0)
+        hi = min(((hi//brick_size) + 1)*brick_size - 1, shape[i] - 1)
+        result.extend([lo, hi])
+    return tuple(result)
+
+
+def _plane_extent(origin, normal, shape, thickness):
+    """Given a plane in index coordinates, return the inclusive index
+    extent of the slab of given `thickness` that contains the part of the
+    plane lying inside an array of the given `shape`.
+    """
+    normal = numpy.asarray(normal, dtype=float)
+    origin = numpy.asarray(origin, dtype=float)
+    axis = int(numpy.argmax(numpy.abs(normal)))
+    others = [i for i in range(3) if i != axis]
+    extent = [0, shape[0] - 1, 0, shape[1] - 1, 0, shape[2] - 1]
+    if abs(normal[axis]) < 1e-12:
+        return tuple(extent)
+    # Find where the plane crosses the dominant axis at the corners of
+    # the volume.
+    values = []
+    for a in (0, shape[others[0]] - 1):
+        for b in (0, shape[others[1]] - 1):
+            d = normal[others[0]]*(a - origin[others[0]]) + \
+                normal[others[1]]*(b - origin[others[1]])
+            values.append(origin[axis] - d/normal[axis])
+    lo = int(numpy.floor(min(values))) - thickness//2
+    hi = int(numpy.ceil(max(values))) + thickness//2
+    extent[2*axis] = min(max(lo, 0), shape[axis] - 1)
+    extent[2*axis+1] = min(max(hi, 0), shape[axis] - 1)
+    return tuple(extent)
+
+
+######################################################################
+# `MemmapVolumeReader` class.
+######################################################################
+class MemmapVolumeReader(Source):
+
+    """An out-of-core reader for large raw binary or ``.npy`` volumes.
+
+    The first output is a level of detail overview of the complete
+    volume, the second is the full resolution data inside the volume of
+    interest, ``voi``.  Use a ``SelectOutput`` filter to view the
+    second output.
+    """
+
+    # The version of this class.  Used for persistence.
+    __version__ = 0
+
+    # The file to read.
+    file_name = Str('', desc='the raw or .npy file to read')
+
+    # The number of points along each axis.  This is only needed for
+    # raw files; it is read from the header of .npy files.
+    dimensions = Array(int, value=(0, 0, 0), shape=(3,),
+                       desc='the number of points along x, y and z')
+
+    # The type of the data in raw files.
+    data_type = Enum('uint8', 'int8', 'uint16', 'int16', 'uint32',
+                     'int32', 'float32', 'float64',
+                     desc='the type of the data in a raw file')
+
+    # The byte order of raw files.
+    byte_order = Enum('little', 'big', desc='the byte order of a raw file')
+
+    # The number of bytes to skip at the start of raw files.
+    header_size = Int(0, desc='the size of the header of a raw file')
+
+    # The order of the data in raw files.  'fortran' means that x
+    # varies fastest, as VTK expects, 'c' means that z varies fastest.
+    file_order = Enum('fortran', 'c', desc='the memory order of the file')
+
+    # The spacing of the points in the volume.
+    spacing = Array(float, value=(1.0, 1.0, 1.0), shape=(3,),
+                    desc='the spacing between the points')
+
+    # The origin of the volume.
+    origin = Array(float, value=(0.0, 0.0, 0.0), shape=(3,),
+                   desc='the origin of the volume')
+
+    # The maximum number of points handed to VTK for each output.
+    max_points = Range(1, None, 128**3,
+                       desc='the maximum number of points per output')
+
+    # The detail region is grown to multiples of this size, this avoids
+    # re-reading the data on every small change of the region.
+    brick_size = Range(1, None, 32, desc='the size of a brick')
+
+    # The thickness of the slab read around a tracked plane.
+    slab_thickness = Range(1, None, 8,
+                           desc='the thickness of the slab around a plane')
+
+    # The volume of interest, in full resolution index coordinates, for
+    # the detail output.  Given as (x_min, x_max, y_min, y_max, z_min,
+    # z_max), both ends inclusive.
+    voi = Array(int, value=(0, -1, 0, -1, 0, -1), shape=(6,),
+                desc='the full resolution volume of interest')
+
+    # Resets the volume of interest to the full volume.
+    reset_voi = Button('Reset volume of interest')
+
+    # The stride used for the overview output.
+    overview_stride = Property(Int, depends_on='_overview_stride')
+
+    # The stride used for the detail output.  This is 1 unless the
+    # volume of interest is too large for the point budget.
+    detail_stride = Property(Int, depends_on='_detail_stride')
+
+    # The number of bytes held by the outputs.
+    memory_usage = Property(Int)
+
+    # Information about what this object can produce.
+    output_info = PipelineInfo(datasets=['image_data'],
+                               attribute_types=['any'],
+                               attributes=['scalars'])
+
+    # Our view.
+    view = View(Group(Item(name='file_name', style='readonly'),
+                      Item(name='dimensions'),
+                      Item(name='data_type'),
+                      Item(name='byte_order'),
+                      Item(name='header_size'),
+                      Item(name='file_order'),
+                      Item(name='spacing'),
+                      Item(name='origin'),
+                      label='File'),
+                Group(Item(name='max_points'),
+                      Item(name='brick_size'),
+                      Item(name='slab_thickness'),
+                      Item(name='voi'),
+                      Item(name='reset_voi', show_label=False),
+                      Item(name='overview_stride', style='readonly'),
+                      Item(name='detail_stride', style='readonly'),
+                      Item(name='memory_usage', style='readonly'),
+                      label='Level of detail'),
+                resizable=True)
+
+    ########################################
+    # Private traits.
+
+    # The memory-mapped array, indexed as [x, y, z].
+    _array = Any
+
+    # The overview and detail datasets.
+    _overview = Instance(tvtk.ImageData, args=())
+    _detail = Instance(tvtk.ImageData, args=())
+
+    _overview_stride = Int(1)
+    _detail_stride = Int(1)
+
+    # The brick aligned extent currently held by the detail output.
+    _detail_extent = Any
+
+    # (object, callable) pairs to remove the handlers of tracked objects.
+    _trackers = List
+
+    ######################################################################
+    # `object` interface
+    ######################################################################
+    def __get_pure_state__(self):
+        d = super(MemmapVolumeReader, self).__get_pure_state__()
+        for name in ('_array', '_overview', '_detail'):
+            d.pop(name, None)
+        return d
+
+    ######################################################################
+    # `MemmapVolumeReader` interface
+    ######################################################################
+    def initialize(self, file_name):
+        """Used by the engine to open the given file."""
+        self.file_name = file_name
+
+    def track(self, obj):
+        """Make the detail output follow the given object.  `obj` may be
+        a module or filter with an ``implicit_plane`` (for example a
+        ``ScalarCutPlane``), an ``ImagePlaneWidget`` module or an
+        ``ExtractGrid`` filter connected to the overview output.
+        """
+        if hasattr(obj, 'implicit_plane'):
+            plane = obj.implicit_plane.plane
+            handler = lambda: self._track_plane(plane.origin, plane.normal)
+            plane.on_trait_change(handler, 'origin,normal')
+            remover = lambda: plane.on_trait_change(handler,
+                                                    'origin,normal',
+                                                    remove=True)
+            handler()
+        elif hasattr(obj, 'ipw'):
+            ipw = tvtk.to_vtk(obj.ipw)
+            handler = lambda *args: self._track_plane(ipw.GetOrigin(),
+                                                      ipw.GetNormal())
+            oid = ipw.AddObserver('InteractionEvent', handler)
+            remover = lambda: ipw.RemoveObserver(oid)
+            handler()
+        elif hasattr(obj, 'x_ratio'):
+            names = 'x_min,x_max,y_min,y_max,z_min,z_max'
+            handler = lambda: self._track_extract_grid(obj)
+            obj.on_trait_change(handler, names)
+            remover = lambda: obj.on_trait_change(handler, names,
+                                                  remove=True)
+            handler()
+        else:
+            raise TypeError('Cannot track object %r' % obj)
+        self._trackers.append((obj, remover))
+
+    def untrack(self, obj=None):
+        """Stop tracking `obj`, or all tracked objects if `obj` is None."""
+        for item in self._trackers[:]:
+            if obj is None or item[0] is obj:
+                item[1]()
+                self._trackers.remove(item)
+
+    ######################################################################
+    # `Base` interface
+    ######################################################################
+    def stop(self):
+        self.untrack()
+        super(MemmapVolumeReader, self).stop()
+
+    ######################################################################
+    # Non-public interface
+    ######################################################################
+    def _file_name_changed(self):
+        self._open()
+        self.name = self._get_name()
+
+    @on_trait_change('dimensions,data_type,byte_order,header_size,'
+                     'file_order')
+    def _file_format_changed(self):
+        self._open()
+
+    @on_trait_change('spacing,origin,max_points')
+    def _geometry_changed(self):
+        self._detail_extent = None
+        self._update_overview()
+        self._update_detail()
+
+    def _brick_size_changed(self):
+        self._update_detail()
+
+    def _reset_voi_fired(self):
+        self.voi = (0, -1, 0, -1, 0, -1)
+
+    def _voi_changed(self):
+        self._update_detail()
+
+    def _get_name(self):
+        if len(self.file_name) == 0:
+            return 'MemmapVolumeReader'
+        return 'MemmapVolumeReader: %s' % basename(self.file_name)
+
+    def _get_overview_stride(self):
+        return self._overview_stride
+
+    def _get_detail_stride(self):
+        return self._detail_stride
+
+    def _get_memory_usage(self):
+        total = 0
+        for data in (self._overview, self._detail):
+            if data is not None:
+                total += data.actual_memory_size*1024
+        return total
+
+    def _open(self):
+        """Memory-map the file."""
+        fname = self.file_name
+        if len(fname) == 0:
+            return
+        if splitext(fname)[1].lower() == '.npy':
+            arr = numpy.load(fname, mmap_mode='r')
+            if arr.ndim == 2:
+                arr = arr[:, :, numpy.newaxis]
+            if arr.ndim != 3:
+                raise ValueError('%s: only 2D or 3D arrays are supported, '
+                                 'not %dD ones.' % (fname, arr.ndim))
+        else:
+            shape = tuple(int(x) for x in self.dimensions)
+            if min(shape) < 1:
+                return
+            dtype = numpy.dtype(self.data_type)
+            if self.byte_order == 'little':
+                dtype = dtype.newbyteorder('<')
+            else:
+                dtype = dtype.newbyteorder('>')
+            order = 'C' if self.file_order == 'c' else 'F'
+            arr = numpy.memmap(fname, dtype=dtype, mode='r',
+                               offset=self.header_size, shape=shape,
+                               order=order)
+        self._array = arr
+        self._detail_extent = None
+        self._update_overview()
+        self._update_detail()
+        self.outputs = [self._overview, self._detail]
+
+    def _get_full_extent(self):
+        shape = self._array.shape
+        return (0, shape[0] - 1, 0, shape[1] - 1, 0, shape[2] - 1)
+
+    def _get_voi_extent(self):
+        """Return the volume of interest clipped to the data."""
+        shape = self._array.shape
+        voi = [int(x) for x in self.voi]
+        result = []
+        for i in range(3):
+            lo, hi = voi[2*i], voi[2*i+1]
+            if hi < 0:
+                hi = shape[i] - 1
+            lo = min(max(lo, 0), shape[i] - 1)
+            hi = min(max(hi, lo), shape[i] - 1)
+            result.extend([lo, hi])
+        return tuple(result)
+
+    def _read(self, data, extent, stride):
+        """Read the given inclusive index `extent` of the file with the
+        given `stride` into the image `data`.  Only the required part of
+        the file is paged in.
+        """
+        x0, x1, y0, y1, z0, z1 = extent
+        block = self._array[x0:x1+1:stride, y0:y1+1:stride, z0:z1+1:stride]
+        # This is the only copy made and is bounded by max_points.
+        flat = numpy.ravel(block, order='F')
+        if not flat.dtype.isnative:
+            flat = flat.astype(flat.dtype.newbyteorder('='))
+        spacing = numpy.asarray(self.spacing)
+        origin = numpy.asarray(self.origin) + \
+                 spacing*numpy.array([x0, y0, z0])
+        data.origin = tuple(origin)
+        data.spacing = tuple(spacing*stride)
+        data.dimensions = block.shape
+        data.point_data.scalars = flat
+        data.point_data.scalars.name = 'scalar'
+        data.modified()
+
+    def _update_overview(self):
+        if self._array is None:
+            return
+        shape = self._array.shape
+        stride = get_stride(shape, self.max_points)
+        self._overview_stride = stride
+        self._read(self._overview, self._get_full_extent(), stride)
+        self.data_changed = True
+
+    def _update_detail(self):
+        if self._array is None:
+            return
+        shape = self._array.shape
+        extent = _snap_extent(self._get_voi_extent(), self.brick_size, shape)
+        stride = get_stride([extent[2*i+1] - extent[2*i] + 1
+                             for i in range(3)], self.max_points)
+        if (extent, stride) == self._detail_extent:
+            return
+        self._detail_extent = (extent, stride)
+        self._detail_stride = stride
+        self._read(self._detail, extent, stride)
+        self.data_changed = True
+        self.render()
+
+    def _track_plane(self, origin, normal):
+        """Set the volume of interest to a slab around the plane given
+        in world coordinates."""
+        if self._array is None:
+            return
+        spacing = numpy.asarray(self.spacing)
+        index_origin = (numpy.asarray(origin) - self.origin)/spacing
+        index_normal = numpy.asarray(normal)*spacing
+        self.voi = _plane_extent(index_origin, index_normal,
+                                 self._array.shape, self.slab_thickness)
+
+    def _track_extract_grid(self, extract_grid):
+        """Set the volume of interest to the VOI of an ExtractGrid filter
+        acting on the overview output."""
+        s = self._overview_stride
+        e = extract_grid
+        self.voi = (e.x_min*s, e.x_max*s, e.y_min*s, e.y_max*s,
+                    e.z_min*s, e.z_max*s)
@@ -248,6 +248,19 @@ open_chaco = SourceMetadata(
                                attributes=['any'])
 )
 
+open_memmap_volume = SourceMetadata(
+    id            = "MemmapVolumeFile",
+    class_name    = BASE + ".memmap_volume_reader.MemmapVolumeReader",
+    menu_name     = "&Out-of-core volume file (NPY/raw)",
+    tooltip       = "Open a large NPY or raw volume without loading it",
+    desc        = "Open a large NPY or raw volume without loading it",
+    help        = "Open a large NPY or raw volume without loading it",
+    extensions = ['npy'],
+    wildcard = 'NPY files (*.npy)|*.npy',
+    output_info = PipelineInfo(datasets=['image_data'],
+                               attribute_types=['any'],
+                               attributes=['scalars'])
+)
 
 
 # Now collect all the sources for the mayavi registry.
@@ -265,5 +278,6 @@ sources = [open_3ds,
            open_ugrid_data,
            open_volume,
            open_chaco,
+           open_memmap_volume,
            ]
 
@@ -9,9 +9,15 @@ files.
 
 # Standard library imports.
 from os.path import basename, isfile, exists, splitext
+from multiprocessing.pool import ThreadPool
+import threading
+import time
+
+import numpy
 
 # Enthought library imports.
-from traits.api import Trait, Instance, Str, TraitPrefixMap, Button
+from traits.api import Trait, Instance, Str, TraitPrefixMap, Button, \
+     Bool, Range, List, Int, Dict, Float, Any
 from traitsui.api import View, Group, Item, FileEditor
 from tvtk.api import tvtk
 from apptools.persistence.state_pickler import set_state
@@ -19,10 +25,110 @@ from apptools.persistence.file_path import FilePath
 
 # Local imports.
 from mayavi.core.source import Source
-from mayavi.core.common import handle_children_state, error
+from mayavi.core.common import handle_children_state, error, warning
 from mayavi.core.pipeline_info import PipelineInfo
 
 
+########################################################################
+# Utility functions.
+########################################################################
+def _get_plot3d_format(reader):
+    """Return a dictionary describing the binary format of the files
+    read by the given `tvtk.MultiBlockPLOT3DReader`.
+    """
+    endian = '>' if reader.byte_order == 'big_endian' else '<'
+    ftype = 'f8' if getattr(reader, 'double_precision', False) else 'f4'
+    return dict(byte_count=bool(reader.has_byte_count),
+                multi_grid=bool(reader.multi_grid),
+                ndim=2 if reader.two_dimensional_geometry else 3,
+                i_blanking=bool(reader.i_blanking),
+                int_type=numpy.dtype(endian + 'i4'),
+                float_type=numpy.dtype(endian + ftype))
+
+
+def _get_plot3d_offsets(file_name, fmt, q_file=False):
+    """Read the header of a binary PLOT3D file and return the
+    dimensions of each block and the offset in bytes of the data of
+    each block.
+    """
+    itype, ftype = fmt['int_type'], fmt['float_type']
+    ndim = fmt['ndim']
+    mark = 4 if fmt['byte_count'] else 0
+    with open(file_name, 'rb') as f:
+        offset = 0
+        n_grids = 1
+        if fmt['multi_grid']:
+            f.seek(mark)
+            n_grids = int(numpy.fromfile(f, itype, 1)[0])
+            offset = 2*mark + itype.itemsize
+        f.seek(offset + mark)
+        dims = numpy.fromfile(f, itype, n_grids*ndim)
+        dims = numpy.reshape(dims, (n_grids, ndim)).tolist()
+        offset += 2*mark + n_grids*ndim*itype.itemsize
+
+    offsets = []
+    for d in dims:
+        n = int(numpy.prod(d))
+        if q_file:
+            # A record with fsmach, alpha, re and time and then a record
+            # with the ndim + 2 solution variables.
+            offset += 2*mark + 4*ftype.itemsize
+            offsets.append(offset + mark)
+            offset += 2*mark + (ndim + 2)*n*ftype.itemsize
+        else:
+            offsets.append(offset + mark)
+            size = ndim*n*ftype.itemsize
+            if fmt['i_blanking']:
+                size += n*itype.itemsize
+            offset += 2*mark + size
+    return dims, offsets
+
+
+def _read_plot3d_block(args):
+    """Read the grid and solution of one block.  This is run in a
+    worker thread and returns the block index, the coordinates and
+    solution arrays and the time taken.
+    """
+    index, xyz_file, q_file, fmt, dims, xyz_offset, q_offset = args
+    t1 = time.time()
+    ndim = fmt['ndim']
+    n = int(numpy.prod(dims))
+    with open(xyz_file, 'rb') as f:
+        f.seek(xyz_offset)
+        xyz = numpy.fromfile(f, fmt['float_type'], ndim*n)
+    q = None
+    if q_offset is not None:
+        with open(q_file, 'rb') as f:
+            f.seek(q_offset)
+            q = numpy.fromfile(f, fmt['float_type'], (ndim + 2)*n)
+            q = numpy.reshape(q, (ndim + 2, n))
+    return index, numpy.reshape(xyz, (ndim, n)), q, time.time() - t1
+
+
+def _make_structured_grid(dims, xyz, q):
+    """Create a `tvtk.StructuredGrid` from the arrays read by
+    `_read_plot3d_block`.
+    """
+    ndim, n = xyz.shape
+    dims = list(dims) + [1]*(3 - len(dims))
+    pts = numpy.zeros((n, 3), dtype=xyz.dtype.newbyteorder('='))
+    pts[:, :ndim] = xyz.T
+    sg = tvtk.StructuredGrid(dimensions=dims)
+    sg.points = pts
+    if q is not None:
+        q = q.astype(q.dtype.newbyteorder('='))
+        pd = sg.point_data
+        pd.scalars = q[0]
+        pd.scalars.name = 'Density'
+        momentum = numpy.zeros((n, 3), dtype=q.dtype)
+        momentum[:, :ndim] = q[1:ndim + 1].T
+        pd.vectors = momentum
+        pd.vectors.name = 'Momentum'
+        idx = pd.add_array(q[-1])
+        pd.get_array(idx).name = 'StagnationEnergy'
+    return sg
+
+
 ########################################################################
 # `PLOT3DReader` class
 ########################################################################
@@ -66,6 +172,36 @@ class PLOT3DReader(Source):
     reader = Instance(tvtk.MultiBlockPLOT3DReader, args=(), allow_none=False,
                       record=True)
 
+    # Read the blocks of binary files concurrently using numpy instead
+    # of the VTK reader.  The format settings of `reader` are used.
+    # Only the density, momentum and stagnation energy are available,
+    # the VTK reader is used if other scalars or vectors are asked for,
+    # with a function file or with i-blanking.
+    parallel_read = Bool(False, desc='if blocks are read concurrently')
+
+    # The number of threads used for a parallel read.
+    number_of_workers = Range(1, 64, 4, desc='the number of read threads')
+
+    # The indices of the blocks to read with a parallel read, all the
+    # blocks are read if this is empty.  Other blocks are not read.
+    blocks_to_load = List(Int, desc='the blocks to read')
+
+    # Do the parallel read in a background thread so the UI is not
+    # blocked.  The outputs are set when all the blocks are read.
+    background_read = Bool(False, desc='if the read is done in the '
+                                       'background')
+
+    # The number of blocks in the file.
+    number_of_blocks = Int(0, desc='the number of blocks in the file')
+
+    # The fraction of the blocks read so far.
+    read_progress = Range(0.0, 1.0, 0.0,
+                          desc='the fraction of the blocks read')
+
+    # The time in seconds taken to read each loaded block.
+    block_read_times = Dict(Int, Float,
+                            desc='the time taken to read each block')
+
     # Information about what this object can produce.
     output_info = PipelineInfo(datasets=['structured_grid'])
 
@@ -84,6 +220,17 @@ class PLOT3DReader(Source):
                       Item(name='update_reader'),
                       label='Reader',
                       ),
+                Group(Item(name='parallel_read'),
+                      Item(name='number_of_workers',
+                           enabled_when='parallel_read'),
+                      Item(name='background_read',
+                           enabled_when='parallel_read'),
+                      Item(name='blocks_to_load',
+                           enabled_when='parallel_read'),
+                      Item(name='number_of_blocks', style='readonly'),
+                      Item(name='read_progress', style='readonly'),
+                      label='Blocks',
+                      ),
                 Group(Item(name='reader', style='custom',
                            resizable=True),
                       show_labels=False,
@@ -99,6 +246,25 @@ class PLOT3DReader(Source):
     xyz_file_path = Instance(FilePath, args=(), desc='the current XYZ file path')
     q_file_path = Instance(FilePath, args=(), desc='the current Q file path')
 
+    # The blocks read by a parallel read, keyed on the block index.
+    _blocks = Dict(Int, Instance(tvtk.StructuredGrid))
+
+    # The files and format the blocks in `_blocks` were read with.
+    _blocks_key = Any
+
+    # True if the outputs are the blocks read by a parallel read.
+    _read_in_parallel = Bool(False)
+
+    # The dimensions of all the blocks in the file.
+    _block_dims = List
+
+    # The blocks still being read and the number of blocks selected.
+    _reading = List(Int)
+    _n_selected = Int(0)
+
+    # Set if the selection changed during a background read.
+    _read_again = Bool(False)
+
     ######################################################################
     # `object` interface
     ######################################################################
@@ -106,7 +272,9 @@ class PLOT3DReader(Source):
         d = super(PLOT3DReader, self).__get_pure_state__()
         # These traits are dynamically created.
         for name in ('scalars_name', 'vectors_name', 'xyz_file_name',
-                     'q_file_name'):
+                     'q_file_name', 'read_progress', 'block_read_times',
+                     '_blocks', '_blocks_key', '_block_dims', '_reading',
+                     '_read_in_parallel'):
             d.pop(name, None)
 
         return d
@@ -161,12 +329,13 @@ class PLOT3DReader(Source):
     def update(self):
         if len(self.xyz_file_path.get()) == 0:
             return
-        self.reader.update()
+        if not self._read_in_parallel:
+            self.reader.update()
         self.render()
 
     def has_output_port(self):
-        """ Return True as the reader has output port."""
-        return True
+        """ Return True if the VTK reader provides the output."""
+        return not self._read_in_parallel
 
     def get_output_object(self):
         """ Return the reader output port."""
@@ -192,6 +361,15 @@ class PLOT3DReader(Source):
             self._update_reader_output()
 
     def _update_reader_output(self):
+        if self.parallel_read:
+            msg = self._check_parallel_read()
+            if msg is None:
+                self._read_in_parallel = True
+                self._read_blocks()
+                return
+            warning('%s, using the VTK reader.'%msg)
+        self._read_in_parallel = False
+        self._blocks = {}
         r = self.reader
         r.update()
 
@@ -262,20 +440,139 @@ class PLOT3DReader(Source):
     def _scalars_name_changed(self, value):
         self.reader.scalar_function_number = self.scalars_name_
         self.reader.modified()
+        if self.parallel_read:
+            self._update_reader_output()
         self.update()
         self.data_changed = True
 
     def _vectors_name_changed(self, value):
         self.reader.vector_function_number = self.vectors_name_
         self.reader.modified()
+        if self.parallel_read:
+            self._update_reader_output()
         self.update()
         self.data_changed = True
 
     def _update_reader_fired(self):
         self.reader.modified()
+        self._blocks = {}
         self._update_reader_output()
         self.pipeline_changed = True
 
+    def _parallel_read_changed(self):
+        if len(self.xyz_file_path.get()) > 0:
+            self._update_reader_output()
+
+    def _blocks_to_load_changed(self):
+        if self.parallel_read and len(self.xyz_file_path.get()) > 0:
+            self._update_reader_output()
+
+    def _blocks_to_load_items_changed(self):
+        self._blocks_to_load_changed()
+
+    def _check_parallel_read(self):
+        """Return why the file cannot be read in parallel or None if
+        it can.
+        """
+        r = self.reader
+        if not r.binary_file:
+            return 'Parallel reads only support binary files'
+        if self.scalars_name_ != 100 or self.vectors_name_ != 202:
+            return 'Parallel reads only provide the density and momentum'
+        if len(r.function_file_name or '') > 0:
+            return 'Parallel reads do not support function files'
+        if r.i_blanking:
+            return 'Parallel reads do not support i-blanking'
+        return None
+
+    def _read_blocks(self):
+        """Read the selected blocks that are not already read using a
+        pool of threads.
+        """
+        if len(self._reading) > 0:
+            # A background read is in progress, read again once it is
+            # done.
+            self._read_again = True
+            return
+        xyz_file = self.xyz_file_path.get()
+        q_file = self.q_file_path.get()
+        fmt = _get_plot3d_format(self.reader)
+        dims, xyz_offsets = _get_plot3d_offsets(xyz_file, fmt)
+        q_offsets = [None]*len(dims)
+        if len(q_file) > 0:
+            q_offsets = _get_plot3d_offsets(q_file, fmt, q_file=True)[1]
+        self.number_of_blocks = n = len(dims)
+        self._block_dims = dims
+
+        # Blocks read with another format or byte order are stale.
+        key = (xyz_file, q_file, tuple(sorted(fmt.items())))
+        if self._blocks_key != key:
+            self._blocks = {}
+            self.block_read_times = {}
+            self._blocks_key = key
+        selected = [i for i in self.blocks_to_load if 0 <= i < n]
+        if len(self.blocks_to_load) == 0:
+            selected = list(range(n))
+        # Release the blocks that are no longer selected.
+        for i in list(self._blocks.keys()):
+            if i not in selected:
+                del self._blocks[i]
+        todo = [i for i in selected if i not in self._blocks]
+        self._n_selected = len(selected)
+        if len(todo) == 0:
+            self._set_block_outputs()
+            return
+
+        self._reading = todo
+        self.read_progress = 1.0 - float(len(todo))/len(selected)
+        args = [(i, xyz_file, q_file, fmt, dims[i], xyz_offsets[i],
+                 q_offsets[i]) for i in todo]
+        if self.background_read:
+            from pyface.api import GUI
+            t = threading.Thread(target=self._run_block_reads,
+                                 args=(args, GUI.invoke_later))
+            t.daemon = True
+            t.start()
+        else:
+            self._run_block_reads(args, None)
+
+    def _run_block_reads(self, args, invoke):
+        """Read the given blocks in a thread pool.  If `invoke` is not
+        None it is used to call back into the UI thread.
+        """
+        pool = ThreadPool(min(self.number_of_workers, len(args)))
+        try:
+            for result in pool.imap_unordered(_read_plot3d_block, args):
+                if invoke is None:
+                    self._block_read(*result)
+                else:
+                    invoke(self._block_read, *result)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _block_read(self, index, xyz, q, read_time):
+        """Called in the main thread when a block has been read."""
+        dims = self._block_dims[index]
+        self._blocks[index] = _make_structured_grid(dims, xyz, q)
+        self.block_read_times[index] = read_time
+        self._reading.remove(index)
+        n = self._n_selected
+        self.read_progress = 1.0 - float(len(self._reading))/n
+        if len(self._reading) == 0:
+            self._set_block_outputs()
+
+    def _set_block_outputs(self):
+        self.read_progress = 1.0
+        outputs = [self._blocks[i] for i in sorted(self._blocks.keys())]
+        if len(outputs) > 0:
+            self.outputs = outputs
+        self.data_changed = True
+        self.name = self._get_name()
+        if self._read_again:
+            self._read_again = False
+            self._read_blocks()
+
     def _get_name(self):
         """ Gets the name to display on the tree view.
         """
@@ -6,9 +6,10 @@
 # License: BSD Style.
 
 from os.path import basename
+import time
 
 # Enthought library imports.
-from traits.api import Instance, Str, Dict
+from traits.api import Instance, Str, Dict, List, Float
 from traitsui.api import View, Group, Item, Include
 from tvtk.api import tvtk
 
@@ -29,6 +30,17 @@ class UnstructuredGridReader(FileDataSource):
     # The UnstructuredGridAlgorithm data file reader.
     reader = Instance(tvtk.Object, allow_none=False, record=True)
 
+    # The names of the element blocks of an ExodusII file.
+    element_blocks = List(Str, desc='the element blocks in the file')
+
+    # The names of the element blocks of an ExodusII file to read.  All
+    # the blocks are read if this is empty, other blocks are not read.
+    # Each block read is one output.
+    blocks_to_load = List(Str, desc='the element blocks to read')
+
+    # The time in seconds taken by the last read.
+    read_time = Float(0.0, desc='the time taken to read the file')
+
     # Information about what this object can produce.
     output_info = PipelineInfo(datasets=['unstructured_grid'])
 
@@ -39,6 +51,9 @@ class UnstructuredGridReader(FileDataSource):
     # Our view.
     view = View(Group(Include('time_step_group'),
                       Item(name='base_file_name'),
+                      Item(name='blocks_to_load',
+                           enabled_when='len(object.element_blocks) > 0'),
+                      Item(name='read_time', style='readonly'),
                       Item(name='reader',
                            style='custom',
                            resizable=True),
@@ -97,23 +112,60 @@ class UnstructuredGridReader(FileDataSource):
             for k in range(self.reader.number_of_point_result_arrays ):
                 arr_name = self.reader.get_point_result_array_name( k )
                 self.reader.set_point_result_array_status( arr_name, 1 )
-        self.reader.update()
+            r = self.reader
+            self.element_blocks = [r.get_element_block_array_name(k)
+                                   for k in
+                                   range(r.number_of_element_block_arrays)]
+            self._set_block_status()
 
         if old_reader is not None:
             old_reader.on_trait_change(self.render, remove=True)
         self.reader.on_trait_change(self.render)
+        self._update_reader_output()
+
+        # Change our name on the tree view
+        self.name = self._get_name()
+
+    def _update_reader_output(self):
+        t1 = time.time()
+        self.reader.update()
+        self.read_time = time.time() - t1
 
         old_outputs = self.outputs
         if isinstance(self.reader, tvtk.ExodusIIReader):
-            self.outputs = [self.reader.output.get_block(0).get_block(0)]
+            blocks = self.reader.output.get_block(0)
+            outputs = []
+            if blocks is not None:
+                outputs = [blocks.get_block(i)
+                           for i in range(blocks.number_of_blocks)]
+                outputs = [x for x in outputs if x is not None]
+            if len(outputs) == 0:
+                # No block was read, the downstream objects need some
+                # dataset.
+                outputs = [tvtk.UnstructuredGrid()]
+            self.outputs = outputs
         else:
             self.outputs = [self.reader.output]
 
         if self.outputs == old_outputs:
             self.data_changed = True
 
-        # Change our name on the tree view
-        self.name = self._get_name()
+    def _set_block_status(self):
+        """Enable only the element blocks selected in
+        `blocks_to_load`."""
+        load = self.blocks_to_load
+        for name in self.element_blocks:
+            status = 1 if len(load) == 0 or name in load else 0
+            self.reader.set_element_block_array_status(name, status)
+
+    def _blocks_to_load_changed(self):
+        if isinstance(self.reader, tvtk.ExodusIIReader) and \
+                len(self.element_blocks) > 0:
+            self._set_block_status()
+            self._update_reader_output()
+
+    def _blocks_to_load_items_changed(self):
+        self._blocks_to_load_changed()
 
     def _get_name(self):
         """ Returns the name to display on the tree view.  Note that
@@ -0,0 +1,438 @@
+"""
+A harness to check that pipeline objects do not retain memory.
+
+Each case is run through a number of create/update/destroy cycles.  After
+every cycle the harness collects the garbage and samples
+
+ - the number of Python objects tracked by the garbage collector,
+ - the number of pipeline objects created by the cycles that are still
+   alive,
+ - the number of VTK objects created by the cycles that were not deleted
+   and the extra VTK references held on them,
+ - the size of the TVTK array cache and object cache,
+ - the resident memory of the process.
+
+A case fails when pipeline objects, VTK objects or cached arrays created
+by the cycles are kept alive.  The Python objects and the resident
+memory depend on the caches and the allocator and are only checked
+against thresholds when these are given to the harness.
+`get_registry_cases` returns a case for every source, filter and module
+in the registry, for example::
+
+    harness = RetentionHarness(cycles=5)
+    results = harness.run(get_registry_cases())
+    print(harness.report(results))
+
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+# Standard library imports.
+import gc
+import os
+import weakref
+
+import numpy
+
+# Enthought library imports.
+from traits.api import HasTraits
+from tvtk.api import tvtk
+from tvtk import array_handler, tvtk_base
+
+# Local imports.
+from mayavi.core.component import Component
+from mayavi.core.null_engine import NullEngine
+from mayavi.core.registry import registry
+from mayavi.sources.vtk_data_source import VTKDataSource
+
+# The metrics sampled after each cycle.
+METRICS = ('objects', 'retained', 'vtk_retained', 'vtk_refs',
+           'array_cache', 'tvtk_objects', 'rss')
+
+# Traits that refer back up the pipeline or to other scenes and are not
+# followed when looking for the objects created by a cycle.
+_SKIP_TRAITS = ('scene', 'parent', 'inputs', 'outputs', 'module_manager',
+                'source', 'module')
+
+
+################################################################################
+# Utility functions.
+################################################################################
+def get_rss():
+    """Return the current resident memory of the process in MB or None
+    if it is not known.
+
+    The peak resident memory reported by `resource.getrusage` is not
+    used as it never goes down and so cannot show growth per cycle.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages*os.sysconf('SC_PAGE_SIZE')/1024.0**2
+    except (IOError, OSError, ValueError, IndexError):
+        return None
+
+
+def make_dataset(kind, n=6):
+    """Return a small dataset of the given kind ('image_data',
+    'rectilinear_grid', 'structured_grid', 'unstructured_grid' or
+    'poly_data') with point scalars, vectors and tensors and cell
+    scalars.
+    """
+    dims = (n, n, n)
+    z, y, x = numpy.mgrid[0:n, 0:n, 0:n].astype('d')
+    points = numpy.c_[x.ravel(), y.ravel(), z.ravel()]
+    if kind == 'rectilinear_grid':
+        c = numpy.arange(n, dtype='d')
+        data = tvtk.RectilinearGrid(dimensions=dims, x_coordinates=c,
+                                    y_coordinates=c, z_coordinates=c)
+    elif kind == 'structured_grid':
+        data = tvtk.StructuredGrid(dimensions=dims, points=points)
+    elif kind == 'unstructured_grid':
+        idx = numpy.arange(n**3).reshape(dims)[:-1, :-1, :-1].ravel()
+        offsets = numpy.array([0, 1, n + 1, n, n*n, n*n + 1,
+                               n*n + n + 1, n*n + n])
+        data = tvtk.UnstructuredGrid(points=points)
+        data.set_cells(tvtk.Hexahedron().cell_type, idx[:, None] + offsets)
+    elif kind == 'poly_data':
+        verts = numpy.arange(n**3).reshape(-1, 1)
+        data = tvtk.PolyData(points=points, verts=verts)
+    else:
+        data = tvtk.ImageData(dimensions=dims)
+
+    npoints = n**3
+    pd = data.point_data
+    pd.scalars = numpy.sqrt((points**2).sum(axis=1))
+    pd.scalars.name = 'scalars'
+    pd.vectors = numpy.c_[-points[:, 1], points[:, 0], points[:, 2]]
+    pd.vectors.name = 'vectors'
+    pd.tensors = numpy.tile(numpy.eye(3).ravel(), (npoints, 1))
+    pd.tensors.name = 'tensors'
+    cell_scalars = numpy.arange(data.number_of_cells, dtype='d')
+    data.cell_data.scalars = cell_scalars
+    data.cell_data.scalars.name = 'cell_scalars'
+    return data
+
+
+def _get_dataset_kind(metadata):
+    for kind in metadata.input_info.datasets:
+        if kind in ('image_data', 'rectilinear_grid', 'structured_grid',
+                    'unstructured_grid', 'poly_data'):
+            return kind
+    return 'image_data'
+
+
+def _source_cycle(metadata):
+    def cycle(engine):
+        src = metadata.get_callable()()
+        engine.add_source(src)
+        if len(src.outputs) == 0:
+            raise SkipCase('the source produces no output')
+        src.data_changed = True
+    return cycle
+
+
+def _file_cycle(fname):
+    def cycle(engine):
+        src = engine.open(fname)
+        src.data_changed = True
+    return cycle
+
+
+def _pipeline_cycle(metadata, kind, add):
+    def cycle(engine):
+        src = VTKDataSource(data=make_dataset(kind))
+        engine.add_source(src)
+        obj = metadata.get_callable()()
+        add(engine, obj, src)
+        src.update()
+    return cycle
+
+
+def get_registry_cases(kinds=('sources', 'filters', 'modules'),
+                       data_dir=None):
+    """Return a list of (name, create) cases for the sources, filters
+    and modules in the registry.
+
+    Sources that read files are opened with the first file in
+    `data_dir` that the registry picks them for, by default the test
+    data shipped with mayavi; they are skipped when there is no such
+    file.  Filters and modules are added to a small dataset of the first
+    kind they accept.
+    """
+    cases = []
+    if 'sources' in kinds:
+        if data_dir is None:
+            data_dir = os.path.join(os.path.dirname(__file__), 'data')
+        files = []
+        if os.path.isdir(data_dir):
+            files = [os.path.join(data_dir, x)
+                     for x in sorted(os.listdir(data_dir))]
+        for metadata in registry.sources:
+            if len(metadata.extensions) == 0:
+                cases.append((metadata.id, _source_cycle(metadata)))
+                continue
+            for fname in files:
+                if registry.get_file_reader(fname) is metadata:
+                    name = '%s (%s)'%(metadata.id, os.path.basename(fname))
+                    cases.append((name, _file_cycle(fname)))
+                    break
+
+    def add_filter(engine, obj, src):
+        engine.add_filter(obj, src)
+
+    def add_module(engine, obj, src):
+        engine.add_module(obj, src)
+
+    for kind, add in (('filters', add_filter), ('modules', add_module)):
+        if kind not in kinds:
+            continue
+        for metadata in getattr(registry, kind):
+            cycle = _pipeline_cycle(metadata, _get_dataset_kind(metadata),
+                                    add)
+            cases.append((metadata.id, cycle))
+    return cases
+
+
+################################################################################
+# `SkipCase` class.
+################################################################################
+class SkipCase(Exception):
+    """Raised by a create function when a case cannot be run."""
+    pass
+
+
+################################################################################
+# `RetentionResult` class.
+################################################################################
+class RetentionResult(object):
+    """The samples and the verdict of one case."""
+
+    def __init__(self, name):
+        # The name of the case.
+        self.name = name
+        # The metrics sampled after each measured cycle.
+        self.samples = []
+        # The growth per cycle of each metric.
+        self.growth = {}
+        # The reasons the case failed.
+        self.failures = []
+        # The reason the case was skipped, if it was.
+        self.skipped = ''
+
+    @property
+    def failed(self):
+        return len(self.failures) > 0
+
+    def __repr__(self):
+        if self.skipped:
+            return '<RetentionResult %s: skipped, %s>'%(self.name,
+                                                        self.skipped)
+        status = '; '.join(self.failures) if self.failed else 'ok'
+        return '<RetentionResult %s: %s>'%(self.name, status)
+
+
+################################################################################
+# `RetentionHarness` class.
+################################################################################
+class RetentionHarness(object):
+    """Runs create/update/destroy cycles and checks that the memory
+    retained does not grow from cycle to cycle.
+
+    Each case is a name and a `create(engine)` function that builds and
+    updates a visualization in the current scene of the engine.  The
+    harness makes a new scene before calling it and, unless a `destroy`
+    function is given, closes the scene with `engine.close_scene`
+    afterwards.
+    """
+
+    def __init__(self, engine=None, cycles=5, warmup=2,
+                 max_object_growth=None, max_rss_growth=None):
+        if engine is None:
+            engine = NullEngine()
+            engine.start()
+        # The engine the cases are run with.
+        self.engine = engine
+        # The number of measured cycles per case.
+        self.cycles = cycles
+        # The number of cycles run before measuring, these fill the
+        # caches that are populated on first use.
+        self.warmup = warmup
+        # The allowed growth of the garbage collected Python objects per
+        # cycle, None to only report it.
+        self.max_object_growth = max_object_growth
+        # The allowed growth of the resident memory per cycle in MB, None
+        # to only report it.
+        self.max_rss_growth = max_rss_growth
+
+        self._reset()
+
+    ######################################################################
+    # `RetentionHarness` interface
+    ######################################################################
+    def run(self, cases, destroy=None):
+        """Run the given (name, create) cases and return a list of
+        `RetentionResult`s."""
+        return [self.run_case(name, create, destroy)
+                for name, create in cases]
+
+    def run_case(self, name, create, destroy=None):
+        """Run the cycles of one case and return its `RetentionResult`.
+
+        `destroy(engine, scene)` is called to tear down the scene made
+        for each cycle, it defaults to closing the scene.
+        """
+        result = RetentionResult(name)
+        self._reset()
+        try:
+            for i in range(self.warmup + self.cycles):
+                self._cycle(create, destroy)
+                stats = self.sample()
+                if i >= self.warmup:
+                    result.samples.append(stats)
+        except SkipCase as e:
+            result.skipped = str(e)
+            return result
+        except Exception as e:
+            result.failures.append('error: %s: %s'%(e.__class__.__name__,
+                                                    e))
+            return result
+        finally:
+            self._reset()
+            gc.collect()
+        self._check(result)
+        return result
+
+    def sample(self):
+        """Collect the garbage and return the current metrics."""
+        gc.collect()
+        vtk_refs = 0
+        for vtk_obj in self._vtk_objects:
+            # Discount the reference held by the harness.
+            vtk_refs += vtk_obj.GetReferenceCount() - 1
+        retained = len([x for x in self._objects if x() is not None])
+        # Drop the references to the VTK objects to see which of them
+        # are deleted.
+        self._vtk_objects = []
+        gc.collect()
+        return dict(objects=len(gc.get_objects()),
+                    retained=retained,
+                    vtk_retained=self._vtk_count - len(self._vtk_deleted),
+                    vtk_refs=vtk_refs,
+                    array_cache=len(array_handler._array_cache),
+                    tvtk_objects=len(tvtk_base._object_cache),
+                    rss=get_rss())
+
+    def report(self, results):
+        """Return the given results as a text table."""
+        lines = ['%-40s %8s %8s %8s %8s %8s %8s  %s'%(
+            'case', 'objects', 'retain', 'vtk', 'vtk refs', 'arrays',
+            'rss (MB)', 'status')]
+        for r in results:
+            if r.skipped:
+                lines.append('%-40s %s'%(r.name[:40],
+                                         'skipped: %s'%r.skipped))
+                continue
+            g = r.growth
+            status = '; '.join(r.failures) if r.failed else 'ok'
+            if len(g) == 0:
+                lines.append('%-40s %s'%(r.name[:40], status))
+                continue
+            rss = '%8s'%'-' if g['rss'] is None else '%8.2f'%g['rss']
+            lines.append('%-40s %8.1f %8.1f %8.1f %8.1f %8.1f %s  %s'%(
+                r.name[:40], g['objects'], g['retained'],
+                g['vtk_retained'], g['vtk_refs'], g['array_cache'],
+                rss, status))
+        return '\n'.join(lines)
+
+    ######################################################################
+    # Non-public interface.
+    ######################################################################
+    def _reset(self):
+        # Weak references to the pipeline objects of the cycles.
+        self._objects = []
+        # The VTK objects of the current cycle.
+        self._vtk_objects = []
+        # The keys of the live tracked VTK objects keyed on address.
+        self._vtk_tracked = {}
+        # The keys of the tracked VTK objects that were deleted.
+        self._vtk_deleted = set()
+        # The number of VTK objects tracked.
+        self._vtk_count = 0
+
+    def _cycle(self, create, destroy):
+        engine = self.engine
+        engine.new_scene()
+        scene = engine.current_scene
+        create(engine)
+        self._track(scene)
+        if destroy is None:
+            engine.close_scene(scene)
+        else:
+            destroy(engine, scene)
+
+    def _check(self, result):
+        samples = result.samples
+        n = len(samples) - 1
+        if n < 1:
+            return
+        growth = {}
+        for key in METRICS:
+            first, last = samples[0][key], samples[-1][key]
+            if first is None or last is None:
+                growth[key] = None
+            else:
+                growth[key] = (last - first)/float(n)
+        result.growth = growth
+        max_objects = self.max_object_growth
+        if max_objects is not None and growth['objects'] > max_objects:
+            result.failures.append('%.1f Python objects per cycle'%
+                                   growth['objects'])
+        for key, msg in (('retained', 'pipeline objects retained'),
+                         ('vtk_retained', 'VTK objects retained'),
+                         ('array_cache', 'arrays cached')):
+            if growth[key] > 0:
+                result.failures.append('%.1f %s per cycle'%(growth[key],
+                                                            msg))
+        rss, max_rss = growth['rss'], self.max_rss_growth
+        if rss is not None and max_rss is not None and rss > max_rss:
+            result.failures.append('%.2f MB per cycle'%rss)
+
+    def _track(self, obj):
+        """Track the given pipeline object, the objects below it and
+        the VTK objects they hold."""
+        if not isinstance(obj, HasTraits):
+            return
+        self._objects.append(weakref.ref(obj))
+        children = getattr(obj, 'children', [])
+        for name, value in obj.__dict__.items():
+            if name in _SKIP_TRAITS or name.startswith('__'):
+                continue
+            values = value if isinstance(value, list) else [value]
+            for v in values:
+                if isinstance(v, tvtk.Object):
+                    self._track_vtk(v)
+                elif isinstance(v, Component):
+                    self._track(v)
+        for child in children:
+            self._track(child)
+
+    def _track_vtk(self, tvtk_obj):
+        vtk_obj = tvtk.to_vtk(tvtk_obj)
+        address = vtk_obj.__this__
+        tracked = self._vtk_tracked
+        if address in tracked:
+            # Already tracked, possibly by an earlier cycle.
+            self._vtk_objects.append(vtk_obj)
+            return
+        key = self._vtk_count
+        self._vtk_count = key + 1
+        tracked[address] = key
+        deleted = self._vtk_deleted
+
+        def on_delete(vtk_obj, event):
+            deleted.add(key)
+            tracked.pop(address, None)
+
+        vtk_obj.AddObserver('DeleteEvent', on_delete)
+        self._vtk_objects.append(vtk_obj)
@@ -186,6 +186,45 @@ class TestArraySource(unittest.TestCase):
         self.assertEqual(numpy.allclose(vec2.flatten(),
                          expect[1].flatten()), True)
 
+    def test_no_copy_for_suitably_ordered_data(self):
+        "Test that Fortran or C ordered arrays are used without a copy."
+        d = self.data
+        x, y, z = numpy.mgrid[0:4, 0:3, 0:2]
+        sc = (x + 10*y + 100*z).astype('d')
+        vec = numpy.concatenate([x[..., None], y[..., None],
+                                 z[..., None]], axis=-1).astype('d')
+        # Arrays indexed as [x, y, z], Fortran ordered.
+        f_sc = numpy.asfortranarray(sc)
+        f_vec = numpy.transpose(
+            numpy.ascontiguousarray(numpy.transpose(vec, (2, 1, 0, 3))),
+            (2, 1, 0, 3)
+        )
+        d.scalar_data = f_sc
+        d.vector_data = f_vec
+        pd = d.image_data.point_data
+        self.assertEqual(tuple(d.image_data.dimensions), (4, 3, 2))
+        sc1 = pd.scalars.to_array()
+        self.assertTrue(numpy.may_share_memory(sc1, f_sc))
+        self.assertTrue(numpy.allclose(sc1, numpy.ravel(sc.T)))
+        vec1 = pd.vectors.to_array()
+        self.assertTrue(numpy.may_share_memory(vec1, f_vec))
+        self.assertTrue(numpy.allclose(vec1[:, 0], numpy.ravel(x.T)))
+
+        # Arrays indexed as [z, y, x], C ordered.
+        d.scalar_data = d.vector_data = None
+        d.input_axis_order = 'zyx'
+        c_sc = numpy.ascontiguousarray(sc.T)
+        c_vec = numpy.ascontiguousarray(numpy.transpose(vec, (2, 1, 0, 3)))
+        d.scalar_data = c_sc
+        d.vector_data = c_vec
+        pd = d.image_data.point_data
+        self.assertEqual(tuple(d.image_data.dimensions), (4, 3, 2))
+        sc2 = pd.scalars.to_array()
+        self.assertTrue(numpy.may_share_memory(sc2, c_sc))
+        self.assertTrue(numpy.allclose(sc2, numpy.ravel(sc.T)))
+        vec2 = pd.vectors.to_array()
+        self.assertTrue(numpy.may_share_memory(vec2, c_vec))
+        self.assertTrue(numpy.allclose(vec2[:, 0], numpy.ravel(x.T)))
 
 
 if __name__ == '__main__':
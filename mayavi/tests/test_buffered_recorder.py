@@ -0,0 +1,153 @@
+"""
+Tests for the buffered script recorder.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import re
+import unittest
+
+from traits.api import HasTraits, Float, Instance, Str, List, Bool
+from tvtk.api import tvtk
+from apptools.scripting.api import Recorder, recordable, set_recorder
+
+from mayavi.core.buffered_recorder import BufferedRecorder
+
+
+######################################################################
+# Test classes.
+class Toy(HasTraits):
+    color = Str
+    type = Str
+    ignore = Bool(False, record=False)
+
+
+class Child(HasTraits):
+    name = Str('child')
+    age = Float(10.0)
+    property = Instance(tvtk.Property, (), record=True)
+    toy = Instance(Toy, record=True)
+
+    @recordable
+    def grow(self, x):
+        """Increase age by x years."""
+        self.age += x
+
+
+class Parent(HasTraits):
+    children = List(Child, record=True)
+    recorder = Instance(Recorder, record=False)
+
+
+def make_parent():
+    p = Parent()
+    c = Child(toy=Toy(color='blue', type='bunny'))
+    p.children.append(c)
+    return p
+
+
+def workload(tape, p):
+    c = p.children[0]
+    c.name = 'Ram'
+    c.age = 10.5
+    c.property.representation = 'w'
+    c.property.color = (1, 0, 0)
+    c.toy.color = 'red'
+    c.toy.ignore = True
+    c.grow(1)
+    c.toy = Toy(color='green')
+    c.toy.type = 'ball'
+    p.children.append(Child(name='Sita'))
+    p.children[1].age = 3
+
+
+class TestBufferedRecorder(unittest.TestCase):
+    def tearDown(self):
+        set_recorder(None)
+
+    def _record(self, tape):
+        set_recorder(tape)
+        p = make_parent()
+        tape.recording = True
+        tape.register(p)
+        workload(tape, p)
+        # Remove the addresses of objects in the comments.
+        return re.sub(' at 0x[0-9a-fA-F]+', '', tape.get_code())
+
+    def test_same_code_as_recorder(self):
+        expect = self._record(Recorder())
+        tape = BufferedRecorder(coalesce=False)
+        self.assertEqual(self._record(tape), expect)
+        # A small buffer gives the same code.
+        tape = BufferedRecorder(buffer_size=2)
+        self.assertEqual(self._record(tape), expect)
+
+    def test_buffering(self):
+        tape = BufferedRecorder()
+        p = make_parent()
+        tape.recording = True
+        tape.register(p)
+        c = p.children[0]
+        c.name = 'Ram'
+        c.toy.color = 'red'
+        # Nothing is rendered till the code is needed.
+        self.assertEqual(len(tape.lines), 0)
+        self.assertEqual(len(tape._events), 2)
+        tape.flush()
+        self.assertEqual(tape.lines,
+                         ["child = parent.children[0]",
+                          "child.name = 'Ram'",
+                          "child.toy.color = 'red'"])
+
+        # Stopping the recording renders the remaining events.
+        c.age = 12.0
+        tape.recording = False
+        c.age = 13.0
+        self.assertEqual(tape.lines[-1], "child.age = 12.0")
+        self.assertEqual(len(tape._events), 0)
+
+    def test_coalesce(self):
+        tape = BufferedRecorder()
+        p = make_parent()
+        tape.recording = True
+        tape.register(p)
+        c = p.children[0]
+        for i in range(10):
+            c.age = float(i)
+        c.name = 'Ram'
+        c.age = 20.0
+        tape.flush()
+        self.assertEqual(tape.lines[1:],
+                         ["child.age = 9.0",
+                          "child.name = 'Ram'",
+                          "child.age = 20.0"])
+        self.assertEqual(tape.n_coalesced, 9)
+
+    def test_mutable_values(self):
+        tape = BufferedRecorder()
+        t = Toy()
+        tape.recording = True
+        tape.register(t, known=True)
+        value = ['a']
+        tape.record_format('x = %r', (1.0,))
+        t.color = 'red'
+        # Later changes to the recorded values are not seen.
+        tape._listner(t, 'type', None, value)
+        value.append('b')
+        self.assertEqual(tape.get_code(),
+                         "x = 1.0\ntoy.color = 'red'\ntoy.type = ['a']\n")
+
+    def test_clear(self):
+        tape = BufferedRecorder()
+        p = make_parent()
+        tape.recording = True
+        tape.register(p)
+        p.children[0].name = 'Ram'
+        tape.clear()
+        self.assertEqual(len(tape._events), 0)
+        self.assertEqual(tape.lines, [])
+        self.assertEqual(p.recorder, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
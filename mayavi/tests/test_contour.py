@@ -10,8 +10,13 @@ import copy
 import numpy
 import unittest
 
+# Enthought library imports.
+from tvtk.api import tvtk
+
 # Local imports.
 from mayavi.core.null_engine import NullEngine
+from mayavi.components.contour import (compute_brick_ranges,
+                                       get_active_extent)
 
 from mayavi.sources.vtk_data_source import VTKDataSource
 from mayavi.modules.outline import Outline
@@ -191,5 +196,71 @@ class TestContour(unittest.TestCase):
         cp.implicit_plane.widget.enabled = False
         self.check()
 
+class TestContourIndex(unittest.TestCase):
+
+    def setUp(self):
+        e = NullEngine()
+        e.start()
+        e.new_scene()
+        self.e = e
+        x, y, z = numpy.ogrid[-1:1:40j, -1:1:40j, -1:1:40j]
+        s = numpy.sqrt(x**2 + y**2 + z**2)
+        img = tvtk.ImageData(dimensions=s.shape, spacing=(1, 1, 1))
+        img.point_data.scalars = numpy.ravel(s.T)
+        img.point_data.scalars.name = 'scalars'
+        self.src = VTKDataSource(data=img)
+        e.add_source(self.src)
+        self.s = s
+
+    def tearDown(self):
+        self.e.stop()
+
+    def _surface(self, iso):
+        out = iso.contour.outputs[0]
+        if hasattr(out, 'output'):
+            out = out.output
+        return out
+
+    def test_brick_ranges(self):
+        s = self.s
+        lo, hi = compute_brick_ranges(numpy.ravel(s.T), s.shape, 16)
+        self.assertEqual(lo.shape, (3, 3, 3))
+        self.assertAlmostEqual(lo.min(), s.min())
+        self.assertAlmostEqual(hi.max(), s.max())
+        # The last brick along x covers points 32 to 39.
+        self.assertAlmostEqual(hi[0, 0, 2], s[32:, :17, :17].max())
+        ext = get_active_extent((lo, hi), [0.1], s.shape, 16)
+        self.assertEqual(ext, (16, 32, 16, 32, 16, 32))
+        self.assertEqual(get_active_extent((lo, hi), [10.0], s.shape, 16),
+                         None)
+
+    def test_index_gives_same_surface(self):
+        iso = IsoSurface()
+        self.e.add_module(iso)
+        iso.contour.contours = [0.5]
+        expect = self._surface(iso).number_of_points
+        self.assertTrue(expect > 0)
+        iso.contour.use_index = True
+        iso.contour.contours = [0.5]
+        self.assertEqual(self._surface(iso).number_of_points, expect)
+        self.assertNotEqual(tuple(iso.contour._voi.voi),
+                            (0, 39, 0, 39, 0, 39))
+
+    def test_surface_cache(self):
+        iso = IsoSurface()
+        self.e.add_module(iso)
+        iso.contour.cache_size = 2
+        iso.contour.contours = [0.5]
+        n1 = self._surface(iso).number_of_points
+        iso.contour.contours = [0.3]
+        n2 = self._surface(iso).number_of_points
+        self.assertEqual(len(iso.contour._cache), 2)
+        iso.contour.contours = [0.5]
+        self.assertEqual(self._surface(iso).number_of_points, n1)
+        iso.contour.contours = [0.7]
+        self.assertEqual(len(iso.contour._cache), 2)
+        self.assertNotEqual(n1, n2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,6 +5,8 @@
 # Standard library imports.
 import unittest
 
+import mock
+
 # Local imports.
 from . import datasets
 from .common import get_example_data
@@ -81,5 +83,74 @@ class TestCutter(unittest.TestCase):
 
         self.check()
 
+    def test_interaction_preview(self):
+        e = self.e
+        src = VTKDataSource(data=datasets.generateStructuredGrid())
+        e.add_source(src)
+        cp = ScalarCutPlane()
+        e.add_module(cp)
+        ip = cp.implicit_plane
+        cutter = cp.cutter.cutter
+        cutter.update()
+        full = cutter.output.number_of_points
+
+        # Dragging the widget cuts a subsampled input.
+        ip.preview_stride = 2
+        ip._on_start_interaction(None, 'StartInteractionEvent')
+        self.assertTrue(ip.outputs[0].is_a('vtkExtractGrid'))
+        cutter.update()
+        self.assertTrue(cutter.output.number_of_points < full)
+
+        # Updates are throttled while dragging.
+        ip.max_update_rate = 1.0
+        ip._on_interaction_event(None, 'InteractionEvent')
+        self.assertFalse(ip._pending)
+        ip._on_interaction_event(None, 'InteractionEvent')
+        self.assertTrue(ip._pending)
+
+        # The full resolution input is restored on release.
+        ip._on_end_interaction(None, 'EndInteractionEvent')
+        self.assertFalse(ip._interacting)
+        self.assertTrue(ip.outputs[0] is ip.inputs[0].outputs[0])
+        cutter.update()
+        self.assertEqual(cutter.output.number_of_points, full)
+
+    def test_interaction_throttle(self):
+        e = self.e
+        src = VTKDataSource(data=datasets.generateStructuredGrid())
+        e.add_source(src)
+        cp = ScalarCutPlane()
+        e.add_module(cp)
+        ip = cp.implicit_plane
+        self.assertEqual(ip.max_update_rate, 0.0)
+        ip.max_update_rate = 1.0
+        timers = []
+
+        def make_timer(wait):
+            timers.append(mock.Mock(wait=wait))
+            return timers[-1]
+
+        with mock.patch.object(ip, '_make_timer', side_effect=make_timer):
+            ip._on_start_interaction(None, 'StartInteractionEvent')
+            ip._on_interaction_event(None, 'InteractionEvent')
+            self.assertEqual(len(timers), 0)
+            # Moving the widget again right away skips the update and
+            # starts a single timer.
+            normal = tuple(ip.plane.normal)
+            ip.widget.normal = (0.0, 1.0, 0.0)
+            ip._on_interaction_event(None, 'InteractionEvent')
+            self.assertTrue(ip._pending)
+            self.assertEqual(len(timers), 1)
+            self.assertTrue(0.0 < timers[0].wait <= 1.0)
+            self.assertEqual(tuple(ip.plane.normal), normal)
+            self.assertNotEqual(normal, (0.0, 1.0, 0.0))
+
+            # The timer does the skipped update.
+            ip._on_timer()
+            self.assertTrue(timers[0].Stop.called)
+            self.assertFalse(ip._pending)
+            self.assertEqual(tuple(ip.plane.normal), (0.0, 1.0, 0.0))
+            ip._on_end_interaction(None, 'EndInteractionEvent')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,190 @@
+"""
+Tests for the frame server using a local client.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import json
+import socket
+import unittest
+
+import mock
+import numpy
+
+from tvtk.api import tvtk
+from tvtk.pyface.tvtk_scene import TVTKScene
+from mayavi.tools.frame_server import FrameServer, FrameClient, \
+    TileEncoder, MAX_FRAME_SIZE, OP_PING, OP_PONG, OP_TEXT, read_message, \
+    write_message
+
+
+class TestTileEncoder(unittest.TestCase):
+    def test_encode_tile(self):
+        enc = TileEncoder()
+        tile = numpy.zeros((8, 16, 3), dtype=numpy.uint8)
+        tile[:4] = 255
+        png = enc.encode_tile(tile, 'png')
+        self.assertTrue(png.startswith(b'\x89PNG'))
+        jpeg = enc.encode_tile(tile, 'jpeg', 50)
+        self.assertTrue(jpeg.startswith(b'\xff\xd8'))
+
+    def test_changed_tiles(self):
+        enc = TileEncoder(tile_size=16)
+        a = numpy.zeros((40, 50, 3), dtype=numpy.uint8)
+        # The edge tiles are smaller.
+        tiles = enc.changed_tiles(a, None)
+        self.assertEqual(len(tiles), 3*4)
+        self.assertTrue((48, 32, 2, 8) in tiles)
+        b = a.copy()
+        b[20, 35] = 255
+        self.assertEqual(enc.changed_tiles(b, a), [(32, 16, 16, 16)])
+        self.assertEqual(enc.changed_tiles(a, a), [])
+
+
+class TestReadMessage(unittest.TestCase):
+    def test_ping_is_answered_holding_the_lock(self):
+        a, b = socket.socketpair()
+        try:
+            write_message(a, b'ping', OP_PING, mask=True)
+            write_message(a, b'{}', OP_TEXT, mask=True)
+            lock = mock.MagicMock()
+            self.assertEqual(read_message(b, lock), (OP_TEXT, b'{}'))
+            self.assertEqual(lock.__enter__.call_count, 1)
+            self.assertEqual(read_message(a), (OP_PONG, b'ping'))
+        finally:
+            a.close()
+            b.close()
+
+
+class TestFrameServer(unittest.TestCase):
+    def setUp(self):
+        scene = TVTKScene(off_screen_rendering=True)
+        cs = tvtk.ConeSource()
+        m = tvtk.PolyDataMapper(input_connection=cs.output_port)
+        scene.add_actors(tvtk.Actor(mapper=m))
+        scene.reset_zoom()
+        self.scene = scene
+        self.server = FrameServer(scene, port=0, tile_size=32,
+                                  idle_delay=0.05)
+        self.server.start()
+        self.client = FrameClient('127.0.0.1', self.server.port,
+                                  self.server.token)
+        self.client.connect()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        self.scene.close()
+
+    def get_frame(self, n=100):
+        """Process events until the client receives a frame."""
+        for i in range(n):
+            self.server.process(0.02)
+            if not self.client.frames.empty():
+                return self.client.get_frame()
+        self.fail('No frame received.')
+
+    def test_frames(self):
+        w, h = self.scene.render_window.size
+        # The first frame has all the tiles.
+        header, data = self.get_frame()
+        self.assertEqual((header['width'], header['height']), (w, h))
+        self.assertEqual(sum(t[2]*t[3] for t in header['tiles']), w*h)
+        self.assertEqual(sum(t[4] for t in header['tiles']), len(data))
+        self.assertEqual(header['format'], 'png')
+
+        # Interaction gives low quality frames acknowledging the event.
+        self.client.send_event(type='start')
+        eid = self.client.send_event(type='rotate', dx=20.0)
+        header, data = self.get_frame()
+        while header['event'] != eid:
+            header, data = self.get_frame()
+        self.assertEqual(header['format'], 'jpeg')
+        self.assertFalse(header['idle'])
+        self.assertTrue(len(self.client.latencies) > 0)
+
+        # Once idle the tiles sent at low quality are sent again.
+        sent = set(tuple(t[:4]) for t in header['tiles'])
+        self.client.send_event(type='end')
+        header, data = self.get_frame()
+        while not header['idle']:
+            header, data = self.get_frame()
+        self.assertEqual(header['format'], 'png')
+        self.assertTrue(sent <= set(tuple(t[:4]) for t in header['tiles']))
+
+        # A camera change that does not change the image sends no tiles.
+        position = list(self.scene.camera.position)
+        eid = self.client.send_event(type='camera', position=position)
+        header, data = self.get_frame()
+        self.assertEqual(header['event'], eid)
+        self.assertEqual(header['tiles'], [])
+
+        stats = self.server.stats()
+        self.assertTrue(stats['frames_sent'] >= 4)
+        self.assertTrue(stats['latency'] is not None)
+        self.assertTrue(stats['bandwidth'] > 0)
+        self.assertTrue('latency' in self.server.report())
+
+    def test_bad_events_are_dropped(self):
+        self.get_frame()
+        client = self.client
+        with mock.patch('mayavi.tools.frame_server.logger') as logger:
+            # Events that are not objects, miss values or have bad
+            # values.
+            for payload in (b'[1, 2]', b'"rotate"', b'{"type": "rotate"',
+                            json.dumps({'type': 'resize',
+                                        'width': 100}).encode('utf-8'),
+                            json.dumps({'type': 'rotate',
+                                        'dx': 'x'}).encode('utf-8')):
+                with client._send_lock:
+                    write_message(client._sock, payload, OP_TEXT,
+                                  mask=True)
+            # The server still applies the events that follow.
+            eid = client.send_event(type='resize', width=10**6, height=0)
+            header, data = self.get_frame()
+            while header['event'] != eid:
+                header, data = self.get_frame()
+        self.assertEqual(logger.warning.call_count, 5)
+        self.assertEqual(self.server.stats()['events_dropped'], 5)
+        self.assertEqual((header['width'], header['height']),
+                         (MAX_FRAME_SIZE, 1))
+
+    def request(self, path, headers=''):
+        sock = socket.create_connection(('127.0.0.1', self.server.port))
+        request = 'GET %s HTTP/1.1\r\nHost: 127.0.0.1:%d\r\n%s\r\n'%(
+            path, self.server.port, headers)
+        sock.sendall(request.encode('ascii'))
+        data = b''
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+        sock.close()
+        return data
+
+    def test_page(self):
+        data = self.request('/?token=%s'%self.server.token)
+        self.assertTrue(data.startswith(b'HTTP/1.1 200'))
+        self.assertTrue(b'WebSocket' in data)
+        self.assertTrue(self.server.url.endswith(self.server.token))
+
+    def test_token_and_origin_are_checked(self):
+        self.assertTrue(self.request('/').startswith(b'HTTP/1.1 403'))
+        data = self.request('/?token=wrong')
+        self.assertTrue(data.startswith(b'HTTP/1.1 403'))
+
+        client = FrameClient('127.0.0.1', self.server.port, 'wrong')
+        self.assertRaises(IOError, client.connect)
+
+        # A WebSocket opened by a page of another site.
+        ws = ('Upgrade: websocket\r\nConnection: Upgrade\r\n'
+              'Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n'
+              'Sec-WebSocket-Version: 13\r\n')
+        path = '/ws?token=%s'%self.server.token
+        data = self.request(path, ws + 'Origin: http://example.com\r\n')
+        self.assertTrue(data.startswith(b'HTTP/1.1 403'))
+
+
+if __name__ == '__main__':
+    unittest.main()
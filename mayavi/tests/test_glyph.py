@@ -15,7 +15,9 @@ import unittest
 from mayavi.core.null_engine import NullEngine
 
 # Enthought library imports
+from tvtk.api import tvtk
 from mayavi.sources.array_source import ArraySource
+from mayavi.sources.vtk_data_source import VTKDataSource
 from mayavi.modules.outline import Outline
 from mayavi.modules.glyph import Glyph
 from mayavi.modules.vector_cut_plane import VectorCutPlane
@@ -158,6 +160,95 @@ class TestGlyph(unittest.TestCase):
         g.glyph.mask_input_points = True
         self.check(mask=True)
 
+    def test_instanced(self):
+        """Test if the glyph mapper mirrors the glyph settings."""
+        s = self.scene
+        src = s.children[0]
+        g = src.children[0].children[1]
+        glyph = g.glyph
+        glyph.instanced = True
+        gm = glyph.glyph_mapper
+        self.assertTrue(g.actor.mapper is gm)
+        self.assertEqual(gm.scale_factor, 0.5)
+        self.assertEqual(gm.scale_mode, 'scale_by_vector_components')
+        # There are no normals to orient the glyphs with.
+        self.assertFalse(gm.orient)
+        n_output_points = src.outputs[0].number_of_points
+        self.assertEqual(gm.input.number_of_points, n_output_points)
+
+        glyph.mask_points.random_mode = 0
+        glyph.mask_input_points = True
+        on_ratio = glyph.mask_points.on_ratio
+        self.assertEqual(gm.input.number_of_points,
+                         n_output_points / on_ratio)
+        glyph.mask_input_points = False
+
+        glyph.scale_mode = 'data_scaling_off'
+        self.assertEqual(gm.scale_mode, 'no_data_scaling')
+        glyph.scale_mode = 'scale_by_scalar'
+
+        glyph.instanced = False
+        self.assertFalse(g.actor.mapper is gm)
+        self.assertTrue(isinstance(g.actor.mapper, tvtk.PolyDataMapper))
+        self.check()
+
+    def test_instanced_negative_scalars(self):
+        """Test if negative scalars scale the instanced glyphs like the
+        glyph filter."""
+        pd = tvtk.PolyData(points=numpy.random.random((4, 3)))
+        pd.point_data.scalars = numpy.array([-2.0, -0.5, 0.5, 1.0])
+        pd.point_data.scalars.name = 's'
+        pd.point_data.vectors = numpy.ones((4, 3))
+        pd.point_data.vectors.name = 'v'
+        self.e.add_source(VTKDataSource(data=pd))
+        g = Glyph()
+        self.e.add_module(g)
+        glyph = g.glyph
+        glyph.scale_mode = 'scale_by_scalar'
+        glyph.instanced = True
+        gm = glyph.glyph_mapper
+        self.assertTrue(g.actor.mapper is gm)
+        self.assertEqual(gm.scale_mode, 'scale_by_vector_components')
+        self.assertTrue(numpy.allclose(gm.range, glyph.glyph.range))
+        self.assertTrue(gm.clamping)
+        scale = gm.input.point_data.get_array('GlyphScale').to_array()
+        s = pd.point_data.scalars.to_array()
+        self.assertTrue(numpy.allclose(scale, numpy.c_[s, s, s]))
+        self.assertEqual(gm.input.point_data.scalars.name, 's')
+
+        # The vectors are used as they are.
+        glyph.scale_mode = 'scale_by_vector'
+        self.assertEqual(gm.scale_mode, 'scale_by_magnitude')
+        self.assertTrue(gm.input.point_data.get_array('GlyphScale') is None)
+        glyph.scale_mode = 'scale_by_scalar'
+        glyph.mask_points.random_mode = False
+        glyph.mask_points.on_ratio = 2
+        glyph.mask_input_points = True
+        scale = gm.input.point_data.get_array('GlyphScale').to_array()
+        self.assertTrue(numpy.allclose(scale[:, 0], s[::2]))
+
+        glyph.instanced = False
+        self.assertTrue(isinstance(g.actor.mapper, tvtk.PolyDataMapper))
+        self.assertEqual(glyph.glyph.input.number_of_points, 2)
+
+    def test_instanced_vector_mode(self):
+        """Test if the shared vector LUT mode is restored."""
+        v = self.v
+        lut = v.module_manager.vector_lut_manager.lut
+        lut.vector_mode = 'component'
+        v.glyph.instanced = True
+        self.assertEqual(lut.vector_mode, 'magnitude')
+        v.glyph.instanced = False
+        self.assertEqual(lut.vector_mode, 'component')
+
+        v.glyph.instanced = True
+        v.glyph.color_mode = 'color_by_scalar'
+        self.assertEqual(lut.vector_mode, 'component')
+        v.glyph.color_mode = 'color_by_vector'
+        self.assertEqual(lut.vector_mode, 'magnitude')
+        v.remove()
+        self.assertEqual(lut.vector_mode, 'component')
+
     def test_components_changed(self):
         """"Test if the modules respond correctly when the components
             are changed."""
@@ -0,0 +1,147 @@
+"""
+Tests for the label culling of the Labels module.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import unittest
+
+import numpy
+
+from mayavi.core.off_screen_engine import OffScreenEngine
+from mayavi.modules.labels import Labels, cull_labels
+from mayavi.sources.vtk_data_source import VTKDataSource
+from tvtk.api import tvtk
+
+
+class TestCullLabels(unittest.TestCase):
+    def test_one_label_per_cell(self):
+        xy = numpy.array([[1, 1], [5, 5], [15, 1], [1, 15]], dtype=float)
+        depth = numpy.array([0.5, 0.1, 0.3, 0.9])
+        keep = cull_labels(xy, depth, 10, 100)
+        # The second point is nearer than the first in the same cell and
+        # the result is sorted front to back.
+        self.assertEqual(list(keep), [1, 2, 3])
+
+    def test_budget(self):
+        xy = numpy.random.uniform(0, 1000, (1000, 2))
+        depth = numpy.random.uniform(0, 1, 1000)
+        keep = cull_labels(xy, depth, 10, 25)
+        self.assertEqual(len(keep), 25)
+        self.assertTrue(numpy.all(numpy.diff(depth[keep]) >= 0))
+
+    def test_empty(self):
+        keep = cull_labels(numpy.zeros((0, 2)), numpy.zeros(0), 10, 5)
+        self.assertEqual(len(keep), 0)
+
+
+class TestLabelFormatCache(unittest.TestCase):
+    def test_format_label(self):
+        labels = Labels()
+        self.assertEqual(labels._format_label(1.5), '1.5')
+        self.assertEqual(labels._format_label((1.0, 2.0)), '(1, 2)')
+        self.assertEqual(len(labels._label_cache), 2)
+        labels.label_format = '%.2f'
+        self.assertEqual(len(labels._label_cache), 0)
+        self.assertEqual(labels._format_label(1.5), '1.50')
+
+
+class TestLabelCulling(unittest.TestCase):
+    def setUp(self):
+        e = OffScreenEngine()
+        e.start()
+        e.new_scene()
+        self.e = e
+        self.scene = e.current_scene.scene
+        # A grid of labeled points in the plane z=0.
+        x, y = numpy.mgrid[-1:1:20j, -1:1:20j]
+        points = numpy.c_[x.ravel(), y.ravel(), numpy.zeros(400)]
+        pd = tvtk.PolyData(points=points)
+        pd.point_data.scalars = numpy.arange(400, dtype=float)
+        e.add_source(VTKDataSource(data=pd))
+        self.labels = Labels(label_format='%.1f', label_culling=True,
+                             label_budget=30, cell_size=20)
+        self.labels.mask.filter.random_mode = False
+        e.add_module(self.labels)
+        self.scene.reset_zoom()
+
+    def tearDown(self):
+        self.e.stop()
+
+    def get_labels(self):
+        arr = self.labels.mapper.input.point_data.get_abstract_array('labels')
+        return [arr.get_value(i) for i in range(arr.number_of_tuples)]
+
+    def test_render(self):
+        labels = self.labels
+        self.scene.render()
+        self.assertTrue(labels.mapper.label_format in (None, '%s'))
+        text = self.get_labels()
+        self.assertTrue(0 < len(text) <= 30)
+        for t in text:
+            self.assertEqual('%.1f' % float(t), t)
+
+        # Rendering again with the same view keeps the labels.
+        key = labels._culled_key
+        self.scene.render()
+        self.assertEqual(labels._culled_key, key)
+
+        # Fewer labels fit in larger cells.
+        labels.cell_size = 100
+        self.assertTrue(0 < len(self.get_labels()) < len(text))
+
+        labels.label_culling = False
+        self.assertEqual(labels.mapper.label_format, '%.1f')
+
+    def test_render_once(self):
+        # The labels are culled before the frame is drawn, so a view
+        # with new labels is not rendered twice.
+        self.scene.render()
+        frames = []
+        rw = self.scene.render_window
+        rw.add_observer('EndEvent', lambda *args: frames.append(1))
+        key = self.labels._culled_key
+        self.scene.camera.zoom(3.0)
+        self.scene.render()
+        self.assertEqual(len(frames), 1)
+        self.assertNotEqual(self.labels._culled_key, key)
+        self.assertEqual(self.labels.mapper.input.number_of_points,
+                         len(self.labels._culled_key[1]))
+
+    def add_occluder(self):
+        # A plane in front of the lower half of the points.
+        plane = tvtk.PlaneSource(origin=(-2, -2, 0.5), point1=(2, -2, 0.5),
+                                 point2=(-2, 0, 0.5))
+        m = tvtk.PolyDataMapper(input_connection=plane.output_port)
+        self.scene.add_actor(tvtk.Actor(mapper=m))
+        self.scene.camera.position = (0, 0, 10)
+        self.scene.camera.focal_point = (0, 0, 0)
+        self.scene.camera.view_up = (0, 1, 0)
+        self.scene.reset_zoom()
+        self.labels.cell_size = 1
+        self.labels.label_budget = 400
+
+    def get_label_y(self):
+        self.scene.render()
+        return self.labels.mapper.input.points.to_array()[:, 1]
+
+    def test_occluded_labels(self):
+        self.add_occluder()
+        self.assertTrue(numpy.any(self.get_label_y() < -0.1))
+
+        self.labels.visible_points.enabled = True
+        y = self.get_label_y()
+        self.assertTrue(len(y) > 0)
+        self.assertTrue(numpy.all(y > -0.1))
+
+    def test_occluded_labels_in_viewport(self):
+        # The z-buffer is read where the viewport is.
+        self.scene.renderer.viewport = (0.5, 0.0, 1.0, 1.0)
+        self.add_occluder()
+        self.labels.visible_points.enabled = True
+        y = self.get_label_y()
+        self.assertTrue(len(y) > 0)
+        self.assertTrue(numpy.all(y > -0.1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Tests for the MaskPoints filter.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import unittest
+
+import numpy
+
+from mayavi.core.null_engine import NullEngine
+from mayavi.filters.mask_points import (MaskPoints, random_subsample,
+                                        voxel_subsample)
+from mayavi.filters.threshold import Threshold
+from mayavi.sources.array_source import ArraySource
+
+
+class TestSubsample(unittest.TestCase):
+    def test_random_subsample(self):
+        idx = random_subsample(1000, 100, seed=1)
+        self.assertEqual(len(idx), 100)
+        self.assertEqual(len(numpy.unique(idx)), 100)
+        self.assertTrue(numpy.all(numpy.diff(idx) > 0))
+        self.assertTrue(numpy.all(idx == random_subsample(1000, 100, 1)))
+        self.assertEqual(len(random_subsample(10, 100)), 10)
+
+    def test_voxel_subsample(self):
+        points = numpy.random.RandomState(0).uniform(0, 1, (10000, 3))
+        # Make the bounding box the unit cube.
+        points[:2] = [[0, 0, 0], [1, 1, 1]]
+        for blue_noise in (False, True):
+            idx = voxel_subsample(points, 64, seed=2, blue_noise=blue_noise)
+            # At most one point in each cell of a 4x4x4 grid.
+            cells = numpy.floor(points[idx]*4).astype(int)
+            cells = numpy.ravel_multi_index(numpy.minimum(cells, 3).T,
+                                            (4, 4, 4))
+            self.assertEqual(len(numpy.unique(cells)), len(idx))
+            self.assertTrue(len(idx) <= 64)
+            same = voxel_subsample(points, 64, seed=2,
+                                   blue_noise=blue_noise)
+            self.assertTrue(numpy.all(idx == same))
+
+    def test_voxel_subsample_flat(self):
+        points = numpy.zeros((100, 3))
+        points[:, 0] = numpy.linspace(0, 1, 100)
+        idx = voxel_subsample(points, 10, blue_noise=True)
+        self.assertEqual(len(idx), 10)
+
+
+class TestMaskPoints(unittest.TestCase):
+    def setUp(self):
+        e = NullEngine()
+        e.start()
+        e.new_scene()
+        self.e = e
+        self.src = ArraySource(scalar_data=numpy.random.random((20, 20, 20)))
+        e.add_source(self.src)
+
+    def tearDown(self):
+        self.e.stop()
+
+    def test_get_output_size(self):
+        self.assertEqual(self.src.get_output_size(), (8000, 6859))
+        t = Threshold()
+        self.e.add_filter(t)
+        dataset = t.get_output_dataset()
+        self.assertEqual(t.get_output_size(),
+                         (dataset.number_of_points, dataset.number_of_cells))
+
+    def test_vtk_strategy(self):
+        mask = MaskPoints()
+        mask.filter.on_ratio = 10
+        self.e.add_filter(mask)
+        self.assertEqual(mask.filter.maximum_number_of_points, 8000)
+        self.assertEqual(mask.get_output_dataset().number_of_points, 800)
+
+    def test_numpy_strategies(self):
+        mask = MaskPoints(strategy='random', number_of_points=500)
+        self.e.add_filter(mask)
+        out = mask.get_output_dataset()
+        self.assertEqual(out.number_of_points, 500)
+        scalars = self.src.scalar_data.ravel(order='F')
+        expect = scalars[mask._indices]
+        self.assertTrue(numpy.allclose(out.point_data.scalars.to_array(),
+                                       expect))
+
+        for strategy in ('voxel', 'blue_noise'):
+            mask.strategy = strategy
+            out = mask.get_output_dataset()
+            self.assertTrue(0 < out.number_of_points <= 500)
+
+    def test_indices_are_cached(self):
+        mask = MaskPoints(strategy='voxel', number_of_points=200)
+        self.e.add_filter(mask)
+        idx = mask._indices
+        # Changing only the attributes reuses the chosen points.
+        data = numpy.random.random((20, 20, 20))
+        self.src.scalar_data = data
+        self.assertTrue(mask._indices is idx)
+        out = mask.get_output_dataset()
+        self.assertTrue(numpy.allclose(out.point_data.scalars.to_array(),
+                                       data.ravel(order='F')[idx]))
+        # Changing the parameters does not.
+        mask.seed = 1
+        self.assertFalse(mask._indices is idx)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for the MemmapVolumeReader source.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from traits.api import push_exception_handler, pop_exception_handler
+from mayavi.sources.memmap_volume_reader import (MemmapVolumeReader,
+                                                 get_stride)
+
+
+class TestMemmapVolumeReader(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        x, y, z = numpy.mgrid[0:40, 0:30, 0:20]
+        self.array = (x + 100*y + 10000*z).astype('float32')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _get_scalars(self, data):
+        dims = data.dimensions
+        s = data.point_data.scalars.to_array()
+        return numpy.reshape(s, dims[::-1]).T
+
+    def test_get_stride(self):
+        self.assertEqual(get_stride((10, 10, 10), 1000), 1)
+        self.assertEqual(get_stride((10, 10, 10), 999), 2)
+        self.assertEqual(get_stride((1000, 1000, 1000), 1000), 100)
+
+    def test_npy_overview_is_bounded(self):
+        fname = os.path.join(self.root, 'data.npy')
+        numpy.save(fname, self.array)
+        src = MemmapVolumeReader(max_points=2000)
+        src.initialize(fname)
+        self.assertEqual(len(src.outputs), 2)
+        overview = src.outputs[0]
+        stride = src.overview_stride
+        self.assertTrue(stride > 1)
+        self.assertTrue(overview.number_of_points <= 2000)
+        expect = self.array[::stride, ::stride, ::stride]
+        self.assertTrue(numpy.all(self._get_scalars(overview) == expect))
+        self.assertEqual(tuple(overview.spacing), (stride,)*3)
+
+    def test_raw_voi_is_full_resolution(self):
+        fname = os.path.join(self.root, 'data.raw')
+        # Write the file in C order, i.e. with z varying fastest.
+        self.array.tofile(fname)
+        src = MemmapVolumeReader(dimensions=(40, 30, 20),
+                                 data_type='float32', file_order='c',
+                                 max_points=4000, brick_size=4,
+                                 file_name=fname)
+        src.voi = (8, 15, 4, 11, 2, 5)
+        detail = src.outputs[1]
+        self.assertEqual(src.detail_stride, 1)
+        # The z extent is grown to the brick boundaries.
+        self.assertEqual(tuple(detail.dimensions), (8, 8, 8))
+        self.assertEqual(tuple(detail.origin), (8.0, 4.0, 0.0))
+        expect = self.array[8:16, 4:12, 0:8]
+        self.assertTrue(numpy.all(self._get_scalars(detail) == expect))
+
+    def test_bad_npy_dimensions(self):
+        fname = os.path.join(self.root, 'data.npy')
+        numpy.save(fname, numpy.zeros(10))
+        src = MemmapVolumeReader()
+        # The error is raised in a trait handler.
+        push_exception_handler(reraise_exceptions=True)
+        try:
+            self.assertRaises(ValueError, src.initialize, fname)
+        finally:
+            pop_exception_handler()
+
+    def test_plane_slab(self):
+        fname = os.path.join(self.root, 'data.npy')
+        numpy.save(fname, self.array)
+        src = MemmapVolumeReader(file_name=fname, brick_size=1,
+                                 slab_thickness=2)
+        src._track_plane((0.0, 0.0, 10.0), (0.0, 0.0, 1.0))
+        self.assertEqual(tuple(src.voi), (0, 39, 0, 29, 9, 11))
+
+
+if __name__ == '__main__':
+    unittest.main()
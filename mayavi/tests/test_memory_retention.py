@@ -0,0 +1,105 @@
+"""
+Tests for the harness that checks that pipeline objects do not retain
+memory when they are repeatedly created, updated and destroyed.  The
+sweep over the whole registry is in the benchmark suite, see
+``benchmarks/suite/bench_memory_retention.py``.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import gc
+import unittest
+import weakref
+
+from mayavi.core.null_engine import NullEngine
+from mayavi.modules.outline import Outline
+from mayavi.modules.surface import Surface
+from mayavi.sources.vtk_data_source import VTKDataSource
+from mayavi.tests.retention import RetentionHarness, make_dataset
+
+
+class TestMemoryRetention(unittest.TestCase):
+    def setUp(self):
+        e = NullEngine()
+        e.start()
+        self.e = e
+        self.harness = RetentionHarness(engine=e, cycles=3, warmup=1)
+
+    def tearDown(self):
+        self.e.stop()
+
+    def test_harness_detects_retention(self):
+        leaked = []
+
+        def create(engine, leak=True):
+            src = VTKDataSource(data=make_dataset('image_data', 5))
+            engine.add_source(src)
+            engine.add_module(Outline())
+            if leak:
+                leaked.append(src)
+
+        result = self.harness.run_case('leak', create)
+        self.assertTrue(result.failed)
+        self.assertTrue(result.growth['retained'] > 0)
+        del leaked[:]
+
+        result = self.harness.run_case('no leak',
+                                       lambda e: create(e, leak=False))
+        self.assertEqual(len(result.samples), 3)
+        self.assertEqual(result.growth['retained'], 0)
+        self.assertEqual(len(self.e.scenes), 0)
+
+    def make_pipeline(self, engine):
+        """Add a source with two modules and return weak references to
+        the pipeline objects and their VTK objects."""
+        src = VTKDataSource(data=make_dataset('image_data', 5))
+        engine.add_source(src)
+        outline = Outline()
+        engine.add_module(outline)
+        surface = Surface()
+        engine.add_module(surface)
+        objs = [src, src.children[0], outline, outline.outline_filter,
+                surface, surface.actor.actor, surface.actor.mapper]
+        return src, [weakref.ref(x) for x in objs]
+
+    def alive(self, refs):
+        gc.collect()
+        return [r() for r in refs if r() is not None]
+
+    def test_removed_objects_are_collected(self):
+        e = self.e
+        e.new_scene()
+        src, refs = self.make_pipeline(e)
+        self.assertEqual(len(self.alive(refs)), len(refs))
+        src.remove()
+        del src
+        self.assertEqual(self.alive(refs), [])
+
+    def test_objects_are_collected_with_the_engine(self):
+        e = NullEngine()
+        e.start()
+        e.new_scene()
+        refs = self.make_pipeline(e)[1]
+        refs.extend([weakref.ref(e), weakref.ref(e.current_scene)])
+        e.stop()
+        del e
+        self.assertEqual(self.alive(refs), [])
+
+    def test_thresholds(self):
+        def create(engine):
+            engine.add_source(VTKDataSource(data=make_dataset('poly_data', 3)))
+
+        # The Python objects and memory are only reported by default.
+        result = self.harness.run_case('no leak', create)
+        self.assertFalse(result.failed)
+        self.assertTrue('objects' in result.growth)
+
+        harness = RetentionHarness(engine=self.e, cycles=3, warmup=1,
+                                   max_object_growth=-1)
+        result = harness.run_case('no leak', create)
+        self.assertTrue(result.failed)
+        self.assertTrue('Python objects' in result.failures[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,8 @@ from traits.testing.unittest_tools import UnittestTools
 
 from mayavi import mlab
 from mayavi.core.engine import Engine
+from mayavi.core.lut_manager import LUTManager
+from mayavi.tools.pipe_base import _same_colormap
 from tvtk.api import tvtk
 from mayavi.tools.engine_manager import engine_manager
 from mayavi.core.registry import registry
@@ -342,6 +344,37 @@ class TestMlabHelperFunctions(TestMlabNullEngine, UnittestTools):
         ipw = mlab.volume_slice(scalars, plane_orientation='y_axes')
         self.assertEqual(ipw.ipw.plane_orientation, 'y_axes')
 
+    def test_batch(self):
+        pts = [np.random.random((3, 5)) for i in range(4)]
+        objs = mlab.points3d.batch(pts, scale_factor=0.1, color=(1, 0, 0))
+        self.assertEqual(len(objs), 4)
+        for obj in objs:
+            self.assertEqual(obj.glyph.glyph.scale_factor, 0.1)
+            self.assertEqual(obj.actor.property.color, (1, 0, 0))
+
+        fig = mlab.gcf()
+        with mlab.batch(fig):
+            mlab.plot3d(*pts[0])
+        self.assertEqual(len(fig.children), 5)
+
+    def test_invalid_keyword(self):
+        self.assertRaises(ValueError, mlab.points3d, [0], [0], [0],
+                          not_a_keyword=1)
+
+    def test_colormap_does_not_add_module_manager(self):
+        src = mlab.pipeline.scalar_field(np.random.random((5, 5, 5)))
+        mlab.pipeline.iso_surface(src, colormap='hot')
+        mlab.pipeline.iso_surface(src, colormap='hot')
+        self.assertEqual(len(src.children), 1)
+
+    def test_same_colormap(self):
+        lut = LUTManager(lut_mode='hot')
+        self.assertTrue(_same_colormap(lut, 'hot'))
+        self.assertFalse(_same_colormap(lut, 'hot_r'))
+        lut.reverse_lut = True
+        self.assertTrue(_same_colormap(lut, 'hot_r'))
+        self.assertFalse(_same_colormap(lut, 'hot'))
+
 
 ################################################################################
 # class `TestMlabModules`
@@ -0,0 +1,89 @@
+"""
+Tests for the binary backend of the notebook support.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from tvtk.api import tvtk
+from tvtk.pyface.tvtk_scene import TVTKScene
+from mayavi.tools import notebook
+
+
+class TestBinaryBackend(unittest.TestCase):
+    def setUp(self):
+        self.scene = TVTKScene(off_screen_rendering=True)
+        self.sources = []
+        for center in ((0, 0, 0), (2, 0, 0)):
+            src = tvtk.SphereSource(center=center)
+            m = tvtk.PolyDataMapper(input_connection=src.output_port)
+            self.scene.add_actors(tvtk.Actor(mapper=m))
+            self.sources.append(src)
+        notebook.reset()
+
+    def tearDown(self):
+        self.scene.close()
+        notebook.reset()
+
+    def test_actor_to_mesh(self):
+        actor = self.scene.renderer.actors[1]
+        actor.position = (0, 1, 0)
+        mesh = notebook.actor_to_mesh(actor)
+        src = self.sources[1]
+        self.assertEqual(len(mesh['points']), src.output.number_of_points)
+        self.assertEqual(mesh['triangles'].shape[1], 3)
+        center = mesh['points'].mean(axis=0)
+        self.assertTrue(numpy.allclose(center, (2, 1, 0), atol=1e-6))
+
+    def test_quantize(self):
+        mesh = notebook.actor_to_mesh(self.scene.renderer.actors[0])
+        info, blob = notebook.encode_mesh(mesh, quantize=True)
+        dtype, offset, size = info['points']
+        self.assertEqual(dtype, 'f2')
+        points = numpy.frombuffer(blob, '<f2', size, offset).reshape(-1, 3)
+        points = info['center'] + points*info['scale']
+        self.assertTrue(numpy.allclose(points, mesh['points'], atol=1e-3))
+        full = notebook.encode_mesh(mesh)[1]
+        self.assertTrue(len(blob) < len(full))
+
+    def test_only_changed_meshes_are_sent(self):
+        html = notebook.scene_to_binary(self.scene)
+        self.assertEqual(html.count('IndexedTriangleSet id='), 2)
+        self.assertEqual(html.count('"data"'), 2)
+
+        # Nothing changed so no data is sent again.
+        html = notebook.scene_to_binary(self.scene)
+        self.assertEqual(html.count('"data"'), 0)
+
+        self.sources[0].radius = 2.0
+        html = notebook.scene_to_binary(self.scene)
+        self.assertEqual(html.count('"data"'), 1)
+
+        notebook.reset()
+        html = notebook.scene_to_binary(self.scene)
+        self.assertEqual(html.count('"data"'), 2)
+
+    def test_sidecar(self):
+        tmpdir = tempfile.mkdtemp()
+        orig = notebook._sidecar, notebook._sidecar_url
+        notebook._sidecar = notebook._sidecar_url = tmpdir
+        try:
+            html = notebook.scene_to_binary(self.scene)
+            self.assertEqual(html.count('"data"'), 0)
+            self.assertEqual(len(os.listdir(tmpdir)), 2)
+            self.sources[0].radius = 2.0
+            notebook.scene_to_binary(self.scene)
+            self.assertEqual(len(os.listdir(tmpdir)), 3)
+        finally:
+            notebook._sidecar, notebook._sidecar_url = orig
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    unittest.main()
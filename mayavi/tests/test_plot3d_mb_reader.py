@@ -9,6 +9,8 @@ from io import BytesIO
 import copy
 import unittest
 
+import numpy
+
 # Local imports.
 from mayavi.tests.common import get_example_data
 
@@ -112,5 +114,55 @@ class TestPlot3dMbReader(unittest.TestCase):
         self.assertEqual(o1.outline_filter.output.bounds,
                                     (2.0, 3.0, 1.0, 2.0, 1.0, 2.0))
 
+class TestPlot3dParallelRead(unittest.TestCase):
+
+    def _make_reader(self, **traits):
+        r = PLOT3DReader(**traits)
+        r.reader.set(has_byte_count=True, multi_grid=True,
+                     byte_order='little_endian')
+        r.initialize(get_example_data('tiny.xyz'),
+                     get_example_data('tiny.q'),
+                     configure=False)
+        return r
+
+    def test_parallel_read_matches_vtk(self):
+        r = self._make_reader()
+        p = self._make_reader(parallel_read=True, number_of_workers=3)
+        self.assertEqual(p.number_of_blocks, 5)
+        self.assertEqual(len(p.outputs), 5)
+        self.assertEqual(p.read_progress, 1.0)
+        self.assertEqual(sorted(p.block_read_times.keys()), list(range(5)))
+        for expect, out in zip(r.outputs, p.outputs):
+            self.assertEqual(out.bounds, expect.bounds)
+            rho = out.point_data.get_array('Density').to_array()
+            rho1 = expect.point_data.get_array('Density').to_array()
+            self.assertTrue(numpy.allclose(rho, rho1))
+
+    def test_blocks_to_load(self):
+        r = self._make_reader()
+        p = self._make_reader(parallel_read=True, blocks_to_load=[1, 3])
+        self.assertEqual(len(p.outputs), 2)
+        self.assertEqual(p.outputs[0].bounds, r.outputs[1].bounds)
+        self.assertEqual(p.outputs[1].bounds, r.outputs[3].bounds)
+        self.assertEqual(sorted(p.block_read_times.keys()), [1, 3])
+        p.blocks_to_load = [3]
+        self.assertEqual(len(p.outputs), 1)
+        self.assertEqual(p.outputs[0].bounds, r.outputs[3].bounds)
+
+    def test_fallback_to_vtk_reader(self):
+        r = self._make_reader()
+        p = self._make_reader(parallel_read=True)
+        self.assertFalse(p.has_output_port())
+        # Only the VTK reader computes the other functions.
+        p.scalars_name = 'pressure'
+        self.assertTrue(p.has_output_port())
+        self.assertEqual(len(p.outputs), 5)
+        self.assertEqual(p.outputs[0].point_data.scalars.name, 'Pressure')
+        p.scalars_name = 'density'
+        self.assertFalse(p.has_output_port())
+        for expect, out in zip(r.outputs, p.outputs):
+            self.assertEqual(out.bounds, expect.bounds)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests for the pipeline profiler.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from mayavi.core.null_engine import NullEngine
+from mayavi.filters.threshold import Threshold
+from mayavi.modules.outline import Outline
+from mayavi.sources.array_source import ArraySource
+from mayavi.sources.vtk_data_source import VTKDataSource
+from tvtk.api import tvtk
+
+
+class TestPipelineProfiler(unittest.TestCase):
+    def setUp(self):
+        e = NullEngine()
+        e.start()
+        e.new_scene()
+        self.e = e
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.e.stop()
+        shutil.rmtree(self.root)
+
+    def _make_pipeline(self):
+        src = ArraySource(scalar_data=numpy.random.random((5, 5, 5)))
+        self.e.add_source(src)
+        self.e.add_filter(Threshold())
+        o = Outline()
+        self.e.add_module(o)
+        return src, o
+
+    def test_profile(self):
+        with self.e.profile() as p:
+            self.assertTrue(p.running)
+            src, o = self._make_pipeline()
+            src.scalar_data = numpy.random.random((6, 6, 6))
+        self.assertFalse(p.running)
+        classes = [x['class'] for x in p.summary()]
+        self.assertTrue('Threshold' in classes)
+        self.assertTrue('Outline' in classes)
+        self.assertTrue('ModuleManager' in classes)
+        for stat in p.summary():
+            self.assertTrue(sum(stat['calls'].values()) > 0)
+            self.assertTrue(stat['wall_time'] >= stat['self_time'])
+        self.assertTrue(len(p.stacks) > 0)
+        self.assertTrue('Total profiled time' in p.report())
+
+    def test_other_engines_are_not_profiled(self):
+        e = NullEngine()
+        e.start()
+        e.new_scene()
+        try:
+            with self.e.profile() as p:
+                src = VTKDataSource(data=tvtk.ImageData(dimensions=(3, 3, 3)))
+                e.add_source(src)
+                e.add_module(Outline())
+                src.update()
+            self.assertEqual(p.objects, {})
+
+            with e.profile() as p:
+                e.add_module(Outline())
+                src.update()
+            types = [x['type'] for x in p.summary()]
+            self.assertTrue('Source' in types)
+            self.assertTrue('Module' in types)
+        finally:
+            e.stop()
+
+    def test_instrumentation_is_removed(self):
+        with self.e.profile():
+            self.assertTrue(hasattr(Outline.update_pipeline, '_profiled'))
+        self.assertFalse(hasattr(Outline.update_pipeline, '_profiled'))
+        self.assertFalse(hasattr(Threshold.update_data, '_profiled'))
+
+    def test_save(self):
+        with self.e.profile() as p:
+            self._make_pipeline()
+        fname = os.path.join(self.root, 'profile.json')
+        p.save(fname)
+        with open(fname) as f:
+            data = json.load(f)
+        self.assertEqual(len(data['objects']), len(p.objects))
+        self.assertEqual(len(data['stacks']), len(p.stacks))
+
+        fname = os.path.join(self.root, 'profile.folded')
+        p.save(fname)
+        with open(fname) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), len(p.stacks))
+        for line in lines:
+            path, t = line.rsplit(' ', 1)
+            self.assertTrue(int(t) >= 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,10 +9,18 @@ from io import BytesIO
 import copy
 import numpy
 import unittest
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+import mock
 
 # Enthought library imports
+from tvtk.api import tvtk
 from mayavi.core.null_engine import NullEngine
 from mayavi.sources.array_source import ArraySource
+from mayavi.sources.vtk_data_source import VTKDataSource
 from mayavi.modules.outline import Outline
 from mayavi.modules.streamline import Streamline
 
@@ -145,6 +153,121 @@ class TestStreamline(unittest.TestCase):
 
 
 
+    def test_seed_preview(self):
+        """Test if the seeds are subsampled while the widget is dragged."""
+        st = self.scene.children[0].children[0].children[1]
+        seed = st.seed
+        seed.update_mode = 'interactive'
+        full = seed.poly_data.number_of_points
+        seed.preview_stride = 4
+        updates = []
+        seed.on_trait_change(lambda: updates.append(True),
+                             'poly_data_updated')
+        seed._on_start_interaction(None, 'StartInteractionEvent')
+        seed._on_interaction_event(None, 'InteractionEvent')
+        self.assertTrue(seed.poly_data.number_of_points < full)
+        self.assertEqual(len(updates), 1)
+        seed._on_end_interaction(None, 'EndInteractionEvent')
+        self.assertEqual(seed.poly_data.number_of_points, full)
+        self.assertEqual(len(updates), 2)
+        self.check()
+
+    def test_seed_throttle(self):
+        """Test if the last skipped seed update is done by a timer."""
+        st = self.scene.children[0].children[0].children[1]
+        seed = st.seed
+        seed.update_mode = 'interactive'
+        self.assertEqual(seed.max_update_rate, 0.0)
+        seed.max_update_rate = 1.0
+        timers = []
+
+        def make_timer(wait):
+            timers.append(mock.Mock(wait=wait))
+            return timers[-1]
+
+        with mock.patch.object(seed, '_make_timer', side_effect=make_timer), \
+                mock.patch.object(type(seed), 'update_poly_data') as update:
+            seed._on_start_interaction(None, 'StartInteractionEvent')
+            seed._on_interaction_event(None, 'InteractionEvent')
+            self.assertEqual(update.call_count, 1)
+            self.assertEqual(len(timers), 0)
+            # The next updates are skipped and one timer started.
+            seed._on_interaction_event(None, 'InteractionEvent')
+            seed._on_interaction_event(None, 'InteractionEvent')
+            self.assertEqual(update.call_count, 1)
+            self.assertEqual(len(timers), 1)
+            self.assertTrue(0.0 < timers[0].wait <= 1.0)
+            # The timer does the skipped update.
+            seed._on_timer()
+            self.assertTrue(timers[0].Stop.called)
+            self.assertEqual(update.call_count, 2)
+            seed._on_end_interaction(None, 'EndInteractionEvent')
+            self.assertEqual(update.call_count, 2)
+
+    def test_background_tracing(self):
+        """Test if tracing the seeds in the background gives the same
+        result."""
+        # The streamlines of a rotating vector field.
+        x, y, z = numpy.mgrid[-5:5:20j, -5:5:20j, -5:5:20j]
+        v = numpy.zeros(x.shape + (3,))
+        v[..., 0], v[..., 1], v[..., 2] = -y, x, 0.1
+        img = tvtk.ImageData(origin=(-5, -5, -5), spacing=(10./19,)*3,
+                             dimensions=x.shape)
+        img.point_data.vectors = v.transpose(2, 1, 0, 3).reshape(-1, 3)
+        img.point_data.vectors.name = 'v'
+        self.e.add_source(VTKDataSource(data=img))
+        st = Streamline()
+        self.e.add_module(st)
+        st.seed.widget.set(radius=2.0, center=(1.0, 0.0, 0.0),
+                           theta_resolution=6, phi_resolution=6)
+        st.seed.update_poly_data()
+        calls = queue.Queue()
+
+        def invoke_later(func, *args):
+            calls.put((func, args))
+
+        def wait():
+            # Make the calls to the UI thread until the trace is done.
+            while True:
+                func, args = calls.get(timeout=60)
+                func(*args)
+                if func == st._traces_finished and not st._tracing:
+                    break
+
+        # The GUI of the null toolkit may have no invoke_later.
+        with mock.patch('pyface.api.GUI.invoke_later', create=True,
+                        side_effect=invoke_later), \
+                mock.patch.object(type(st), 'render') as render:
+            st.number_of_subsets = 3
+            st.background_tracing = True
+            wait()
+            st.stream_tracer.update()
+            expect = st.stream_tracer.output.number_of_points
+            self.assertTrue(expect > 0)
+            self.assertEqual(st.trace_progress, 1.0)
+            self.assertEqual(len(st._parts), 3)
+            self.assertEqual(st._merge.output.number_of_points, expect)
+            self.assertTrue(st.outputs[0] is st._merge.output_port)
+            self.assertTrue(render.called)
+
+            # A request made while tracing aborts the trace and the
+            # latest state is traced once it has stopped.
+            generation = st._generation
+            st.stream_tracer.maximum_propagation = 2.0
+            self.assertTrue(st._tracing)
+            st.seed.update_poly_data()
+            self.assertTrue(st._trace_again)
+            wait()
+            self.assertFalse(st._trace_again)
+            self.assertTrue(st._generation > generation)
+            st.stream_tracer.update()
+            self.assertEqual(st._merge.output.number_of_points,
+                             st.stream_tracer.output.number_of_points)
+            self.assertTrue(st._merge.output.number_of_points < expect)
+
+            st.background_tracing = False
+            self.assertTrue(st.outputs[0] is st.stream_tracer.output_port)
+
     def test_save_and_restore(self):
         """Test if saving a visualization and restoring it works."""
         engine = self.e
@@ -81,6 +81,29 @@ class TestExodusReader(DataReaderTestBase):
 
         self.check_deepcopying(self.scene, self.bounds)
 
+@unittest.skipIf(old_pipeline,
+                 "ExodusIIReader is only used from VTK 6.0 onwards.")
+class TestExodusIIBlocks(unittest.TestCase):
+
+    def test_blocks_to_load(self):
+        r = UnstructuredGridReader()
+        r.initialize(get_example_data('disk_out_ref.ex2'))
+        self.assertEqual(len(r.element_blocks), 1)
+        self.assertEqual(len(r.outputs), 1)
+        self.assertEqual(r.outputs[0].number_of_cells, 7472)
+
+        r.blocks_to_load = r.element_blocks[:1]
+        self.assertEqual(len(r.outputs), 1)
+        self.assertEqual(r.outputs[0].number_of_cells, 7472)
+
+        # When no block is read the output is empty.
+        r.blocks_to_load = ['no such block']
+        self.assertEqual(len(r.outputs), 1)
+        self.assertEqual(r.outputs[0].number_of_cells, 0)
+
+        r.blocks_to_load = []
+        self.assertEqual(r.outputs[0].number_of_cells, 7472)
+
 #TODO: Update the ExodusIIReader test for scenarios as for the other readers
 #in this module.
 @unittest.skip("ExodusIIReader support is disabled for now.")
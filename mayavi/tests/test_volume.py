@@ -2,10 +2,16 @@
 import numpy as np
 import unittest
 from mock import patch
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
 
 # Enthought library imports
+from tvtk.api import tvtk
 from mayavi.tests.common import get_example_data
 from mayavi import mlab
+from mayavi.modules.volume import downsample_image_data
 
 
 class TestVolumeWorksWithProbe(unittest.TestCase):
@@ -28,5 +34,131 @@ class TestVolumeWorksWithProbe(unittest.TestCase):
 
 
 
+
+class TestVolumeLOD(unittest.TestCase):
+    def setUp(self):
+        self._orig_backend = mlab.options.backend
+        mlab.options.backend = "test"
+        data = np.random.randint(0, 255, (16, 16, 8)).astype('uint8')
+        img = tvtk.ImageData(dimensions=data.shape)
+        img.point_data.scalars = np.ravel(data.T)
+        img.point_data.scalars.name = 'scalars'
+        src = mlab.pipeline.add_dataset(img)
+        self.vol = mlab.pipeline.volume(src)
+
+    def tearDown(self):
+        mlab.close(all=True)
+        mlab.options.backend = self._orig_backend
+
+    def get_mapper_input(self):
+        vm = self.vol._volume_mapper
+        vm.update()
+        return vm.get_input_data_object(0, 0)
+
+    def test_lod_pyramid(self):
+        vol = self.vol
+        self.assertEqual(len(vol._lod_pyramid), 0)
+        vol.use_lod = True
+        pyramid = vol._lod_pyramid
+        self.assertEqual(sorted(pyramid.keys()), [2, 4, 8])
+        self.assertEqual(tuple(pyramid[2].dimensions), (8, 8, 4))
+        self.assertEqual(tuple(pyramid[8].dimensions), (2, 2, 1))
+        self.assertTrue(vol.lod_memory > 0)
+        self.assertTrue(vol.lod_build_time >= 0.0)
+        sc = pyramid[2].point_data.scalars.to_array()
+        self.assertEqual(sc.dtype, np.uint8)
+
+    def test_interaction_switches_level(self):
+        vol = self.vol
+        vol.volume_mapper_type = 'FixedPointVolumeRayCastMapper'
+        full = self.get_mapper_input()
+        self.assertEqual(tuple(full.dimensions), (16, 16, 8))
+
+        # Nothing happens when the LOD is off.
+        vol._start_lod()
+        self.assertFalse(vol._lod_active)
+        self.assertEqual(tuple(self.get_mapper_input().dimensions),
+                         (16, 16, 8))
+
+        vol.use_lod = True
+        vol.interactive_lod = 4
+        vol._start_lod()
+        self.assertTrue(vol._lod_active)
+        self.assertEqual(tuple(self.get_mapper_input().dimensions),
+                         (4, 4, 2))
+
+        vol._end_lod()
+        self.assertFalse(vol._lod_active)
+        self.assertEqual(tuple(self.get_mapper_input().dimensions),
+                         (16, 16, 8))
+
+        # Turning the LOD off during an interaction restores the input.
+        vol._start_lod()
+        vol.use_lod = False
+        self.assertFalse(vol._lod_active)
+        self.assertEqual(tuple(self.get_mapper_input().dimensions),
+                         (16, 16, 8))
+
+
+class TestDownsampleImageData(unittest.TestCase):
+    def test_block_average(self):
+        x, y, z = np.mgrid[0:4, 0:4, 0:2]
+        s = (x + 10*y + 100*z).astype('d')
+        img = tvtk.ImageData(dimensions=s.shape, spacing=(1, 1, 1),
+                             origin=(0, 0, 0))
+        img.point_data.scalars = np.ravel(s.T)
+        img.point_data.scalars.name = 'scalars'
+        res = downsample_image_data(img, 2)
+        self.assertEqual(tuple(res.dimensions), (2, 2, 1))
+        self.assertEqual(tuple(res.spacing), (2.0, 2.0, 2.0))
+        self.assertEqual(tuple(res.origin), (0.5, 0.5, 0.5))
+        avg = res.point_data.scalars.to_array()
+        self.assertTrue(np.allclose(avg, [55.5, 57.5, 75.5, 77.5]))
+
+    def test_integers_are_rounded(self):
+        s = np.array([0, 1, 1, 1, 0, 0, 0, 1], dtype='uint8')
+        img = tvtk.ImageData(dimensions=(2, 2, 2))
+        img.point_data.scalars = s
+        res = downsample_image_data(img, 2)
+        avg = res.point_data.scalars.to_array()
+        self.assertEqual(avg.dtype, np.uint8)
+        # 4/8 rounds up to 1 instead of being truncated to 0.
+        self.assertEqual(list(avg), [1])
+
+    @unittest.skipIf(tracemalloc is None, 'Needs tracemalloc')
+    def test_memory_use(self):
+        s = np.zeros((64, 64, 64), dtype='uint8')
+        img = tvtk.ImageData(dimensions=s.shape)
+        img.point_data.scalars = np.ravel(s)
+        tracemalloc.start()
+        try:
+            downsample_image_data(img, 2)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        # A float64 copy of the input would take 8 times its size.
+        self.assertTrue(peak < s.nbytes)
+
+    def test_multiple_components(self):
+        for ncomp in (3, 4):
+            x, y, z = np.mgrid[0:4, 0:4, 0:2]
+            planes = [x + 10*y + 100*z + 3*i for i in range(ncomp)]
+            rgb = np.c_[tuple(np.ravel(p.T) for p in planes)]
+            img = tvtk.ImageData(dimensions=(4, 4, 2))
+            img.point_data.scalars = rgb.astype('uint8')
+            img.point_data.scalars.name = 'colors'
+            res = downsample_image_data(img, 2)
+            self.assertEqual(tuple(res.dimensions), (2, 2, 1))
+            sc = res.point_data.scalars
+            self.assertEqual(sc.number_of_components, ncomp)
+            self.assertEqual(sc.name, 'colors')
+            avg = sc.to_array()
+            self.assertEqual(avg.dtype, np.uint8)
+            self.assertEqual(avg.shape, (4, ncomp))
+            expect = np.array([56, 58, 76, 78])
+            for i in range(ncomp):
+                self.assertTrue(np.allclose(avg[:, i], expect + 3*i))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -11,6 +11,7 @@ Functions related to creating the engine or the figures.
 import gc
 import warnings
 import copy
+from contextlib import contextmanager
 
 import numpy as np
 
@@ -117,6 +118,34 @@ def gcf(engine=None):
     return scene
 
 
+@contextmanager
+def batch(figure=None):
+    """Context manager to create many objects in a figure with a
+    single render at the end.
+
+    Rendering of the figure (the current one by default) is disabled
+    inside the block, so adding each object does not trigger a redraw::
+
+        with mlab.batch():
+            for x, y, z in positions:
+                mlab.points3d(x, y, z)
+    """
+    if figure is None:
+        figure = gcf()
+    scene = figure.scene
+    if scene is None:
+        yield figure
+        return
+    disable_render = scene.disable_render
+    scene.disable_render = True
+    try:
+        yield figure
+    finally:
+        scene.disable_render = disable_render
+    if not disable_render:
+        scene.render()
+
+
 def clf(figure=None):
     """Clear the current figure.
 
@@ -193,7 +222,7 @@ def draw(figure=None):
 
 
 def savefig(filename, size=None, figure=None, magnification='auto',
-                    **kwargs):
+                    tiled=False, **kwargs):
     """ Save the current scene.
         The output format are deduced by the extension to filename.
         Possibilities are png, jpg, bmp, tiff, ps, eps, pdf, rib (renderman),
@@ -215,6 +244,15 @@ def savefig(filename, size=None, figure=None, magnification='auto',
                         Mayavi will use the given size as a screen size,
                         and the file size will be 'magnification * size'.
 
+        :tiled: if True, the image is rendered one tile at a time and
+                each row of tiles is written to the file as soon as
+                it is rendered, so images much larger than the
+                available memory can be saved.  Only png, tiff and npy
+                (a memory mapped NumPy array) files are supported.
+                Text, scalar bars and the other 2D actors are scaled
+                with the image, but the other renderers of the
+                window, like the orientation axes, are left out.
+
         **Notes**
 
         If the size specified is larger than the window size, and no
@@ -234,18 +272,29 @@ def savefig(filename, size=None, figure=None, magnification='auto',
         if size is not None:
             current_x, current_y = tuple(figure.scene.get_size())
             target_x, target_y = size
-            if magnification is 'auto':
+            if magnification == 'auto':
                 magnification = max(target_x // current_x,
                                             target_y // current_y) + 1
                 target_x = int(target_x / magnification)
                 target_y = int(target_y / magnification)
                 size = target_x, target_y
-        elif magnification is 'auto':
+        elif magnification == 'auto':
             magnification = 1
         figure.scene.magnification = int(magnification)
-        figure.scene.save(filename,
-                            size=size,
-                            **kwargs)
+        if tiled:
+            scene = figure.scene
+            if size is not None:
+                orig_size = scene.get_size()
+                scene.set_size(size)
+            try:
+                scene.save_tiled(filename, int(magnification), **kwargs)
+            finally:
+                if size is not None:
+                    scene.set_size(orig_size)
+        else:
+            figure.scene.save(filename,
+                                size=size,
+                                **kwargs)
     finally:
         figure.scene.magnification = int(current_mag)
 
@@ -253,6 +302,8 @@ def savefig(filename, size=None, figure=None, magnification='auto',
 def sync_camera(reference_figure, target_figure):
     """ Synchronise the camera of the target_figure on the camera of the
         reference_figure.
+
+        See `link_cameras` to link the cameras of many figures both ways.
     """
     reference_figure.scene._renderer.sync_trait('active_camera',
                         target_figure.scene._renderer)
@@ -260,6 +311,39 @@ def sync_camera(reference_figure, target_figure):
             lambda: do_later(target_figure.scene.render))
 
 
+def link_cameras(figures, link='camera'):
+    """ Link the cameras of the given figures in both directions.
+
+        Moving the camera of any of the figures moves the cameras of the
+        others.  The changes are applied once per iteration of the GUI
+        event loop and only the figures whose camera changed are
+        rendered, so this works well with many figures.
+
+        **Parameters**
+
+        :figures: a list of figure instances.
+        :link: {'camera', 'focal_point', 'zoom', 'clipping'} or a list
+            of these, optional.  The aspects of the cameras to link,
+            'camera' links the whole view, 'focal_point' only pans the
+            cameras, 'zoom' links the distance to the focal point and
+            'clipping' links the clipping range.
+
+        **Returns**
+
+        The `tvtk.pyface.camera_link.CameraLink` linking the cameras,
+        call its `unlink` method to remove the link or `add` to link
+        another figure.
+
+        **Examples**
+
+        >>> from mayavi import mlab
+        >>> figures = [mlab.figure() for i in range(4)]
+        >>> link = mlab.link_cameras(figures)
+    """
+    from tvtk.pyface.camera_link import CameraLink
+    return CameraLink(figures, link=link)
+
+
 def screenshot(figure=None, mode='rgb', antialiased=False):
     """ Return the current figure pixmap as an array.
 
@@ -0,0 +1,946 @@
+"""A local HTTP/WebSocket server streaming the frames of an offscreen
+scene to a browser, for interactive viewing of scenes rendered on a
+headless machine.
+
+Here is sample usage::
+
+    from mayavi import mlab
+    from mayavi.tools.frame_server import FrameServer
+    mlab.options.offscreen = True
+    mlab.test_plot3d()
+    server = FrameServer(port=8008)
+    print(server.url)
+    server.serve_forever()
+
+and then open the printed URL in a browser, possibly through an ssh
+tunnel.  Dragging the mouse rotates the camera, with shift or the
+right button it pans and the wheel zooms.
+
+The camera events sent by the clients are applied and the scene is
+rendered in the thread calling `process` or `serve_forever`, all the
+events received since the last frame are applied before rendering once.
+Each frame is cut into tiles and only the tiles that changed since the
+last frame sent to a client are sent to it, as JPEG images of a lower
+quality while the user interacts and as images of full quality once the
+scene is idle.  Each client has its own sending thread which encodes
+and sends only the latest frame, so a slow client skips frames instead
+of falling behind.  The latency and bandwidth are available from
+`stats`.
+
+The server only listens on the loopback interface by default.  The page
+and the WebSocket are only served to requests carrying the random
+`token` of the server, which is part of its `url`, and WebSocket
+requests from a page of another origin are refused.  This stops other
+web sites open in the browser from connecting to the server.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import logging
+import math
+import os
+import socket
+import struct
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+try:
+    from urllib.parse import urlsplit, parse_qs
+except ImportError:
+    from urlparse import urlsplit, parse_qs
+
+import numpy
+import vtk
+from vtk.util import numpy_support
+
+from traits.api import TraitError
+from tvtk.api import tvtk
+from tvtk.common import is_old_pipeline
+
+# Setup a logger for this module.
+logger = logging.getLogger(__name__)
+
+# The GUID used in the WebSocket handshake.
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+# WebSocket opcodes.
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+# The largest width or height the clients may resize the scene to.
+MAX_FRAME_SIZE = 4096
+
+clock = getattr(time, 'perf_counter', time.time)
+
+
+######################################################################
+# WebSocket utilities.
+######################################################################
+def accept_key(key):
+    """Return the Sec-WebSocket-Accept value for the given key."""
+    digest = hashlib.sha1((key + WS_GUID).encode('ascii')).digest()
+    return base64.b64encode(digest).decode('ascii')
+
+
+def _recv_exact(sock, n):
+    data = b''
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            raise EOFError('Connection closed.')
+        data += chunk
+    return data
+
+
+def _mask(data, mask):
+    arr = numpy.frombuffer(data, dtype=numpy.uint8)
+    m = numpy.resize(numpy.frombuffer(mask, dtype=numpy.uint8), len(arr))
+    return (arr ^ m).tobytes()
+
+
+def read_message(sock, lock=None):
+    """Read one WebSocket message and return its opcode and payload.
+    Fragmented messages are joined.  Pings are answered holding `lock`,
+    the lock of the other threads writing to the socket, if given."""
+    opcode = None
+    payload = b''
+    while True:
+        b1, b2 = struct.unpack('!BB', _recv_exact(sock, 2))
+        fin = b1 & 0x80
+        op = b1 & 0x0F
+        n = b2 & 0x7F
+        if n == 126:
+            n = struct.unpack('!H', _recv_exact(sock, 2))[0]
+        elif n == 127:
+            n = struct.unpack('!Q', _recv_exact(sock, 8))[0]
+        mask = _recv_exact(sock, 4) if b2 & 0x80 else None
+        data = _recv_exact(sock, n)
+        if mask is not None:
+            data = _mask(data, mask)
+        if op >= OP_CLOSE:
+            # Control frames may come in between fragments.
+            if op == OP_PING:
+                if lock is None:
+                    write_message(sock, data, OP_PONG, mask is None)
+                else:
+                    with lock:
+                        write_message(sock, data, OP_PONG, mask is None)
+                continue
+            return op, data
+        if op != OP_CONTINUATION:
+            opcode = op
+        payload += data
+        if fin:
+            return opcode, payload
+
+
+def write_message(sock, payload, opcode=OP_BINARY, mask=False):
+    """Write a WebSocket message, clients must `mask` their messages."""
+    n = len(payload)
+    header = struct.pack('!B', 0x80 | opcode)
+    mbit = 0x80 if mask else 0
+    if n < 126:
+        header += struct.pack('!B', mbit | n)
+    elif n < 65536:
+        header += struct.pack('!BH', mbit | 126, n)
+    else:
+        header += struct.pack('!BQ', mbit | 127, n)
+    if mask:
+        key = os.urandom(4)
+        header += key
+        payload = _mask(payload, key)
+    sock.sendall(header + payload)
+
+
+def _read_http_request(sock):
+    """Read the request line and headers of an HTTP request."""
+    data = b''
+    while b'\r\n\r\n' not in data:
+        chunk = sock.recv(4096)
+        if not chunk or len(data) > 65536:
+            raise EOFError('Bad request.')
+        data += chunk
+    lines = data.split(b'\r\n\r\n')[0].decode('latin-1').split('\r\n')
+    headers = {}
+    for line in lines[1:]:
+        if ':' in line:
+            k, v = line.split(':', 1)
+            headers[k.strip().lower()] = v.strip()
+    return lines[0].split(), headers
+
+
+######################################################################
+# `TileEncoder` class.
+######################################################################
+class TileEncoder(object):
+    """Cut frames into square tiles and encode the tiles that changed
+    as JPEG or PNG images."""
+
+    def __init__(self, tile_size=64):
+        self.tile_size = tile_size
+
+    def changed_tiles(self, image, previous):
+        """Return the (x, y, w, h) of the tiles of the (height, width,
+        3) `image` that differ from `previous`, all of them if
+        `previous` is None or has another shape.
+        """
+        ts = self.tile_size
+        ny, nx = image.shape[:2]
+        full = previous is None or previous.shape != image.shape
+        if not full:
+            diff = (image != previous).any(axis=2)
+        tiles = []
+        for y in range(0, ny, ts):
+            for x in range(0, nx, ts):
+                h, w = min(ts, ny - y), min(ts, nx - x)
+                if full or diff[y:y + h, x:x + w].any():
+                    tiles.append((x, y, w, h))
+        return tiles
+
+    def encode_tile(self, tile, fmt='jpeg', quality=95):
+        """Encode the given (h, w, 3) uint8 array, top row first, and
+        return the bytes.  This is called by the sending threads so
+        only plain VTK objects are used, not TVTK ones.
+        """
+        h, w = tile.shape[:2]
+        # VTK images start at the bottom.
+        pixels = numpy.ascontiguousarray(tile[::-1].reshape(-1,
+                                                            tile.shape[2]))
+        img = vtk.vtkImageData()
+        img.SetDimensions(w, h, 1)
+        img.GetPointData().SetScalars(
+            numpy_support.numpy_to_vtk(pixels, deep=1)
+        )
+        if fmt == 'png':
+            writer = vtk.vtkPNGWriter()
+        else:
+            writer = vtk.vtkJPEGWriter()
+            writer.SetQuality(quality)
+        writer.SetWriteToMemory(1)
+        if is_old_pipeline():
+            writer.SetInput(img)
+        else:
+            writer.SetInputData(img)
+        writer.Write()
+        return numpy_support.vtk_to_numpy(writer.GetResult()).tobytes()
+
+    def encode(self, image, tiles, fmt='jpeg', quality=95):
+        """Encode the given (x, y, w, h) tiles of `image` and return
+        the list of [x, y, w, h, nbytes] and the bytes."""
+        result = []
+        parts = []
+        for x, y, w, h in tiles:
+            data = self.encode_tile(image[y:y + h, x:x + w], fmt, quality)
+            result.append([x, y, w, h, len(data)])
+            parts.append(data)
+        return result, b''.join(parts)
+
+
+def pack_frame(header, data):
+    """Pack a frame message: the length of the JSON header, the header
+    and the tile data."""
+    h = json.dumps(header).encode('utf-8')
+    return struct.pack('!I', len(h)) + h + data
+
+
+def unpack_frame(message):
+    """Return the header and the tile data of a frame message."""
+    n = struct.unpack('!I', message[:4])[0]
+    return json.loads(message[4:4 + n].decode('utf-8')), message[4 + n:]
+
+
+######################################################################
+# `_Connection` class.
+######################################################################
+class _Connection(object):
+    """The server side of a client connection, with a thread reading
+    the events of the client and one sending it the frames."""
+
+    def __init__(self, server, sock):
+        self.server = server
+        self.sock = sock
+        self.running = True
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.events_dropped = 0
+        self.bytes_sent = 0
+        self.latencies = []
+        try:
+            self.address = sock.getpeername()
+        except socket.error:
+            self.address = None
+        self._frame = None
+        self._last_sent = None
+        # The tiles sent at the interactive quality since the last
+        # frame of full quality.
+        self._lossy = set()
+        self._cond = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._encoder = TileEncoder(server.tile_size)
+        self._sender = threading.Thread(target=self._send_loop)
+        self._sender.daemon = True
+
+    def start(self):
+        self._sender.start()
+        try:
+            while self.running:
+                opcode, payload = read_message(self.sock, self._send_lock)
+                if opcode == OP_CLOSE:
+                    break
+                if opcode == OP_TEXT:
+                    try:
+                        event = json.loads(payload.decode('utf-8'))
+                    except ValueError as e:
+                        self.drop_event(payload, e)
+                        continue
+                    if isinstance(event, dict):
+                        self.server.post_event(self, event)
+                    else:
+                        self.drop_event(event, 'not an object')
+        except (EOFError, socket.error):
+            pass
+        finally:
+            self.close()
+
+    def post_frame(self, frame):
+        """Queue the frame to be sent, replacing any frame that was not
+        sent yet."""
+        with self._cond:
+            old = self._frame
+            if old is not None:
+                self.frames_dropped += 1
+                # The new frame also shows the events of the dropped
+                # one, keep the earliest time for the latency.
+                if old['received'] is not None and \
+                   (frame['received'] is None or
+                    old['received'] < frame['received']):
+                    frame['received'] = old['received']
+                if frame['event'] is None:
+                    frame['event'] = old['event']
+            self._frame = frame
+            self._cond.notify()
+
+    def drop_event(self, event, reason):
+        """Drop an invalid event sent by the client."""
+        self.events_dropped += 1
+        logger.warning('Dropped event %r from %s: %s', event, self.address,
+                       reason)
+
+    def refresh(self):
+        """Send all the tiles of the next frame."""
+        with self._cond:
+            self._last_sent = None
+
+    def close(self):
+        if not self.running:
+            return
+        self.running = False
+        with self._cond:
+            self._cond.notify()
+        try:
+            with self._send_lock:
+                write_message(self.sock, b'', OP_CLOSE)
+        except socket.error:
+            pass
+        try:
+            self.sock.close()
+        except socket.error:
+            pass
+        self.server._remove(self)
+
+    def _send_loop(self):
+        while self.running:
+            with self._cond:
+                while self.running and self._frame is None:
+                    self._cond.wait(0.5)
+                frame, self._frame = self._frame, None
+                previous = self._last_sent
+            if frame is None:
+                continue
+            image = frame['image']
+            encoder = self._encoder
+            tiles = encoder.changed_tiles(image, previous)
+            if previous is None:
+                self._lossy = set()
+            if frame['idle']:
+                tiles = sorted(self._lossy.union(tiles))
+                self._lossy = set()
+            else:
+                self._lossy.update(tiles)
+            tiles, data = encoder.encode(image, tiles, frame['format'],
+                                         frame['quality'])
+            header = {'frame': frame['index'],
+                      'width': image.shape[1], 'height': image.shape[0],
+                      'format': frame['format'],
+                      'quality': frame['quality'], 'idle': frame['idle'],
+                      'tiles': tiles, 'event': frame['event'],
+                      'dropped': self.frames_dropped}
+            message = pack_frame(header, data)
+            try:
+                with self._send_lock:
+                    write_message(self.sock, message)
+            except socket.error:
+                self.close()
+                return
+            with self._cond:
+                self._last_sent = image
+            self.frames_sent += 1
+            self.bytes_sent += len(message)
+            if frame['received'] is not None:
+                self.latencies.append(clock() - frame['received'])
+
+
+######################################################################
+# `FrameServer` class.
+######################################################################
+class FrameServer(object):
+    """Serve the frames of a scene to browsers over HTTP and WebSocket.
+
+    Parameters
+    ----------
+
+    scene : the TVTK scene to serve, defaults to that of the current
+        mlab figure.
+    host, port : the address to listen on, with port 0 a free port is
+        chosen and available as the `port` attribute.
+    tile_size : the size of the tiles in pixels.
+    interactive_quality : the JPEG quality of the frames sent while
+        the user interacts.
+    idle_format, idle_quality : the format ('png' or 'jpeg') and JPEG
+        quality of the frames sent when the scene is idle.
+    idle_delay : the time in seconds without events after which the
+        scene is idle.
+    token : the secret that the clients must send, a random one is
+        used by default.
+    """
+
+    def __init__(self, scene=None, host='127.0.0.1', port=8008,
+                 tile_size=64, interactive_quality=50, idle_format='png',
+                 idle_quality=95, idle_delay=0.25, token=None):
+        if scene is None:
+            from mayavi import mlab
+            scene = mlab.gcf().scene
+        self.scene = scene
+        self.host = host
+        self.port = port
+        self.tile_size = tile_size
+        self.interactive_quality = interactive_quality
+        self.idle_format = idle_format
+        self.idle_quality = idle_quality
+        self.idle_delay = idle_delay
+        if token is None:
+            token = binascii.hexlify(os.urandom(16)).decode('ascii')
+        self.token = token
+        self.running = False
+        self.frames_rendered = 0
+        self.render_time = 0.0
+        self._events = queue.Queue()
+        self._connections = []
+        # All the connections ever made, for the statistics.
+        self._history = []
+        self._lock = threading.Lock()
+        self._socket = None
+        self._thread = None
+        self._interacting = False
+        self._last_event = 0.0
+        self._refined = True
+        self._needs_frame = False
+        self._start_time = 0.0
+        self._w2if = None
+
+    ######################################################################
+    # `FrameServer` interface.
+    ######################################################################
+    @property
+    def url(self):
+        """The URL of the page showing the scene."""
+        return 'http://%s:%d/?token=%s'%(self.host, self.port, self.token)
+
+    def start(self):
+        """Start listening for clients in a background thread."""
+        if self.running:
+            return
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind((self.host, self.port))
+        s.listen(5)
+        s.settimeout(0.2)
+        self.port = s.getsockname()[1]
+        self._socket = s
+        self.running = True
+        self._start_time = clock()
+        self._thread = threading.Thread(target=self._accept_loop)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop the server and close all the connections."""
+        if not self.running:
+            return
+        self.running = False
+        self._thread.join()
+        self._socket.close()
+        self._socket = None
+        for conn in list(self._connections):
+            conn.close()
+
+    def serve_forever(self):
+        """Start the server and process the events until interrupted."""
+        self.start()
+        try:
+            while self.running:
+                self.process()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def process(self, timeout=0.05):
+        """Apply the events received, waiting at most `timeout` seconds
+        for one, render the scene and send the frame to the clients.
+        This must be called from the thread owning the scene.
+        """
+        events = []
+        try:
+            events.append(self._events.get(True, timeout))
+            while True:
+                events.append(self._events.get_nowait())
+        except queue.Empty:
+            pass
+        now = clock()
+        applied = False
+        event_id = None
+        received = None
+        for conn, event, t in events:
+            try:
+                self._apply(conn, event)
+            except (KeyError, TypeError, ValueError, TraitError) as e:
+                # A bad event of one client must not stop the server.
+                conn.drop_event(event, e)
+                continue
+            applied = True
+            if event.get('id') is not None:
+                event_id = event['id']
+            if received is None:
+                received = t
+        if applied:
+            self._last_event = now
+            self._refined = False
+            self._send_frame(self.interactive_quality, 'jpeg', False,
+                             event_id, received)
+        elif self._needs_frame or (not self._refined and
+                                   not self._interacting and
+                                   now - self._last_event > self.idle_delay):
+            self._refined = True
+            self._needs_frame = False
+            self._send_frame(self.idle_quality, self.idle_format, True)
+
+    def post_event(self, conn, event):
+        """Queue an event from the given connection, this is called from
+        the threads reading the connections."""
+        self._events.put((conn, event, clock()))
+
+    def stats(self):
+        """Return a dictionary with the number of frames rendered, sent
+        and dropped, the number of invalid events dropped, the mean
+        render time, the mean and maximum latency
+        from receiving an event to sending the frame showing it, and
+        the bandwidth in bytes per second.
+        """
+        conns = list(self._history)
+        latencies = sum([c.latencies for c in conns], [])
+        sent = sum(c.bytes_sent for c in conns)
+        elapsed = max(clock() - self._start_time, 1e-9)
+        n = max(self.frames_rendered, 1)
+        return {'frames_rendered': self.frames_rendered,
+                'frames_sent': sum(c.frames_sent for c in conns),
+                'frames_dropped': sum(c.frames_dropped for c in conns),
+                'events_dropped': sum(c.events_dropped for c in conns),
+                'render_time': self.render_time/n,
+                'latency': (sum(latencies)/len(latencies)
+                            if latencies else None),
+                'max_latency': max(latencies) if latencies else None,
+                'bytes_sent': sent,
+                'bandwidth': sent/elapsed}
+
+    def report(self):
+        """Return the statistics as text."""
+        s = self.stats()
+        lines = ['frames rendered: %d, sent: %d, dropped: %d'%(
+                     s['frames_rendered'], s['frames_sent'],
+                     s['frames_dropped']),
+                 'render time: %.1f ms'%(s['render_time']*1e3)]
+        if s['latency'] is not None:
+            lines.append('latency: %.1f ms mean, %.1f ms max'%(
+                s['latency']*1e3, s['max_latency']*1e3))
+        lines.append('bandwidth: %.1f kB/s'%(s['bandwidth']/1024.0))
+        return '\n'.join(lines)
+
+    ######################################################################
+    # Non-public interface.
+    ######################################################################
+    def _accept_loop(self):
+        while self.running:
+            try:
+                sock, address = self._socket.accept()
+            except socket.timeout:
+                continue
+            except socket.error:
+                break
+            sock.settimeout(None)
+            t = threading.Thread(target=self._handle, args=(sock,))
+            t.daemon = True
+            t.start()
+
+    def _handle(self, sock):
+        """Serve the page or upgrade the connection to a WebSocket."""
+        try:
+            request, headers = _read_http_request(sock)
+        except (EOFError, socket.error):
+            sock.close()
+            return
+        url = urlsplit(request[1] if len(request) > 1 else '/')
+        path = url.path
+        token = parse_qs(url.query).get('token', [''])[0]
+        if not self._is_allowed(token, headers):
+            self._send_response(sock, '403 Forbidden', b'Forbidden')
+            return
+        if headers.get('upgrade', '').lower() == 'websocket':
+            response = ('HTTP/1.1 101 Switching Protocols\r\n'
+                        'Upgrade: websocket\r\n'
+                        'Connection: Upgrade\r\n'
+                        'Sec-WebSocket-Accept: %s\r\n\r\n'%
+                        accept_key(headers.get('sec-websocket-key', '')))
+            sock.sendall(response.encode('ascii'))
+            conn = _Connection(self, sock)
+            with self._lock:
+                self._connections.append(conn)
+                self._history.append(conn)
+            self._needs_frame = True
+            conn.start()
+            return
+        if path in ('/', '/index.html'):
+            self._send_response(sock, '200 OK', _CLIENT_PAGE.encode('utf-8'))
+        else:
+            self._send_response(sock, '404 Not Found', b'Not found')
+
+    def _is_allowed(self, token, headers):
+        """Return True if the request has the token of the server and
+        comes from the same origin, browsers always send the origin of
+        the page opening a WebSocket."""
+        if not hmac.compare_digest(token.encode('utf-8'),
+                                   self.token.encode('utf-8')):
+            return False
+        origin = headers.get('origin')
+        if origin is not None and \
+           urlsplit(origin).netloc != headers.get('host'):
+            return False
+        return True
+
+    def _send_response(self, sock, status, body):
+        header = ('HTTP/1.1 %s\r\nContent-Type: text/html\r\n'
+                  'Content-Length: %d\r\nConnection: close\r\n\r\n'%(
+                      status, len(body)))
+        try:
+            sock.sendall(header.encode('ascii') + body)
+        except socket.error:
+            pass
+        finally:
+            sock.close()
+
+    def _remove(self, conn):
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+
+    def _apply(self, conn, event):
+        """Apply a camera event to the scene.  Invalid events raise a
+        KeyError, TypeError, ValueError or TraitError."""
+        if not isinstance(event, dict):
+            raise TypeError('the event is not an object')
+        kind = event.get('type')
+        scene = self.scene
+        camera = scene.camera
+        if kind == 'start':
+            self._interacting = True
+        elif kind == 'end':
+            self._interacting = False
+        elif kind == 'rotate':
+            camera.azimuth(event.get('dx', 0.0))
+            camera.elevation(event.get('dy', 0.0))
+            camera.orthogonalize_view_up()
+        elif kind == 'pan':
+            self._pan(camera, event.get('dx', 0.0), event.get('dy', 0.0))
+        elif kind == 'zoom':
+            factor = event.get('factor', 1.0)
+            if camera.parallel_projection:
+                camera.zoom(factor)
+            else:
+                camera.dolly(factor)
+        elif kind == 'camera':
+            for name in ('position', 'focal_point', 'view_up',
+                         'view_angle'):
+                if name in event:
+                    setattr(camera, name, event[name])
+        elif kind == 'resize':
+            size = [min(max(int(event[name]), 1), MAX_FRAME_SIZE)
+                    for name in ('width', 'height')]
+            scene.set_size(tuple(size))
+        elif kind == 'refresh':
+            conn.refresh()
+        scene.renderer.reset_camera_clipping_range()
+
+    def _pan(self, camera, dx, dy):
+        """Move the camera by the given fractions of the view."""
+        pos = numpy.asarray(camera.position)
+        focus = numpy.asarray(camera.focal_point)
+        d = focus - pos
+        dist = numpy.linalg.norm(d)
+        up = numpy.asarray(camera.view_up)
+        right = numpy.cross(d/dist, up)
+        if camera.parallel_projection:
+            height = 2.0*camera.parallel_scale
+        else:
+            height = 2.0*dist*math.tan(math.radians(camera.view_angle)/2)
+        shift = (-dx*right + dy*up)*height
+        camera.position = pos + shift
+        camera.focal_point = focus + shift
+
+    def _capture(self):
+        """Render the scene and return the image as a (height, width, 3)
+        array, top row first."""
+        rw = self.scene.render_window
+        w2if = self._w2if
+        if w2if is None:
+            w2if = tvtk.WindowToImageFilter(input=rw, read_front_buffer=
+                                            not rw.off_screen_rendering)
+            if hasattr(w2if, 'should_rerender'):
+                w2if.should_rerender = False
+            self._w2if = w2if
+        t0 = clock()
+        rw.render()
+        w2if.modified()
+        w2if.update()
+        self.render_time += clock() - t0
+        self.frames_rendered += 1
+        image = w2if.output
+        nx, ny = image.dimensions[:2]
+        pixels = image.point_data.scalars.to_array()
+        return pixels.reshape(ny, nx, -1)[::-1, :, :3].copy()
+
+    def _send_frame(self, quality, fmt, idle, event_id=None,
+                    received=None):
+        conns = list(self._connections)
+        if not conns:
+            return
+        image = self._capture()
+        for conn in conns:
+            conn.post_frame({'image': image, 'index': self.frames_rendered,
+                             'format': fmt, 'quality': quality,
+                             'idle': idle, 'event': event_id,
+                             'received': received})
+
+
+######################################################################
+# `FrameClient` class.
+######################################################################
+class FrameClient(object):
+    """A minimal client of the frame server, mostly for testing.
+
+    The frames received are put in the `frames` queue as (header, tile
+    data) tuples by a background thread and the latency of each event
+    acknowledged by a frame is appended to `latencies`.
+    """
+
+    def __init__(self, host='127.0.0.1', port=8008, token=''):
+        self.host = host
+        self.port = port
+        self.token = token
+        self.frames = queue.Queue()
+        self.latencies = []
+        self.bytes_received = 0
+        self._sent = {}
+        self._next_id = 0
+        self._sock = None
+        self._thread = None
+        self._send_lock = threading.Lock()
+
+    def connect(self):
+        sock = socket.create_connection((self.host, self.port))
+        key = base64.b64encode(os.urandom(16)).decode('ascii')
+        request = ('GET /ws?token=%s HTTP/1.1\r\nHost: %s:%d\r\n'
+                   'Upgrade: websocket\r\nConnection: Upgrade\r\n'
+                   'Sec-WebSocket-Key: %s\r\n'
+                   'Sec-WebSocket-Version: 13\r\n\r\n'%(
+                       self.token, self.host, self.port, key))
+        sock.sendall(request.encode('ascii'))
+        status, headers = _read_http_request(sock)
+        if status[1] != '101' or \
+           headers.get('sec-websocket-accept') != accept_key(key):
+            sock.close()
+            raise IOError('WebSocket handshake failed.')
+        self._sock = sock
+        self._thread = threading.Thread(target=self._read_loop)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def send_event(self, **event):
+        """Send an event like `send_event(type='rotate', dx=10)` and
+        return its id."""
+        event_id = self._next_id
+        self._next_id += 1
+        event['id'] = event_id
+        self._sent[event_id] = clock()
+        with self._send_lock:
+            write_message(self._sock, json.dumps(event).encode('utf-8'),
+                          OP_TEXT, mask=True)
+        return event_id
+
+    def get_frame(self, timeout=5.0):
+        """Return the next (header, data) frame."""
+        return self.frames.get(True, timeout)
+
+    def close(self):
+        if self._sock is not None:
+            try:
+                with self._send_lock:
+                    write_message(self._sock, b'', OP_CLOSE, mask=True)
+            except socket.error:
+                pass
+            self._sock.close()
+            self._sock = None
+
+    def _read_loop(self):
+        try:
+            while True:
+                opcode, payload = read_message(self._sock, self._send_lock)
+                if opcode == OP_CLOSE:
+                    break
+                if opcode != OP_BINARY:
+                    continue
+                self.bytes_received += len(payload)
+                header, data = unpack_frame(payload)
+                t = self._sent.pop(header.get('event'), None)
+                if t is not None:
+                    self.latencies.append(clock() - t)
+                self.frames.put((header, data))
+        except (EOFError, socket.error, ValueError, AttributeError):
+            pass
+
+
+# The page served to browsers.
+_CLIENT_PAGE = '''<!DOCTYPE html>
+<html><head><title>Mayavi</title>
+<style>body {margin: 0; background: #333; color: #ccc; font: 12px sans-serif}
+canvas {display: block} #stats {position: absolute; left: 4px; top: 4px}
+</style></head>
+<body><canvas id="view"></canvas><div id="stats"></div>
+<script type="text/javascript">
+(function() {
+    var canvas = document.getElementById('view');
+    var ctx = canvas.getContext('2d');
+    var stats = document.getElementById('stats');
+    var ws = new WebSocket('ws://' + location.host + '/ws' +
+                           location.search);
+    ws.binaryType = 'arraybuffer';
+    var sent = {}, nextId = 0, bytes = 0, frames = 0, latency = 0;
+    // The tiles of a frame only update those of the previous frame so
+    // the frames are drawn one after the other, in order.
+    var drawn = Promise.resolve(), lastFrame = -1;
+    var t0 = performance.now();
+    function send(event) {
+        if (ws.readyState !== 1) { return; }
+        event.id = nextId++;
+        sent[event.id] = performance.now();
+        ws.send(JSON.stringify(event));
+    }
+    ws.onopen = function() {
+        send({type: 'resize', width: window.innerWidth,
+              height: window.innerHeight});
+    };
+    ws.onmessage = function(msg) {
+        var buf = msg.data, view = new DataView(buf);
+        var n = view.getUint32(0);
+        var header = JSON.parse(new TextDecoder().decode(
+            new Uint8Array(buf, 4, n)));
+        var offset = 4 + n, type = 'image/' + header.format;
+        var bitmaps = header.tiles.map(function(t) {
+            var blob = new Blob([new Uint8Array(buf, offset, t[4])],
+                                {type: type});
+            offset += t[4];
+            return createImageBitmap(blob);
+        });
+        drawn = drawn.then(function() {
+            return Promise.all(bitmaps);
+        }).then(function(bmps) {
+            if (header.frame < lastFrame) { return; }
+            lastFrame = header.frame;
+            if (canvas.width !== header.width ||
+                canvas.height !== header.height) {
+                canvas.width = header.width;
+                canvas.height = header.height;
+            }
+            header.tiles.forEach(function(t, i) {
+                ctx.drawImage(bmps[i], t[0], t[1]);
+            });
+        }).catch(function() {});
+        frames += 1;
+        bytes += buf.byteLength;
+        if (header.event !== null && sent[header.event] !== undefined) {
+            latency = performance.now() - sent[header.event];
+            delete sent[header.event];
+        }
+        var dt = (performance.now() - t0)/1000;
+        stats.textContent = 'latency ' + latency.toFixed(0) + ' ms, ' +
+            (frames/dt).toFixed(1) + ' fps, ' +
+            (bytes/1024/dt).toFixed(0) + ' kB/s, dropped ' + header.dropped;
+    };
+    var drag = null;
+    canvas.addEventListener('contextmenu', function(e) { e.preventDefault(); });
+    canvas.addEventListener('mousedown', function(e) {
+        drag = {x: e.clientX, y: e.clientY,
+                pan: e.shiftKey || e.button !== 0};
+        send({type: 'start'});
+    });
+    window.addEventListener('mousemove', function(e) {
+        if (drag === null) { return; }
+        var dx = e.clientX - drag.x, dy = e.clientY - drag.y;
+        drag.x = e.clientX;
+        drag.y = e.clientY;
+        if (drag.pan) {
+            send({type: 'pan', dx: dx/canvas.height, dy: dy/canvas.height});
+        } else {
+            send({type: 'rotate', dx: -dx*0.5, dy: dy*0.5});
+        }
+    });
+    window.addEventListener('mouseup', function() {
+        if (drag !== null) {
+            drag = null;
+            send({type: 'end'});
+        }
+    });
+    canvas.addEventListener('wheel', function(e) {
+        e.preventDefault();
+        send({type: 'zoom', factor: Math.pow(1.1, -e.deltaY/100)});
+    });
+    window.addEventListener('resize', function() {
+        send({type: 'resize', width: window.innerWidth,
+              height: window.innerHeight});
+    });
+})();
+</script></body></html>
+'''
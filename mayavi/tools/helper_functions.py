@@ -23,6 +23,8 @@ from .filters import ExtractVectorNormFactory, WarpScalarFactory, \
             TubeFactory, ExtractEdgesFactory, PolyDataNormalsFactory, \
             StripperFactory
 from .animator import animate
+from .figure import batch
+from .pipe_base import get_public_trait_names
 from mayavi.core.scene import Scene
 from .auto_doc import traits_doc, dedent
 from . import tools
@@ -31,11 +33,32 @@ from traits.api import Array, Callable, CFloat, HasTraits, \
 import numpy
 
 
+# Per class caches of the pipeline metadata: the traits accepted by a
+# pipeline, and the keyword arguments accepted by each pipe.
+_all_traits = {}
+_pipe_keywords = {}
+
+
+def _get_pipe_keywords(pipe):
+    """ Returns the set of keyword arguments accepted by the given
+        factory class.
+    """
+    keywords = _pipe_keywords.get(pipe)
+    if keywords is None:
+        keywords = set(pipe.class_trait_names())
+        keywords.remove('trait_added')
+        keywords.remove('trait_modified')
+        keywords = _pipe_keywords[pipe] = frozenset(keywords)
+    return keywords
+
+
 def document_pipeline(pipeline):
 
     def the_function(*args, **kwargs):
         return pipeline(*args, **kwargs)
 
+    the_function.batch = pipeline.batch
+
     if hasattr(pipeline, 'doc'):
         doc = pipeline.doc
     elif pipeline.__doc__ is not None:
@@ -85,6 +108,21 @@ class Pipeline(HasTraits):
             scene.disable_render = not self._do_redraw
         return output
 
+    def batch(self, args_list, **kwargs):
+        """ Calls the pipeline once for each tuple of positional
+            arguments in `args_list`, with the same keyword arguments,
+            and returns the list of objects created.
+
+            The figure is rendered only once, at the end.
+        """
+        if 'figure' in kwargs:
+            figure = kwargs['figure']
+        else:
+            figure = tools.gcf()
+        with batch(figure):
+            return [self.__call_internal__(*args, **kwargs)
+                    for args in args_list]
+
     def __call_internal__(self, *args, **kwargs):
         """ Builds the source and runs through the pipeline, returning
         the last object created by the pipeline."""
@@ -97,15 +135,13 @@ class Pipeline(HasTraits):
     def store_kwargs(self, kwargs):
         """ Merges the given keyword argument, with traits default and
             store the resulting dictionary in self.kwargs."""
-        kwargs = kwargs.copy()
-        all_traits = self.get_all_traits()
-        if not set(kwargs.keys()).issubset(list(all_traits.keys())):
+        all_traits = self._get_all_traits()
+        if not all_traits.issuperset(kwargs):
             raise ValueError("Invalid keyword arguments : %s" % \
                     ', '.join(
                         str(k) for k in
-                        set(kwargs.keys()).difference(list(all_traits.keys()))))
-        traits = self.get(self.class_trait_names())
-        [traits.pop(key) for key in list(traits.keys()) if key[0] == '_']
+                        set(kwargs.keys()).difference(all_traits)))
+        traits = self.get(get_public_trait_names(self.__class__))
         traits.update(kwargs)
         self.kwargs = traits
 
@@ -113,13 +149,10 @@ class Pipeline(HasTraits):
         """ Runs through the pipeline, applying pipe after pipe. """
         object = self.source
         for pipe in self.pipeline:
-            keywords = set(pipe.class_trait_names())
-            keywords.remove('trait_added')
-            keywords.remove('trait_modified')
-            this_kwargs = {}
-            for key, value in self.kwargs.items():
-                if key in keywords:
-                    this_kwargs[key] = value
+            keywords = _get_pipe_keywords(pipe)
+            this_kwargs = dict((key, value)
+                               for key, value in self.kwargs.items()
+                               if key in keywords)
             object = pipe(object, **this_kwargs)._target
         return object
 
@@ -134,6 +167,17 @@ class Pipeline(HasTraits):
         traits.pop('trait_modified')
         return traits
 
+    def _get_all_traits(self):
+        """ Returns the names of all the traits of the class and the
+            classes in the pipeline.  The result is cached per class and
+            pipeline.
+        """
+        key = (self.__class__, tuple(self._pipeline))
+        names = _all_traits.get(key)
+        if names is None:
+            names = _all_traits[key] = frozenset(self.get_all_traits())
+        return names
+
 
 #############################################################################
 class Points3d(Pipeline):
@@ -250,6 +250,12 @@ class VectorsFactory(DataModuleFactory):
                         "to reduce the number of points displayed "
                         "on large datasets")
 
+    instanced = Bool(False, adapts='glyph.instanced',
+                        desc="if the glyphs are instanced by the mapper at "
+                        "render time instead of building the geometry of "
+                        "all the glyphs. This uses much less memory for "
+                        "large numbers of points")
+
     def _resolution_changed(self):
         glyph = self._target.glyph.glyph_source.glyph_source
         if hasattr(glyph, 'theta_resolution'):
@@ -3,9 +3,15 @@
 from __future__ import print_function
 
 import base64
+import hashlib
+import json
+import os
 from itertools import count
+
+import numpy
+
 from tvtk.api import tvtk
-from tvtk.common import configure_input
+from tvtk.common import configure_input, configure_input_data
 
 
 _backend = 'x3d'
@@ -13,22 +19,41 @@ _width = None
 _height = None
 _local = True
 
+# Options of the binary backend, see `init`.
+_quantize = False
+_sidecar = None
+_sidecar_url = None
+
+# The hashes of the meshes sent inline by the binary backend.
+_sent_meshes = set()
+
+# The size of the chunks of base64 encoded mesh data.
+CHUNK_SIZE = 65536
+
 counter = count()
 
 
-def init(backend='x3d', width=None, height=None, local=True):
+def init(backend='x3d', width=None, height=None, local=True,
+         quantize=False, sidecar=None, sidecar_url=None):
     """Initialize a suitable backend for Jupyter notebooks.
 
     Parameters
     ----------
 
-    backend :str: one of ('png', 'x3d')
+    backend :str: one of ('png', 'x3d', 'binary')
     width :int: suggested default width of the element
     height :int: suggested default height of the element
     local :bool: Use local copy of x3dom.js instead of online version.
+    quantize :bool: With the 'binary' backend store the coordinates as
+        16 bit floats relative to the bounds of each actor.
+    sidecar :str: With the 'binary' backend write the geometry to files
+        in this directory instead of embedding it in the notebook.
+    sidecar_url :str: The URL of the `sidecar` directory as seen by the
+        browser, defaults to the `sidecar` path.
     """
-    global _backend, _width, _height
-    backends = ('png', 'x3d')
+    global _backend, _width, _height, _local
+    global _quantize, _sidecar, _sidecar_url
+    backends = ('png', 'x3d', 'binary')
     error_msg = "Backend must be one of %r, got %s"%(backends, backend)
     assert backend in backends, error_msg
     from mayavi import mlab
@@ -36,10 +61,23 @@ def init(backend='x3d', width=None, height=None, local=True):
     _backend = backend
     _width, _height = width, height
     _local = local
+    _quantize = quantize
+    _sidecar = sidecar
+    if sidecar is not None and sidecar_url is None:
+        sidecar_url = sidecar.replace(os.sep, '/')
+    _sidecar_url = sidecar_url
+    reset()
     _monkey_patch_for_ipython()
     print("Notebook initialized with %s backend."%backend)
 
 
+def reset():
+    """Forget the meshes sent by the 'binary' backend so they are sent
+    again, this is needed when the notebook page is reloaded.
+    """
+    _sent_meshes.clear()
+
+
 def _monkey_patch_for_ipython():
     from mayavi.core.base import Base
     from tvtk.pyface.tvtk_scene import TVTKScene
@@ -58,16 +96,23 @@ def _repr_html_(self):
         return scene_to_png(scene)
     elif _backend == 'x3d':
         return scene_to_x3d(scene)
+    elif _backend == 'binary':
+        return scene_to_binary(scene)
 
 
-def _fix_x3d_header(x3d):
-    id = 'scene_%d' % next(counter)
+def _x3d_tag(id):
     rep = '<X3D profile="Immersive" version="3.0" id="%s" '%id
     if _width is not None:
         rep += 'width="%dpx" '%_width
     if _height is not None:
         rep += 'height="%dpx" '%_height
     rep += '>'
+    return rep
+
+
+def _fix_x3d_header(x3d):
+    id = 'scene_%d' % next(counter)
+    rep = _x3d_tag(id)
 
     x3d = x3d.replace(
         '<X3D profile="Immersive" version="3.0">',
@@ -86,15 +131,24 @@ def scene_to_x3d(scene):
     ex.write()
     # Switch back
     scene.light_manager.light_mode = lm
-    if _local:
-        url_base = "/nbextensions/mayavi/x3d"
-    else:
-        url_base = "http://www.x3dom.org/download"
     x3d_elem = _fix_x3d_header(ex.output_string)
     html = '''
     %s
     <script type="text/javascript">
-    require(["%s/x3dom.js"], function(x3dom) {
+    %s
+    </script>
+    '''%(x3d_elem, _x3dom_reload())
+    return html
+
+
+def _x3dom_reload():
+    """Return the javascript that loads x3dom and renders the X3D
+    elements of the page."""
+    if _local:
+        url_base = "/nbextensions/mayavi/x3d"
+    else:
+        url_base = "http://www.x3dom.org/download"
+    return '''require(["%s/x3dom.js"], function(x3dom) {
         var x3dom_css = document.getElementById("x3dom-css");
         if (x3dom_css === null) {
             var l = document.createElement("link");
@@ -110,10 +164,7 @@ def scene_to_x3d(scene):
         else if (typeof window.x3dom != 'undefined') {
             window.x3dom.reload();
         }
-    })
-    </script>
-    '''%(x3d_elem, url_base, url_base)
-    return html
+    })'''%(url_base, url_base)
 
 def scene_to_png(scene):
     w2if = tvtk.WindowToImageFilter()
@@ -127,6 +178,319 @@ def scene_to_png(scene):
     html = '<img src="data:image/png;base64,%s" alt="PNG image"></img>'
     return html % data
 
+######################################################################
+# The binary backend.
+######################################################################
+def actor_to_mesh(actor):
+    """Return the triangles and line segments drawn by the given actor
+    as a dictionary of arrays in world coordinates, or None if the
+    actor draws nothing.
+
+    The keys are 'points' (n, 3), 'triangles' (m, 3), 'lines' (k, 2)
+    and 'colors' (n, 3) uint8 if the points are colored by scalars.
+    """
+    mapper = actor.mapper
+    if mapper is None:
+        return None
+    mapper.update()
+    data = mapper.input
+    if data is None or data.number_of_points == 0:
+        return None
+    if not data.is_a('vtkPolyData'):
+        gf = tvtk.GeometryFilter()
+        configure_input_data(gf, data)
+        gf.update()
+        data = gf.output
+    tf = tvtk.TriangleFilter()
+    configure_input_data(tf, data)
+    tf.update()
+    poly = tf.output
+    if poly.number_of_points == 0:
+        return None
+
+    points = poly.points.to_array().astype(numpy.float64)
+    matrix = actor.matrix.to_array()
+    points = points.dot(matrix[:3, :3].T) + matrix[:3, 3]
+    mesh = {'points': points}
+    # The triangle filter leaves triangles and line segments only.
+    if poly.number_of_polys > 0:
+        mesh['triangles'] = poly.polys.to_array().reshape(-1, 4)[:, 1:]
+    if poly.number_of_lines > 0:
+        mesh['lines'] = poly.lines.to_array().reshape(-1, 3)[:, 1:]
+    if 'triangles' not in mesh and 'lines' not in mesh:
+        return None
+    if mapper.scalar_visibility:
+        colors = mapper.map_scalars(1.0)
+        # The triangle filter keeps the points so the point colors of
+        # the input apply.
+        if colors is not None and \
+           colors.number_of_tuples == data.number_of_points:
+            mesh['colors'] = colors.to_array()[:, :3].astype(numpy.uint8)
+    return mesh
+
+
+def encode_mesh(mesh, quantize=False):
+    """Pack the arrays of a mesh as returned by `actor_to_mesh` into one
+    little endian binary blob.
+
+    Returns a dictionary describing the arrays, with the dtype, byte
+    offset and number of values of each, and the blob.  With
+    `quantize` the points are stored as 16 bit floats relative to the
+    center and half size of their bounds, given as 'center' and
+    'scale'.
+    """
+    info = {}
+    parts = []
+    offset = 0
+    points = mesh['points']
+    if quantize:
+        lo, hi = points.min(axis=0), points.max(axis=0)
+        center = (lo + hi)*0.5
+        scale = max(float((hi - lo).max())*0.5, 1e-30)
+        info['center'] = center.tolist()
+        info['scale'] = scale
+        points = ((points - center)/scale).astype('<f2')
+    else:
+        points = points.astype('<f4')
+    arrays = [('points', points)]
+    if len(mesh['points']) < 65536:
+        index_type = '<u2'
+    else:
+        index_type = '<u4'
+    for name in ('triangles', 'lines'):
+        if name in mesh:
+            arrays.append((name, mesh[name].astype(index_type)))
+    if 'colors' in mesh:
+        arrays.append(('colors', mesh['colors'].astype(numpy.uint8)))
+
+    for name, arr in arrays:
+        data = arr.tobytes()
+        info[name] = [arr.dtype.str[1:], offset, arr.size]
+        # Keep the arrays aligned for the typed arrays of the browser.
+        pad = -len(data) % 4
+        parts.append(data + b'\0'*pad)
+        offset += len(data) + pad
+    return info, b''.join(parts)
+
+
+def _material(actor):
+    prop = actor.property
+    return {'color': list(prop.color), 'opacity': prop.opacity,
+            'point_size': prop.point_size}
+
+
+def _viewpoint(camera):
+    """Return the X3D position, orientation (axis and angle), center of
+    rotation and field of view of the given camera."""
+    pos = numpy.asarray(camera.position, dtype=float)
+    focus = numpy.asarray(camera.focal_point, dtype=float)
+    d = focus - pos
+    d /= numpy.linalg.norm(d)
+    right = numpy.cross(d, camera.view_up)
+    right /= numpy.linalg.norm(right)
+    up = numpy.cross(right, d)
+    # The rotation taking the default X3D view (looking down -z with y
+    # up) to the camera.
+    rot = numpy.column_stack((right, up, -d))
+    angle = numpy.arccos(numpy.clip((numpy.trace(rot) - 1.0)*0.5,
+                                    -1.0, 1.0))
+    if angle < 1e-8:
+        axis = numpy.array([0.0, 0.0, 1.0])
+    elif numpy.pi - angle < 1e-6:
+        axis = numpy.sqrt(numpy.maximum(0.0, (numpy.diag(rot) + 1.0)*0.5))
+        i = numpy.argmax(axis)
+        for j in range(3):
+            if j != i:
+                axis[j] = numpy.copysign(axis[j], rot[i, j] + rot[j, i])
+    else:
+        axis = numpy.array([rot[2, 1] - rot[1, 2], rot[0, 2] - rot[2, 0],
+                            rot[1, 0] - rot[0, 1]])
+        axis /= 2.0*numpy.sin(angle)
+    return pos, numpy.append(axis, angle), focus, \
+        numpy.radians(camera.view_angle)
+
+
+def _fmt(values):
+    return ' '.join('%g'%x for x in values)
+
+
+def scene_to_binary(scene):
+    """Return the HTML showing the scene with x3dom, with the geometry of
+    each actor sent as binary data identified by its hash.
+
+    The geometry of an actor is only sent the first time it is seen,
+    either embedded in the page as base64 chunks or, if a sidecar
+    directory was given to `init`, as a file in that directory.  When a
+    figure is shown again only the actors that changed are sent again.
+    """
+    sid = 'scene_%d' % next(counter)
+    shapes = []
+    meshes = []
+    for i, actor in enumerate(scene.renderer.actors):
+        if not actor.visibility:
+            continue
+        mesh = actor_to_mesh(actor)
+        if mesh is None:
+            continue
+        info, blob = encode_mesh(mesh, _quantize)
+        key = hashlib.sha1(blob + json.dumps(info, sort_keys=True).encode(
+            'ascii')).hexdigest()
+        mid = '%s_%d'%(sid, i)
+        record = {'id': mid, 'hash': key, 'arrays': info}
+        if _sidecar is not None:
+            fname = os.path.join(_sidecar, key + '.bin')
+            if not os.path.exists(fname):
+                if not os.path.isdir(_sidecar):
+                    os.makedirs(_sidecar)
+                with open(fname, 'wb') as f:
+                    f.write(blob)
+            record['url'] = '%s/%s.bin'%(_sidecar_url, key)
+        elif key not in _sent_meshes:
+            data = base64.b64encode(blob).decode('ascii')
+            record['data'] = [data[j:j + CHUNK_SIZE]
+                              for j in range(0, len(data), CHUNK_SIZE)]
+            _sent_meshes.add(key)
+        meshes.append(record)
+
+        m = _material(actor)
+        material = '<Material diffuseColor="%s" transparency="%g"/>'%(
+            _fmt(m['color']), 1.0 - m['opacity'])
+        color = '<Color id="%s_col" color=""/>'%mid \
+            if 'colors' in info else ''
+        if 'triangles' in info:
+            shapes.append(
+                '<Shape><Appearance>%s</Appearance>'
+                '<IndexedTriangleSet id="%s_t" solid="false" index="">'
+                '<Coordinate id="%s_tc" point=""/>%s'
+                '</IndexedTriangleSet></Shape>'%(
+                    material, mid, mid, color.replace('_col', '_tcol'))
+            )
+        if 'lines' in info:
+            line_material = '<Material emissiveColor="%s"/>'%(
+                _fmt(m['color']))
+            shapes.append(
+                '<Shape><Appearance>%s</Appearance>'
+                '<IndexedLineSet id="%s_l" coordIndex="">'
+                '<Coordinate id="%s_lc" point=""/>%s'
+                '</IndexedLineSet></Shape>'%(
+                    line_material, mid, mid, color.replace('_col', '_lcol'))
+            )
+
+    pos, orientation, center, fov = _viewpoint(scene.camera)
+    x3d = '''%s<Scene>
+    <Background skyColor="%s"></Background>
+    <Viewpoint position="%s" orientation="%s" centerOfRotation="%s"
+               fieldOfView="%g"></Viewpoint>
+    %s
+    </Scene></X3D>'''%(_x3d_tag(sid), _fmt(scene.background), _fmt(pos),
+                       _fmt(orientation), _fmt(center), fov,
+                       '\n    '.join(shapes))
+    html = '''
+    %s
+    <script type="text/javascript">
+    %s
+    mayavi_load_meshes(%s, function() {
+        %s
+    });
+    </script>
+    '''%(x3d, _MESH_LOADER, json.dumps(meshes), _x3dom_reload())
+    return html
+
+
+# The javascript filling the X3D nodes of the binary backend from the
+# mesh data.  The data of each mesh is kept in `window.mayavi_meshes`
+# keyed on its hash so it is only sent once.
+_MESH_LOADER = '''
+    function mayavi_load_meshes(meshes, done) {
+        var cache = window.mayavi_meshes = window.mayavi_meshes || {};
+        var types = {f4: Float32Array, f2: Uint16Array, u4: Uint32Array,
+                     u2: Uint16Array, u1: Uint8Array};
+        function half(h) {
+            var s = (h & 0x8000) ? -1 : 1, e = (h >> 10) & 0x1f,
+                f = h & 0x3ff;
+            if (e === 0) { return s*Math.pow(2, -14)*(f/1024); }
+            if (e === 31) { return f ? NaN : s*Infinity; }
+            return s*Math.pow(2, e - 15)*(1 + f/1024);
+        }
+        function decode(chunks) {
+            var s = atob(chunks.join('')), n = s.length;
+            var buf = new Uint8Array(n);
+            for (var i = 0; i < n; i++) { buf[i] = s.charCodeAt(i); }
+            return buf.buffer;
+        }
+        function get(buffer, spec) {
+            return new types[spec[0]](buffer, spec[1], spec[2]);
+        }
+        function set(id, attr, value) {
+            var node = document.getElementById(id);
+            if (node !== null) { node.setAttribute(attr, value); }
+        }
+        function fill(mesh, buffer) {
+            var a = mesh.arrays, p = get(buffer, a.points), pts = [];
+            var i, j;
+            if (a.center !== undefined) {
+                for (i = 0; i < p.length; i++) {
+                    pts.push(a.center[i%3] + half(p[i])*a.scale);
+                }
+            } else {
+                pts = Array.prototype.slice.call(p);
+            }
+            pts = pts.join(' ');
+            var colors = null;
+            if (a.colors !== undefined) {
+                var c = get(buffer, a.colors), col = [];
+                for (i = 0; i < c.length; i++) { col.push(c[i]/255); }
+                colors = col.join(' ');
+            }
+            if (a.triangles !== undefined) {
+                var t = get(buffer, a.triangles);
+                set(mesh.id + '_t', 'index',
+                    Array.prototype.slice.call(t).join(' '));
+                set(mesh.id + '_tc', 'point', pts);
+                if (colors !== null) { set(mesh.id + '_tcol', 'color', colors); }
+            }
+            if (a.lines !== undefined) {
+                var l = get(buffer, a.lines), idx = [];
+                for (j = 0; j < l.length; j += 2) {
+                    idx.push(l[j], l[j + 1], -1);
+                }
+                set(mesh.id + '_l', 'coordIndex', idx.join(' '));
+                set(mesh.id + '_lc', 'point', pts);
+                if (colors !== null) { set(mesh.id + '_lcol', 'color', colors); }
+            }
+        }
+        var pending = 1;
+        function finish() {
+            pending -= 1;
+            if (pending === 0) { done(); }
+        }
+        meshes.forEach(function(mesh) {
+            if (mesh.data !== undefined) {
+                cache[mesh.hash] = decode(mesh.data);
+            }
+            if (cache[mesh.hash] !== undefined) {
+                fill(mesh, cache[mesh.hash]);
+            } else if (mesh.url !== undefined) {
+                pending += 1;
+                var xhr = new XMLHttpRequest();
+                xhr.open('GET', mesh.url, true);
+                xhr.responseType = 'arraybuffer';
+                xhr.onload = function() {
+                    cache[mesh.hash] = xhr.response;
+                    fill(mesh, xhr.response);
+                    finish();
+                };
+                xhr.onerror = finish;
+                xhr.send();
+            } else {
+                console.warn('Mayavi: the data of mesh ' + mesh.hash +
+                             ' was not found, call notebook.reset().');
+            }
+        });
+        finish();
+    }
+'''
+
 def display(obj, backend=None):
     """Display given object on Jupyter notebook using given backend.
 
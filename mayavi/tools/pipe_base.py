@@ -24,6 +24,25 @@ from . import tools
 from .engine_manager import get_engine
 
 
+# Per class caches of the factory metadata.  These only depend on the
+# class so need not be recomputed each time a factory is created.
+_public_trait_names = {}
+_adapts_components = {}
+
+
+def get_public_trait_names(klass):
+    """ Returns the names of the public class traits of the given
+        HasTraits subclass.  The result is cached per class.
+    """
+    names = _public_trait_names.get(klass)
+    if names is None:
+        names = [name for name in klass.class_trait_names()
+                 if name[0] != '_' and
+                 name not in ('trait_added', 'trait_modified')]
+        _public_trait_names[klass] = names
+    return names
+
+
 def get_obj(obj, components):
     """ Get the target object for the specified components. """
 
@@ -43,6 +62,17 @@ def make_function(factory_class):
     return the_function
 
 
+def _same_colormap(lut_manager, colormap):
+    """ Returns if the given LUT manager is setup for the given mlab
+        colormap name, taking into account the reversed ('_r') maps.
+    """
+    reverse = colormap[-2:] == '_r'
+    if reverse:
+        colormap = colormap[:-2]
+    return (lut_manager.lut_mode == colormap and
+            bool(lut_manager.reverse_lut) == reverse)
+
+
 def get_module_manager(obj):
     """ Returns the module manager that would be used when a module
         is added on the given object, if any, and None elsewhere.
@@ -106,8 +136,8 @@ class PipeFactory(HasPrivateTraits):
 
                 elif 'colormap' in kwargs:
                     cmap = kwargs['colormap']
-                    if (scalar_lut.lut_mode != cmap
-                                        or vector_lut.lut_mode != cmap):
+                    if not (_same_colormap(scalar_lut, cmap)
+                                and _same_colormap(vector_lut, cmap)):
                         parent = self._engine.add_module(ModuleManager(),
                                             module_manager.parent)
 
@@ -154,9 +184,7 @@ class PipeFactory(HasPrivateTraits):
             self._target.add_trait('mlab_source', Instance(ms.__class__))
             self._target.mlab_source = ms
 
-        traits = self.get(self.class_trait_names())
-        [traits.pop(key) for key in list(traits.keys())
-                                    if key[0] == '_' or key is None]
+        traits = self.get(get_public_trait_names(self.__class__))
         traits.update(kwargs)
         # Now calling the traits setter, so that traits handlers are
         # called
@@ -187,12 +215,18 @@ class PipeFactory(HasPrivateTraits):
 
     def _anytrait_changed(self, name, value):
         """ This is where we implement the adaptation code. """
-        trait = self.trait(name)
         if name[0] == '_':
             # Private attribute
             return
-        # hasattr(traits, "adapts") always returns True :-<.
-        if not trait.adapts is None:
-            components = trait.adapts.split('.')
+        key = (self.__class__, name)
+        components = _adapts_components.get(key, False)
+        if components is False:
+            trait = self.trait(name)
+            # hasattr(traits, "adapts") always returns True :-<.
+            components = None
+            if not trait.adapts is None:
+                components = trait.adapts.split('.')
+            _adapts_components[key] = components
+        if components is not None:
             obj = get_obj(self._target, components[:-1])
             setattr(obj, components[-1], value)
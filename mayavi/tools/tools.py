@@ -342,19 +342,32 @@ def set_extent(module, extents):
                       zpos + zo - zcenter)
 
 
-def start_recording(ui=True):
+def start_recording(ui=True, buffered=False):
     """Start automatic script recording.  If the `ui` parameter is
     `True`, it creates a recorder with a user interface, if not it
     creates a vanilla recorder without a UI.
 
+    If `buffered` is `True`, a `BufferedRecorder` without a UI is
+    created, this only generates the code of the script when it is
+    saved and has a much lower overhead when interacting with the
+    scene.
+
     **Returns**
         The `Recorder` instance created.
     """
-    from apptools.scripting.api import start_recording as start
+    from apptools.scripting.api import start_recording as start, \
+        set_recorder
     e = get_engine()
     msg = "Current engine, %s, is already being recorded." % (e)
     assert e.recorder is None, msg
-    r = start(e, ui=ui)
+    if buffered:
+        from mayavi.core.buffered_recorder import BufferedRecorder
+        r = BufferedRecorder()
+        set_recorder(r)
+        r.recording = True
+        r.register(e)
+    else:
+        r = start(e, ui=ui)
     return r
 
 
@@ -232,27 +232,16 @@ class Messenger:
           or 'all', then any event will invoke these.
 
         """
-        try:
-            sigs = self._get_signals(source)
-        except (MessengerError, KeyError):
+        sigs = self._signals.get(hash(source))
+        if not sigs:
             return
-        events = self._catch_all[:]
-        if event not in events:
-            events.append(event)
-        for evt in events:
+        # This is called for every VTK event of every TVTK object so
+        # avoid building the list of events on each call.
+        for evt in self._catch_all:
             if evt in sigs:
-                slots = sigs[evt]
-                for key in list(slots.keys()):
-                    obj, meth = slots[key]
-                    if obj: # instance method
-                        inst = obj()
-                        if inst:
-                            getattr(inst, meth)(source, event, *args, **kw_args)
-                        else:
-                            # Oops, dead reference.
-                            del slots[key]
-                    else: # normal function
-                        meth(source, event, *args, **kw_args)
+                self._call_slots(sigs[evt], source, event, args, kw_args)
+        if event in sigs and event not in self._catch_all:
+            self._call_slots(sigs[event], source, event, args, kw_args)
 
     def is_registered(self, obj):
         """Returns if the given object has registered itself with the
@@ -277,6 +266,20 @@ class Messenger:
     # Non-public interface.
     #################################################################
 
+    def _call_slots(self, slots, source, event, args, kw_args):
+        """Call the handlers in `slots` and remove the dead ones."""
+        # The handlers may connect or disconnect handlers.
+        for key, (obj, meth) in list(slots.items()):
+            if obj: # instance method
+                inst = obj()
+                if inst:
+                    getattr(inst, meth)(source, event, *args, **kw_args)
+                else:
+                    # Oops, dead reference.
+                    slots.pop(key, None)
+            else: # normal function
+                meth(source, event, *args, **kw_args)
+
     def _get_signals(self, obj):
         """Given an object `obj` it returns the signals of that
         object.
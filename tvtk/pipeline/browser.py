@@ -35,7 +35,7 @@ import re
 
 # Enthought library imports.
 from traits.api import HasTraits, Property, Any, Instance, \
-                             Trait, List, Str, Dict, Python
+                             Trait, List, Str, Dict, Python, Bool
 from traitsui.api import \
      TreeEditor, TreeNodeObject, ObjectTreeNode, View, Item, Group
 from traitsui.menu import Menu, Action
@@ -47,6 +47,31 @@ from tvtk.tvtk_base_handler import TVTKBaseHandler
 from tvtk.common import camel2enthought
 
 
+# The attributes of tvtk objects that may refer to their children.
+_CHILD_ATTRIBUTES = ('source', 'get_input', 'input', 'mapper', 'property',
+                     'texture', 'text_property', 'volume_property',
+                     'lookup_table', 'producer_port', 'producer')
+
+# The attributes that `SimpleTreeGenerator` adds as children as such.
+_MISC_ATTRIBUTES = ('mapper', 'property', 'texture', 'text_property',
+                    'volume_property', 'lookup_table', 'producer')
+
+# The attributes of the inputs and sources of tvtk objects.
+_INPUT_ATTRIBUTES = ('number_of_sources', 'source', 'get_input',
+                     'number_of_input_ports', 'input', 'producer_port')
+
+# The attributes each tvtk class has, of a given tuple of names.
+_attributes_cache = {}
+
+# The methods of each VTK class that refer to children, parsed from
+# the printed VTK object.
+_methods_cache = {}
+
+# The attributes of each tvtk class that refer to children, found from
+# the methods in `_methods_cache`.
+_child_attributes_cache = {}
+
+
 ######################################################################
 # Utility functions.
 ######################################################################
@@ -54,6 +79,17 @@ def is_iterable(x):
     return hasattr(x, '__iter__')
 
 
+def get_attributes(obj, names):
+    """Return the attributes of the tuple `names` that the object has.
+    This is cached for each class."""
+    key = (obj.__class__, names)
+    attrs = _attributes_cache.get(key)
+    if attrs is None:
+        attrs = tuple(x for x in names if hasattr(obj, x))
+        _attributes_cache[key] = attrs
+    return attrs
+
+
 def get_icon(object_name):
     """Given the name of the object, this function returns an
     appropriate icon image name.  If no icon is appropriate it returns
@@ -128,13 +164,7 @@ class SimpleTreeGenerator(TreeGenerator):
                             tvtk.Collection)):
             return True
 
-        for attribute in ['source', 'get_input', 'input', 'mapper', 'property',
-                          'texture', 'text_property', 'volume_property',
-                          'lookup_table', 'producer_port', 'producer']:
-            if hasattr(obj, attribute):
-                return True
-
-        return False
+        return len(get_attributes(obj, _CHILD_ATTRIBUTES)) > 0
 
     def get_children(self, obj):
         """Returns the child objects of a particular tvtk object in a
@@ -166,23 +196,21 @@ class SimpleTreeGenerator(TreeGenerator):
         #    _add_kid(obj)
 
         # Misc. properties.
-        for attribute in ['mapper', 'property', 'texture',
-                          'text_property', 'volume_property',
-                          'lookup_table', 'producer']:
-            if hasattr(obj, attribute):
-                _add_kid(attribute, getattr(obj, attribute))
+        for attribute in get_attributes(obj, _MISC_ATTRIBUTES):
+            _add_kid(attribute, getattr(obj, attribute))
 
         # Check for sources and inputs.
-        if hasattr(obj, 'number_of_sources'):
+        attrs = get_attributes(obj, _INPUT_ATTRIBUTES)
+        if 'number_of_sources' in attrs:
             srcs = [obj.get_source(i) \
                     for i in range(obj.number_of_sources)]
             _add_kid('source', srcs)
-        elif hasattr(obj, 'source'):
+        elif 'source' in attrs:
             _add_kid('source', obj.source)
 
-        if hasattr(obj, 'get_input'):
+        if 'get_input' in attrs:
             inputs = []
-            if hasattr(obj, 'number_of_input_ports'):
+            if 'number_of_input_ports' in attrs:
                 if obj.number_of_input_ports:
                     inputs = [obj.get_input(i) \
                               for i in range(obj.number_of_input_ports)]
@@ -190,10 +218,10 @@ class SimpleTreeGenerator(TreeGenerator):
                 inputs = [obj.get_input(i) \
                           for i in range(obj.number_of_inputs)]
             _add_kid('input', inputs)
-        elif hasattr(obj, 'input'):
+        elif 'input' in attrs:
             _add_kid('input', obj.input)
 
-        if hasattr(obj, 'producer_port'):
+        if 'producer_port' in attrs:
             _add_kid('producer_port', obj.producer_port)
 
         return kids
@@ -246,9 +274,6 @@ class FullTreeGenerator(SimpleTreeGenerator):
         dictionary, the keys are the trait names.  This is used to
         generate the tree in the browser."""
 
-        vtk_obj = tvtk.to_vtk(obj)
-        methods = self._get_methods(vtk_obj)
-
         kids = {}
         def _add_kid(key, x):
             if x is None:
@@ -267,22 +292,21 @@ class FullTreeGenerator(SimpleTreeGenerator):
                     else:
                         kids[key] = x
 
-        for method in methods:
-            attr = camel2enthought(method[0])
-            if hasattr(obj, attr):
-                _add_kid(attr, getattr(obj, attr))
+        for attr in self._get_child_attributes(obj):
+            _add_kid(attr, getattr(obj, attr))
 
         # Check for sources and inputs.
-        if hasattr(obj, 'number_of_sources'):
+        attrs = get_attributes(obj, _INPUT_ATTRIBUTES)
+        if 'number_of_sources' in attrs:
             srcs = [obj.get_source(i) \
                     for i in range(obj.number_of_sources)]
             _add_kid('source', srcs)
-        elif hasattr(obj, 'source'):
+        elif 'source' in attrs:
             _add_kid('source', obj.source)
 
-        if hasattr(obj, 'get_input'):
+        if 'get_input' in attrs:
             inputs = []
-            if hasattr(obj, 'number_of_input_ports'):
+            if 'number_of_input_ports' in attrs:
                 if obj.number_of_input_ports:
                     # Sometimes not all the inputs can be retrieved using
                     # 'get_input', as they may be sources (for instance
@@ -299,36 +323,85 @@ class FullTreeGenerator(SimpleTreeGenerator):
                 inputs = [obj.get_input(i) \
                           for i in range(obj.number_of_inputs)]
             _add_kid('input', inputs)
-        elif hasattr(obj, 'input'):
+        elif 'input' in attrs:
             _add_kid('input', obj.input)
 
-        if hasattr(obj, 'producer_port'):
+        if 'producer_port' in attrs:
             _add_kid('producer_port', obj.producer_port)
 
         return kids
 
     def has_children(self, obj):
-        """Returns true of the object has children, false if not.  This is
-        very specific to tvtk objects."""
+        """Returns true of the object may have children, false if not.
+        This only looks at the class of the object, the children are
+        only computed when the node is expanded."""
         if isinstance(obj, (tvtk.RenderWindow, tvtk.Renderer,
                             tvtk.Collection)):
             return True
-        for attribute in ['source', 'get_input', 'input', 'mapper', 'property',
-                          'texture', 'text_property', 'volume_property',
-                          'lookup_table', 'producer_port', 'producer']:
-            if hasattr(obj, attribute):
-                return True
-        # FIXME: This is inefficient.  We probably should cache the
-        # get_children call.
-        if self.get_children(obj):
+        if len(get_attributes(obj, _CHILD_ATTRIBUTES)) > 0:
             return True
-        return False
+        return len(self._get_class_child_attributes(obj)) > 0
 
     ###########################################################################
     # Non-public interface.
     ###########################################################################
+    def _get_class_child_attributes(self, obj):
+        """Return the attributes of the class of the tvtk object that
+        refer to children, this is cached for each class."""
+        klass = obj.__class__
+        attrs = _child_attributes_cache.get(klass)
+        if attrs is None:
+            methods = self._get_class_methods(tvtk.to_vtk(obj))
+            names = [camel2enthought(m[0]) for m in methods]
+            attrs = tuple(x for x in names if hasattr(obj, x))
+            _child_attributes_cache[klass] = attrs
+        return attrs
+
+    def _get_child_attributes(self, obj):
+        """Return the attributes of the tvtk object that refer to
+        children."""
+        attrs = self._get_class_child_attributes(obj)
+        # Only show the inverse of the first of a chain of transforms.
+        if isinstance(obj, tvtk.AbstractTransform):
+            if self.last_transform > 0:
+                attrs = tuple(x for x in attrs if x != 'inverse')
+            else:
+                self.last_transform += 1
+        else:
+            self.last_transform = 0
+        return attrs
+
     def _get_methods(self, vtk_obj):
         """Obtain the various methods from the passed object."""
+        # Oops, this isn't a VTK object.
+        if not hasattr(vtk_obj, 'GetClassName'):
+            return []
+        methods = [list(x) for x in self._get_class_methods(vtk_obj)]
+        if vtk_obj.IsA('vtkAbstractTransform'):
+            if self.last_transform > 0:
+                methods = [x for x in methods if x[0] != 'Inverse']
+            else:
+                self.last_transform += 1
+        else:
+            self.last_transform = 0
+        return methods
+
+    def _get_class_methods(self, vtk_obj):
+        """Obtain the methods of the class of the passed object, these
+        are cached for each class."""
+        # Oops, this isn't a VTK object.
+        if not hasattr(vtk_obj, 'GetClassName'):
+            return []
+        name = vtk_obj.GetClassName()
+        methods = _methods_cache.get(name)
+        if methods is None:
+            methods = self._parse_methods(vtk_obj)
+            _methods_cache[name] = methods
+        return methods
+
+    def _parse_methods(self, vtk_obj):
+        """Parse the methods referring to children from the printed
+        object."""
 
         def _remove_method(name, methods, method_names):
             """Removes methods if they have a particular name."""
@@ -345,10 +418,6 @@ class FullTreeGenerator(SimpleTreeGenerator):
         # the object's children.  It is a hack but has worked well for
         # a *very* long time with MayaVi-1.x and before.
 
-        # Oops, this isn't a VTK object.
-        if not hasattr(vtk_obj, 'GetClassName'):
-            return []
-
         methods = str(vtk_obj)
         methods = methods.split("\n")
         del methods[0]
@@ -389,14 +458,6 @@ class FullTreeGenerator(SimpleTreeGenerator):
             methods.append(["Volumes", ""])
             methods.append(["Actors", ""])
 
-        if vtk_obj.IsA('vtkAbstractTransform'):
-            if self.last_transform > 0:
-                _remove_method('Inverse', methods, method_names)
-            else:
-                self.last_transform += 1
-        else:
-            self.last_transform = 0
-
         # Some of these object are removed because they arent useful in
         # the browser.  I check for Source and Input anyway so I dont need
         # them.
@@ -405,7 +466,7 @@ class FullTreeGenerator(SimpleTreeGenerator):
                     'Interactor', 'Lights', 'Information', 'Executive'):
             _remove_method(name, methods, method_names)
 
-        return methods
+        return tuple(tuple(x) for x in methods)
 
 
 ######################################################################
@@ -424,8 +485,15 @@ class CompositeIterable(HasTraits):
     def __init__(self, args, **traits):
         super(CompositeIterable, self).__init__(**traits)
         self.args = args
+        self._nodes = None
 
     def __iter__(self):
+        # The nodes are made when first iterated over and reused after.
+        if self._nodes is None:
+            self._nodes = list(self._make_nodes())
+        return iter(self._nodes)
+
+    def _make_nodes(self):
         tg = self.tree_generator
         for arg in self.args:
             if is_iterable(arg):
@@ -495,6 +563,13 @@ class TVTKBranchNode(TreeNodeObject):
     # Cache of children.
     children_cache = Dict
 
+    # The children are only created, and the listeners for changes to
+    # them setup, when the node is expanded.  True once this is done.
+    _children_created = Bool(False)
+
+    # The iterable of the child nodes, reused till the children change.
+    _nodes = Any
+
     # Work around problem with HasPrivateTraits.
     __ = Python
 
@@ -516,6 +591,8 @@ class TVTKBranchNode(TreeNodeObject):
     def _create_children(self):
         kids = self.tree_generator.get_children(self.object)
         self.children_cache = kids
+        self._children_created = True
+        self._nodes = None
         self._setup_listners()
 
     def _setup_listners(self):
@@ -530,6 +607,8 @@ class TVTKBranchNode(TreeNodeObject):
                 object.on_trait_change(self._notify_children, key)
 
     def _remove_listners(self):
+        if not self._children_created:
+            return
         object = self.object
         kids = self.children_cache
         for key, val in kids.items():
@@ -548,11 +627,13 @@ class TVTKBranchNode(TreeNodeObject):
         self.trait_property_changed('children', old_val, new_val)
 
     def _get_children(self):
-        if not self.children_cache:
+        if not self._children_created:
             self._create_children()
-        kids = self._get_children_from_cache()
-        tg = self.tree_generator
-        return CompositeIterable(kids, tree_generator=tg)
+        if self._nodes is None:
+            kids = self._get_children_from_cache()
+            tg = self.tree_generator
+            self._nodes = CompositeIterable(kids, tree_generator=tg)
+        return self._nodes
 
     def _get_name(self):
         return self.object.__class__.__name__
@@ -569,6 +650,12 @@ class TVTKBranchNode(TreeNodeObject):
         else:
             return super(TVTKBranchNode, self).tno_get_icon(node, is_expanded)
 
+    def tno_has_children(self, node):
+        """ Returns whether or not the object has children.  This does
+        not create the children until the node is expanded.
+        """
+        return self.tree_generator.has_children(self.object)
+
 
 ######################################################################
 # `TVTKCollectionNode` class.
@@ -14,6 +14,11 @@
 """Helper functions to make a bunch of simple actors.  This is useful
 when writing demo/example code.
 
+The cone, cube, cylinder, sphere and arrow actors of the same resolution
+share their geometry (see `geometry_cache`) but each has its own mapper.
+Their size, position and orientation are set on the actor, and the
+input of their mappers should not be modified.
+
 """
 
 # Author: Prabhu Ramachandran <prabhu_r@users.sf.net>
@@ -23,6 +28,7 @@ when writing demo/example code.
 from tvtk.api import tvtk
 from vtk.util import colors
 from tvtk.common import configure_input_data
+from tvtk.pyface.geometry_cache import get_mapper, orient_actor
 
 def axes_actor(origin=(0, 0, 0), scale_factor=1.0, radius=0.02,
                sides=12):
@@ -42,39 +48,30 @@ def cone_actor(center=(0, 0, 0), height=1.0, radius=0.5,
                direction=(1, 0, 0), resolution=100, color=colors.red,
                opacity=1.0):
     """ Sets up a cone actor and returns the tvtk.Actor object."""
-    source = tvtk.ConeSource(center=center, height=height,
-                             radius=radius, direction=direction,
-                             resolution=resolution)
-    mapper = tvtk.PolyDataMapper()
-    configure_input_data(mapper, source.output)
+    mapper = get_mapper('cone', resolution=resolution)
     p = tvtk.Property(opacity=opacity, color=color)
-    actor = tvtk.Actor(mapper=mapper, property=p)
-    source.update()
+    actor = tvtk.Actor(mapper=mapper, property=p, position=center,
+                       scale=(height, 2.0*radius, 2.0*radius))
+    orient_actor(actor, direction)
     return actor
 
 
 def cube_actor(center=(0, 0, 0), color=colors.blue, opacity=1.0):
     """ Creates a cube and returns the tvtk.Actor. """
 
-    source = tvtk.CubeSource(center=center)
-    mapper = tvtk.PolyDataMapper()
-    configure_input_data(mapper, source.output)
+    mapper = get_mapper('cube')
     p = tvtk.Property(opacity=opacity, color=color)
-    actor = tvtk.Actor(mapper=mapper, property=p)
-    source.update()
+    actor = tvtk.Actor(mapper=mapper, property=p, position=center)
     return actor
 
 
 def cylinder_actor(center=(0, 0, 0), radius=0.5, resolution=64,
                    color=colors.green, opacity=1.0):
     """ Creates a cylinder and returns a tvtk.Actor. """
-    source = tvtk.CylinderSource(center=center, radius=radius,
-                                 resolution=resolution)
-    mapper = tvtk.PolyDataMapper()
-    configure_input_data(mapper, source.output)
+    mapper = get_mapper('cylinder', resolution=resolution)
     prop = tvtk.Property(opacity=opacity, color=color)
-    actor = tvtk.Actor(mapper=mapper, property=prop)
-    source.update()
+    actor = tvtk.Actor(mapper=mapper, property=prop, position=center,
+                       scale=(2.0*radius, 1.0, 2.0*radius))
     return actor
 
 
@@ -92,25 +89,20 @@ def earth_actor(radius=0.5, opacity=1.0):
 def sphere_actor(center=(0, 0, 0), radius=0.5, resolution=32,
                  color=colors.purple, opacity=1.0):
     """ Creates a sphere and returns the actor. """
-    source = tvtk.SphereSource(center=center, radius=radius,
-                               theta_resolution=resolution,
-                               phi_resolution=resolution)
-    mapper = tvtk.PolyDataMapper()
-    configure_input_data(mapper, source.output)
+    mapper = get_mapper('sphere', theta_resolution=resolution,
+                        phi_resolution=resolution)
     prop = tvtk.Property(opacity=opacity, color=color)
-    actor = tvtk.Actor(mapper=mapper, property=prop)
-    source.update()
+    s = radius/0.5
+    actor = tvtk.Actor(mapper=mapper, property=prop, position=center,
+                       scale=(s, s, s))
     return actor
 
 
 def arrow_actor(color=colors.peacock, opacity=1.0, resolution=24):
     """ Creates a 3D Arrow and returns an actor. """
-    source = tvtk.ArrowSource(tip_resolution=resolution,
-                              shaft_resolution=resolution)
-    mapper = tvtk.PolyDataMapper()
-    configure_input_data(mapper, source.output)
+    mapper = get_mapper('arrow', tip_resolution=resolution,
+                        shaft_resolution=resolution)
     prop = tvtk.Property(opacity=opacity, color=color)
     actor = tvtk.Actor(mapper=mapper, property=prop)
-    source.update()
     return actor
 
@@ -0,0 +1,280 @@
+"""Link the cameras of several scenes.
+
+A `CameraLink` links the cameras of any number of scenes in both
+directions: interacting with any of the scenes moves the cameras of
+all the others.  The camera changes are not applied on every camera
+event, instead the state of the camera that changed last is applied
+to the other scenes once per iteration of the GUI event loop and only
+the scenes whose camera actually changed are rendered.  This keeps
+dashboards with many linked views interactive::
+
+    link = CameraLink([s1, s2, s3, s4])
+    # Only link the zoom and clipping range.
+    link.link = ['zoom', 'clipping']
+    ...
+    link.unlink()
+
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import math
+import weakref
+
+from traits.api import HasTraits, List, Enum, Bool, Int, Any, Dict
+from tvtk.api import tvtk
+
+# The aspects of the cameras that may be linked.  'camera' links the
+# position, focal point, view up, view angle and parallel scale,
+# 'focal_point' pans the cameras to the same focal point, 'zoom' links
+# the distance to the focal point, view angle and parallel scale, and
+# 'clipping' links the clipping range.
+ASPECTS = ('camera', 'focal_point', 'zoom', 'clipping')
+
+# The state of the camera that is linked.
+_STATE = ('position', 'focal_point', 'view_up', 'view_angle',
+          'parallel_scale', 'clipping_range')
+
+
+######################################################################
+# Utility functions.
+######################################################################
+def get_camera_state(camera):
+    """Return the linked state of the given VTK camera as a dict."""
+    return dict(position=camera.GetPosition(),
+                focal_point=camera.GetFocalPoint(),
+                view_up=camera.GetViewUp(),
+                view_angle=camera.GetViewAngle(),
+                parallel_scale=camera.GetParallelScale(),
+                clipping_range=camera.GetClippingRange())
+
+
+def set_camera_state(camera, state):
+    """Set the state of the given VTK camera from a dict as returned by
+    `get_camera_state`."""
+    camera.SetFocalPoint(state['focal_point'])
+    camera.SetPosition(state['position'])
+    camera.SetViewUp(state['view_up'])
+    camera.SetViewAngle(state['view_angle'])
+    camera.SetParallelScale(state['parallel_scale'])
+    camera.SetClippingRange(state['clipping_range'])
+
+
+def linked_state(source, target, aspects):
+    """Return the camera state `target` with the given `aspects` of
+    the camera state `source` applied to it.
+    """
+    state = dict(target)
+    if 'camera' in aspects:
+        for key in _STATE[:-1]:
+            state[key] = source[key]
+    else:
+        if 'focal_point' in aspects:
+            fp = source['focal_point']
+            shift = [a - b for a, b in zip(fp, state['focal_point'])]
+            state['position'] = tuple(a + b for a, b in
+                                      zip(state['position'], shift))
+            state['focal_point'] = fp
+        if 'zoom' in aspects:
+            fp = state['focal_point']
+            d = [a - b for a, b in zip(state['position'], fp)]
+            dist = math.sqrt(sum(x*x for x in d))
+            src_dist = math.sqrt(sum((a - b)**2 for a, b in
+                                     zip(source['position'],
+                                         source['focal_point'])))
+            if dist > 0.0:
+                f = src_dist/dist
+                state['position'] = tuple(a + x*f for a, x in zip(fp, d))
+            state['view_angle'] = source['view_angle']
+            state['parallel_scale'] = source['parallel_scale']
+    if 'clipping' in aspects:
+        state['clipping_range'] = source['clipping_range']
+    return state
+
+
+def same_state(s1, s2, keys=_STATE):
+    """Return True if the camera states are the same for the given
+    keys, within round off."""
+    for key in keys:
+        a, b = s1[key], s2[key]
+        if not isinstance(a, tuple):
+            a, b = (a,), (b,)
+        for x, y in zip(a, b):
+            if abs(x - y) > 1e-9*(1.0 + abs(x)):
+                return False
+    return True
+
+
+######################################################################
+# `_CameraObserver` class.
+######################################################################
+class _CameraObserver(object):
+    """The observer of the ModifiedEvent of a camera, this only holds
+    weak references so the camera does not keep the link alive.
+    """
+    def __init__(self, link, scene):
+        self.link = weakref.ref(link)
+        self.scene = weakref.ref(scene)
+
+    def __call__(self, vtk_obj, event):
+        link, scene = self.link(), self.scene()
+        if link is not None and scene is not None:
+            link._camera_modified(scene)
+
+
+######################################################################
+# `CameraLink` class.
+######################################################################
+class CameraLink(HasTraits):
+    """Links the cameras of any number of scenes in both directions.
+    """
+
+    # The linked scenes.
+    scenes = List
+
+    # The aspects of the cameras that are linked, any of `ASPECTS`.
+    link = List(Enum(*ASPECTS), ['camera'])
+
+    # Apply camera changes as soon as they happen instead of once per
+    # iteration of the GUI event loop.  This is useful when there is no
+    # event loop.
+    immediate = Bool(False)
+
+    # The number of times the cameras were updated.
+    n_updates = Int(0)
+
+    # The number of scenes rendered because their camera changed.
+    n_renders = Int(0)
+
+    ########################################
+    # Private traits.
+
+    # The (VTK camera, observer id) of each scene.
+    _observers = Dict
+
+    # The scene whose camera changed last.
+    _source = Any
+
+    # True when an update is scheduled.
+    _pending = Bool(False)
+
+    # True while the cameras are being updated.
+    _applying = Bool(False)
+
+    def __init__(self, scenes=None, link='camera', **traits):
+        super(CameraLink, self).__init__(**traits)
+        self.link = [link] if isinstance(link, str) else list(link)
+        for scene in (scenes or []):
+            self.add(scene)
+
+    ######################################################################
+    # `CameraLink` interface.
+    ######################################################################
+    def add(self, scene):
+        """Add a scene, or a figure with a `scene`, to the link.  The
+        camera of the scene is set from the first linked scene.
+        """
+        scene = self._get_scene(scene)
+        if scene in self.scenes:
+            return
+        self.scenes.append(scene)
+        self._observe(scene)
+        scene.on_trait_change(self._on_scene_closing, 'closing')
+        if len(self.scenes) > 1:
+            self._source = self.scenes[0]
+            self.update()
+
+    def remove(self, scene):
+        """Remove a scene, or a figure with a `scene`, from the link."""
+        scene = self._get_scene(scene)
+        if scene not in self.scenes:
+            return
+        self.scenes.remove(scene)
+        self._unobserve(scene)
+        scene.on_trait_change(self._on_scene_closing, 'closing',
+                              remove=True)
+        if self._source is scene:
+            self._source = None
+
+    def unlink(self):
+        """Remove all the scenes from the link."""
+        for scene in list(self.scenes):
+            self.remove(scene)
+
+    def update(self):
+        """Apply the camera of the scene that changed last to the other
+        scenes and render those whose camera changed.
+        """
+        self._pending = False
+        source = self._source
+        if source is None:
+            return
+        self._source = None
+        src_state = get_camera_state(self._get_camera(source))
+        aspects = self.link
+        link_clipping = 'clipping' in aspects
+        keys = _STATE if link_clipping else _STATE[:-1]
+        self._applying = True
+        try:
+            for scene in self.scenes:
+                if scene is source:
+                    continue
+                camera = self._get_camera(scene)
+                state = get_camera_state(camera)
+                new = linked_state(src_state, state, aspects)
+                if same_state(state, new, keys):
+                    continue
+                set_camera_state(camera, new)
+                if not link_clipping:
+                    tvtk.to_vtk(scene.renderer).ResetCameraClippingRange()
+                scene.render()
+                self.n_renders += 1
+        finally:
+            self._applying = False
+        self.n_updates += 1
+
+    ######################################################################
+    # Non-public interface.
+    ######################################################################
+    def _get_scene(self, scene):
+        # mlab figures hold the actual scene.
+        if not hasattr(scene, 'renderer'):
+            scene = scene.scene
+        return scene
+
+    def _get_camera(self, scene):
+        camera = tvtk.to_vtk(scene.renderer).GetActiveCamera()
+        # The active camera of the scene may have been replaced.
+        if self._observers[scene][0] is not camera:
+            self._unobserve(scene)
+            self._observe(scene)
+        return camera
+
+    def _observe(self, scene):
+        camera = tvtk.to_vtk(scene.renderer).GetActiveCamera()
+        oid = camera.AddObserver('ModifiedEvent',
+                                 _CameraObserver(self, scene))
+        self._observers[scene] = (camera, oid)
+
+    def _unobserve(self, scene):
+        camera, oid = self._observers.pop(scene)
+        camera.RemoveObserver(oid)
+
+    def _camera_modified(self, scene):
+        if self._applying:
+            return
+        self._source = scene
+        if self.immediate:
+            self.update()
+        elif not self._pending:
+            self._pending = True
+            self._schedule()
+
+    def _schedule(self):
+        """Schedule an update on the next iteration of the event
+        loop."""
+        from pyface.api import GUI
+        GUI.invoke_later(self.update)
+
+    def _on_scene_closing(self, scene, name, old, new):
+        self.remove(scene)
@@ -0,0 +1,110 @@
+"""A cache of the geometry of simple primitives.
+
+Creating many spheres, cones or cylinders with their own VTK source
+stores the same tessellated geometry once per object.  This module
+caches the output of the primitive sources, keyed on the kind of
+primitive and the traits of its source, so that objects of the same
+resolution share the geometry and only differ in their transform and
+property::
+
+    actors = [tvtk.Actor(mapper=get_mapper('sphere', theta_resolution=16),
+                         position=p) for p in points]
+
+Each actor gets its own mapper, so its mapper may be changed, but the
+cached polydata is shared and should not be modified.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import math
+
+from tvtk.api import tvtk
+from tvtk.common import configure_input_data
+
+# The tvtk source class for each kind of primitive.
+SOURCES = {'sphere': 'SphereSource',
+           'cone': 'ConeSource',
+           'cylinder': 'CylinderSource',
+           'arrow': 'ArrowSource',
+           'cube': 'CubeSource',
+           'disk': 'DiskSource'}
+
+# The cached objects keyed on (kind, sorted parameters).
+_cache = {}
+
+
+######################################################################
+# Utility functions.
+######################################################################
+def get_cached(key, factory):
+    """Return the object cached with the given key, calling `factory`
+    to create it if there is none."""
+    obj = _cache.get(key)
+    if obj is None:
+        obj = _cache[key] = factory()
+    return obj
+
+
+def get_polydata(kind, **params):
+    """Return the shared output of the source of the given kind of
+    primitive, one of `SOURCES`, created with the given traits."""
+    key = ('polydata', kind, tuple(sorted(params.items())))
+
+    def factory():
+        if kind not in SOURCES:
+            msg = 'Unknown primitive %r, use one of %s.' % (
+                kind, ', '.join(sorted(SOURCES)))
+            raise ValueError(msg)
+        source = getattr(tvtk, SOURCES[kind])(**params)
+        source.update()
+        output = source.output
+        # Keep the output but not the source around.
+        pd = tvtk.PolyData()
+        pd.shallow_copy(output)
+        return pd
+
+    return get_cached(key, factory)
+
+
+def get_points(kind, **params):
+    """Return the points of `get_polydata` as a read only array."""
+    key = ('points', kind, tuple(sorted(params.items())))
+
+    def factory():
+        points = get_polydata(kind, **params).points.to_array()
+        points.flags.writeable = False
+        return points
+
+    return get_cached(key, factory)
+
+
+def get_mapper(kind, **params):
+    """Return a new mapper for `get_polydata`."""
+    mapper = tvtk.PolyDataMapper()
+    configure_input_data(mapper, get_polydata(kind, **params))
+    return mapper
+
+
+def orient_actor(actor, direction):
+    """Rotate the actor so its X axis points along `direction`, the
+    same way the `ConeSource` orients itself."""
+    dx, dy, dz = direction
+    mag = math.sqrt(dx*dx + dy*dy + dz*dz)
+    if mag == 0.0 or (dx, dy, dz) == (1.0, 0.0, 0.0):
+        return
+    # The actor's rotations are post-multiplied.
+    if dx < 0.0:
+        actor.rotate_wxyz(180.0, 0, 1, 0)
+        actor.rotate_wxyz(180.0, (dx - mag)/2.0, dy/2.0, dz/2.0)
+    else:
+        actor.rotate_wxyz(180.0, (dx + mag)/2.0, dy/2.0, dz/2.0)
+
+
+def clear():
+    """Clear the cache."""
+    _cache.clear()
+
+
+def cache_size():
+    """Return the number of cached objects."""
+    return len(_cache)
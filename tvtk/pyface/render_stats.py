@@ -0,0 +1,485 @@
+"""Render statistics and adaptive rendering quality for scenes.
+
+`RenderStats` times every render of a scene and reports the last, mean
+and 95th percentile render times along with the number of triangles
+and actors shown.  It is normally obtained from the scene::
+
+    stats = scene.render_stats
+    ...
+    print(stats.report())
+
+`AdaptiveQuality` keeps a scene interactive by lowering the rendering
+quality while the user interacts with it when the frames take longer
+than the target frame rate allows.  Anti-aliasing is turned off first,
+then the resolution of glyph sources and the sides of tubes are
+reduced and the sample distance of volume mappers is increased.  All of
+these are restored when the interaction ends.  It is enabled with the
+`adaptive_quality` trait of the scene.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import time
+import weakref
+from collections import deque
+
+from traits.api import HasTraits, Any, Int, Float, Bool, Event, \
+    Property, List
+from tvtk.api import tvtk
+
+# The anti-aliasing settings of the render window and renderer turned
+# off at the first quality level.
+AA_SETTINGS = (('render_window', 'AAFrames'),
+               ('render_window', 'PointSmoothing'),
+               ('render_window', 'LineSmoothing'),
+               ('render_window', 'PolygonSmoothing'),
+               ('renderer', 'UseFXAA'))
+
+# The resolutions reduced from the second quality level for each VTK
+# class, with their smallest value.
+RESOLUTIONS = {
+    'vtkSphereSource': (('ThetaResolution', 4), ('PhiResolution', 3)),
+    'vtkConeSource': (('Resolution', 3),),
+    'vtkCylinderSource': (('Resolution', 3),),
+    'vtkArrowSource': (('TipResolution', 3), ('ShaftResolution', 3)),
+    'vtkDiskSource': (('CircumferentialResolution', 4),),
+    'vtkRegularPolygonSource': (('NumberOfSides', 3),),
+    'vtkTubeFilter': (('NumberOfSides', 3),),
+}
+
+# The sample distances increased from the second quality level for the
+# volume mappers having them.
+SAMPLE_DISTANCES = ('SampleDistance', 'ImageSampleDistance')
+
+
+######################################################################
+# Utility functions.
+######################################################################
+def _count_triangles(cells):
+    """Return the number of triangles in a vtkCellArray of polygons or
+    triangle strips."""
+    n = cells.GetNumberOfCells()
+    if hasattr(cells, 'GetNumberOfConnectivityIds'):
+        return cells.GetNumberOfConnectivityIds() - 2*n
+    return cells.GetNumberOfConnectivityEntries() - 3*n
+
+
+def count_props(renderer):
+    """Return the number of triangles, actors and volumes visible in
+    the given renderer.  For data that is not polygonal the number of
+    cells is counted as triangles.
+    """
+    ren = tvtk.to_vtk(renderer)
+    triangles = actors = volumes = 0
+    props = ren.GetViewProps()
+    props.InitTraversal()
+    for i in range(props.GetNumberOfItems()):
+        prop = props.GetNextProp()
+        if not prop.GetVisibility():
+            continue
+        if prop.IsA('vtkVolume'):
+            volumes += 1
+        elif prop.IsA('vtkActor'):
+            actors += 1
+            mapper = prop.GetMapper()
+            data = mapper.GetInputAsDataSet() if mapper else None
+            if data is None:
+                continue
+            if data.IsA('vtkPolyData'):
+                triangles += _count_triangles(data.GetPolys())
+                triangles += _count_triangles(data.GetStrips())
+            else:
+                triangles += data.GetNumberOfCells()
+    return triangles, actors, volumes
+
+
+def find_algorithms(renderer):
+    """Return the VTK algorithms upstream of the mappers of the visible
+    props in the renderer, including the mappers."""
+    ren = tvtk.to_vtk(renderer)
+    result = []
+    seen = set()
+    stack = []
+    props = ren.GetViewProps()
+    props.InitTraversal()
+    for i in range(props.GetNumberOfItems()):
+        prop = props.GetNextProp()
+        if prop.GetVisibility() and hasattr(prop, 'GetMapper'):
+            mapper = prop.GetMapper()
+            if mapper is not None:
+                stack.append(mapper)
+    while stack:
+        alg = stack.pop()
+        key = alg.GetAddressAsString('vtkObject')
+        if key in seen:
+            continue
+        seen.add(key)
+        result.append(alg)
+        if not hasattr(alg, 'GetInputAlgorithm'):
+            continue
+        for port in range(alg.GetNumberOfInputPorts()):
+            for i in range(alg.GetNumberOfInputConnections(port)):
+                inp = alg.GetInputAlgorithm(port, i)
+                if inp is not None:
+                    stack.append(inp)
+    return result
+
+
+######################################################################
+# `_Observer` class.
+######################################################################
+class _Observer(object):
+    """A VTK observer calling a method of an object, this only holds a
+    weak reference to the object."""
+    def __init__(self, obj, method):
+        self.obj = weakref.ref(obj)
+        self.method = method
+
+    def __call__(self, vtk_obj, event):
+        obj = self.obj()
+        if obj is not None:
+            getattr(obj, self.method)(vtk_obj, event)
+
+
+######################################################################
+# `RenderStats` class.
+######################################################################
+class RenderStats(HasTraits):
+    """Times the renders of a scene."""
+
+    # The scene whose renders are timed.
+    scene = Any
+
+    # The number of most recent frames used for the statistics.
+    window = Int(100)
+
+    # The number of frames rendered since the statistics were reset.
+    n_frames = Int(0)
+
+    # The render time of the last frame in seconds.
+    last = Float(0.0)
+
+    # The mean render time of the recent frames in seconds.
+    mean = Property(Float)
+
+    # The 95th percentile of the render time of the recent frames in
+    # seconds.
+    p95 = Property(Float)
+
+    # The frame rate from the mean render time.
+    fps = Property(Float)
+
+    # The number of triangles shown.
+    triangles = Property(Int)
+
+    # The number of actors shown.
+    actors = Property(Int)
+
+    # The number of volumes shown.
+    volumes = Property(Int)
+
+    # Fired after each frame with its render time.
+    frame = Event
+
+    ########################################
+    # Private traits.
+
+    # The recent render times.
+    _times = Any
+
+    # The time the current render started.
+    _start = Float(0.0)
+
+    # The (VTK object, observer id) of the observers.
+    _observers = List
+
+    def __init__(self, scene=None, **traits):
+        super(RenderStats, self).__init__(**traits)
+        self._times = deque(maxlen=self.window)
+        if scene is not None:
+            self.start(scene)
+
+    ######################################################################
+    # `RenderStats` interface.
+    ######################################################################
+    def start(self, scene):
+        """Start timing the renders of the scene."""
+        self.stop()
+        self.scene = scene
+        renwin = tvtk.to_vtk(scene.render_window)
+        for event, method in (('StartEvent', '_render_start'),
+                              ('EndEvent', '_render_end')):
+            oid = renwin.AddObserver(event, _Observer(self, method))
+            self._observers.append((renwin, oid))
+
+    def stop(self):
+        """Stop timing the renders."""
+        for obj, oid in self._observers:
+            obj.RemoveObserver(oid)
+        self._observers = []
+
+    def reset(self):
+        """Clear the recorded render times."""
+        self._times.clear()
+        self.n_frames = 0
+        self.last = 0.0
+
+    def report(self):
+        """Return a short text report of the statistics."""
+        lines = ['frames: %d' % self.n_frames,
+                 'render time: %.1f ms last, %.1f ms mean, '
+                 '%.1f ms 95th percentile' % (self.last*1e3,
+                                               self.mean*1e3,
+                                               self.p95*1e3),
+                 'frame rate: %.1f fps' % self.fps,
+                 'triangles: %d, actors: %d, volumes: %d' % (
+                     self.triangles, self.actors, self.volumes)]
+        return '\n'.join(lines)
+
+    ######################################################################
+    # Non-public interface.
+    ######################################################################
+    def _render_start(self, vtk_obj, event):
+        self._start = time.time()
+
+    def _render_end(self, vtk_obj, event):
+        t = time.time() - self._start
+        self._times.append(t)
+        self.n_frames += 1
+        self.last = t
+        self.frame = t
+
+    def _window_changed(self, value):
+        self._times = deque(self._times or (), maxlen=value)
+
+    def _get_mean(self):
+        times = self._times
+        return sum(times)/len(times) if times else 0.0
+
+    def _get_p95(self):
+        times = sorted(self._times)
+        if not times:
+            return 0.0
+        return times[min(len(times) - 1, int(0.95*len(times)))]
+
+    def _get_fps(self):
+        mean = self.mean
+        return 1.0/mean if mean > 0 else 0.0
+
+    def _get_triangles(self):
+        return count_props(self.scene.renderer)[0]
+
+    def _get_actors(self):
+        return count_props(self.scene.renderer)[1]
+
+    def _get_volumes(self):
+        return count_props(self.scene.renderer)[2]
+
+
+######################################################################
+# `_Setting` class.
+######################################################################
+class _Setting(object):
+    """A setting of a VTK object lowered to reduce the quality.  `kind`
+    is one of 'aa', 'resolution' or 'distance'."""
+    def __init__(self, obj, name, kind, minimum=0):
+        self.obj = obj
+        self.name = name
+        self.kind = kind
+        self.minimum = minimum
+        self.original = getattr(obj, 'Get' + name)()
+
+    def value(self, level):
+        """The value of the setting at the given quality level."""
+        orig = self.original
+        if self.kind == 'aa':
+            return 0 if level > 0 else orig
+        if level < 2:
+            return orig
+        f = 2**(level - 1)
+        if self.kind == 'resolution':
+            return max(min(self.minimum, orig), int(orig/f))
+        return orig*f
+
+    def apply(self, level):
+        value = self.value(level)
+        if getattr(self.obj, 'Get' + self.name)() != value:
+            getattr(self.obj, 'Set' + self.name)(value)
+
+
+######################################################################
+# `AdaptiveQuality` class.
+######################################################################
+class AdaptiveQuality(HasTraits):
+    """Lowers the rendering quality of a scene while interacting with
+    it to keep the target frame rate and restores it after the
+    interaction.
+    """
+
+    # The scene.
+    scene = Any
+
+    # The frame rate to keep while interacting.
+    target_frame_rate = Float(15.0)
+
+    # The lowest quality level used.  Level 0 is the full quality,
+    # level 1 turns off anti-aliasing and the higher levels halve the
+    # resolutions and double the sample distances for each level.
+    max_level = Int(3)
+
+    # The current quality level.
+    level = Int(0)
+
+    # True while interacting with the scene.
+    interacting = Bool(False)
+
+    ########################################
+    # Private traits.
+
+    # The render statistics of the scene.
+    _stats = Any
+
+    # The settings changed while interacting.
+    _settings = List
+
+    # The quality level reached in the last interaction, used to start
+    # the next one.
+    _last_level = Int(0)
+
+    # True when the next frame is not used to choose the level.  The
+    # frame after a level change also updates the changed pipeline and
+    # is slower than the frames that follow.
+    _skip_frame = Bool(False)
+
+    # The (VTK object, observer id) of the observers.
+    _observers = List
+
+    # The desired update rate of the interactor before this was
+    # enabled.
+    _update_rate = Any
+
+    def __init__(self, scene=None, **traits):
+        super(AdaptiveQuality, self).__init__(**traits)
+        if scene is not None:
+            self.enable(scene)
+
+    ######################################################################
+    # `AdaptiveQuality` interface.
+    ######################################################################
+    def enable(self, scene):
+        """Start controlling the quality of the scene."""
+        self.disable()
+        self.scene = scene
+        self._stats = scene.render_stats
+        self._stats.on_trait_change(self._on_frame, 'frame')
+        iren = tvtk.to_vtk(scene.interactor)
+        objs = [iren]
+        style = iren.GetInteractorStyle()
+        if style is not None:
+            objs.append(style)
+        for obj in objs:
+            for event, method in (('StartInteractionEvent', '_start'),
+                                  ('EndInteractionEvent', '_end')):
+                oid = obj.AddObserver(event, _Observer(self, method))
+                self._observers.append((obj, oid))
+        # The LOD actors use the desired update rate while interacting.
+        self._update_rate = iren.GetDesiredUpdateRate()
+        iren.SetDesiredUpdateRate(self.target_frame_rate)
+
+    def disable(self):
+        """Stop controlling the quality of the scene and restore it."""
+        if self.scene is None:
+            return
+        self.end_interaction()
+        for obj, oid in self._observers:
+            obj.RemoveObserver(oid)
+        self._observers = []
+        self._stats.on_trait_change(self._on_frame, 'frame', remove=True)
+        iren = self.scene.interactor
+        if iren is not None and self._update_rate is not None:
+            tvtk.to_vtk(iren).SetDesiredUpdateRate(self._update_rate)
+        self.scene = None
+        self._stats = None
+
+    def start_interaction(self):
+        """Called when an interaction starts, this finds the settings
+        that may be lowered and applies the quality level needed at the
+        end of the last interaction."""
+        if self.interacting:
+            return
+        self.interacting = True
+        self._settings = self._find_settings()
+        self._set_level(self._last_level)
+
+    def end_interaction(self):
+        """Called when an interaction ends, this restores the quality
+        and renders the scene."""
+        if not self.interacting:
+            return
+        self.interacting = False
+        self._last_level = level = self.level
+        self._set_level(0)
+        self._settings = []
+        self._skip_frame = False
+        if level > 0:
+            self.scene.render()
+
+    ######################################################################
+    # Non-public interface.
+    ######################################################################
+    def _start(self, vtk_obj, event):
+        self.start_interaction()
+
+    def _end(self, vtk_obj, event):
+        self.end_interaction()
+
+    def _target_frame_rate_changed(self, value):
+        if self.scene is not None:
+            tvtk.to_vtk(self.scene.interactor).SetDesiredUpdateRate(value)
+
+    def _on_frame(self, t):
+        if not self.interacting:
+            return
+        if self._skip_frame:
+            self._skip_frame = False
+            return
+        budget = 1.0/self.target_frame_rate
+        level = self.level
+        if t > budget and level < self.max_level:
+            self._set_level(level + 1)
+        elif t < 0.25*budget and level > 0:
+            self._set_level(level - 1)
+
+    def _set_level(self, level):
+        scene = self.scene
+        # Changing the settings must not render the scene.
+        disable_render = scene.disable_render
+        scene.trait_setq(disable_render=True)
+        try:
+            for setting in self._settings:
+                setting.apply(level)
+        finally:
+            scene.trait_setq(disable_render=disable_render)
+        if level != self.level:
+            self._skip_frame = self.interacting
+        self.level = level
+
+    def _find_settings(self):
+        """Return the settings of the scene that may be lowered."""
+        scene = self.scene
+        settings = []
+        objs = dict(render_window=tvtk.to_vtk(scene.render_window),
+                    renderer=tvtk.to_vtk(scene.renderer))
+        for key, name in AA_SETTINGS:
+            obj = objs[key]
+            if hasattr(obj, 'Get' + name):
+                settings.append(_Setting(obj, name, 'aa'))
+        for alg in find_algorithms(scene.renderer):
+            for name, minimum in RESOLUTIONS.get(alg.GetClassName(), ()):
+                settings.append(_Setting(alg, name, 'resolution',
+                                         minimum))
+            if alg.IsA('vtkVolumeMapper'):
+                for name in SAMPLE_DISTANCES:
+                    if hasattr(alg, 'Get' + name):
+                        settings.append(_Setting(alg, name, 'distance'))
+        return settings
@@ -180,6 +180,24 @@ class SceneModel(TVTKScene):
         self._check_scene_editor()
         self.scene_editor.save(file_name, size, **kw_args)
 
+    def save_frames(self, file_name, frames, start=0, **kw_args):
+        """Save an image of the scene for every item of the iterable
+        `frames` to `file_name % frame_number` and return the list of
+        saved file names.  See `TVTKScene.save_frames` for details.
+        """
+        self._check_scene_editor()
+        return self.scene_editor.save_frames(file_name, frames, start,
+                                             **kw_args)
+
+    def save_tiled(self, file_name, magnification=None, alpha=False):
+        """Save the scene to a PNG, TIFF or NumPy file as a large image
+        rendered and written one tile at a time.  See
+        `TVTKScene.save_tiled` for details.
+        """
+        self._check_scene_editor()
+        return self.scene_editor.save_tiled(file_name, magnification,
+                                            alpha)
+
     def save_ps(self, file_name):
         """Saves the rendered scene to a rasterized PostScript image.
         For vector graphics use the save_gl2ps method."""
@@ -0,0 +1,346 @@
+"""Save very large images of a scene by rendering it tile by tile.
+
+The scene is rendered once per tile with the camera narrowed to the
+part of the view seen by the tile, in the same way as
+`WindowToImageFilter` does for a magnified image.  However, instead of
+assembling the whole image in memory, each row of tiles is written to
+the output file as soon as it is rendered, so the memory used depends
+on the size of the window and the width of the image but not on its
+height.  PNG, TIFF and NumPy ('.npy') files are supported, the NumPy
+file is written through a memory map.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import math
+import os.path
+import struct
+import warnings
+import zlib
+
+import numpy
+
+from tvtk.api import tvtk
+
+
+######################################################################
+# Streaming image writers.
+######################################################################
+class PNGStreamWriter(object):
+    """Write an 8 bit RGB or RGBA PNG file a few rows at a time."""
+
+    def __init__(self, file_name, width, height, channels=3):
+        self.width = width
+        self.height = height
+        self.channels = channels
+        self._rows = 0
+        self._compressor = zlib.compressobj(6)
+        self._file = open(file_name, 'wb')
+        self._file.write(b'\x89PNG\r\n\x1a\n')
+        color_type = 6 if channels == 4 else 2
+        self._chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8,
+                                         color_type, 0, 0, 0))
+
+    def write_rows(self, rows):
+        """Write the given (n, width, channels) uint8 array of rows,
+        ordered from the top of the image down.
+        """
+        n = rows.shape[0]
+        data = numpy.zeros((n, self.width*self.channels + 1), numpy.uint8)
+        data[:, 1:] = rows.reshape(n, -1)
+        out = self._compressor.compress(data.tobytes())
+        if out:
+            self._chunk(b'IDAT', out)
+        self._rows += n
+
+    def close(self):
+        if self._file is None:
+            return
+        try:
+            self._chunk(b'IDAT', self._compressor.flush())
+            self._chunk(b'IEND', b'')
+        finally:
+            self._file.close()
+            self._file = None
+
+    def _chunk(self, tag, data):
+        f = self._file
+        f.write(struct.pack('>I', len(data)))
+        f.write(tag)
+        f.write(data)
+        f.write(struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff))
+
+
+class TIFFStreamWriter(object):
+    """Write an uncompressed 8 bit RGB or RGBA TIFF file a few rows at a
+    time.  The image must be smaller than 4 GB.
+    """
+
+    def __init__(self, file_name, width, height, channels=3):
+        self.width = width
+        self.height = height
+        self.channels = channels
+        row_bytes = width*channels
+        if row_bytes*height >= 2**32 - 2**20:
+            raise ValueError('Image is too large for a TIFF file.')
+        rows_per_strip = max(1, 65536//row_bytes)
+        n_strips = (height + rows_per_strip - 1)//rows_per_strip
+
+        tags = [(256, 4, [width]), (257, 4, [height]),
+                (258, 3, [8]*channels), (259, 3, [1]),
+                (262, 3, [2]), (273, 4, None), (277, 3, [channels]),
+                (278, 4, [rows_per_strip]), (279, 4, None),
+                (284, 3, [1])]
+        if channels == 4:
+            # Unassociated alpha.
+            tags.append((338, 3, [2]))
+        ifd_size = 2 + 12*len(tags) + 4
+        # The values that do not fit in an entry follow the IFD.
+        extra = 8 + ifd_size
+        bits_offset = extra
+        extra += 2*channels if channels > 2 else 0
+        offsets_offset = extra
+        extra += 4*n_strips if n_strips > 1 else 0
+        counts_offset = extra
+        extra += 4*n_strips if n_strips > 1 else 0
+        data_offset = extra
+
+        strip_bytes = rows_per_strip*row_bytes
+        offsets = [data_offset + i*strip_bytes for i in range(n_strips)]
+        counts = [min(strip_bytes, row_bytes*height - i*strip_bytes)
+                  for i in range(n_strips)]
+
+        header = [b'II*\x00', struct.pack('<I', 8),
+                  struct.pack('<H', len(tags))]
+        values = []
+        for tag, typ, value in tags:
+            if tag == 273:
+                value, offset = offsets, offsets_offset
+            elif tag == 279:
+                value, offset = counts, counts_offset
+            else:
+                offset = bits_offset
+            fmt = '<%d%s'%(len(value), 'H' if typ == 3 else 'I')
+            packed = struct.pack(fmt, *value)
+            if len(packed) <= 4:
+                entry = packed + b'\x00'*(4 - len(packed))
+            else:
+                entry = struct.pack('<I', offset)
+                values.append(packed)
+            header.append(struct.pack('<HHI', tag, typ, len(value)) + entry)
+        header.append(struct.pack('<I', 0))
+        self._file = open(file_name, 'wb')
+        self._file.write(b''.join(header + values))
+
+    def write_rows(self, rows):
+        """Write the given (n, width, channels) uint8 array of rows,
+        ordered from the top of the image down.
+        """
+        self._file.write(numpy.ascontiguousarray(rows).tobytes())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class NPYStreamWriter(object):
+    """Write the image to a memory mapped NumPy '.npy' file of shape
+    (height, width, channels).
+    """
+
+    def __init__(self, file_name, width, height, channels=3):
+        self.width = width
+        self.height = height
+        self.channels = channels
+        self._row = 0
+        self._array = numpy.lib.format.open_memmap(
+            file_name, mode='w+', dtype=numpy.uint8,
+            shape=(height, width, channels)
+        )
+
+    def write_rows(self, rows):
+        """Write the given (n, width, channels) uint8 array of rows,
+        ordered from the top of the image down.
+        """
+        n = rows.shape[0]
+        self._array[self._row:self._row + n] = rows
+        self._array.flush()
+        self._row += n
+
+    def close(self):
+        if self._array is not None:
+            self._array.flush()
+            self._array = None
+
+
+# The writer used for each file extension.
+WRITERS = {'.png': PNGStreamWriter, '.tif': TIFFStreamWriter,
+           '.tiff': TIFFStreamWriter, '.npy': NPYStreamWriter}
+
+
+def get_stream_writer_class(file_name):
+    """Return the streaming writer class for the extension of the
+    given file name."""
+    ext = os.path.splitext(file_name)[1].lower()
+    if ext not in WRITERS:
+        raise ValueError(
+            'Tiled images can only be saved to %s files.'%
+            ', '.join(sorted(WRITERS))
+        )
+    return WRITERS[ext]
+
+
+######################################################################
+# Tiled rendering.
+######################################################################
+def _text_properties(prop):
+    """Return the text properties of a 2D actor and of its mapper."""
+    result = []
+    for obj in (prop, prop.mapper):
+        if obj is None:
+            continue
+        for name in obj.trait_names():
+            if name.endswith('text_property'):
+                tp = getattr(obj, name)
+                if isinstance(tp, tvtk.TextProperty):
+                    result.append(tp)
+    return result
+
+
+def _scale_2d_actors(renderer, mag):
+    """Switch the position coordinates of the 2D actors of the renderer
+    to display coordinates and scale their fonts by `mag`.  Returns the
+    saved state of the coordinates and fonts.
+    """
+    coords, fonts = [], []
+    for p in renderer.view_props:
+        if not isinstance(p, tvtk.Actor2D):
+            continue
+        for c in (p.position_coordinate, p.position2_coordinate):
+            # The second coordinate may be relative to the first, so
+            # get all the positions before changing any.
+            xy = c.get_computed_double_display_value(renderer)
+            state = (c.coordinate_system, tuple(c.value),
+                     c.reference_coordinate)
+            coords.append((c, state, xy))
+        for tp in _text_properties(p):
+            if not any(tp is f for f, size in fonts):
+                fonts.append((tp, tp.font_size))
+    for c, state, xy in coords:
+        c.reference_coordinate = None
+        c.coordinate_system = 'display'
+    for tp, size in fonts:
+        tp.font_size = size*mag
+    return coords, fonts
+
+
+def _shift_2d_actors(saved, mag, x, y):
+    """Move the saved coordinates to where they are in the tile whose
+    lower left corner is at (x, y) in the magnified image."""
+    for c, state, xy in saved[0]:
+        c.value = (xy[0]*mag - x, xy[1]*mag - y, 0.0)
+
+
+def _restore_2d_actors(saved):
+    coords, fonts = saved
+    for c, state, xy in coords:
+        c.coordinate_system, c.value, c.reference_coordinate = state
+    for tp, size in fonts:
+        tp.font_size = size
+
+
+def iter_tiles(scene, magnification, alpha=False):
+    """Render the scene as `magnification` x `magnification` tiles and
+    yield each row of tiles, from the top of the image down, as a
+    (height, width*magnification, channels) array.
+
+    The camera is restored when done.  Props drawn in display
+    coordinates, like text and scalar bars, are moved on each tile and
+    their fonts scaled, so they appear once and at the magnified size.
+    The other renderers of the window, like the orientation axes, are
+    not tiled and so are hidden, with a warning, while the tiles are
+    rendered.
+    """
+    rw = scene.render_window
+    camera = scene.camera
+    renderer = scene.renderer
+    mag = int(magnification)
+
+    w2if = tvtk.WindowToImageFilter(input=rw, read_front_buffer=
+                                    not scene.off_screen_rendering)
+    if alpha:
+        w2if.input_buffer_type = 'rgba'
+    if hasattr(w2if, 'should_rerender'):
+        w2if.should_rerender = False
+
+    state = (camera.view_angle, camera.parallel_scale,
+             tuple(camera.window_center))
+    others = [r for r in rw.renderers if r is not renderer and r.draw]
+    if others:
+        warnings.warn('Only the main renderer is saved in tiled images, '
+                      'the other %d renderers of the window, like the '
+                      'orientation axes, are left out.' % len(others))
+    # VTK 9 dropped the accumulation buffer anti-aliasing.
+    has_aa = hasattr(rw, 'aa_frames')
+    aa_frames = rw.aa_frames if has_aa else 0
+    nx, ny = rw.size
+    saved = _scale_2d_actors(renderer, mag)
+    try:
+        for r in others:
+            r.draw = False
+        if has_aa:
+            rw.aa_frames = scene.anti_aliasing_frames
+        # Narrow the view so the whole view spans `mag` tiles.
+        half = math.radians(state[0])/2.0
+        camera.view_angle = math.degrees(2.0*math.atan(math.tan(half)/mag))
+        camera.parallel_scale = state[1]/float(mag)
+        cx, cy = state[2]
+        for j in range(mag - 1, -1, -1):
+            strip = []
+            for i in range(mag):
+                camera.window_center = (mag*cx + 2*i - mag + 1,
+                                        mag*cy + 2*j - mag + 1)
+                _shift_2d_actors(saved, mag, i*nx, j*ny)
+                rw.render()
+                w2if.modified()
+                w2if.update()
+                image = w2if.output
+                w, h = image.dimensions[:2]
+                pixels = image.point_data.scalars.to_array()
+                strip.append(pixels.reshape(h, w, -1)[::-1])
+            yield numpy.concatenate(strip, axis=1)
+    finally:
+        camera.view_angle, camera.parallel_scale = state[:2]
+        camera.window_center = state[2]
+        _restore_2d_actors(saved)
+        for r in others:
+            r.draw = True
+        if has_aa:
+            rw.aa_frames = aa_frames
+        rw.render()
+
+
+def save_tiled(scene, file_name, magnification, alpha=False):
+    """Save the scene to `file_name` as an image `magnification` times
+    the size of the render window, rendering it one tile at a time and
+    streaming the rows of tiles to the file.  Returns the (width,
+    height) of the image.  A ValueError is raised if nothing was
+    rendered, for example if the render window has no size.
+    """
+    if int(magnification) < 1:
+        raise ValueError('The magnification must be at least 1.')
+    klass = get_stream_writer_class(file_name)
+    writer = None
+    try:
+        for strip in iter_tiles(scene, magnification, alpha):
+            if writer is None:
+                ny, nx, nc = strip.shape
+                writer = klass(file_name, nx, ny*magnification, nc)
+            writer.write_rows(strip)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError('No image was rendered to save to %s.' % file_name)
+    return writer.width, writer.height
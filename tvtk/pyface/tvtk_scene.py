@@ -23,7 +23,7 @@ from tvtk.tvtk_base import vtk_color_trait
 from tvtk.common import configure_input
 
 from traits.api import HasPrivateTraits, HasTraits, Any, Int, \
-     Property, Instance, Event, Range, Bool, Trait, Str
+     Property, Instance, Event, Range, Bool, Trait, Str, Dict
 
 from tvtk.pyface import light_manager
 
@@ -133,6 +133,14 @@ class TVTKScene(HasPrivateTraits):
     # Default JPEG progressive setting.
     jpeg_progressive = Bool(True, desc='if the generated JPEG should be progressive')
 
+    # Lower the rendering quality while interacting with the scene when
+    # the frames are too slow for the `target_frame_rate`.  The quality
+    # is restored when the interaction ends.
+    adaptive_quality = Bool(False, desc='if the quality is lowered to keep the frame rate when interacting')
+
+    # The frame rate kept while interacting if `adaptive_quality` is on.
+    target_frame_rate = Range(1.0, 120.0, 15.0, desc='the frame rate to keep when interacting')
+
     # The light manager.
     light_manager = Instance(light_manager.LightManager, record=True)
 
@@ -142,6 +150,9 @@ class TVTKScene(HasPrivateTraits):
     # Is the scene busy or not.
     busy = Property(Bool, record=False)
 
+    # The statistics of the renders of the scene, created on first use.
+    render_stats = Property(record=False)
+
     ########################################
     # Events
 
@@ -194,6 +205,15 @@ class TVTKScene(HasPrivateTraits):
     _camera = Instance(tvtk.Camera)
     _busy_count = Int(0)
 
+    # The filter capturing the render window and the image writers
+    # keyed on their class, reused by the image save methods.
+    _image_filter = Instance(tvtk.WindowToImageFilter)
+    _image_writers = Dict
+
+    # The render statistics and the adaptive quality controller.
+    _render_stats = Any(transient=True)
+    _quality_controller = Any(transient=True)
+
     ###########################################################################
     # 'object' interface.
     ###########################################################################
@@ -208,6 +228,8 @@ class TVTKScene(HasPrivateTraits):
 
         self.control = self._create_control(parent)
         self._renwin.update_traits()
+        if self.adaptive_quality:
+            self._adaptive_quality_changed(True)
 
     def __get_pure_state__(self):
         """Allows us to pickle the scene."""
@@ -216,6 +238,8 @@ class TVTKScene(HasPrivateTraits):
         d = self.__dict__.copy()
         for x in ['control', '_renwin', '_interactor', '_camera',
                   '_busy_count', '__sync_trait__', 'recorder',
+                  '_image_filter', '_image_writers',
+                  '_render_stats', '_quality_controller',
                   '_last_camera_state', '_camera_observer_id',
                   '_script_id', '__traits_listener__']:
             d.pop(x, None)
@@ -328,6 +352,14 @@ class TVTKScene(HasPrivateTraits):
         self.sync_trait('parallel_projection', self.camera, remove=True)
         self.sync_trait('off_screen_rendering', self._renwin, remove=True)
 
+        # Stop timing the renders and controlling the quality.
+        if self._quality_controller is not None:
+            self._quality_controller.disable()
+            self._quality_controller = None
+        if self._render_stats is not None:
+            self._render_stats.stop()
+            self._render_stats = None
+
         # Remove all the renderer's props.
         self._renderer.remove_all_view_props()
         # Set the renderwindow to release all resources and the OpenGL
@@ -335,7 +367,10 @@ class TVTKScene(HasPrivateTraits):
         self._renwin.finalize()
         # Disconnect the interactor from the renderwindow.
         self._interactor.render_window = None
-        # Remove the reference to the render window.
+        # Remove the capture pipeline and the reference to the render
+        # window.
+        self._image_writers = {}
+        self._image_filter = None
         del self._renwin
         # Fire the "closed" event.
         self.closed = True
@@ -396,18 +431,7 @@ class TVTKScene(HasPrivateTraits):
         Any extra keyword arguments are passed along to the respective
         image format's save method.
         """
-        ext = os.path.splitext(file_name)[1]
-        meth_map = {'.ps': 'ps', '.bmp': 'bmp', '.tiff': 'tiff',
-                    '.png': 'png', '.jpg': 'jpg', '.jpeg': 'jpg',
-                    '.iv': 'iv', '.wrl': 'vrml', '.vrml':'vrml',
-                    '.oogl': 'oogl', '.rib': 'rib', '.obj': 'wavefront',
-                    '.eps': 'gl2ps', '.pdf':'gl2ps', '.tex': 'gl2ps',
-                    '.x3d': 'x3d', '.pov': 'povray'}
-        if ext.lower() not in meth_map:
-            raise ValueError(
-                'Unable to find suitable image type for given file extension.'
-            )
-        meth = getattr(self, 'save_' + meth_map[ext])
+        meth = self._get_save_method(file_name)
         if size is not None:
             orig_size = self.get_size()
             self.set_size(size)
@@ -418,57 +442,82 @@ class TVTKScene(HasPrivateTraits):
             meth(file_name, **kw_args)
             self._record_methods('save(%r)'%(file_name))
 
+    def save_frames(self, file_name, frames, start=0, **kw_args):
+        """Save an image of the scene for every item of the iterable
+        `frames` and return the list of saved file names.
+
+        `file_name` is a pattern like 'frame%05d.png' that is formatted
+        with the frame number, counted from `start`.  Iterating over
+        `frames` should change the scene, for example `frames` can be
+        a generator that updates the data of a visualization.  The
+        anti-aliasing frames are set once for the whole sequence so
+        each frame is rendered once only.
+
+        Any extra keyword arguments are passed along to the respective
+        image format's save method.
+        """
+        meth = self._get_save_method(file_name % start)
+        rw = self._renwin
+        aa_frames = self._set_aa_frames(self.anti_aliasing_frames)
+        names = []
+        try:
+            for i, frame in enumerate(frames):
+                name = file_name % (start + i)
+                meth(name, **kw_args)
+                names.append(name)
+        finally:
+            if aa_frames is not None and rw.aa_frames != aa_frames:
+                rw.aa_frames = aa_frames
+                rw.render()
+        return names
+
+    def save_tiled(self, file_name, magnification=None, alpha=False):
+        """Save the scene to a PNG, TIFF or NumPy ('.npy') file as an
+        image `magnification` times the size of the window, which
+        defaults to the `magnification` trait.
+
+        Unlike the other save methods, the image is never held in
+        memory as a whole: the scene is rendered one tile at a time and
+        each row of tiles is written to the file as soon as it is
+        ready.  This makes it possible to save posters that are too
+        large for memory.  Returns the size of the saved image.
+        """
+        from tvtk.pyface.tiled_image import save_tiled
+        if magnification is None:
+            magnification = self.magnification
+        self._lift()
+        size = save_tiled(self, file_name, magnification, alpha)
+        self._record_methods('save_tiled(%r, %r)'%(file_name,
+                                                   magnification))
+        return size
+
     def save_ps(self, file_name):
         """Saves the rendered scene to a rasterized PostScript image.
         For vector graphics use the save_gl2ps method."""
         if len(file_name) != 0:
-            w2if = tvtk.WindowToImageFilter(read_front_buffer=
-                                              not self.off_screen_rendering)
-            w2if.magnification = self.magnification
-            self._lift()
-            w2if.input = self._renwin
-            ex = tvtk.PostScriptWriter()
+            ex = self._get_image_writer(tvtk.PostScriptWriter)
             ex.file_name = file_name
-            configure_input(ex, w2if)
             self._exporter_write(ex)
 
     def save_bmp(self, file_name):
         """Save to a BMP image file."""
         if len(file_name) != 0:
-            w2if = tvtk.WindowToImageFilter(read_front_buffer=
-                                              not self.off_screen_rendering)
-            w2if.magnification = self.magnification
-            self._lift()
-            w2if.input = self._renwin
-            ex = tvtk.BMPWriter()
+            ex = self._get_image_writer(tvtk.BMPWriter)
             ex.file_name = file_name
-            configure_input(ex, w2if)
             self._exporter_write(ex)
 
     def save_tiff(self, file_name):
         """Save to a TIFF image file."""
         if len(file_name) != 0:
-            w2if = tvtk.WindowToImageFilter(read_front_buffer=
-                                              not self.off_screen_rendering)
-            w2if.magnification = self.magnification
-            self._lift()
-            w2if.input = self._renwin
-            ex = tvtk.TIFFWriter()
+            ex = self._get_image_writer(tvtk.TIFFWriter)
             ex.file_name = file_name
-            configure_input(ex, w2if)
             self._exporter_write(ex)
 
     def save_png(self, file_name):
         """Save to a PNG image file."""
         if len(file_name) != 0:
-            w2if = tvtk.WindowToImageFilter(read_front_buffer=
-                                              not self.off_screen_rendering)
-            w2if.magnification = self.magnification
-            self._lift()
-            w2if.input = self._renwin
-            ex = tvtk.PNGWriter()
+            ex = self._get_image_writer(tvtk.PNGWriter)
             ex.file_name = file_name
-            configure_input(ex, w2if)
             self._exporter_write(ex)
 
     def save_jpg(self, file_name, quality=None, progressive=None):
@@ -478,16 +527,10 @@ class TVTKScene(HasPrivateTraits):
         if len(file_name) != 0:
             if not quality and not progressive:
                 quality, progressive = self.jpeg_quality, self.jpeg_progressive
-            w2if = tvtk.WindowToImageFilter(read_front_buffer=
-                                              not self.off_screen_rendering)
-            w2if.magnification = self.magnification
-            self._lift()
-            w2if.input = self._renwin
-            ex = tvtk.JPEGWriter()
+            ex = self._get_image_writer(tvtk.JPEGWriter)
             ex.quality = quality
             ex.progressive = progressive
             ex.file_name = file_name
-            configure_input(ex, w2if)
             self._exporter_write(ex)
 
     def save_iv(self, file_name):
@@ -767,6 +810,28 @@ class TVTKScene(HasPrivateTraits):
     def _get_busy(self):
         return self._busy_count > 0
 
+    def _get_render_stats(self):
+        if self._render_stats is None:
+            from tvtk.pyface.render_stats import RenderStats
+            self._render_stats = RenderStats(scene=self)
+        return self._render_stats
+
+    def _adaptive_quality_changed(self, value):
+        if self._renwin is None:
+            return
+        qc = self._quality_controller
+        if value and qc is None:
+            from tvtk.pyface.render_stats import AdaptiveQuality
+            self._quality_controller = AdaptiveQuality(
+                scene=self, target_frame_rate=self.target_frame_rate)
+        elif not value and qc is not None:
+            qc.disable()
+            self._quality_controller = None
+
+    def _target_frame_rate_changed(self, value):
+        if self._quality_controller is not None:
+            self._quality_controller.target_frame_rate = value
+
     def _set_busy(self, value):
         """The `busy` trait is either `True` or `False`.  However,
         this could be problematic since we could have two methods
@@ -844,19 +909,77 @@ class TVTKScene(HasPrivateTraits):
         image."""
         return
 
+    def _get_save_method(self, file_name):
+        """Return the save method for the extension of the given file
+        name."""
+        ext = os.path.splitext(file_name)[1]
+        meth_map = {'.ps': 'ps', '.bmp': 'bmp', '.tiff': 'tiff',
+                    '.png': 'png', '.jpg': 'jpg', '.jpeg': 'jpg',
+                    '.iv': 'iv', '.wrl': 'vrml', '.vrml':'vrml',
+                    '.oogl': 'oogl', '.rib': 'rib', '.obj': 'wavefront',
+                    '.eps': 'gl2ps', '.pdf':'gl2ps', '.tex': 'gl2ps',
+                    '.x3d': 'x3d', '.pov': 'povray'}
+        if ext.lower() not in meth_map:
+            raise ValueError(
+                'Unable to find suitable image type for given file extension.'
+            )
+        return getattr(self, 'save_' + meth_map[ext.lower()])
+
+    def _get_image_writer(self, klass):
+        """Return the image writer of the given class connected to the
+        filter capturing the render window, both are created the first
+        time and reused after that.
+        """
+        w2if = self._image_filter
+        if w2if is None:
+            w2if = tvtk.WindowToImageFilter()
+            w2if.input = self._renwin
+            self._image_filter = w2if
+        w2if.read_front_buffer = not self.off_screen_rendering
+        if hasattr(w2if, 'magnification'):
+            w2if.magnification = self.magnification
+        else:
+            w2if.scale = (self.magnification,)*2
+        self._lift()
+        ex = self._image_writers.get(klass)
+        if ex is None:
+            ex = klass()
+            configure_input(ex, w2if)
+            self._image_writers[klass] = ex
+        return ex
+
     def _exporter_write(self, ex):
         """Abstracts the exporter's write method."""
         # Bumps up the anti-aliasing frames when the image is saved so
         # that the saved picture looks nicer.
         rw = self.render_window
-        aa_frames = rw.aa_frames
-        rw.aa_frames = self.anti_aliasing_frames
+        aa_frames = self._set_aa_frames(self.anti_aliasing_frames)
         rw.render()
+        w2if = self._image_filter
+        if w2if is not None:
+            # The window was just rendered, the filter only needs to
+            # capture it again.
+            if hasattr(w2if, 'should_rerender'):
+                w2if.should_rerender = self.magnification > 1
+            w2if.modified()
         ex.update()
         ex.write()
-        # Set the frames back to original setting.
-        rw.aa_frames = aa_frames
-        rw.render()
+        # Set the frames back to original setting, this needs another
+        # render only if they were changed.
+        if aa_frames is not None and aa_frames != rw.aa_frames:
+            rw.aa_frames = aa_frames
+            rw.render()
+
+    def _set_aa_frames(self, frames):
+        """Set the anti-aliasing frames of the render window and return
+        the previous value, or None if the render window has none as
+        with VTK 9."""
+        rw = self._renwin
+        if not hasattr(rw, 'aa_frames'):
+            return None
+        aa_frames = rw.aa_frames
+        rw.aa_frames = frames
+        return aa_frames
 
     def _update_view(self, x, y, z, vx, vy, vz):
         """Used internally to set the view."""
@@ -878,33 +1001,46 @@ class TVTKScene(HasPrivateTraits):
         interpret this as multiple calls.
         """
         r = self.recorder
-        if r is not None:
+        if r is not None and r.recording:
             sid = self._script_id
             for call in calls.split('\n'):
-                r.record('%s.%s'%(sid, call))
+                self._record('%s.%s', sid, call)
+
+    def _record(self, fmt, *args):
+        """Record the code `fmt % args`, recorders that support it
+        only format the code when the script is generated.
+        """
+        r = self.recorder
+        record_format = getattr(r, 'record_format', None)
+        if record_format is not None:
+            record_format(fmt, args)
+        else:
+            r.record(fmt % args)
 
     def _record_camera_position(self, vtk_obj=None, event=None):
         """Callback to record the camera position."""
         r = self.recorder
-        if r is not None:
+        if r is not None and r.recording:
             state = self._get_camera_state()
             lcs = self._last_camera_state
             if state != lcs:
                 self._last_camera_state = state
                 sid = self._script_id
                 for key, value in state:
-                    r.record('%s.camera.%s = %r'%(sid, key, value))
-                r.record('%s.camera.compute_view_plane_normal()'%sid)
-                r.record('%s.render()'%sid)
+                    self._record('%s.camera.%s = %r', sid, key, value)
+                self._record('%s.camera.compute_view_plane_normal()', sid)
+                self._record('%s.render()', sid)
 
     def _get_camera_state(self):
-        c = self.camera
+        # Read the state from the VTK camera, this avoids updating the
+        # traits of the tvtk camera.
+        c = tvtk.to_vtk(self.camera)
         state = []
-        state.append(('position', list(c.position)))
-        state.append(('focal_point', list(c.focal_point)))
-        state.append(('view_angle', c.view_angle))
-        state.append(('view_up', list(c.view_up)))
-        state.append(('clipping_range', list(c.clipping_range)))
+        state.append(('position', list(c.GetPosition())))
+        state.append(('focal_point', list(c.GetFocalPoint())))
+        state.append(('view_angle', c.GetViewAngle()))
+        state.append(('view_up', list(c.GetViewUp())))
+        state.append(('clipping_range', list(c.GetClippingRange())))
         return state
 
     def _recorder_changed(self, r):
@@ -0,0 +1,72 @@
+"""Tests for the lazy tree generation of the pipeline browser.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import unittest
+
+from tvtk.api import tvtk
+from tvtk.pipeline import browser
+
+
+class TestTreeGenerator(unittest.TestCase):
+    def setUp(self):
+        cs = tvtk.ConeSource()
+        m = tvtk.PolyDataMapper(input_connection=cs.output_port)
+        self.actor = tvtk.Actor(mapper=m)
+
+    def test_methods_are_cached_per_class(self):
+        tg = browser.FullTreeGenerator()
+        kids = tg.get_children(self.actor)
+        self.assertTrue('mapper' in kids)
+        name = self.actor._vtk_obj.GetClassName()
+        self.assertTrue(name in browser._methods_cache)
+        self.assertTrue(tvtk.Actor in browser._child_attributes_cache)
+
+        # Another actor reuses the cached methods.
+        calls = []
+        orig = tg._parse_methods
+        def _parse_methods(vtk_obj):
+            calls.append(vtk_obj)
+            return orig(vtk_obj)
+        tg._parse_methods = _parse_methods
+        actor = tvtk.Actor(mapper=tvtk.PolyDataMapper())
+        self.assertEqual(sorted(tg.get_children(actor).keys()),
+                         sorted(kids.keys()))
+        self.assertEqual(calls, [])
+
+    def test_has_children_does_not_get_children(self):
+        tg = browser.FullTreeGenerator()
+        def get_children(obj):
+            raise AssertionError('get_children called')
+        tg.get_children = get_children
+        self.assertTrue(tg.has_children(self.actor))
+        self.assertTrue(tg.has_children(tvtk.Property()))
+        self.assertTrue(isinstance(tg.get_node(self.actor),
+                                   browser.TVTKBranchNode))
+
+    def test_children_created_on_expansion(self):
+        tg = browser.FullTreeGenerator()
+        node = tg.get_node(self.actor)
+        self.assertTrue(node.tno_has_children(None))
+        self.assertFalse(node._children_created)
+        other = tg.get_node(tvtk.Points())
+        self.assertEqual(other.tno_has_children(None),
+                         tg.has_children(other.object))
+        self.assertEqual(node.children_cache, {})
+        kids = node.children
+        self.assertTrue(len(kids) > 0)
+        self.assertTrue(node._children_created)
+        # The child nodes are reused.
+        self.assertTrue(kids is node.children)
+        self.assertEqual([id(x) for x in kids], [id(x) for x in kids])
+
+        # Changing a child recreates the children.
+        mapper = tvtk.PolyDataMapper()
+        self.actor.mapper = mapper
+        self.assertTrue(node.children is not kids)
+        self.assertTrue(node.children_cache['mapper'] is mapper)
+
+
+if __name__ == '__main__':
+    unittest.main()
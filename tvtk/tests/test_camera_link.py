@@ -0,0 +1,117 @@
+"""Tests for linking the cameras of scenes.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import math
+import unittest
+
+from traits.api import TraitError
+from tvtk.api import tvtk
+from tvtk.pyface.camera_link import CameraLink, get_camera_state, \
+    same_state
+from tvtk.pyface.tvtk_scene import TVTKScene
+
+
+def distance(camera):
+    return math.sqrt(sum((a - b)**2 for a, b in
+                         zip(camera.position, camera.focal_point)))
+
+
+class TestCameraLink(unittest.TestCase):
+    def setUp(self):
+        self.scenes = []
+        for i in range(3):
+            scene = TVTKScene(off_screen_rendering=True)
+            cs = tvtk.ConeSource(center=(i, 0, 0))
+            m = tvtk.PolyDataMapper(input_connection=cs.output_port)
+            scene.add_actors(tvtk.Actor(mapper=m))
+            scene.reset_zoom()
+            self.scenes.append(scene)
+        self.scheduled = []
+
+    def tearDown(self):
+        for scene in self.scenes:
+            scene.close()
+
+    def make_link(self, **kw):
+        link = CameraLink(self.scenes, **kw)
+        # Record the scheduled updates instead of using the event loop.
+        link._schedule = lambda: self.scheduled.append(True)
+        return link
+
+    def state(self, scene):
+        return get_camera_state(tvtk.to_vtk(scene.camera))
+
+    def test_link_both_ways(self):
+        s0, s1, s2 = self.scenes
+        link = self.make_link()
+        n_renders = link.n_renders
+        # Many camera changes only schedule one update.
+        for i in range(5):
+            s1.camera.azimuth(5)
+        self.assertEqual(len(self.scheduled), 1)
+        self.assertFalse(same_state(self.state(s0), self.state(s1)))
+        link.update()
+        keys = ('position', 'focal_point', 'view_up', 'view_angle')
+        for scene in (s0, s2):
+            self.assertTrue(same_state(self.state(scene), self.state(s1),
+                                       keys))
+        self.assertEqual(link.n_renders - n_renders, 2)
+
+        # Nothing changed, nothing is rendered.
+        link.update()
+        self.assertEqual(link.n_renders - n_renders, 2)
+
+        # The other way.
+        s2.camera.elevation(10)
+        s2.camera.orthogonalize_view_up()
+        link.update()
+        for scene in (s0, s1):
+            self.assertTrue(same_state(self.state(scene), self.state(s2),
+                                       keys))
+        self.assertEqual(len(self.scheduled), 2)
+
+    def test_link_zoom(self):
+        s0, s1, s2 = self.scenes
+        link = self.make_link(link='zoom')
+        s1.camera.azimuth(30)
+        link.update()
+        s0.camera.dolly(2.0)
+        link.update()
+        d = distance(s0.camera)
+        self.assertAlmostEqual(distance(s1.camera), d)
+        self.assertAlmostEqual(distance(s2.camera), d)
+        # The direction of view is not linked.
+        self.assertFalse(same_state(self.state(s0), self.state(s1),
+                                    ('position',)))
+
+    def test_link_focal_point(self):
+        s0, s1, s2 = self.scenes
+        link = self.make_link(link=['focal_point', 'clipping'])
+        d1 = distance(s1.camera)
+        s0.camera.focal_point = (1, 2, 3)
+        s0.camera.clipping_range = (0.5, 50)
+        link.update()
+        for scene in (s1, s2):
+            self.assertTrue(same_state(self.state(scene), self.state(s0),
+                                       ('focal_point', 'clipping_range')))
+        self.assertAlmostEqual(distance(s1.camera), d1)
+
+    def test_unlink(self):
+        link = self.make_link()
+        link.remove(self.scenes[0])
+        self.assertEqual(len(link.scenes), 2)
+        self.scenes[0].camera.azimuth(10)
+        self.assertEqual(self.scheduled, [])
+        link.unlink()
+        self.scenes[1].camera.azimuth(10)
+        self.assertEqual(self.scheduled, [])
+        self.assertEqual(link.scenes, [])
+
+    def test_invalid_aspect(self):
+        self.assertRaises(TraitError, CameraLink, self.scenes, link='pan')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Tests for the shared geometry of simple primitives.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+from tvtk.api import tvtk
+from tvtk.pyface import actors, geometry_cache
+
+
+def source_bounds(source):
+    source.update()
+    return source.output.bounds
+
+
+def sorted_points(points):
+    """The points sorted by their coordinates.  The `ConeSource` turns
+    the cone by half a turn about X when it is not at the origin, which
+    only changes the order of its points."""
+    points = np.round(points, 6) + 0.0
+    return points[np.lexsort(points.T[::-1])]
+
+
+class TestGeometryCache(unittest.TestCase):
+    def setUp(self):
+        geometry_cache.clear()
+
+    def tearDown(self):
+        geometry_cache.clear()
+
+    def test_shared(self):
+        pd = geometry_cache.get_polydata('sphere', theta_resolution=8)
+        self.assertTrue(
+            pd is geometry_cache.get_polydata('sphere', theta_resolution=8)
+        )
+        self.assertFalse(
+            pd is geometry_cache.get_polydata('sphere', theta_resolution=9)
+        )
+        # Each mapper is new but uses the shared polydata.
+        m1 = geometry_cache.get_mapper('sphere', theta_resolution=8)
+        m2 = geometry_cache.get_mapper('sphere', theta_resolution=8)
+        self.assertFalse(m1 is m2)
+        self.assertTrue(m1.input is pd)
+        self.assertTrue(m2.input is pd)
+        points = geometry_cache.get_points('sphere', theta_resolution=8)
+        self.assertFalse(points.flags.writeable)
+        self.assertEqual(geometry_cache.cache_size(), 3)
+
+        geometry_cache.clear()
+        self.assertEqual(geometry_cache.cache_size(), 0)
+
+    def test_unknown_primitive(self):
+        self.assertRaises(ValueError, geometry_cache.get_polydata, 'torus')
+
+    def test_actors(self):
+        a1 = actors.sphere_actor(center=(1, 2, 3), radius=2.0)
+        a2 = actors.sphere_actor(resolution=32)
+        self.assertFalse(a1.mapper is a2.mapper)
+        self.assertTrue(a1.mapper.input is a2.mapper.input)
+        a1.mapper.scalar_visibility = False
+        self.assertTrue(a2.mapper.scalar_visibility)
+        s = tvtk.SphereSource(center=(1, 2, 3), radius=2.0,
+                              theta_resolution=32, phi_resolution=32)
+        assert_allclose(a1.bounds, source_bounds(s), atol=1e-6)
+
+        a = actors.cylinder_actor(center=(1, 0, -1), radius=0.25)
+        s = tvtk.CylinderSource(center=(1, 0, -1), radius=0.25,
+                                resolution=64)
+        assert_allclose(a.bounds, source_bounds(s), atol=1e-6)
+
+        a = actors.cube_actor(center=(0, 1, 2))
+        s = tvtk.CubeSource(center=(0, 1, 2))
+        assert_allclose(a.bounds, source_bounds(s), atol=1e-6)
+
+    def test_cone_orientation(self):
+        for d in ((1, 0, 0), (0, 1, 0), (-1, 0, 0), (1, 2, -3),
+                  (-2, 1, 1)):
+            a = actors.cone_actor(center=(1, -1, 2), height=3.0,
+                                  radius=0.75, direction=d, resolution=8)
+            s = tvtk.ConeSource(center=(1, -1, 2), height=3.0,
+                                radius=0.75, direction=d, resolution=8)
+            s.update()
+            expect = s.output.points.to_array()
+            # The actor bounds are those of its transformed bounding box,
+            # so compare the transformed points instead.
+            template = geometry_cache.get_points('cone', resolution=8)
+            m = a.matrix.to_array()
+            points = template.dot(m[:3, :3].T) + m[:3, 3]
+            assert_allclose(sorted_points(points), sorted_points(expect),
+                            atol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -146,6 +146,35 @@ class TestMessenger(unittest.TestCase):
         # Clean up.
         messenger.disconnect(c1)
 
+    def test_send_calls_each_handler_once(self):
+        """Test that a catch all event sent explicitly is handled once
+        and that handlers may disconnect while being called."""
+        calls = []
+        any_calls = []
+        class C:
+            def foo(self, o, e):
+                calls.append(e)
+                messenger.disconnect(o, 'foo')
+        def any_cb(o, e):
+            any_calls.append(e)
+        c = C()
+        c1 = C()
+        messenger.connect(c1, 'AnyEvent', any_cb)
+        messenger.connect(c1, 'foo', c.foo)
+        messenger.send(c1, 'AnyEvent')
+        self.assertEqual(any_calls, ['AnyEvent'])
+        self.assertEqual(calls, [])
+        messenger.send(c1, 'foo')
+        messenger.send(c1, 'foo')
+        self.assertEqual(calls, ['foo'])
+        self.assertEqual(any_calls, ['AnyEvent', 'foo', 'foo'])
+
+        # Nothing is connected to this object.
+        messenger.send(c, 'foo')
+
+        # Clean up.
+        messenger.disconnect(c1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,105 @@
+"""Tests for the render statistics and adaptive quality of scenes.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import unittest
+
+from tvtk.api import tvtk
+from tvtk.pyface.tvtk_scene import TVTKScene
+
+
+class TestRenderStats(unittest.TestCase):
+    def setUp(self):
+        self.scene = TVTKScene(off_screen_rendering=True)
+
+    def tearDown(self):
+        self.scene.close()
+
+    def test_stats(self):
+        scene = self.scene
+        cs = tvtk.ConeSource(resolution=6)
+        m = tvtk.PolyDataMapper(input_connection=cs.output_port)
+        scene.add_actors(tvtk.Actor(mapper=m))
+        stats = scene.render_stats
+        self.assertTrue(stats is scene.render_stats)
+        stats.reset()
+        for i in range(5):
+            scene.render()
+        self.assertEqual(stats.n_frames, 5)
+        self.assertTrue(stats.last > 0)
+        self.assertTrue(stats.mean > 0)
+        self.assertTrue(stats.p95 >= stats.mean)
+        self.assertTrue(stats.fps > 0)
+        # The sides and the triangulated cap.
+        self.assertEqual(stats.triangles, 6 + 4)
+        self.assertEqual(stats.actors, 1)
+        self.assertEqual(stats.volumes, 0)
+        self.assertTrue('fps' in stats.report())
+
+        # Hidden actors are not counted.
+        scene.renderer.actors[0].visibility = False
+        self.assertEqual(stats.actors, 0)
+        self.assertEqual(stats.triangles, 0)
+
+    def test_adaptive_quality(self):
+        scene = self.scene
+        pts = tvtk.PointSource(number_of_points=10)
+        sphere = tvtk.SphereSource(theta_resolution=16, phi_resolution=16)
+        g = tvtk.Glyph3D(input_connection=pts.output_port)
+        g.set_source_connection(sphere.output_port)
+        m = tvtk.PolyDataMapper(input_connection=g.output_port)
+        line = tvtk.LineSource()
+        tube = tvtk.TubeFilter(input_connection=line.output_port,
+                               number_of_sides=12)
+        m1 = tvtk.PolyDataMapper(input_connection=tube.output_port)
+        scene.add_actors([tvtk.Actor(mapper=m), tvtk.Actor(mapper=m1)])
+        rw = scene.render_window
+        rw.line_smoothing = True
+
+        scene.adaptive_quality = True
+        qc = scene._quality_controller
+        self.assertTrue(qc is not None)
+        # Every frame is too slow for this frame rate.
+        qc.target_frame_rate = 1e9
+        qc.start_interaction()
+        self.assertEqual(qc.level, 0)
+        # Slow frames lower the quality a level at a time.
+        scene.render()
+        self.assertEqual(qc.level, 1)
+        self.assertFalse(rw.line_smoothing)
+        self.assertEqual(sphere.theta_resolution, 16)
+        # The frame after a level change is not used.
+        scene.render()
+        self.assertEqual(qc.level, 1)
+        scene.render()
+        self.assertEqual(qc.level, 2)
+        self.assertEqual(sphere.theta_resolution, 8)
+        self.assertEqual(sphere.phi_resolution, 8)
+        self.assertEqual(tube.number_of_sides, 6)
+
+        # The quality is restored at the end of the interaction.
+        qc.end_interaction()
+        self.assertEqual(qc.level, 0)
+        self.assertTrue(rw.line_smoothing)
+        self.assertEqual(sphere.theta_resolution, 16)
+        self.assertEqual(tube.number_of_sides, 12)
+
+        # The next interaction starts at the level needed before and
+        # fast frames raise the quality.
+        qc.target_frame_rate = 1e-6
+        qc.start_interaction()
+        self.assertEqual(qc.level, 2)
+        scene.render()
+        self.assertEqual(qc.level, 2)
+        scene.render()
+        self.assertEqual(qc.level, 1)
+        self.assertEqual(sphere.theta_resolution, 16)
+        qc.end_interaction()
+
+        scene.adaptive_quality = False
+        self.assertEqual(scene._quality_controller, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+"""Tests for saving tiled images of a scene.
+"""
+# Copyright (c) 2026, Enthought, Inc.
+# License: BSD Style.
+
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import warnings
+
+import mock
+import numpy
+from numpy.testing import assert_allclose
+
+from tvtk.api import tvtk
+from tvtk.pyface import tiled_image
+from tvtk.pyface.tvtk_scene import TVTKScene
+
+
+def read_image(file_name):
+    """Read a PNG file with VTK as a (height, width, channels) array
+    ordered from the top of the image down."""
+    r = tvtk.PNGReader(file_name=file_name)
+    r.update()
+    nx, ny = r.output.dimensions[:2]
+    data = r.output.point_data.scalars.to_array()
+    return data.reshape(ny, nx, -1)[::-1]
+
+
+def read_tiff(file_name):
+    """Read an uncompressed, stripped 8 bit TIFF file as a (height,
+    width, channels) array.  The VTK TIFF reader is not used as the
+    orientation of its output and its handling of the alpha channel
+    depend on the version of VTK."""
+    with open(file_name, 'rb') as f:
+        data = f.read()
+    offset, = struct.unpack('<I', data[4:8])
+    n, = struct.unpack('<H', data[offset:offset+2])
+    tags = {}
+    for k in range(n):
+        entry = data[offset + 2 + 12*k:offset + 14 + 12*k]
+        tag, typ, count = struct.unpack('<HHI', entry[:8])
+        fmt = '<%d%s' % (count, 'H' if typ == 3 else 'I')
+        size = struct.calcsize(fmt)
+        if size <= 4:
+            value = struct.unpack(fmt, entry[8:8+size])
+        else:
+            pos, = struct.unpack('<I', entry[8:])
+            value = struct.unpack(fmt, data[pos:pos+size])
+        tags[tag] = value
+    pixels = b''.join(data[o:o+c] for o, c in zip(tags[273], tags[279]))
+    shape = (tags[257][0], tags[256][0], tags[277][0])
+    return numpy.frombuffer(pixels, numpy.uint8).reshape(shape)
+
+
+def magnified_image(render_window, magnification):
+    """The magnified image of the render window assembled by VTK."""
+    w2if = tvtk.WindowToImageFilter(input=render_window,
+                                    read_front_buffer=False)
+    if hasattr(w2if, 'scale'):
+        w2if.scale = (magnification, magnification)
+    else:
+        w2if.magnification = magnification
+    w2if.update()
+    nx, ny = w2if.output.dimensions[:2]
+    full = w2if.output.point_data.scalars.to_array()
+    return full.reshape(ny, nx, -1)[::-1]
+
+
+class TestStreamWriters(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, ext, image):
+        fname = os.path.join(self.tmpdir, 'image' + ext)
+        klass = tiled_image.get_stream_writer_class(fname)
+        ny, nx, nc = image.shape
+        writer = klass(fname, nx, ny, nc)
+        for i in range(0, ny, 7):
+            writer.write_rows(image[i:i+7])
+        writer.close()
+        return fname
+
+    def test_round_trip(self):
+        numpy.random.seed(0)
+        for nc in (3, 4):
+            image = numpy.random.randint(0, 256, (40, 23, nc))
+            image = image.astype(numpy.uint8)
+            fname = self._write('.png', image)
+            self.assertTrue(numpy.all(read_image(fname) == image))
+            fname = self._write('.tiff', image)
+            self.assertTrue(numpy.all(read_tiff(fname) == image))
+            fname = self._write('.npy', image)
+            self.assertTrue(numpy.all(numpy.load(fname) == image))
+
+    def test_unsupported_file(self):
+        self.assertRaises(ValueError, tiled_image.get_stream_writer_class,
+                          'image.jpg')
+
+
+class TestSaveTiled(unittest.TestCase):
+    def setUp(self):
+        self.scene = scene = TVTKScene(off_screen_rendering=True)
+        self.tmpdir = tempfile.mkdtemp()
+        cs = tvtk.ConeSource(resolution=24)
+        m = tvtk.PolyDataMapper(input_connection=cs.output_port)
+        scene.add_actors(tvtk.Actor(mapper=m))
+        scene.anti_aliasing_frames = 0
+        scene.parallel_projection = True
+        scene.reset_zoom()
+
+    def tearDown(self):
+        self.scene.close()
+        shutil.rmtree(self.tmpdir)
+
+    def _save(self, magnification):
+        fname = os.path.join(self.tmpdir, 'tiled.npy')
+        size = self.scene.save_tiled(fname, magnification=magnification)
+        tiled = numpy.load(fname)
+        self.assertEqual((tiled.shape[1], tiled.shape[0]), size)
+        return tiled
+
+    def _check_same(self, tiled, magnification):
+        # Compare with the image assembled by VTK.
+        full = magnified_image(self.scene.render_window, magnification)
+        self.assertEqual(full.shape, tiled.shape)
+        diff = numpy.abs(full.astype(float) - tiled)
+        self.assertTrue(diff.mean() < 1.0)
+
+    def test_save_tiled(self):
+        camera = self.scene.camera
+        state = (camera.parallel_scale, tuple(camera.window_center))
+        tiled = self._save(3)
+        self.assertEqual(state, (camera.parallel_scale,
+                                 tuple(camera.window_center)))
+        self._check_same(tiled, 3)
+
+    def test_2d_actors(self):
+        text = tvtk.TextActor(input='Tiled', position=(20, 30))
+        text.text_property.trait_set(font_size=24, color=(1, 0, 0))
+        lut = tvtk.LookupTable()
+        bar = tvtk.ScalarBarActor(lookup_table=lut)
+        bar.position_coordinate.coordinate_system = 'normalized_viewport'
+        bar.position_coordinate.value = (0.8, 0.1, 0.0)
+        self.scene.add_actors([text, bar])
+        self.scene.render()
+
+        def text_bounds(image):
+            red = ((image[..., 0] > 200) & (image[..., 1] < 100))
+            y, x = numpy.nonzero(red)
+            return numpy.array([x.min(), x.max() + 1, y.min(), y.max() + 1])
+
+        image = magnified_image(self.scene.render_window, 1)
+        tiled = self._save(2)
+        # The text is moved and scaled with the image.
+        assert_allclose(text_bounds(tiled), 2*text_bounds(image), atol=4)
+        # The 2D actors are restored.
+        cs = bar.position_coordinate
+        self.assertEqual(cs.coordinate_system, 'normalized_viewport')
+        assert_allclose(cs.value, (0.8, 0.1, 0.0))
+        self.assertTrue(bar.position2_coordinate.reference_coordinate
+                        is cs)
+        assert_allclose(text.position, (20, 30))
+        self.assertEqual(text.text_property.font_size, 24)
+
+    def test_other_renderers(self):
+        rw = self.scene.render_window
+        other = tvtk.Renderer(viewport=(0.0, 0.0, 0.2, 0.2))
+        rw.add_renderer(other)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            self._save(2)
+        msgs = [str(x.message) for x in w if 'renderers' in str(x.message)]
+        self.assertEqual(len(msgs), 1)
+        self.assertTrue(other.draw)
+
+    def test_bad_magnification(self):
+        fname = os.path.join(self.tmpdir, 'tiled.png')
+        self.assertRaises(ValueError, self.scene.save_tiled, fname, 0)
+        self.assertFalse(os.path.exists(fname))
+
+    def test_nothing_rendered(self):
+        # No tiles are rendered, for example in a window of no size.
+        fname = os.path.join(self.tmpdir, 'tiled.png')
+        with mock.patch.object(tiled_image, 'iter_tiles',
+                               return_value=iter([])):
+            self.assertRaises(ValueError, self.scene.save_tiled, fname, 2)
+        self.assertFalse(os.path.exists(fname))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,13 @@
-""" Tests for the garbage collection of TVTKScene objects.
+""" Tests for TVTKScene objects.
 
 """
 # Authors: Deepak Surti, Ioannis Tziakos
 # Copyright (c) 2015, Enthought, Inc.
 # License: BSD Style.
 
+import os
+import shutil
+import tempfile
 import unittest
 import weakref
 import gc
@@ -38,6 +41,41 @@ class TestTVTKScene(unittest.TestCase):
         # The TVTK Scene should have been collected.
         self.assertTrue(scene_collected[0])
 
+    def test_save_frames(self):
+        scene = TVTKScene(off_screen_rendering=True)
+        tmpdir = tempfile.mkdtemp()
+        renders = []
+        scene.render_window.add_observer('StartEvent',
+                                         lambda *args: renders.append(1))
+        # VTK 9 has no anti-aliasing frames.
+        has_aa = hasattr(scene.render_window, 'aa_frames')
+        try:
+            # A single image is saved with one render when the
+            # anti-aliasing frames do not change.
+            if has_aa:
+                scene.anti_aliasing_frames = scene.render_window.aa_frames
+            scene.save_png(os.path.join(tmpdir, 'single.png'))
+            self.assertEqual(len(renders), 1)
+            w2if = scene._image_filter
+            scene.save_png(os.path.join(tmpdir, 'again.png'))
+            self.assertIs(scene._image_filter, w2if)
+
+            # A sequence is saved with one render per frame and one
+            # render to restore the anti-aliasing frames.
+            if has_aa:
+                scene.anti_aliasing_frames = \
+                    scene.render_window.aa_frames + 2
+            del renders[:]
+            pattern = os.path.join(tmpdir, 'frame%03d.png')
+            names = scene.save_frames(pattern, range(3), start=1)
+            self.assertEqual(names, [pattern%i for i in (1, 2, 3)])
+            for name in names:
+                self.assertTrue(os.path.exists(name))
+            self.assertEqual(len(renders), 4 if has_aa else 3)
+        finally:
+            scene.close()
+            shutil.rmtree(tmpdir)
+
 
 if __name__ == "__main__":
     unittest.main()